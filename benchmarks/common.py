@@ -0,0 +1,52 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Helpers shared by the benchmark scripts.
+
+Importing this module puts the src directory of the repository on sys.path,
+so the scripts run against the working tree without installing pygxi:
+
+    from common import make_raw_image, time_ms
+    from pygxi.ImageProc import RawImage
+"""
+
+import os
+import sys
+import time
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from pygxi.gxidef import GxFrameStatusList  # noqa: E402
+from pygxi.gxwrapper import GxFrameData  # noqa: E402
+from pygxi.ImageProc import RawImage  # noqa: E402
+
+
+def make_raw_image(data, pixel_format, width, height):
+    """
+    :brief  Complete RawImage copied from a NumPy array of raw data
+    """
+    frame_data = GxFrameData()
+    frame_data.status = GxFrameStatusList.SUCCESS
+    frame_data.width = width
+    frame_data.height = height
+    frame_data.pixel_format = pixel_format
+    frame_data.image_size = data.size
+    frame_data.frame_id = 0
+    frame_data.timestamp = 0
+    frame_data.image_buf = data.ctypes.data
+    return RawImage(frame_data)
+
+
+def time_ms(function, frames):
+    """
+    :brief  Mean time of a call in ms over frames calls, after a warm-up call
+    """
+    function()
+    start = time.perf_counter()
+    for _ in range(frames):
+        function()
+    return (time.perf_counter() - start) * 1e3 / frames
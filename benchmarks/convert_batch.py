@@ -0,0 +1,72 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Time per batch of ImageProc.convert_batch against serial RawImage.convert calls.
+
+A burst of bayer frames is converted to RGB8 into one (N, H, W, 3) array,
+frame after frame, then by convert_batch on 1 to N threads of the shared
+thread pool.
+
+Usage: python benchmarks/convert_batch.py [--batch N] [--frames N] [--width W]
+                                          [--height H] [--threads N] [--engine E]
+Needs the Galaxy SDK for engine "dx"; with PYGXI_BACKEND=simulated the figures
+are those of the reference stand-in of dxsimulator.
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from common import make_raw_image, time_ms  # puts src on sys.path
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.ImageProc import convert_batch
+from pygxi.parallel import set_thread_pool_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch", type=int, default=16)
+    parser.add_argument("--frames", type=int, default=5)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--engine", choices=("dx", "numpy"), default="dx")
+    args = parser.parse_args()
+
+    width, height = args.width, args.height
+    rng = np.random.default_rng(0)
+    data = [
+        rng.integers(0, 256, width * height, dtype=np.uint8) for _ in range(args.batch)
+    ]
+    images = [
+        make_raw_image(frame, GxPixelFormatEntry.BAYER_RG8, width, height)
+        for frame in data
+    ]
+    out = np.empty((args.batch, height, width, 3), dtype=np.uint8)
+
+    def convert_serial():
+        for index, image in enumerate(images):
+            image.convert("RGB", out=out[index], engine=args.engine, workers=1)
+
+    serial = time_ms(convert_serial, args.frames)
+    print("%-10s %12s %12s %10s" % ("threads", "ms/batch", "ms/frame", "speedup"))
+    print("%-10s %12.2f %12.2f %10.2f" % ("serial", serial, serial / args.batch, 1.0))
+    for threads in range(1, args.threads + 1):
+        set_thread_pool_size(threads)
+        elapsed = time_ms(
+            lambda: convert_batch(
+                images, "RGB", out=out, engine=args.engine, workers=threads
+            ),
+            args.frames,
+        )
+        print(
+            "%-10d %12.2f %12.2f %10.2f"
+            % (threads, elapsed, elapsed / args.batch, serial / elapsed)
+        )
+
+
+if __name__ == "__main__":
+    main()
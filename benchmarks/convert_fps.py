@@ -0,0 +1,77 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Frames per second of RawImage.convert("RGB") for BayerRG8 images.
+
+"per-frame handle" empties the converter cache before every frame, so a
+DxImageFormatConvert handle is created, configured and destroyed for every
+frame, which is what RawImage.convert used to do.
+"cached handle" is the current RawImage.convert, which reuses the converter
+cached for the calling thread and makes a single DxImageFormatConvert call.
+
+Usage: python benchmarks/convert_fps.py [--frames N]
+Needs the DxImageProc library of the Galaxy SDK, or PYGXI_BACKEND=simulated, no camera.
+"""
+
+import argparse
+
+import numpy as np
+
+from common import make_raw_image, time_ms  # puts src on sys.path
+import pygxi.dxwrapper as dx
+from pygxi.gxidef import (
+    DxBayerConvertType,
+    DxRGBChannelOrder,
+    GxPixelFormatEntry,
+)
+from pygxi.ImageProc import _converter_cache
+
+SIZES = [
+    ("2 MP", 1920, 1080),
+    ("5 MP", 2448, 2048),
+    ("12 MP", 4096, 3000),
+]
+
+
+def convert_per_frame_handle(raw_image):
+    """
+    :brief  Convert with a new handle every frame, as RawImage.convert did before
+    """
+    _converter_cache.clear()
+    return convert_cached_handle(raw_image)
+
+
+def convert_cached_handle(raw_image):
+    return raw_image.convert(
+        "RGB",
+        convert_type=DxBayerConvertType.NEIGHBOUR,
+        channel_order=DxRGBChannelOrder.ORDER_RGB,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100)
+    args = parser.parse_args()
+
+    if getattr(dx, "dll", None) is None:
+        print("DxImageProc library not found")
+        return
+
+    print(
+        "%-8s %18s %18s %10s" % ("size", "per-frame handle", "cached handle", "speedup")
+    )
+    for label, width, height in SIZES:
+        data = np.random.randint(0, 256, width * height, dtype=np.uint8)
+        raw_image = make_raw_image(data, GxPixelFormatEntry.BAYER_RG8, width, height)
+        before = 1e3 / time_ms(lambda: convert_per_frame_handle(raw_image), args.frames)
+        after = 1e3 / time_ms(lambda: convert_cached_handle(raw_image), args.frames)
+        print(
+            "%-8s %14.1f fps %14.1f fps %9.2fx" % (label, before, after, after / before)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Per-call overhead of the ctypes wrappers, with and without bound prototypes.
+
+A stub shared library exporting every function of GX_FUNCTION_PROTOTYPES and
+DX_FUNCTION_PROTOTYPES is generated from these tables and compiled into a
+temporary directory, so no camera or SDK is needed. "before" builds the
+ctypes argument objects in Python and calls a function without argtypes, as
+the wrappers used to. "after" passes plain Python values to a function bound
+with the real prototypes by pygxi.prototypes.bind_prototypes, so a prototype
+that doesn't accept the arguments of its wrapper fails here.
+
+Usage: python benchmarks/ctypes_prototypes.py [--number N]
+Needs a C compiler, set CC to override "cc".
+"""
+
+import argparse
+import ctypes as ct
+import os
+import subprocess
+import tempfile
+import timeit
+
+import common  # noqa: F401, puts src on sys.path
+from pygxi.dxwrapper import DX_FUNCTION_PROTOTYPES
+from pygxi.gxwrapper import (
+    GX_FUNCTION_PROTOTYPES,
+    GxFrameBuffer,
+    GxFrameData,
+)
+from pygxi.prototypes import bind_prototypes
+
+STUB_PROTOTYPES = {**GX_FUNCTION_PROTOTYPES, **DX_FUNCTION_PROTOTYPES}
+
+# C types of the ctypes types used in the prototype tables, pointers are void *
+C_TYPES = {
+    ct.c_bool: "bool",
+    ct.c_char: "char",
+    ct.c_int: "int",
+    ct.c_uint: "unsigned int",
+    ct.c_int8: "int8_t",
+    ct.c_uint8: "uint8_t",
+    ct.c_int16: "int16_t",
+    ct.c_uint16: "uint16_t",
+    ct.c_int32: "int32_t",
+    ct.c_uint32: "uint32_t",
+    ct.c_int64: "int64_t",
+    ct.c_uint64: "uint64_t",
+    ct.c_long: "long",
+    ct.c_ulong: "unsigned long",
+    ct.c_longlong: "long long",
+    ct.c_ulonglong: "unsigned long long",
+    ct.c_size_t: "size_t",
+    ct.c_float: "float",
+    ct.c_double: "double",
+    ct.c_char_p: "char *",
+    ct.c_void_p: "void *",
+}
+
+HANDLE = 0x1000
+FEATURE_ID = 0x10000
+TIMEOUT = 1000
+WIDTH = 1920
+HEIGHT = 1080
+
+
+def get_c_type(ctype):
+    """
+    :brief  C declaration of a ctypes type of a prototype
+            The stub functions don't read their arguments, a structure passed by value
+            is declared as an opaque structure of the same size
+    """
+    if ctype is None:
+        return "void"
+    if issubclass(ctype, (ct._Pointer, ct._CFuncPtr, ct.py_object)):
+        return "void *"
+    if issubclass(ctype, ct.Structure):
+        return "struct_%d" % ct.sizeof(ctype)
+    if ctype in C_TYPES:
+        return C_TYPES[ctype]
+    raise TypeError("no C type for %r" % (ctype,))
+
+
+def get_stub_source(prototypes):
+    """
+    :brief  C source of a library exporting every function of prototypes, they return 0
+    """
+    structure_sizes = sorted(
+        {
+            ct.sizeof(ctype)
+            for restype, argtypes in prototypes.values()
+            for ctype in argtypes
+            if issubclass(ctype, ct.Structure)
+        }
+    )
+    lines = ["#include <stdbool.h>", "#include <stddef.h>", "#include <stdint.h>", ""]
+    for size in structure_sizes:
+        lines.append(
+            "typedef struct { unsigned char data[%d]; } struct_%d;" % (size, size)
+        )
+
+    for name, (restype, argtypes) in prototypes.items():
+        arguments = ", ".join(
+            "%s a%d" % (get_c_type(argtype), index)
+            for index, argtype in enumerate(argtypes)
+        )
+        lines.append(
+            "%s %s(%s) { return 0; }" % (get_c_type(restype), name, arguments or "void")
+        )
+    return "\n".join(lines) + "\n"
+
+
+def build_stub(directory, prototypes=STUB_PROTOTYPES):
+    source_path = os.path.join(directory, "stub.c")
+    library_path = os.path.join(directory, "libstub.so")
+    with open(source_path, "w") as source_file:
+        source_file.write(get_stub_source(prototypes))
+
+    compiler = os.environ.get("CC", "cc")
+    subprocess.check_call(
+        [compiler, "-O2", "-shared", "-fPIC", "-o", library_path, source_path]
+    )
+    return library_path
+
+
+def make_cases(generic, bound):
+    """
+    :brief  One (name, before, after) tuple per benchmarked call
+    """
+    frame_data = GxFrameData()
+    frame_buffer = ct.pointer(GxFrameBuffer())
+    input_buffer = (ct.c_ubyte * 16)()
+    output_buffer = (ct.c_ubyte * 16)()
+    input_address = ct.addressof(input_buffer)
+    output_address = ct.addressof(output_buffer)
+    converter = ct.c_void_p(HANDLE)
+
+    def get_float_before():
+        float_value = ct.c_double()
+        handle_c = ct.c_void_p()
+        handle_c.value = HANDLE
+        feature_id_c = ct.c_int()
+        feature_id_c.value = FEATURE_ID
+        status = generic.GXGetFloat(handle_c, feature_id_c, ct.byref(float_value))
+        return status, float_value.value
+
+    def get_float_after():
+        float_value = ct.c_double()
+        status = bound.GXGetFloat(HANDLE, FEATURE_ID, ct.byref(float_value))
+        return status, float_value.value
+
+    def get_image_before():
+        handle_c = ct.c_void_p()
+        handle_c.value = HANDLE
+        timeout_c = ct.c_uint()
+        timeout_c.value = TIMEOUT
+        return generic.GXGetImage(handle_c, ct.byref(frame_data), timeout_c)
+
+    def get_image_after():
+        return bound.GXGetImage(HANDLE, ct.byref(frame_data), TIMEOUT)
+
+    def q_buf_before():
+        handle_c = ct.c_void_p()
+        handle_c.value = HANDLE
+        # the old gx_q_buf re-declared the prototype on every call
+        generic.GXQBuf.argtypes = [ct.c_void_p, ct.c_void_p]
+        generic.GXQBuf.restype = ct.c_int
+        return generic.GXQBuf(handle_c, frame_buffer)
+
+    def q_buf_after():
+        return bound.GXQBuf(HANDLE, frame_buffer)
+
+    def format_convert_before():
+        input_address_p = ct.c_void_p()
+        input_address_p.value = input_address
+        output_address_p = ct.c_void_p()
+        output_address_p.value = output_address
+        width_c = ct.c_uint32()
+        width_c.value = WIDTH
+        height_c = ct.c_uint32()
+        height_c.value = HEIGHT
+        pixel_format_c = ct.c_uint()
+        pixel_format_c.value = 0x01080009
+        flip_c = ct.c_bool()
+        flip_c.value = False
+        return generic.DxImageFormatConvert(
+            converter,
+            input_address_p,
+            16,
+            output_address_p,
+            16,
+            pixel_format_c,
+            width_c,
+            height_c,
+            flip_c,
+        )
+
+    def format_convert_after():
+        return bound.DxImageFormatConvert(
+            converter,
+            input_address,
+            16,
+            output_address,
+            16,
+            0x01080009,
+            WIDTH,
+            HEIGHT,
+            False,
+        )
+
+    return [
+        ("gx_get_float", get_float_before, get_float_after),
+        ("gx_get_image", get_image_before, get_image_after),
+        ("gx_q_buf", q_buf_before, q_buf_after),
+        ("dx_image_format_convert", format_convert_before, format_convert_after),
+    ]
+
+
+def measure(function, number, repeat):
+    """
+    :brief  Best per-call time in ns over repeat runs of number calls
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        library_path = build_stub(directory)
+        # two handles on the same library, ctypes keeps one set of function
+        # objects per CDLL instance so only the second one gets prototypes
+        generic = ct.CDLL(library_path)
+        bound = ct.CDLL(library_path)
+        bind_prototypes(bound, STUB_PROTOTYPES)
+
+        print("%-26s %12s %12s %8s" % ("call", "before(ns)", "after(ns)", "speedup"))
+        for name, before, after in make_cases(generic, bound):
+            before_ns = measure(before, args.number, args.repeat)
+            after_ns = measure(after, args.number, args.repeat)
+            print(
+                "%-26s %12.1f %12.1f %7.2fx"
+                % (name, before_ns, after_ns, before_ns / after_ns)
+            )
+
+
+if __name__ == "__main__":
+    main()
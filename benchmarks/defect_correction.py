@@ -0,0 +1,93 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Time per frame of the sparse DefectPixelMap correction against a full frame scan.
+
+A defect map is built from a synthetic dark and flat frame with hot, dead and
+stuck pixels, then applied to frames with RawImage.defective_pixel_correct.
+The scan reference compares every pixel with its same-color neighbours in
+NumPy, the work of a per-frame detection. DxImageProc auto correction is timed
+when the Galaxy SDK is installed.
+
+Usage: python benchmarks/defect_correction.py [--frames N] [--width W] [--height H]
+Runs without the Galaxy SDK with PYGXI_BACKEND=simulated.
+"""
+
+import argparse
+
+import numpy as np
+
+from common import make_raw_image, time_ms  # puts src on sys.path
+from pygxi.defects import build_defect_map
+from pygxi.errors import UnexpectedError
+from pygxi.gxidef import GxPixelFormatEntry
+
+DEFECT_NUMS = [100, 1000, 10000]
+
+
+def scan_frame(values):
+    """
+    :brief  Pixels off the mean of their four same-color neighbours by more than
+            a quarter of the full scale, the cost of detecting defects every frame
+    """
+    values = values.astype(np.int32)
+    padded = np.pad(values, 2, mode="reflect")
+    height, width = values.shape
+    total = (
+        padded[:height, 2 : width + 2]
+        + padded[4:, 2 : width + 2]
+        + padded[2 : height + 2, :width]
+        + padded[2 : height + 2, 4:]
+    )
+    return np.abs(4 * values - total) > 4 * 0x3FFF
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    width, height = args.width, args.height
+    pixel_format = GxPixelFormatEntry.BAYER_RG16
+    rng = np.random.default_rng(0)
+    dark = rng.normal(1000, 50, (height, width)).astype(np.float32)
+    flat = dark + 30000
+
+    frame = np.clip(rng.normal(flat, 200), 0, 0xFFFF).astype(np.uint16)
+    data = frame.reshape(-1).view(np.uint8)
+    image = make_raw_image(data, pixel_format, width, height)
+    scan = time_ms(lambda: scan_frame(image.get_numpy_array()), args.frames)
+    try:
+        dx_time = "%.3f" % time_ms(image.defective_pixel_correct, args.frames)
+    except UnexpectedError:
+        dx_time = "n/a"
+
+    print(
+        "%-10s %12s %12s %12s %10s" % ("defects", "map ms", "scan ms", "dx ms", "found")
+    )
+    for defect_num in DEFECT_NUMS:
+        defect_dark = dark.copy()
+        defect_flat = flat.copy()
+        positions = rng.choice(width * height, defect_num, replace=False)
+        hot, dead = np.array_split(positions, 2)
+        defect_dark.flat[hot] += 20000
+        defect_flat.flat[hot] += 20000
+        defect_flat.flat[dead] = defect_dark.flat[dead]
+        defect_map = build_defect_map(
+            width, height, pixel_format, dark=defect_dark, flat=defect_flat
+        )
+        elapsed = time_ms(
+            lambda: image.defective_pixel_correct(defect_map), args.frames
+        )
+        print(
+            "%-10d %12.3f %12.3f %12s %10d"
+            % (defect_num, elapsed, scan, dx_time, len(defect_map))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Accuracy and time per frame of RawImage.convert("RGB"), DxImageProc against NumPy.
+
+A synthetic RGB scene (smooth gradients, sharp edges and a zone plate) is
+sampled through an RG bayer filter, then converted back by every engine and
+demosaic mode. Accuracy is the PSNR against the scene, 4 border pixels
+excluded; the NumPy engine is timed with one worker and with the default
+number of row bands.
+
+Usage: python benchmarks/demosaic_engines.py [--frames N] [--width W] [--height H]
+Needs the Galaxy SDK for the DxImageProc figures; with PYGXI_BACKEND=simulated
+they are those of the reference stand-in of dxsimulator.
+"""
+
+import argparse
+
+import numpy as np
+
+from common import make_raw_image, time_ms  # puts src on sys.path
+from pygxi.gxidef import (
+    DxBayerConvertType,
+    GxPixelFormatEntry,
+)
+from pygxi.parallel import get_default_workers
+from pygxi.pixelformat import pack_pixels
+
+PIXEL_FORMATS = [("BAYER_RG8", 8), ("BAYER_RG12_PACKED", 12)]
+
+CASES = [
+    ("dx NEIGHBOUR", dict(convert_type=DxBayerConvertType.NEIGHBOUR)),
+    ("dx ADAPTIVE", dict(convert_type=DxBayerConvertType.ADAPTIVE)),
+    ("numpy nearest", dict(engine="numpy", convert_type="nearest")),
+    ("numpy bilinear", dict(engine="numpy", convert_type="bilinear")),
+    ("numpy edge", dict(engine="numpy", convert_type="edge")),
+]
+
+
+def render_scene(width, height):
+    """
+    :brief  Synthetic RGB scene, np.ndarray (height, width, 3) of float in [0, 1]
+    """
+    y, x = np.mgrid[0:height, 0:width].astype(np.float64)
+    scene = np.empty((height, width, 3))
+    scene[..., 0] = 0.5 + 0.4 * np.sin(x / 37.0 + y / 53.0)
+    scene[..., 1] = 0.5 + 0.4 * np.cos(y / 41.0)
+    scene[..., 2] = 0.5 + 0.4 * np.sin((x - y) / 29.0)
+
+    # sharp edges: a checkerboard of 61 pixel squares, not aligned on the bayer cells
+    checker = (((x + 13) // 61 + (y + 7) // 61) % 2) * 0.3 - 0.15
+    scene += checker[..., np.newaxis]
+
+    # fine detail: a zone plate in the center third
+    radius2 = (x - width / 2) ** 2 + (y - height / 2) ** 2
+    zone = np.sqrt(radius2) < min(width, height) / 6
+    scene[zone] = (0.5 + 0.45 * np.cos(radius2[zone] / (min(width, height) * 2.0)))[
+        :, np.newaxis
+    ]
+    return np.clip(scene, 0, 1)
+
+
+def sample_bayer_rg(scene, data_bits):
+    """
+    :brief  Raw RG bayer values of a scene
+    """
+    values = np.round(scene * ((1 << data_bits) - 1)).astype(np.uint16)
+    raw = values[..., 1].copy()
+    raw[0::2, 0::2] = values[0::2, 0::2, 0]
+    raw[1::2, 1::2] = values[1::2, 1::2, 2]
+    return raw
+
+
+def psnr(rgb, reference):
+    error = rgb[4:-4, 4:-4].astype(np.float64) - reference[4:-4, 4:-4]
+    return 10 * np.log10(255.0**2 / max(np.mean(error**2), 1e-12))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    width, height = args.width, args.height
+    workers = get_default_workers(width * height)
+    scene = render_scene(width, height)
+    reference = np.round(scene * 255)
+    out = np.empty((height, width, 3), dtype=np.uint8)
+
+    print(
+        "%-18s %-16s %10s %12s %14s"
+        % ("format", "engine", "PSNR(dB)", "ms/frame", "ms %d bands" % workers)
+    )
+    for name, data_bits in PIXEL_FORMATS:
+        pixel_format = getattr(GxPixelFormatEntry, name)
+        data = pack_pixels(sample_bayer_rg(scene, data_bits), pixel_format)
+        image = make_raw_image(data, pixel_format, width, height)
+        valid_bits = data_bits - 8
+
+        for label, options in CASES:
+            rgb = image.convert("RGB", valid_bits=valid_bits, out=out, **options)
+            if rgb is None:
+                print("%-18s %-16s %10s" % (name, label, "n/a"))
+                continue
+
+            accuracy = psnr(rgb, reference)
+            single = time_ms(
+                lambda: image.convert(
+                    "RGB", valid_bits=valid_bits, out=out, workers=1, **options
+                ),
+                args.frames,
+            )
+            if options.get("engine") == "numpy":
+                bands = "%.2f" % time_ms(
+                    lambda: image.convert(
+                        "RGB",
+                        valid_bits=valid_bits,
+                        out=out,
+                        workers=workers,
+                        **options,
+                    ),
+                    args.frames,
+                )
+            else:
+                bands = "-"
+            print(
+                "%-18s %-16s %10.2f %12.2f %14s"
+                % (name, label, accuracy, single, bands)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Number of GxIAPI calls and time spent per open_device_by_* call.
+
+Every device found is opened by index and by serial number. The calls made
+by the open are counted, then every attribute listed in Device.FEATURES is
+touched and its name read, which is what opening a device used to cost when
+the feature objects were created eagerly.
+
+Usage: python benchmarks/device_startup.py [--timeout MS]
+Needs the Galaxy SDK and at least one connected camera, or PYGXI_BACKEND=simulated.
+"""
+
+import argparse
+import collections
+import time
+
+import common  # noqa: F401, puts src on sys.path
+import pygxi.gxwrapper as gx
+from pygxi.DeviceManager import DeviceManager
+
+
+class CountingLibrary:
+    """
+    :brief  Stand-in for gxwrapper.dll that counts the calls per exported function
+    """
+
+    def __init__(self, library):
+        self.library = library
+        self.counter = collections.Counter()
+
+    def __getattr__(self, name):
+        function = getattr(self.library, name)
+        counter = self.counter
+
+        def counted(*args):
+            counter[name] += 1
+            return function(*args)
+
+        return counted
+
+
+def touch_features(device):
+    """
+    :brief  Create every feature attribute and read its name
+    """
+    for name in type(device).FEATURES:
+        getattr(device, name).feature_name
+
+
+def measure(library, open_device):
+    library.counter.clear()
+    start = time.perf_counter()
+    device = open_device()
+    open_time = time.perf_counter() - start
+    open_calls = sum(library.counter.values())
+
+    library.counter.clear()
+    start = time.perf_counter()
+    touch_features(device)
+    eager_time = time.perf_counter() - start
+    eager_calls = sum(library.counter.values())
+
+    device.close_device()
+    return open_calls, open_time, eager_calls, eager_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--timeout", type=int, default=1000)
+    args = parser.parse_args()
+
+    device_manager = DeviceManager()
+    device_num, device_info_list = device_manager.update_device_list(args.timeout)
+    if device_num == 0:
+        print("No device found")
+        return
+
+    library = CountingLibrary(gx.dll)
+    gx.dll = library
+
+    print(
+        "%-28s %10s %10s %14s %14s"
+        % ("open", "C calls", "time(ms)", "+features", "+features(ms)")
+    )
+    for index, device_info in enumerate(device_info_list, start=1):
+        sn = device_info["sn"]
+        cases = [
+            (
+                "open_device_by_index(%d)" % index,
+                lambda: device_manager.open_device_by_index(index),
+            ),
+            (
+                "open_device_by_sn(%s)" % sn,
+                lambda: device_manager.open_device_by_sn(sn),
+            ),
+        ]
+        for label, open_device in cases:
+            open_calls, open_time, eager_calls, eager_time = measure(
+                library, open_device
+            )
+            print(
+                "%-28s %10d %10.2f %14d %14.2f"
+                % (label, open_calls, open_time * 1e3, eager_calls, eager_time * 1e3)
+            )
+
+
+if __name__ == "__main__":
+    main()
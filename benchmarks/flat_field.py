@@ -0,0 +1,106 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Time per frame of the flat field calibration and of the NumPy flat field correction.
+
+Vignetted bayer frames with noise are added to a FlatFieldCalibration, the
+coefficients are saved and mapped back, then the frames are corrected with
+RawImage.flat_field_correction(out=...) on one worker and on the default number
+of row bands. The residual is the relative standard deviation of a corrected
+noiseless frame, per color plane.
+
+Usage: python benchmarks/flat_field.py [--frames N] [--width W] [--height H]
+Runs without the Galaxy SDK with PYGXI_BACKEND=simulated.
+"""
+
+import argparse
+import tempfile
+
+import numpy as np
+
+from common import make_raw_image, time_ms  # puts src on sys.path
+from pygxi.flatfield import FlatFieldCalibration, load_coefficients
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.parallel import get_default_workers
+from pygxi.pixelformat import pack_pixels
+
+PIXEL_FORMATS = [("BAYER_RG8", 8), ("BAYER_RG12_PACKED", 12), ("BAYER_RG16", 16)]
+
+
+def plane_residual(values):
+    return max(
+        values[y::2, x::2].std() / values[y::2, x::2].mean()
+        for y in (0, 1)
+        for x in (0, 1)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    width, height = args.width, args.height
+    workers = get_default_workers(width * height)
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:height, 0:width]
+    radius2 = ((x - width / 2) ** 2 + (y - height / 2) ** 2) / (
+        (width / 2) ** 2 + (height / 2) ** 2
+    )
+    vignetting = 1 - 0.4 * radius2
+
+    print(
+        "%-18s %12s %12s %14s %10s %10s"
+        % ("format", "add ms", "correct ms", "ms %d bands" % workers, "before", "after")
+    )
+    for name, data_bits in PIXEL_FORMATS:
+        pixel_format = getattr(GxPixelFormatEntry, name)
+        max_value = (1 << data_bits) - 1
+        scene = 0.7 * max_value * vignetting + 0.05 * max_value
+        noisy = np.clip(rng.normal(scene, 0.01 * max_value), 0, max_value)
+        data = pack_pixels(noisy.astype(np.uint16), pixel_format)
+        image = make_raw_image(data, pixel_format, width, height)
+
+        calibration = FlatFieldCalibration(width, height, pixel_format)
+        add_time = time_ms(lambda: calibration.add_bright(image), args.frames)
+        calibration.add_dark(np.full((height, width), 0.05 * max_value))
+
+        with tempfile.TemporaryDirectory() as directory:
+            calibration.get_coefficients(serial="bench").save(directory)
+            coefficients = load_coefficients(
+                directory, "bench", (0, 0, width, height), pixel_format
+            )
+            clean = pack_pixels(np.round(scene).astype(np.uint16), pixel_format)
+            clean_image = make_raw_image(clean, pixel_format, width, height)
+            before = clean_image.get_numpy_array()
+            out = np.empty_like(before)
+
+            single = time_ms(
+                lambda: image.flat_field_correction(coefficients, out, workers=1),
+                args.frames,
+            )
+            bands = time_ms(
+                lambda: image.flat_field_correction(coefficients, out, workers),
+                args.frames,
+            )
+            clean_image.flat_field_correction(coefficients, out)
+            print(
+                "%-18s %12.2f %12.2f %14.2f %10.4f %10.4f"
+                % (
+                    name,
+                    add_time,
+                    single,
+                    bands,
+                    plane_residual(before.astype(np.float64)),
+                    plane_residual(out.astype(np.float64)),
+                )
+            )
+            del coefficients
+
+
+if __name__ == "__main__":
+    main()
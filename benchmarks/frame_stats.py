@@ -0,0 +1,79 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Cost per megapixel of FrameStatisticsEngine.process against np.histogram.
+
+The reference reads the whole frame with RawImage.get_numpy_array and runs
+np.histogram on every CFA plane. The engine bins strided views of the raw
+data with np.bincount, for every subsampling step; the mean error is against
+the full frame mean.
+
+Usage: python benchmarks/frame_stats.py [--frames N] [--width W] [--height H]
+Runs without the Galaxy SDK with PYGXI_BACKEND=simulated.
+"""
+
+import argparse
+
+import numpy as np
+
+from common import make_raw_image, time_ms  # puts src on sys.path
+from pygxi.framestats import FrameStatisticsEngine
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.pixelformat import pack_pixels
+
+PIXEL_FORMATS = [("BAYER_RG8", 8), ("BAYER_RG12_PACKED", 12), ("BAYER_RG16", 16)]
+STEPS = [1, 2, 4, 8]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    width, height = args.width, args.height
+    megapixels = width * height / 1e6
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:height, 0:width]
+    scene = 0.5 + 0.4 * np.sin(x / 97.0) * np.cos(y / 61.0)
+
+    print(
+        "%-18s %-12s %12s %12s %12s"
+        % ("format", "case", "ms/frame", "ms/MP", "mean error")
+    )
+    for name, data_bits in PIXEL_FORMATS:
+        pixel_format = getattr(GxPixelFormatEntry, name)
+        max_value = (1 << data_bits) - 1
+        noisy = np.clip(rng.normal(scene, 0.02) * max_value, 0, max_value)
+        data = pack_pixels(noisy.astype(np.uint16), pixel_format)
+        image = make_raw_image(data, pixel_format, width, height)
+        exact_mean = image.get_numpy_array().mean()
+
+        def reference():
+            values = image.get_numpy_array()
+            return [
+                np.histogram(values[dy::2, dx::2], bins=256, range=(0, max_value + 1))
+                for dy in (0, 1)
+                for dx in (0, 1)
+            ]
+
+        elapsed = time_ms(reference, args.frames)
+        print(
+            "%-18s %-12s %12.2f %12.2f %12s"
+            % (name, "np.histogram", elapsed, elapsed / megapixels, "-")
+        )
+        for step in STEPS:
+            engine = FrameStatisticsEngine(step=step)
+            elapsed = time_ms(lambda: engine.process(image), args.frames)
+            error = abs(engine.get_last().mean / exact_mean - 1)
+            print(
+                "%-18s %-12s %12.2f %12.2f %12.4f"
+                % (name, "step %d" % step, elapsed, elapsed / megapixels, error)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Time of RawImage.convert(roi=...) and convert_rois against the whole frame.
+
+A large bayer frame is converted to RGB8 whole, then only a ROI of every
+size, then a set of ROIs by convert_rois. Every ROI is checked against the
+same region of the whole frame.
+
+Usage: python benchmarks/roi_convert.py [--frames N] [--width W] [--height H]
+                                        [--engine E]
+Needs the Galaxy SDK for engine "dx"; with PYGXI_BACKEND=simulated the figures
+are those of the reference stand-in of dxsimulator.
+"""
+
+import argparse
+
+import numpy as np
+
+from common import make_raw_image, time_ms  # puts src on sys.path
+from pygxi.gxidef import GxPixelFormatEntry
+
+ROI_SIZES = [16, 64, 256]
+ROI_NUM = 16
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--width", type=int, default=4096)
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--engine", choices=("dx", "numpy"), default="dx")
+    args = parser.parse_args()
+
+    width, height = args.width, args.height
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 256, width * height, dtype=np.uint8)
+    image = make_raw_image(data, GxPixelFormatEntry.BAYER_RG8, width, height)
+    whole = np.empty((height, width, 3), dtype=np.uint8)
+
+    def convert(**options):
+        return image.convert("RGB", engine=args.engine, **options)
+
+    if convert(out=whole) is None:
+        print("RawImage.convert failed")
+        return
+    whole_time = time_ms(lambda: convert(out=whole), args.frames)
+
+    print("%-22s %12s %10s %10s" % ("case", "ms", "speedup", "identical"))
+    print("%-22s %12.3f %10.1f %10s" % ("whole frame", whole_time, 1.0, "-"))
+    for size in ROI_SIZES:
+        roi = ((width - size) // 2 + 1, (height - size) // 2 + 1, size, size)
+        x, y = roi[:2]
+        identical = np.array_equal(convert(roi=roi), whole[y : y + size, x : x + size])
+        elapsed = time_ms(lambda: convert(roi=roi), args.frames)
+        print(
+            "%-22s %12.3f %10.1f %10s"
+            % ("roi %dx%d" % (size, size), elapsed, whole_time / elapsed, identical)
+        )
+
+    size = ROI_SIZES[1]
+    rois = [
+        (
+            int(rng.integers(0, width - size)),
+            int(rng.integers(0, height - size)),
+            size,
+            size,
+        )
+        for _ in range(ROI_NUM)
+    ]
+    stacked = image.convert_rois("RGB", rois, engine=args.engine, stack=True)
+    identical = all(
+        np.array_equal(region, whole[y : y + size, x : x + size])
+        for region, (x, y, _, _) in zip(stacked, rois)
+    )
+    elapsed = time_ms(
+        lambda: image.convert_rois("RGB", rois, engine=args.engine, out=stacked),
+        args.frames,
+    )
+    print(
+        "%-22s %12.3f %10.1f %10s"
+        % (
+            "%d rois %dx%d" % (ROI_NUM, size, size),
+            elapsed,
+            whole_time / elapsed,
+            identical,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Frames per second of the acquisition paths of DataStream, on the simulated backend.
+
+The simulated camera runs with an unlimited frame rate, so a frame is ready
+whenever a driver buffer is free and the figures are the cost of pygxi
+itself: get_image, dq_buf (copy and zero-copy), dq_bufs and
+RawImage.convert("RGB") with the reference DxImageProc stand-in.
+
+Usage: python benchmarks/simulated_acquisition.py [--frames N] [--width W] [--height H]
+Needs no SDK and no camera, PYGXI_BACKEND is set to simulated by this script.
+"""
+
+import argparse
+import os
+import time
+
+os.environ["PYGXI_BACKEND"] = "simulated"
+import common  # noqa: F401, puts src on sys.path
+import pygxi.gxwrapper as gx
+from pygxi.DeviceManager import DeviceManager
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.gxsimulator import SimulatedCamera
+
+
+def get_image(data_stream, frames):
+    for _ in range(frames):
+        data_stream.get_image()
+
+
+def dq_buf(data_stream, frames, zero_copy=False):
+    for _ in range(frames):
+        data_stream.q_buf(data_stream.dq_buf(zero_copy=zero_copy))
+
+
+def dq_buf_zero_copy(data_stream, frames):
+    dq_buf(data_stream, frames, zero_copy=True)
+
+
+def dq_bufs(data_stream, frames):
+    out = None
+    for _ in range(frames // 4):
+        out, _metadata = data_stream.dq_bufs(4, out=out)
+
+
+def get_image_convert(data_stream, frames):
+    for _ in range(frames):
+        data_stream.get_image().convert("RGB")
+
+
+CASES = [
+    ("get_image", get_image),
+    ("dq_buf", dq_buf),
+    ("dq_buf zero_copy", dq_buf_zero_copy),
+    ("dq_bufs(4)", dq_bufs),
+    ("get_image + convert", get_image_convert),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    gx.dll.set_cameras(
+        [
+            SimulatedCamera(
+                width=args.width,
+                height=args.height,
+                pixel_format=GxPixelFormatEntry.BAYER_RG8,
+                frame_rate=None,
+            )
+        ]
+    )
+    device_manager = DeviceManager()
+    device_manager.update_device_list()
+    device = device_manager.open_device_by_index(1)
+    data_stream = device.data_stream[0]
+    device.stream_on()
+
+    print("%-22s %12s" % ("path", "fps"))
+    for label, case in CASES:
+        case(data_stream, 4)
+        start = time.perf_counter()
+        case(data_stream, args.frames)
+        print("%-22s %12.1f" % (label, args.frames / (time.perf_counter() - start)))
+
+    device.stream_off()
+    device.close_device()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Time per frame of TemporalStatistics.add against per-frame float conversions.
+
+The reference converts every frame to float64 and adds it and its square to
+running sums, plus np.minimum/np.maximum, the usual way of averaging frames in
+Python. TemporalStatistics updates float32 mean and variance in place, on one
+worker and on the default number of row bands.
+
+Usage: python benchmarks/temporal_stats.py [--frames N] [--width W] [--height H]
+Runs without the Galaxy SDK with PYGXI_BACKEND=simulated.
+"""
+
+import argparse
+
+import numpy as np
+
+from common import make_raw_image, time_ms  # puts src on sys.path
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.parallel import get_default_workers
+from pygxi.pixelformat import pack_pixels
+from pygxi.temporal import TemporalStatistics
+
+PIXEL_FORMATS = [("BAYER_RG8", 8), ("BAYER_RG12_PACKED", 12), ("BAYER_RG16", 16)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    width, height = args.width, args.height
+    workers = get_default_workers(width * height)
+    rng = np.random.default_rng(0)
+
+    print(
+        "%-18s %12s %12s %14s %10s"
+        % ("format", "float64 ms", "add ms", "ms %d bands" % workers, "speedup")
+    )
+    for name, data_bits in PIXEL_FORMATS:
+        pixel_format = getattr(GxPixelFormatEntry, name)
+        values = rng.integers(0, 1 << data_bits, (height, width), dtype=np.uint16)
+        data = pack_pixels(values, pixel_format)
+        image = make_raw_image(data, pixel_format, width, height)
+
+        total = np.zeros((height, width))
+        total2 = np.zeros((height, width))
+        minimum = image.get_numpy_array().copy()
+        maximum = minimum.copy()
+
+        def add_reference():
+            frame = image.get_numpy_array()
+            value = frame.astype(np.float64)
+            np.add(total, value, out=total)
+            np.add(total2, value * value, out=total2)
+            np.minimum(minimum, frame, out=minimum)
+            np.maximum(maximum, frame, out=maximum)
+
+        statistics = TemporalStatistics(width, height, pixel_format)
+        reference = time_ms(add_reference, args.frames)
+        single = time_ms(lambda: statistics.add(image, workers=1), args.frames)
+        bands = time_ms(lambda: statistics.add(image, workers=workers), args.frames)
+        print(
+            "%-18s %12.2f %12.2f %14.2f %10.2f"
+            % (name, reference, single, bands, reference / min(single, bands))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Scaling of the tiled DxImageProc conversion of RawImage.convert with the thread count.
+
+A bayer frame is converted to RGB8 in one call, then in bands on 1 to N
+threads of the shared thread pool; the speedup is against the single call.
+The tiled output is checked against the single call.
+
+Usage: python benchmarks/tiled_convert.py [--frames N] [--width W] [--height H]
+                                          [--threads N] [--band-height ROWS]
+Needs the Galaxy SDK; with PYGXI_BACKEND=simulated the figures are those of
+the reference stand-in of dxsimulator.
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from common import make_raw_image, time_ms  # puts src on sys.path
+from pygxi.gxidef import (
+    DxBayerConvertType,
+    GxPixelFormatEntry,
+)
+from pygxi.parallel import set_thread_pool_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--band-height", type=int, default=None)
+    args = parser.parse_args()
+
+    width, height = args.width, args.height
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 256, width * height, dtype=np.uint8)
+    image = make_raw_image(data, GxPixelFormatEntry.BAYER_RG8, width, height)
+    out = np.empty((height, width, 3), dtype=np.uint8)
+    reference = np.empty_like(out)
+
+    def convert(workers, output):
+        return image.convert(
+            "RGB",
+            convert_type=DxBayerConvertType.ADAPTIVE,
+            out=output,
+            workers=workers,
+            band_height=args.band_height if workers is not None else None,
+        )
+
+    if convert(None, reference) is None:
+        print("RawImage.convert failed")
+        return
+    single = time_ms(lambda: convert(None, out), args.frames)
+
+    print("%-10s %12s %10s %10s" % ("threads", "ms/frame", "speedup", "identical"))
+    print("%-10s %12.2f %10.2f %10s" % ("one call", single, 1.0, "-"))
+    for threads in range(1, args.threads + 1):
+        set_thread_pool_size(threads)
+        elapsed = time_ms(lambda: convert(threads, out), args.frames)
+        print(
+            "%-10d %12.2f %10.2f %10s"
+            % (threads, elapsed, single / elapsed, np.array_equal(out, reference))
+        )
+
+
+if __name__ == "__main__":
+    main()
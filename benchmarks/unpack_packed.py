@@ -0,0 +1,94 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Time per frame of the NumPy unpackers of pixelformat against DxImageProc.
+
+Every packed mono format is unpacked to uint16 by unpack_pixels, allocating
+the result and into a preallocated out=, with one worker and with the default
+number of row bands. MONO10_PACKED and MONO12_PACKED are also unpacked by
+dx_raw10_packed_to_raw16 and dx_raw12_packed_to_raw16.
+
+Usage: python benchmarks/unpack_packed.py [--frames N] [--width W] [--height H]
+Needs the Galaxy SDK for the DxImageProc figures, n/a without it or with
+PYGXI_BACKEND=simulated.
+"""
+
+import argparse
+
+import numpy as np
+
+from common import time_ms  # puts src on sys.path
+import pygxi.dxwrapper as dx
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.parallel import get_default_workers
+from pygxi.pixelformat import (
+    get_pixel_format_layout,
+    pack_pixels,
+    unpack_pixels,
+)
+
+PIXEL_FORMATS = [
+    ("MONO10_PACKED", "dx_raw10_packed_to_raw16"),
+    ("MONO12_PACKED", "dx_raw12_packed_to_raw16"),
+    ("MONO10_P", None),
+    ("MONO12_P", None),
+    ("MONO14_P", None),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    width, height = args.width, args.height
+    workers = get_default_workers(width * height)
+    rng = np.random.default_rng(0)
+    out = np.empty((height, width), dtype=np.uint16)
+
+    print(
+        "%-16s %10s %10s %14s %14s"
+        % ("ms/frame", "numpy", "numpy out", "out %d bands" % workers, "DxImageProc")
+    )
+    for name, dx_function_name in PIXEL_FORMATS:
+        pixel_format = getattr(GxPixelFormatEntry, name)
+        data_bits = get_pixel_format_layout(pixel_format).data_bits
+        values = rng.integers(0, 1 << data_bits, (height, width), dtype=np.uint16)
+        data = pack_pixels(values, pixel_format)
+
+        numpy_time = time_ms(
+            lambda: unpack_pixels(data, pixel_format, width, height, workers=1),
+            args.frames,
+        )
+        out_time = time_ms(
+            lambda: unpack_pixels(data, pixel_format, width, height, out, 1),
+            args.frames,
+        )
+        bands_time = time_ms(
+            lambda: unpack_pixels(data, pixel_format, width, height, out, workers),
+            args.frames,
+        )
+
+        dx_time = "n/a"
+        dx_function = getattr(dx, str(dx_function_name), None)
+        if (
+            dx_function is not None
+            and dx_function(data.ctypes.data, out.ctypes.data, width, height)
+            == dx.DxStatus.OK
+        ):
+            dx_time = "%.2f" % time_ms(
+                lambda: dx_function(data.ctypes.data, out.ctypes.data, width, height),
+                args.frames,
+            )
+        print(
+            "%-16s %10.2f %10.2f %14.2f %14s"
+            % (name, numpy_time, out_time, bands_time, dx_time)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Time per frame of the raw white balance estimate against the RGB24 path.
+
+A bayer frame of a gray scene under colored light is converted to RGB24 and
+measured by RGBImage.get_white_balance_ratio (DxImageProc) or, without the
+Galaxy SDK, by the channel means of the RGB array. RawImage.get_white_balance_ratio
+measures the raw data with every step of subsampling. The error is against
+the gains of the light.
+
+Usage: python benchmarks/white_balance.py [--frames N] [--width W] [--height H]
+Runs without the Galaxy SDK with PYGXI_BACKEND=simulated.
+"""
+
+import argparse
+
+import numpy as np
+
+from common import make_raw_image, time_ms  # puts src on sys.path
+from pygxi.errors import UnexpectedError
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.pixelformat import pack_pixels
+
+PIXEL_FORMATS = [("BAYER_RG8", 8), ("BAYER_RG12_PACKED", 12), ("BAYER_RG16", 16)]
+STEPS = [1, 4, 16]
+LIGHT = (0.55, 1.0, 0.75)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    width, height = args.width, args.height
+    rng = np.random.default_rng(0)
+    gray = rng.uniform(0.1, 0.9, (height // 2, width // 2))
+    expected = np.array([1 / LIGHT[0], 1.0, 1 / LIGHT[2]])
+
+    print("%-18s %-12s %12s %10s" % ("format", "case", "us/frame", "error"))
+    for name, data_bits in PIXEL_FORMATS:
+        pixel_format = getattr(GxPixelFormatEntry, name)
+        max_value = (1 << data_bits) - 1
+        raw = np.empty((height, width))
+        raw[0::2, 0::2] = gray * LIGHT[0]
+        raw[0::2, 1::2] = gray * LIGHT[1]
+        raw[1::2, 0::2] = gray * LIGHT[1]
+        raw[1::2, 1::2] = gray * LIGHT[2]
+        data = pack_pixels(np.round(raw * max_value).astype(np.uint16), pixel_format)
+        image = make_raw_image(data, pixel_format, width, height)
+        rgb = np.empty((height, width, 3), dtype=np.uint8)
+
+        def measure_rgb():
+            rgb_image = image.convert("RGB")
+            try:
+                return rgb_image.get_white_balance_ratio()
+            except UnexpectedError:
+                means = image.convert(
+                    "RGB", valid_bits=data_bits - 8, out=rgb, engine="numpy"
+                ).mean(axis=(0, 1))
+                return means[1] / means[0], 1.0, means[1] / means[2]
+
+        cases = [("rgb24", measure_rgb)]
+        cases += [
+            (
+                "raw step %d" % step,
+                lambda step=step: image.get_white_balance_ratio(step=step),
+            )
+            for step in STEPS
+        ]
+        for label, measure in cases:
+            error = np.abs(np.array(measure()) / expected - 1).max()
+            print(
+                "%-18s %-12s %12.1f %10.4f"
+                % (name, label, 1e3 * time_ms(measure, args.frames), error)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import asyncio
+import collections
+import threading
+
+from .errors import InvalidParameterError, ParameterTypeError
+
+
+class AsyncFrameQueue:
+    def __init__(self, loop, queue_depth):
+        """
+        :brief  Constructor for instance initialization, a bounded queue filled from the
+                SDK capture callback thread and read from an asyncio event loop
+        :param loop:            event loop the frames are consumed in
+        :param queue_depth:     maximum number of queued frames, range:[1, ...]
+        """
+        if not isinstance(queue_depth, int):
+            raise ParameterTypeError(
+                "AsyncFrameQueue.__init__: "
+                "Expected queue_depth type is int, not %s" % type(queue_depth)
+            )
+
+        if queue_depth < 1:
+            raise InvalidParameterError(
+                "AsyncFrameQueue.__init__: queue_depth must be positive"
+            )
+
+        self.__loop = loop
+        self.__queue_depth = queue_depth
+        self.__frames = collections.deque()
+        self.__condition = threading.Condition()
+        self.__event = asyncio.Event()
+        self.__closed = False
+        self.__blocked_count = 0
+
+    def put(self, image):
+        """
+        :brief      Copy a frame into the queue, called from the capture callback thread
+                    When the queue is full the callback waits, so the SDK keeps the
+                    buffer until the consumer catches up
+        :param      image:  image object valid for the duration of the call
+        :return:    True if the frame was queued, False if the queue is closed
+        """
+        with self.__condition:
+            if len(self.__frames) >= self.__queue_depth:
+                self.__blocked_count += 1
+                while len(self.__frames) >= self.__queue_depth and not self.__closed:
+                    self.__condition.wait()
+
+            if self.__closed:
+                return False
+
+            self.__frames.append(image.copy())
+
+        try:
+            # wakes the loop through its self-pipe
+            self.__loop.call_soon_threadsafe(self.__event.set)
+        except RuntimeError:
+            # the event loop is closed, nobody will consume the frames any more
+            self.close()
+            return False
+        return True
+
+    async def get(self, timeout=None):
+        """
+        :brief      Wait for the oldest frame
+        :param      timeout:    maximum wait time in ms, None waits until a frame arrives
+        :return:    image object, None on timeout or when the queue is closed and empty
+        """
+        deadline = None
+        if timeout is not None:
+            deadline = self.__loop.time() + timeout / 1000
+
+        while True:
+            with self.__condition:
+                if self.__frames:
+                    image = self.__frames.popleft()
+                    self.__condition.notify_all()
+                    return image
+
+                if self.__closed:
+                    return None
+
+                # cleared under the lock, a frame put after this sets the event again
+                self.__event.clear()
+
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - self.__loop.time(), 0)
+
+            try:
+                await asyncio.wait_for(self.__event.wait(), remaining)
+            except asyncio.TimeoutError:
+                return None
+
+    def close(self):
+        """
+        :brief      Release a waiting capture callback and wake up the consumers
+        :return:    None
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+        try:
+            self.__loop.call_soon_threadsafe(self.__event.set)
+        except RuntimeError:
+            pass
+
+    def get_size(self):
+        """
+        :brief      Get the number of queued frames
+        :return:    queued frame number
+        """
+        return len(self.__frames)
+
+    def get_queue_depth(self):
+        """
+        :brief      Get the maximum number of queued frames
+        :return:    queue depth
+        """
+        return self.__queue_depth
+
+    def get_blocked_count(self):
+        """
+        :brief      Get how many times the capture callback had to wait for the consumer
+        :return:    blocked number
+        """
+        return self.__blocked_count
@@ -2,19 +2,43 @@
 # -*- coding:utf-8 -*-
 # -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
 
+import asyncio
 import ctypes
+import threading
 import types
 from typing import Any
 
+import numpy as np
+
 import pygxi.Feature as feat
 import pygxi.gxwrapper as gx
 
-from .errors import InvalidCallError, ParameterTypeError
+from .AsyncFrameQueue import AsyncFrameQueue
+from .errors import InvalidCallError, InvalidParameterError, ParameterTypeError
 from .FeatureControl import FeatureControl
-from .gxidef import UNSIGNED_INT_MAX, UNSIGNED_LONG_LONG_MAX
+from .FrameBufferPool import FrameBufferPool
+from .FrameQueue import FrameQueue
+from .framestats import FrameStatisticsEngine
+from .gxidef import (
+    GX_PIXEL_8BIT,
+    GX_PIXEL_16BIT,
+    PIXEL_BIT_MASK,
+    UNSIGNED_INT_MAX,
+    UNSIGNED_LONG_LONG_MAX,
+    GxPixelFormatEntry,
+    GxQueueOverflowPolicy,
+)
 from .ImageProc import RawImage
 from .status import check_return_status
 
+# DQBuf timeout of the grabbing thread, bounds the time stop_grabbing waits
+GRAB_POLL_TIMEOUT = 100
+
+# per-frame metadata returned by DataStream.dq_bufs
+FRAME_METADATA_DTYPE = np.dtype(
+    [("frame_id", np.uint64), ("timestamp", np.uint64), ("status", np.int32)]
+)
+
 
 class DataStream:
     def __init__(self, dev_handle, stream_handle) -> None:
@@ -51,6 +75,16 @@ class DataStream:
         self.__data_stream_handle = stream_handle
         self.__stream_feature_control = FeatureControl(stream_handle)
         self.__frame_buf_map: dict[int, Any] = {}
+        self.__frame_buffer_pool_size = 0
+        self.__frame_buffer_pool: FrameBufferPool | None = None
+        self.__pool_images: dict[RawImage, tuple[FrameBufferPool, int]] = {}
+        self.__frame_queue: FrameQueue | None = None
+        self.__grab_thread: threading.Thread | None = None
+        self.__grab_stop_event = threading.Event()
+        self.__grab_error: Exception | None = None
+        self.__async_frame_queue: AsyncFrameQueue | None = None
+        self.__frame_statistics: FrameStatisticsEngine | None = None
+        self.__frame_statistics_error: Exception | None = None
 
     def get_feature_control(self) -> FeatureControl:
         """
@@ -68,9 +102,178 @@ class DataStream:
         check_return_status(status, "DataStreamHandle", "get_payload_size")
         return stream_payload_size
 
+    def set_payload_size(self, payload_size):
+        """
+        :brief      Set the payload size used to allocate images, called at stream on
+                    The frame buffer pool is reallocated when the payload size changes
+        :param      payload_size:   payload size in bytes
+        :return:    none
+        """
+        if not isinstance(payload_size, int):
+            raise ParameterTypeError(
+                "DataStream.set_payload_size: "
+                "Expected payload_size type is int, not %s" % type(payload_size)
+            )
+
+        self.payload_size = payload_size
+        self.__update_frame_buffer_pool()
+
+    def set_frame_buffer_pool_size(self, buf_num):
+        """
+        :brief      Set the number of preallocated payload-sized buffers filled round-robin by get_image
+                    Images got from the pool must be given back with release_image
+        :param      buf_num:    the number of buffers, 0 disables the pool, range:[0, 0xFFFFFFFF]
+        :return:    none
+        """
+        if not isinstance(buf_num, int):
+            raise ParameterTypeError(
+                "DataStream.set_frame_buffer_pool_size: "
+                "Expected buf_num type is int, not %s" % type(buf_num)
+            )
+
+        if (buf_num < 0) or (buf_num > UNSIGNED_INT_MAX):
+            print(
+                "DataStream.set_frame_buffer_pool_size: "
+                "buf_num out of bounds, minimum=0, maximum=%s"
+                % hex(UNSIGNED_INT_MAX).__str__()
+            )
+            return
+
+        self.__frame_buffer_pool_size = buf_num
+        self.__update_frame_buffer_pool()
+
+    def get_frame_buffer_pool(self):
+        """
+        :brief      Get the frame buffer pool, it holds the free number and exhaustion counters
+        :return:    FrameBufferPool object, None when the pool is disabled or stream is not on
+        """
+        return self.__frame_buffer_pool
+
+    def set_frame_statistics(self, engine):
+        """
+        :brief      Attach a statistics engine, it measures every complete frame returned by
+                    get_image, dq_buf, retrieve and the capture callback before it is returned,
+                    and the frames of aget_image and aiter_frames on the consumer side
+        :param      engine:     FrameStatisticsEngine object, None detaches it
+        :return:    none
+        """
+        if engine is not None and not isinstance(engine, FrameStatisticsEngine):
+            raise ParameterTypeError(
+                "DataStream.set_frame_statistics: "
+                "Expected engine type is FrameStatisticsEngine, not %s" % type(engine)
+            )
+
+        self.__frame_statistics = engine
+        self.__frame_statistics_error = None
+
+    def get_frame_statistics(self):
+        """
+        :brief      Get the statistics of the last frame measured by the attached engine
+                    A failure of the engine is raised once, by the next call
+        :return:    FrameStatistics object, None without engine or before the first frame
+        """
+        error = self.__frame_statistics_error
+        if error is not None:
+            self.__frame_statistics_error = None
+            raise error
+
+        engine = self.__frame_statistics
+        if engine is None:
+            return None
+        return engine.get_last()
+
+    def __measure(self, image):
+        """
+        :brief      Measure an image with the attached statistics engine
+                    It runs on the acquisition and callback threads, a failure is kept for
+                    get_frame_statistics instead of being raised into them
+        :param      image:  image object
+        :return:    image
+        """
+        engine = self.__frame_statistics
+        if engine is not None and image is not None:
+            try:
+                engine.process(image)
+            except Exception as error:
+                self.__frame_statistics_error = error
+        return image
+
+    def release_image(self, image):
+        """
+        :brief      Give an image got by get_image back to the frame buffer pool
+                    The image can't be accessed any more, call copy() before to keep the data
+        :param      image:  image object returned by get_image
+        :return:    none
+        """
+        if not isinstance(image, RawImage):
+            raise ParameterTypeError(
+                "DataStream.release_image: "
+                "Expected image type is RawImage, not %s" % type(image)
+            )
+
+        try:
+            frame_buffer_pool, index = self.__pool_images.pop(image)
+        except KeyError:
+            raise InvalidParameterError(
+                "DataStream.release_image: image is not from the frame buffer pool "
+                "or has already been released"
+            )
+
+        image.invalidate_buffer()
+        frame_buffer_pool.release(index)
+
+    def __update_frame_buffer_pool(self):
+        """
+        :brief      Allocate the frame buffer pool for the current payload size and pool size
+                    Images still out keep a reference to the pool they were taken from
+        :return:    none
+        """
+        if self.__frame_buffer_pool_size == 0 or self.payload_size <= 0:
+            self.__frame_buffer_pool = None
+            return
+
+        if (
+            self.__frame_buffer_pool is not None
+            and self.__frame_buffer_pool.get_buffer_num()
+            == self.__frame_buffer_pool_size
+            and self.__frame_buffer_pool.get_buffer_size() == self.payload_size
+        ):
+            return
+
+        self.__frame_buffer_pool = FrameBufferPool(
+            self.__frame_buffer_pool_size, self.payload_size
+        )
+
+    def __get_pool_image(self, frame_buffer_pool, index, timeout):
+        """
+        :brief      Get an image into a buffer of the frame buffer pool
+        :param      frame_buffer_pool:  pool the buffer was acquired from
+        :param      index:              buffer index
+        :param      timeout:            Acquisition timeout
+        :return:    image object
+        """
+        frame_data = gx.GxFrameData()
+        frame_data.image_size = frame_buffer_pool.get_buffer_size()
+        frame_data.image_buf = frame_buffer_pool.get_buffer_address(index)
+
+        status = gx.gx_get_image(self.__dev_handle, frame_data, timeout)
+        if status != gx.GxStatusList.SUCCESS:
+            frame_buffer_pool.release(index)
+            if status != gx.GxStatusList.TIMEOUT:
+                check_return_status(status, "DataStream", "get_image")
+            return None
+
+        # the pool buffer stays valid until release_image, get_numpy_array doesn't copy it
+        image = RawImage(frame_data, True, True)
+        self.__pool_images[image] = (frame_buffer_pool, index)
+        return self.__measure(image)
+
     def get_image(self, timeout=1000):
         """
         :brief          Get an image, get successfully create image class object
+                        With a frame buffer pool the image is read-only and must be
+                        given back with release_image, get_numpy_array returns a view
+                        of the pool buffer which must not be used after release_image
         :param          timeout:    Acquisition timeout, range:[0, 0xFFFFFFFF]
         :return:        image object
         """
@@ -92,6 +295,15 @@ class DataStream:
             print("DataStream.get_image: Current data steam don't  start acquisition")
             return None
 
+        self.__check_not_grabbing("get_image")
+
+        frame_buffer_pool = self.__frame_buffer_pool
+        if frame_buffer_pool is not None:
+            index = frame_buffer_pool.acquire()
+            if index is not None:
+                return self.__get_pool_image(frame_buffer_pool, index, timeout)
+
+        # pool disabled or exhausted, fall back to a newly allocated image
         frame_data = gx.GxFrameData()
         frame_data.image_size = self.payload_size
         frame_data.image_buf = None
@@ -99,14 +311,22 @@ class DataStream:
 
         status = gx.gx_get_image(self.__dev_handle, image.frame_data, timeout)
         if status == gx.GxStatusList.SUCCESS:
-            return image
+            return self.__measure(image)
         elif status == gx.GxStatusList.TIMEOUT:
             return None
         else:
             check_return_status(status, "DataStream", "get_image")
             return None
 
-    def dq_buf(self, timeout=1000):
+    def dq_buf(self, timeout=1000, zero_copy=False):
+        """
+        :brief          Dequeue a frame buffer from the driver, return it with q_buf
+        :param          timeout:    Acquisition timeout, range:[0, 0xFFFFFFFF]
+        :param          zero_copy:  True: the image wraps the driver buffer without copying,
+                                    its data is read-only and only valid until q_buf,
+                                    get_numpy_array copies it unless view=True
+        :return:        image object
+        """
         if not isinstance(timeout, int):
             raise ParameterTypeError(
                 "DataStream.dq_buf: "
@@ -121,13 +341,21 @@ class DataStream:
             )
             return None
 
-        if not self.__py_capture_callback:
+        if not isinstance(zero_copy, bool):
+            raise ParameterTypeError(
+                "DataStream.dq_buf: "
+                "Expected zero_copy type is bool, not %s" % type(zero_copy)
+            )
+
+        if self.__py_capture_callback or self.__async_frame_queue:
             raise InvalidCallError("Can't call DQBuf after register capture callback")
 
         if not self.acquisition_flag:
             print("DataStream.get_image: Current data steam don't  start acquisition")
             return None
 
+        self.__check_not_grabbing("dq_buf")
+
         ptr_frame_buffer = ctypes.POINTER(gx.GxFrameBuffer)()
         status = gx.gx_dq_buf(
             self.__dev_handle, ctypes.byref(ptr_frame_buffer), timeout
@@ -146,8 +374,8 @@ class DataStream:
             frame_data.timestamp = frame_buffer.timestamp
             frame_data.buf_id = frame_buffer.buf_id
 
-            image = RawImage(frame_data)
-            return image
+            image = RawImage(frame_data, zero_copy)
+            return self.__measure(image)
         elif status == gx.GxStatusList.TIMEOUT:
             return None
         else:
@@ -155,6 +383,11 @@ class DataStream:
             return None
 
     def q_buf(self, image):
+        """
+        :brief          Return a frame buffer got by dq_buf to the driver
+        :param          image:  image object returned by dq_buf
+        :return:        none
+        """
         if not isinstance(image, RawImage):
             raise ParameterTypeError(
                 "DataStream.q_buf: "
@@ -165,8 +398,10 @@ class DataStream:
             print("DataStream.get_image: Current data steam don't  start acquisition")
             return
 
-        if not self.__py_capture_callback:
-            raise InvalidCallError("Can't call DQBuf after register capture callback")
+        if self.__py_capture_callback or self.__async_frame_queue:
+            raise InvalidCallError("Can't call QBuf after register capture callback")
+
+        self.__check_not_grabbing("q_buf")
 
         ptr_frame_buffer = ctypes.POINTER(gx.GxFrameBuffer)()
         try:
@@ -175,10 +410,450 @@ class DataStream:
             print(f"Key {image.frame_data.buf_id} not found in frame buffer map.")
             return
 
+        # the driver may overwrite the buffer as soon as it is queued
+        image.invalidate_buffer()
         status = gx.gx_q_buf(self.__dev_handle, ptr_frame_buffer)
         check_return_status(status, "DataStream", "q_buf")
         self.__frame_buf_map.pop(image.frame_data.buf_id)
 
+    def start_grabbing(
+        self, queue_depth=8, overflow_policy=GxQueueOverflowPolicy.DROP_OLDEST
+    ):
+        """
+        :brief      Start a grabbing thread which dequeues every frame with DQBuf, copies it,
+                    gives the buffer back to the driver at once and pushes the copy into
+                    a bounded queue read by retrieve
+        :param      queue_depth:        maximum number of frames waiting in the queue, range:[1, 0xFFFFFFFF]
+        :param      overflow_policy:    what to do when the queue is full, See detail in GxQueueOverflowPolicy
+        :return:    none
+        """
+        if not isinstance(queue_depth, int):
+            raise ParameterTypeError(
+                "DataStream.start_grabbing: "
+                "Expected queue_depth type is int, not %s" % type(queue_depth)
+            )
+
+        if not isinstance(overflow_policy, int):
+            raise ParameterTypeError(
+                "DataStream.start_grabbing: "
+                "Expected overflow_policy type is int, not %s" % type(overflow_policy)
+            )
+
+        if (queue_depth < 1) or (queue_depth > UNSIGNED_INT_MAX):
+            print(
+                "DataStream.start_grabbing: "
+                "queue_depth out of bounds, minimum=1, maximum=%s"
+                % hex(UNSIGNED_INT_MAX).__str__()
+            )
+            return
+
+        overflow_policy_dict = dict(
+            (name, getattr(GxQueueOverflowPolicy, name))
+            for name in dir(GxQueueOverflowPolicy)
+            if not name.startswith("__")
+        )
+        if overflow_policy not in overflow_policy_dict.values():
+            print(
+                "DataStream.start_grabbing: overflow_policy out of bounds, %s"
+                % overflow_policy_dict.__str__()
+            )
+            return
+
+        if self.__py_capture_callback or self.__async_frame_queue:
+            raise InvalidCallError(
+                "Can't start grabbing after register capture callback"
+            )
+
+        if self.is_grabbing():
+            raise InvalidCallError("DataStream.start_grabbing: already grabbing")
+
+        if not self.acquisition_flag:
+            print(
+                "DataStream.start_grabbing: Current data steam don't  start acquisition"
+            )
+            return
+
+        self.__frame_queue = FrameQueue(queue_depth, overflow_policy)
+        self.__grab_stop_event.clear()
+        self.__grab_error = None
+        self.__grab_thread = threading.Thread(
+            target=self.__grab_loop, name="pygxi-grabber", daemon=True
+        )
+        self.__grab_thread.start()
+
+    def stop_grabbing(self):
+        """
+        :brief      Stop the grabbing thread, frames already queued can still be retrieved
+        :return:    none
+        """
+        if self.__grab_thread is None:
+            return
+
+        self.__grab_stop_event.set()
+        self.__frame_queue.close()
+        self.__grab_thread.join()
+        self.__grab_thread = None
+
+    def is_grabbing(self):
+        """
+        :brief      Whether the grabbing thread is running, it ends by itself on an error
+        :return:    True or False
+        """
+        grab_thread = self.__grab_thread
+        return grab_thread is not None and grab_thread.is_alive()
+
+    def retrieve(self, timeout=1000):
+        """
+        :brief      Get the oldest frame pushed by the grabbing thread, can be called from any thread
+        :param      timeout:    Wait timeout, range:[0, 0xFFFFFFFF]
+        :return:    image object, None on timeout
+        """
+        if not isinstance(timeout, int):
+            raise ParameterTypeError(
+                "DataStream.retrieve: "
+                "Expected timeout type is int, not %s" % type(timeout)
+            )
+
+        if (timeout < 0) or (timeout > UNSIGNED_INT_MAX):
+            print(
+                "DataStream.retrieve: "
+                "timeout out of bounds, minimum=0, maximum=%s"
+                % hex(UNSIGNED_INT_MAX).__str__()
+            )
+            return None
+
+        frame_queue = self.__frame_queue
+        if frame_queue is None:
+            print("DataStream.retrieve: Current data steam don't  start grabbing")
+            return None
+
+        image = frame_queue.get(timeout)
+        if image is None and self.__grab_error is not None:
+            raise self.__grab_error
+
+        return image
+
+    def get_frame_queue(self):
+        """
+        :brief      Get the queue filled by the grabbing thread, it holds the drop counters
+        :return:    FrameQueue object, None when grabbing was never started
+        """
+        return self.__frame_queue
+
+    def start_async_frames(self, queue_depth=4, loop=None):
+        """
+        :brief      Register a capture callback feeding frames to an asyncio event loop,
+                    read them with aget_image or aiter_frames
+                    As register_capture_callback, call it before stream on
+        :param      queue_depth:    maximum number of frames waiting for the consumer, range:[1, 0xFFFFFFFF]
+                                    when it is reached the callback holds the SDK buffer until a frame is read
+        :param      loop:           event loop, default is the running loop
+        :return:    none
+        """
+        if not isinstance(queue_depth, int):
+            raise ParameterTypeError(
+                "DataStream.start_async_frames: "
+                "Expected queue_depth type is int, not %s" % type(queue_depth)
+            )
+
+        if (queue_depth < 1) or (queue_depth > UNSIGNED_INT_MAX):
+            print(
+                "DataStream.start_async_frames: "
+                "queue_depth out of bounds, minimum=1, maximum=%s"
+                % hex(UNSIGNED_INT_MAX).__str__()
+            )
+            return
+
+        if self.__py_capture_callback or self.__async_frame_queue:
+            raise InvalidCallError(
+                "DataStream.start_async_frames: capture callback already registered"
+            )
+
+        if self.is_grabbing():
+            raise InvalidCallError(
+                "DataStream.start_async_frames: Can't be called while grabbing"
+            )
+
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise InvalidCallError(
+                    "DataStream.start_async_frames: no running event loop, pass loop"
+                )
+
+        async_frame_queue = AsyncFrameQueue(loop, queue_depth)
+        self.__async_frame_queue = async_frame_queue
+        status = gx.gx_register_capture_callback(
+            self.__dev_handle, self.__c_capture_callback
+        )
+        if status != gx.GxStatusList.SUCCESS:
+            self.__async_frame_queue = None
+            check_return_status(status, "DataStream", "start_async_frames")
+
+    def stop_async_frames(self):
+        """
+        :brief      Unregister the capture callback registered by start_async_frames
+        :return:    none
+        """
+        async_frame_queue = self.__async_frame_queue
+        if async_frame_queue is None:
+            return
+
+        # release a callback waiting for room first, unregister waits for it
+        async_frame_queue.close()
+        status = gx.gx_unregister_capture_callback(self.__dev_handle)
+        self.__async_frame_queue = None
+        check_return_status(status, "DataStream", "stop_async_frames")
+
+    async def aget_image(self, timeout=1000):
+        """
+        :brief      Wait for an image without blocking the event loop, call start_async_frames before
+        :param      timeout:    Acquisition timeout, range:[0, 0xFFFFFFFF]
+        :return:    image object, None on timeout
+        """
+        if not isinstance(timeout, int):
+            raise ParameterTypeError(
+                "DataStream.aget_image: "
+                "Expected timeout type is int, not %s" % type(timeout)
+            )
+
+        if (timeout < 0) or (timeout > UNSIGNED_INT_MAX):
+            print(
+                "DataStream.aget_image: "
+                "timeout out of bounds, minimum=0, maximum=%s"
+                % hex(UNSIGNED_INT_MAX).__str__()
+            )
+            return None
+
+        async_frame_queue = self.__async_frame_queue
+        if async_frame_queue is None:
+            raise InvalidCallError(
+                "DataStream.aget_image: Current data steam don't  start async frames"
+            )
+
+        return self.__measure(await async_frame_queue.get(timeout))
+
+    async def aiter_frames(self):
+        """
+        :brief      Asynchronous iterator over the captured images, call start_async_frames before
+                    The iteration ends with stop_async_frames
+        :return:    asynchronous iterator of image objects
+        """
+        async_frame_queue = self.__async_frame_queue
+        if async_frame_queue is None:
+            raise InvalidCallError(
+                "DataStream.aiter_frames: Current data steam don't  start async frames"
+            )
+
+        while True:
+            image = await async_frame_queue.get()
+            if image is None:
+                return
+            yield self.__measure(image)
+
+    def __check_not_grabbing(self, func_name):
+        """
+        :brief      Raise if frames are being dequeued by the grabbing thread
+        :param      func_name:  name of the calling method
+        :return:    none
+        """
+        if self.is_grabbing() and threading.current_thread() is not self.__grab_thread:
+            raise InvalidCallError(
+                "DataStream.%s: Can't be called while grabbing, use retrieve"
+                % func_name
+            )
+
+    def __grab_loop(self):
+        """
+        :brief      Body of the grabbing thread
+        :return:    none
+        """
+        try:
+            while not self.__grab_stop_event.is_set() and self.acquisition_flag:
+                image = self.dq_buf(GRAB_POLL_TIMEOUT, True)
+                if image is None:
+                    continue
+
+                # keep the driver buffer only for the copy, slow consumers don't starve the driver
+                try:
+                    frame = image.copy()
+                finally:
+                    self.q_buf(image)
+                self.__frame_queue.put(frame)
+        except Exception as error:
+            self.__grab_error = error
+        finally:
+            self.__frame_queue.close()
+
+    def dq_bufs(self, n, timeout=1000, out=None):
+        """
+        :brief          Dequeue n frames and copy them into one contiguous array,
+                        every buffer is given back to the driver right after its copy
+        :param          n:          number of frames, range:[1, 0xFFFFFFFF]
+        :param          timeout:    Acquisition timeout of every dequeue, range:[0, 0xFFFFFFFF]
+        :param          out:        C-contiguous writable np.ndarray with at least n frames on the first axis,
+                                    of the frame shape and dtype allocated for None
+                                    None: allocate (n, height, width) for mono, (n, height, width, 3) for RGB8/BGR8
+                                    and (n, image_size) bytes for the other formats
+        :return:        frames array and FRAME_METADATA_DTYPE metadata array, both cut to the number
+                        of frames got before a timeout
+        """
+        if not isinstance(n, int):
+            raise ParameterTypeError(
+                "DataStream.dq_bufs: Expected n type is int, not %s" % type(n)
+            )
+
+        if not isinstance(timeout, int):
+            raise ParameterTypeError(
+                "DataStream.dq_bufs: "
+                "Expected timeout type is int, not %s" % type(timeout)
+            )
+
+        if out is not None and not isinstance(out, np.ndarray):
+            raise ParameterTypeError(
+                "DataStream.dq_bufs: "
+                "Expected out type is np.ndarray, not %s" % type(out)
+            )
+
+        if (n < 1) or (n > UNSIGNED_INT_MAX):
+            print(
+                "DataStream.dq_bufs: "
+                "n out of bounds, minimum=1, maximum=%s"
+                % hex(UNSIGNED_INT_MAX).__str__()
+            )
+            return None
+
+        if (timeout < 0) or (timeout > UNSIGNED_INT_MAX):
+            print(
+                "DataStream.dq_bufs: "
+                "timeout out of bounds, minimum=0, maximum=%s"
+                % hex(UNSIGNED_INT_MAX).__str__()
+            )
+            return None
+
+        if out is not None and (
+            out.ndim == 0
+            or out.shape[0] < n
+            or not out.flags.c_contiguous
+            or not out.flags.writeable
+        ):
+            raise InvalidParameterError(
+                "DataStream.dq_bufs: out must be a C-contiguous writable array "
+                "with at least n frames"
+            )
+
+        if self.__py_capture_callback or self.__async_frame_queue:
+            raise InvalidCallError("Can't call DQBuf after register capture callback")
+
+        if not self.acquisition_flag:
+            print("DataStream.dq_bufs: Current data steam don't  start acquisition")
+            return None
+
+        self.__check_not_grabbing("dq_bufs")
+
+        metadata = np.zeros(n, dtype=FRAME_METADATA_DTYPE)
+        count = 0
+        if hasattr(gx, "gx_dq_all_bufs"):
+            ptr_frame_buffer_array = (ctypes.POINTER(gx.GxFrameBuffer) * n)()
+            while count < n:
+                status, frame_count = gx.gx_dq_all_bufs(
+                    self.__dev_handle, ptr_frame_buffer_array, n - count, timeout
+                )
+                if status == gx.GxStatusList.TIMEOUT:
+                    break
+                check_return_status(status, "DataStream", "dq_bufs")
+                if frame_count == 0:
+                    break
+
+                try:
+                    for index in range(frame_count):
+                        out = self.__copy_frame_buffer(
+                            ptr_frame_buffer_array[index].contents,
+                            count,
+                            n,
+                            out,
+                            metadata,
+                        )
+                        count += 1
+                finally:
+                    status = gx.gx_q_all_bufs(self.__dev_handle)
+                    check_return_status(status, "DataStream", "dq_bufs")
+        else:
+            ptr_frame_buffer = ctypes.POINTER(gx.GxFrameBuffer)()
+            while count < n:
+                status = gx.gx_dq_buf(
+                    self.__dev_handle, ctypes.byref(ptr_frame_buffer), timeout
+                )
+                if status == gx.GxStatusList.TIMEOUT:
+                    break
+                check_return_status(status, "DataStream", "dq_bufs")
+
+                try:
+                    out = self.__copy_frame_buffer(
+                        ptr_frame_buffer.contents, count, n, out, metadata
+                    )
+                    count += 1
+                finally:
+                    status = gx.gx_q_buf(self.__dev_handle, ptr_frame_buffer)
+                    check_return_status(status, "DataStream", "dq_bufs")
+
+        if out is None:
+            return None, metadata[:0]
+
+        return out[:count], metadata[:count]
+
+    @staticmethod
+    def __copy_frame_buffer(frame_buffer, index, n, out, metadata):
+        """
+        :brief      Copy a dequeued frame into out[index] and record its metadata
+        :param      frame_buffer:   GxFrameBuffer got from the driver
+        :param      index:          frame index in out
+        :param      n:              number of frames, used to allocate out
+        :param      out:            frames array, None: allocate it from the frame layout
+        :param      metadata:       FRAME_METADATA_DTYPE array
+        :return:    frames array
+        """
+        pixel_format = frame_buffer.pixel_format
+        if pixel_format in (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8):
+            shape = (frame_buffer.height, frame_buffer.width, 3)
+            dtype = np.dtype(np.uint8)
+        elif pixel_format & PIXEL_BIT_MASK == GX_PIXEL_8BIT:
+            shape = (frame_buffer.height, frame_buffer.width)
+            dtype = np.dtype(np.uint8)
+        elif pixel_format & PIXEL_BIT_MASK == GX_PIXEL_16BIT:
+            shape = (frame_buffer.height, frame_buffer.width)
+            dtype = np.dtype(np.uint16)
+        else:
+            # packed formats are kept as they come from the driver
+            shape = (frame_buffer.image_size,)
+            dtype = np.dtype(np.uint8)
+
+        if out is None:
+            out = np.empty((n,) + shape, dtype=dtype)
+        elif out.shape[1:] != shape or out.dtype != dtype:
+            raise InvalidParameterError(
+                "DataStream.dq_bufs: frames of out are %s %s, expected %s %s for frame %d"
+                % (out.shape[1:], out.dtype, shape, dtype, index)
+            )
+
+        frame_size = out.nbytes // out.shape[0]
+        if frame_buffer.image_size < frame_size:
+            raise InvalidParameterError(
+                "DataStream.dq_bufs: frame size %d is smaller than the %d bytes of a frame of out"
+                % (frame_buffer.image_size, frame_size)
+            )
+
+        ctypes.memmove(
+            out.ctypes.data + index * frame_size, frame_buffer.image_buf, frame_size
+        )
+        metadata[index] = (
+            frame_buffer.frame_id,
+            frame_buffer.timestamp,
+            frame_buffer.status,
+        )
+        return out
+
     def flush_queue(self):
         status = gx.gx_flush_queue(self.__dev_handle)
         check_return_status(status, "DataStream", "flush_queue")
@@ -220,6 +895,11 @@ class DataStream:
                 "Expected callback type is function not %s" % type(callback_func)
             )
 
+        if self.__async_frame_queue is not None:
+            raise InvalidCallError(
+                "DataStream.register_capture_callback: Can't be called after start_async_frames"
+            )
+
         status = gx.gx_register_capture_callback(
             self.__dev_handle, self.__c_capture_callback
         )
@@ -251,7 +931,17 @@ class DataStream:
         frame_data.frame_id = capture_data.contents.frame_id
         frame_data.timestamp = capture_data.contents.timestamp
         frame_data.status = capture_data.contents.status
-        image = RawImage(frame_data)
+
+        async_frame_queue = self.__async_frame_queue
+        if async_frame_queue is not None:
+            # the buffer is only valid during the callback, the queue keeps a copy,
+            # measured by the consumer
+            image = RawImage(frame_data, True)
+            async_frame_queue.put(image)
+            image.invalidate_buffer()
+            return
+
+        image = self.__measure(RawImage(frame_data))
         self.__py_capture_callback(image)
 
 
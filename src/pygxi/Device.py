@@ -24,1101 +24,982 @@ class Device:
     Python interface does not upgrade, or only the definition of the control code can support new features
     """
 
-    def __init__(self, handle, interface_obj):
-        """
-        :brief  Constructor for instance initialization
-        :param handle:  Device handle
-        """
-        self.__dev_handle = handle
-        self.data_stream = []
-        self.__interface_obj = interface_obj
-
-        self.__c_offline_callback = gx.OFF_LINE_CALL(self.__on_device_offline_callback)
-        self.__py_offline_callback = None
-        self.__offline_callback_handle = None
-
-        self.__c_feature_callback = gx.FEATURE_CALL(self.__on_device_feature_callback)
-        self.__py_feature_callback = None
-        self.__color_correction_param = 0
-
-        # Function code function is obsolete, please use string to obtain attribute value
+    # Function code function is obsolete, please use string to obtain attribute value
+    # Feature attributes, created on first access, see __getattr__
+    # attribute name: (feature class, feature ID)
+    FEATURES = {
         # ---------------Device Information Section--------------------------
-        self.DeviceVendorName = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_DEVICE_VENDOR_NAME
-        )
-        self.DeviceModelName = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_DEVICE_MODEL_NAME
-        )
-        self.DeviceFirmwareVersion = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_DEVICE_FIRMWARE_VERSION
-        )
-        self.DeviceVersion = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_DEVICE_VERSION
-        )
-        self.DeviceSerialNumber = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_DEVICE_SERIAL_NUMBER
-        )
-        self.FactorySettingVersion = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_FACTORY_SETTING_VERSION
-        )
-        self.DeviceUserID = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_DEVICE_USER_ID
-        )
-        self.DeviceLinkSelector = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_DEVICE_LINK_SELECTOR
-        )
-        self.DeviceLinkThroughputLimitMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_DEVICE_LINK_THROUGHPUT_LIMIT_MODE
-        )
-        self.DeviceLinkThroughputLimit = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_DEVICE_LINK_THROUGHPUT_LIMIT
-        )
-        self.DeviceLinkCurrentThroughput = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_DEVICE_LINK_CURRENT_THROUGHPUT
-        )
-        self.DeviceReset = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_DEVICE_RESET
-        )
-        self.TimestampTickFrequency = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_TIMESTAMP_TICK_FREQUENCY
-        )
-        self.TimestampLatch = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_TIMESTAMP_LATCH
-        )
-        self.TimestampReset = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_TIMESTAMP_RESET
-        )
-        self.TimestampLatchReset = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_TIMESTAMP_LATCH_RESET
-        )
-        self.TimestampLatchValue = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_TIMESTAMP_LATCH_VALUE
-        )
-        self.DevicePHYVersion = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_DEVICE_PHY_VERSION
-        )
-        self.DeviceTemperatureSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_DEVICE_TEMPERATURE_SELECTOR
-        )
-        self.DeviceTemperature = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_DEVICE_TEMPERATURE
-        )
-        self.DeviceIspFirmwareVersion = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_DEVICE_ISP_FIRMWARE_VERSION
-        )
-        self.LowPowerMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_LOWPOWER_MODE
-        )
-        self.CloseCCD = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_CLOSE_CCD
-        )
-        self.ProductionCode = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_PRODUCTION_CODE
-        )
-        self.DeviceOriginalName = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_DEVICE_ORIGINAL_NAME
-        )
-        self.Revision = feat.IntFeature(self.__dev_handle, gx.GxFeatureID.INT_REVISION)
-        self.VersionsSupported = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_VERSIONS_SUPPORTED
-        )
-        self.VersionUsed = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_VERSION_USED
-        )
-        self.TecEnable = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_TEC_ENABLE
-        )
-        self.TecTargetTemperature = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_TEC_TARGET_TEMPERATURE
-        )
-        self.FanEnable = self.TecEnable = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_FAN_ENABLE
-        )
-        self.TemperatureDetectionStatus = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_TEMPERATURE_DETECTION_STATUS
-        )
-        self.FanSpeed = feat.IntFeature(self.__dev_handle, gx.GxFeatureID.INT_FAN_SPEED)
-        self.DeviceHumidity = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_DEVICE_HUMIDITY
-        )
-        self.DevicePressure = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_DEVICE_PRESSURE
-        )
-        self.AirChangeDetectionStatus = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_AIR_CHANGE_DETECTION_STATUS
-        )
-        self.AirTightnessDetectionStatus = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_AIR_TIGHTNESS_DETECTION_STATUS
-        )
-        self.DeviceScanType = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_DEVICE_SCAN_TYPE
-        )
+        "DeviceVendorName": (
+            feat.StringFeature,
+            gx.GxFeatureID.STRING_DEVICE_VENDOR_NAME,
+        ),
+        "DeviceModelName": (
+            feat.StringFeature,
+            gx.GxFeatureID.STRING_DEVICE_MODEL_NAME,
+        ),
+        "DeviceFirmwareVersion": (
+            feat.StringFeature,
+            gx.GxFeatureID.STRING_DEVICE_FIRMWARE_VERSION,
+        ),
+        "DeviceVersion": (feat.StringFeature, gx.GxFeatureID.STRING_DEVICE_VERSION),
+        "DeviceSerialNumber": (
+            feat.StringFeature,
+            gx.GxFeatureID.STRING_DEVICE_SERIAL_NUMBER,
+        ),
+        "FactorySettingVersion": (
+            feat.StringFeature,
+            gx.GxFeatureID.STRING_FACTORY_SETTING_VERSION,
+        ),
+        "DeviceUserID": (feat.StringFeature, gx.GxFeatureID.STRING_DEVICE_USER_ID),
+        "DeviceLinkSelector": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_DEVICE_LINK_SELECTOR,
+        ),
+        "DeviceLinkThroughputLimitMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_DEVICE_LINK_THROUGHPUT_LIMIT_MODE,
+        ),
+        "DeviceLinkThroughputLimit": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_DEVICE_LINK_THROUGHPUT_LIMIT,
+        ),
+        "DeviceLinkCurrentThroughput": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_DEVICE_LINK_CURRENT_THROUGHPUT,
+        ),
+        "DeviceReset": (feat.CommandFeature, gx.GxFeatureID.COMMAND_DEVICE_RESET),
+        "TimestampTickFrequency": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_TIMESTAMP_TICK_FREQUENCY,
+        ),
+        "TimestampLatch": (feat.CommandFeature, gx.GxFeatureID.COMMAND_TIMESTAMP_LATCH),
+        "TimestampReset": (feat.CommandFeature, gx.GxFeatureID.COMMAND_TIMESTAMP_RESET),
+        "TimestampLatchReset": (
+            feat.CommandFeature,
+            gx.GxFeatureID.COMMAND_TIMESTAMP_LATCH_RESET,
+        ),
+        "TimestampLatchValue": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_TIMESTAMP_LATCH_VALUE,
+        ),
+        "DevicePHYVersion": (
+            feat.StringFeature,
+            gx.GxFeatureID.STRING_DEVICE_PHY_VERSION,
+        ),
+        "DeviceTemperatureSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_DEVICE_TEMPERATURE_SELECTOR,
+        ),
+        "DeviceTemperature": (
+            feat.FloatFeature,
+            gx.GxFeatureID.FLOAT_DEVICE_TEMPERATURE,
+        ),
+        "DeviceIspFirmwareVersion": (
+            feat.StringFeature,
+            gx.GxFeatureID.STRING_DEVICE_ISP_FIRMWARE_VERSION,
+        ),
+        "LowPowerMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_LOWPOWER_MODE),
+        "CloseCCD": (feat.EnumFeature, gx.GxFeatureID.ENUM_CLOSE_CCD),
+        "ProductionCode": (feat.StringFeature, gx.GxFeatureID.STRING_PRODUCTION_CODE),
+        "DeviceOriginalName": (
+            feat.StringFeature,
+            gx.GxFeatureID.STRING_DEVICE_ORIGINAL_NAME,
+        ),
+        "Revision": (feat.IntFeature, gx.GxFeatureID.INT_REVISION),
+        "VersionsSupported": (feat.IntFeature, gx.GxFeatureID.INT_VERSIONS_SUPPORTED),
+        "VersionUsed": (feat.IntFeature, gx.GxFeatureID.INT_VERSION_USED),
+        "TecEnable": (feat.BoolFeature, gx.GxFeatureID.BOOL_TEC_ENABLE),
+        "TecTargetTemperature": (
+            feat.FloatFeature,
+            gx.GxFeatureID.FLOAT_TEC_TARGET_TEMPERATURE,
+        ),
+        "FanEnable": (feat.BoolFeature, gx.GxFeatureID.BOOL_FAN_ENABLE),
+        "TemperatureDetectionStatus": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_TEMPERATURE_DETECTION_STATUS,
+        ),
+        "FanSpeed": (feat.IntFeature, gx.GxFeatureID.INT_FAN_SPEED),
+        "DeviceHumidity": (feat.FloatFeature, gx.GxFeatureID.FLOAT_DEVICE_HUMIDITY),
+        "DevicePressure": (feat.FloatFeature, gx.GxFeatureID.FLOAT_DEVICE_PRESSURE),
+        "AirChangeDetectionStatus": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_AIR_CHANGE_DETECTION_STATUS,
+        ),
+        "AirTightnessDetectionStatus": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_AIR_TIGHTNESS_DETECTION_STATUS,
+        ),
+        "DeviceScanType": (feat.EnumFeature, gx.GxFeatureID.ENUM_DEVICE_SCAN_TYPE),
 
         # ---------------ImageFormat Section--------------------------------
-        self.SensorWidth = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SENSOR_WIDTH
-        )
-        self.SensorHeight = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SENSOR_HEIGHT
-        )
-        self.WidthMax = feat.IntFeature(self.__dev_handle, gx.GxFeatureID.INT_WIDTH_MAX)
-        self.HeightMax = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_HEIGHT_MAX
-        )
-        self.OffsetX = feat.IntFeature(self.__dev_handle, gx.GxFeatureID.INT_OFFSET_X)
-        self.OffsetY = feat.IntFeature(self.__dev_handle, gx.GxFeatureID.INT_OFFSET_Y)
-        self.Width = feat.IntFeature(self.__dev_handle, gx.GxFeatureID.INT_WIDTH)
-        self.Height = feat.IntFeature(self.__dev_handle, gx.GxFeatureID.INT_HEIGHT)
-        self.BinningHorizontal = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_BINNING_HORIZONTAL
-        )
-        self.BinningVertical = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_BINNING_VERTICAL
-        )
-        self.DecimationHorizontal = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_DECIMATION_HORIZONTAL
-        )
-        self.DecimationVertical = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_DECIMATION_VERTICAL
-        )
-        self.PixelSize = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_PIXEL_SIZE
-        )
-        self.PixelColorFilter = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_PIXEL_COLOR_FILTER
-        )
-        self.PixelFormat = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_PIXEL_FORMAT
-        )
-        self.ReverseX = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_REVERSE_X
-        )
-        self.ReverseY = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_REVERSE_Y
-        )
-        self.TestPattern = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TEST_PATTERN
-        )
-        self.TestPatternGeneratorSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TEST_PATTERN_GENERATOR_SELECTOR
-        )
-        self.RegionSendMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_REGION_SEND_MODE
-        )
-        self.RegionMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_REGION_MODE
-        )
-        self.RegionSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_REGION_SELECTOR
-        )
-        self.CenterWidth = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_CENTER_WIDTH
-        )
-        self.CenterHeight = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_CENTER_HEIGHT
-        )
-        self.BinningHorizontalMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_BINNING_HORIZONTAL_MODE
-        )
-        self.BinningVerticalMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_BINNING_VERTICAL_MODE
-        )
-        self.SensorShutterMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SENSOR_SHUTTER_MODE
-        )
-        self.DecimationLineNumber = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_DECIMATION_LINENUMBER
-        )
-        self.SensorDecimationHorizontal = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SENSOR_DECIMATION_HORIZONTAL
-        )
-        self.SensorDecimationVertical = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SENSOR_DECIMATION_VERTICAL
-        )
-        self.SensorSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SENSOR_SELECTOR
-        )
-        self.CurrentSensorWidth = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_CURRENT_SENSOR_WIDTH
-        )
-        self.CurrentSensorHeight = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_CURRENT_SENSOR_HEIGHT
-        )
-        self.CurrentSensorOffsetX = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_CURRENT_SENSOR_OFFSETX
-        )
-        self.CurrentSensorOffsetY = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_CURRENT_SENSOR_OFFSETY
-        )
-        self.CurrentSensorWidthMax = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_CURRENT_SENSOR_WIDTHMAX
-        )
-        self.CurrectSensorHeightMax = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_CURRENT_SENSOR_HEIGHTMAX
-        )
-        self.SensorBitDepth = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SENSOR_BIT_DEPTH
-        )
-        self.WatermarkEnable = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_WATERMARK_ENABLE
-        )
+        "SensorWidth": (feat.IntFeature, gx.GxFeatureID.INT_SENSOR_WIDTH),
+        "SensorHeight": (feat.IntFeature, gx.GxFeatureID.INT_SENSOR_HEIGHT),
+        "WidthMax": (feat.IntFeature, gx.GxFeatureID.INT_WIDTH_MAX),
+        "HeightMax": (feat.IntFeature, gx.GxFeatureID.INT_HEIGHT_MAX),
+        "OffsetX": (feat.IntFeature, gx.GxFeatureID.INT_OFFSET_X),
+        "OffsetY": (feat.IntFeature, gx.GxFeatureID.INT_OFFSET_Y),
+        "Width": (feat.IntFeature, gx.GxFeatureID.INT_WIDTH),
+        "Height": (feat.IntFeature, gx.GxFeatureID.INT_HEIGHT),
+        "BinningHorizontal": (feat.IntFeature, gx.GxFeatureID.INT_BINNING_HORIZONTAL),
+        "BinningVertical": (feat.IntFeature, gx.GxFeatureID.INT_BINNING_VERTICAL),
+        "DecimationHorizontal": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_DECIMATION_HORIZONTAL,
+        ),
+        "DecimationVertical": (feat.IntFeature, gx.GxFeatureID.INT_DECIMATION_VERTICAL),
+        "PixelSize": (feat.EnumFeature, gx.GxFeatureID.ENUM_PIXEL_SIZE),
+        "PixelColorFilter": (feat.EnumFeature, gx.GxFeatureID.ENUM_PIXEL_COLOR_FILTER),
+        "PixelFormat": (feat.EnumFeature, gx.GxFeatureID.ENUM_PIXEL_FORMAT),
+        "ReverseX": (feat.BoolFeature, gx.GxFeatureID.BOOL_REVERSE_X),
+        "ReverseY": (feat.BoolFeature, gx.GxFeatureID.BOOL_REVERSE_Y),
+        "TestPattern": (feat.EnumFeature, gx.GxFeatureID.ENUM_TEST_PATTERN),
+        "TestPatternGeneratorSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_TEST_PATTERN_GENERATOR_SELECTOR,
+        ),
+        "RegionSendMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_REGION_SEND_MODE),
+        "RegionMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_REGION_MODE),
+        "RegionSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_REGION_SELECTOR),
+        "CenterWidth": (feat.IntFeature, gx.GxFeatureID.INT_CENTER_WIDTH),
+        "CenterHeight": (feat.IntFeature, gx.GxFeatureID.INT_CENTER_HEIGHT),
+        "BinningHorizontalMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_BINNING_HORIZONTAL_MODE,
+        ),
+        "BinningVerticalMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_BINNING_VERTICAL_MODE,
+        ),
+        "SensorShutterMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_SENSOR_SHUTTER_MODE,
+        ),
+        "DecimationLineNumber": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_DECIMATION_LINENUMBER,
+        ),
+        "SensorDecimationHorizontal": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_SENSOR_DECIMATION_HORIZONTAL,
+        ),
+        "SensorDecimationVertical": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_SENSOR_DECIMATION_VERTICAL,
+        ),
+        "SensorSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_SENSOR_SELECTOR),
+        "CurrentSensorWidth": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_CURRENT_SENSOR_WIDTH,
+        ),
+        "CurrentSensorHeight": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_CURRENT_SENSOR_HEIGHT,
+        ),
+        "CurrentSensorOffsetX": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_CURRENT_SENSOR_OFFSETX,
+        ),
+        "CurrentSensorOffsetY": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_CURRENT_SENSOR_OFFSETY,
+        ),
+        "CurrentSensorWidthMax": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_CURRENT_SENSOR_WIDTHMAX,
+        ),
+        "CurrectSensorHeightMax": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_CURRENT_SENSOR_HEIGHTMAX,
+        ),
+        "SensorBitDepth": (feat.EnumFeature, gx.GxFeatureID.ENUM_SENSOR_BIT_DEPTH),
+        "WatermarkEnable": (feat.BoolFeature, gx.GxFeatureID.BOOL_WATERMARK_ENABLE),
 
         # ---------------TransportLayer Section-------------------------------
-        self.PayloadSize = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_PAYLOAD_SIZE
-        )
-        self.GevCurrentIPConfigurationLLA = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_LLA
-        )
-        self.GevCurrentIPConfigurationDHCP = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_DHCP
-        )
-        self.GevCurrentIPConfigurationPersistentIP = feat.BoolFeature(
-            self.__dev_handle,
+        "PayloadSize": (feat.IntFeature, gx.GxFeatureID.INT_PAYLOAD_SIZE),
+        "GevCurrentIPConfigurationLLA": (
+            feat.BoolFeature,
+            gx.GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_LLA,
+        ),
+        "GevCurrentIPConfigurationDHCP": (
+            feat.BoolFeature,
+            gx.GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_DHCP,
+        ),
+        "GevCurrentIPConfigurationPersistentIP": (
+            feat.BoolFeature,
             gx.GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_PERSISTENT_IP,
-        )
-        self.EstimatedBandwidth = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_ESTIMATED_BANDWIDTH
-        )
-        self.GevHeartbeatTimeout = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_GEV_HEARTBEAT_TIMEOUT
-        )
-        self.GevSCPSPacketSize = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_GEV_PACKET_SIZE
-        )
-        self.GevSCPD = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_GEV_PACKET_DELAY
-        )
-        self.GevLinkSpeed = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_GEV_LINK_SPEED
-        )
-        self.DeviceTapGeometry = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_DEVICE_TAP_GEOMETRY
-        )
+        ),
+        "EstimatedBandwidth": (feat.IntFeature, gx.GxFeatureID.INT_ESTIMATED_BANDWIDTH),
+        "GevHeartbeatTimeout": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_GEV_HEARTBEAT_TIMEOUT,
+        ),
+        "GevSCPSPacketSize": (feat.IntFeature, gx.GxFeatureID.INT_GEV_PACKET_SIZE),
+        "GevSCPD": (feat.IntFeature, gx.GxFeatureID.INT_GEV_PACKET_DELAY),
+        "GevLinkSpeed": (feat.IntFeature, gx.GxFeatureID.INT_GEV_LINK_SPEED),
+        "DeviceTapGeometry": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_DEVICE_TAP_GEOMETRY,
+        ),
 
         # ---------------AcquisitionTrigger Section---------------------------
-        self.AcquisitionMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_ACQUISITION_MODE
-        )
-        self.AcquisitionStart = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_ACQUISITION_START
-        )
-        self.AcquisitionStop = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_ACQUISITION_STOP
-        )
-        self.TriggerMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TRIGGER_MODE
-        )
-        self.TriggerSoftware = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_TRIGGER_SOFTWARE
-        )
-        self.TriggerActivation = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TRIGGER_ACTIVATION
-        )
-        self.ExposureTime = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_EXPOSURE_TIME
-        )
-        self.ExposureAuto = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_EXPOSURE_AUTO
-        )
-        self.TriggerFilterRaisingEdge = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_TRIGGER_FILTER_RAISING
-        )
-        self.TriggerFilterFallingEdge = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_TRIGGER_FILTER_FALLING
-        )
-        self.TriggerSource = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TRIGGER_SOURCE
-        )
-        self.ExposureMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_EXPOSURE_MODE
-        )
-        self.TriggerSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TRIGGER_SELECTOR
-        )
-        self.TriggerDelay = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_TRIGGER_DELAY
-        )
-        self.TransferControlMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TRANSFER_CONTROL_MODE
-        )
-        self.TransferOperationMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TRANSFER_OPERATION_MODE
-        )
-        self.TransferStart = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_TRANSFER_START
-        )
-        self.TransferBlockCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_TRANSFER_BLOCK_COUNT
-        )
-        self.FrameBufferOverwriteActive = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_FRAMESTORE_COVER_ACTIVE
-        )
-        self.AcquisitionFrameRateMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_ACQUISITION_FRAME_RATE_MODE
-        )
-        self.AcquisitionFrameRate = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_ACQUISITION_FRAME_RATE
-        )
-        self.CurrentAcquisitionFrameRate = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_CURRENT_ACQUISITION_FRAME_RATE
-        )
-        self.FixedPatternNoiseCorrectMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_FIXED_PATTERN_NOISE_CORRECT_MODE
-        )
-        self.AcquisitionBurstFrameCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_ACQUISITION_BURST_FRAME_COUNT
-        )
-        self.AcquisitionStatusSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_ACQUISITION_STATUS_SELECTOR
-        )
-        self.AcquisitionStatus = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_ACQUISITION_STATUS
-        )
-        self.ExposureDelay = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_EXPOSURE_DELAY
-        )
-        self.ExposureOverlapTimeMax = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_EXPOSURE_OVERLAP_TIME_MAX
-        )
-        self.ExposureTimeMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_EXPOSURE_TIME_MODE
-        )
-        self.FrameBufferCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_FRAME_BUFFER_COUNT
-        )
-        self.FrameBufferFlush = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_FRAME_BUFFER_FLUSH
-        )
-        self.AcquisitionBurstMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_ACQUISITION_BURST_MODE
-        )
-        self.OverlapMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_OVERLAP_MODE
-        )
-        self.MultiSourceSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_MULTISOURCE_SELECTOR
-        )
-        self.MultiSourceEnable = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_MULTISOURCE_ENABLE
-        )
-        self.TriggerCacheEnable = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_TRIGGER_CACHE_ENABLE
-        )
+        "AcquisitionMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_ACQUISITION_MODE),
+        "AcquisitionStart": (
+            feat.CommandFeature,
+            gx.GxFeatureID.COMMAND_ACQUISITION_START,
+        ),
+        "AcquisitionStop": (
+            feat.CommandFeature,
+            gx.GxFeatureID.COMMAND_ACQUISITION_STOP,
+        ),
+        "TriggerMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_TRIGGER_MODE),
+        "TriggerSoftware": (
+            feat.CommandFeature,
+            gx.GxFeatureID.COMMAND_TRIGGER_SOFTWARE,
+        ),
+        "TriggerActivation": (feat.EnumFeature, gx.GxFeatureID.ENUM_TRIGGER_ACTIVATION),
+        "ExposureTime": (feat.FloatFeature, gx.GxFeatureID.FLOAT_EXPOSURE_TIME),
+        "ExposureAuto": (feat.EnumFeature, gx.GxFeatureID.ENUM_EXPOSURE_AUTO),
+        "TriggerFilterRaisingEdge": (
+            feat.FloatFeature,
+            gx.GxFeatureID.FLOAT_TRIGGER_FILTER_RAISING,
+        ),
+        "TriggerFilterFallingEdge": (
+            feat.FloatFeature,
+            gx.GxFeatureID.FLOAT_TRIGGER_FILTER_FALLING,
+        ),
+        "TriggerSource": (feat.EnumFeature, gx.GxFeatureID.ENUM_TRIGGER_SOURCE),
+        "ExposureMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_EXPOSURE_MODE),
+        "TriggerSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_TRIGGER_SELECTOR),
+        "TriggerDelay": (feat.FloatFeature, gx.GxFeatureID.FLOAT_TRIGGER_DELAY),
+        "TransferControlMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_TRANSFER_CONTROL_MODE,
+        ),
+        "TransferOperationMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_TRANSFER_OPERATION_MODE,
+        ),
+        "TransferStart": (feat.CommandFeature, gx.GxFeatureID.COMMAND_TRANSFER_START),
+        "TransferBlockCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_TRANSFER_BLOCK_COUNT,
+        ),
+        "FrameBufferOverwriteActive": (
+            feat.BoolFeature,
+            gx.GxFeatureID.BOOL_FRAMESTORE_COVER_ACTIVE,
+        ),
+        "AcquisitionFrameRateMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_ACQUISITION_FRAME_RATE_MODE,
+        ),
+        "AcquisitionFrameRate": (
+            feat.FloatFeature,
+            gx.GxFeatureID.FLOAT_ACQUISITION_FRAME_RATE,
+        ),
+        "CurrentAcquisitionFrameRate": (
+            feat.FloatFeature,
+            gx.GxFeatureID.FLOAT_CURRENT_ACQUISITION_FRAME_RATE,
+        ),
+        "FixedPatternNoiseCorrectMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_FIXED_PATTERN_NOISE_CORRECT_MODE,
+        ),
+        "AcquisitionBurstFrameCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_ACQUISITION_BURST_FRAME_COUNT,
+        ),
+        "AcquisitionStatusSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_ACQUISITION_STATUS_SELECTOR,
+        ),
+        "AcquisitionStatus": (feat.BoolFeature, gx.GxFeatureID.BOOL_ACQUISITION_STATUS),
+        "ExposureDelay": (feat.FloatFeature, gx.GxFeatureID.FLOAT_EXPOSURE_DELAY),
+        "ExposureOverlapTimeMax": (
+            feat.FloatFeature,
+            gx.GxFeatureID.FLOAT_EXPOSURE_OVERLAP_TIME_MAX,
+        ),
+        "ExposureTimeMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_EXPOSURE_TIME_MODE),
+        "AcquisitionBurstMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_ACQUISITION_BURST_MODE,
+        ),
+        "OverlapMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_OVERLAP_MODE),
+        "MultiSourceSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_MULTISOURCE_SELECTOR,
+        ),
+        "MultiSourceEnable": (feat.BoolFeature, gx.GxFeatureID.BOOL_MULTISOURCE_ENABLE),
+        "TriggerCacheEnable": (
+            feat.BoolFeature,
+            gx.GxFeatureID.BOOL_TRIGGER_CACHE_ENABLE,
+        ),
 
         # ----------------DigitalIO Section----------------------------------
-        self.UserOutputSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_USER_OUTPUT_SELECTOR
-        )
-        self.UserOutputValue = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_USER_OUTPUT_VALUE
-        )
-        self.LineSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_LINE_SELECTOR
-        )
-        self.LineMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_LINE_MODE
-        )
-        self.LineInverter = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_LINE_INVERTER
-        )
-        self.LineSource = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_LINE_SOURCE
-        )
-        self.LineStatus = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_LINE_STATUS
-        )
-        self.LineStatusAll = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_LINE_STATUS_ALL
-        )
-        self.PulseWidth = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_PULSE_WIDTH
-        )
-        self.LineRange = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_LINE_RANGE
-        )
-        self.LineDelay = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_LINE_DELAY
-        )
-        self.LineFilterRaisingEdge = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_LINE_FILTER_RAISING_EDGE
-        )
-        self.LineFilterFallingEdge = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_LINE_FILTER_FALLING_EDGE
-        )
+        "UserOutputSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_USER_OUTPUT_SELECTOR,
+        ),
+        "UserOutputValue": (feat.BoolFeature, gx.GxFeatureID.BOOL_USER_OUTPUT_VALUE),
+        "LineSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_LINE_SELECTOR),
+        "LineMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_LINE_MODE),
+        "LineInverter": (feat.BoolFeature, gx.GxFeatureID.BOOL_LINE_INVERTER),
+        "LineSource": (feat.EnumFeature, gx.GxFeatureID.ENUM_LINE_SOURCE),
+        "LineStatus": (feat.BoolFeature, gx.GxFeatureID.BOOL_LINE_STATUS),
+        "LineStatusAll": (feat.IntFeature, gx.GxFeatureID.INT_LINE_STATUS_ALL),
+        "PulseWidth": (feat.FloatFeature, gx.GxFeatureID.FLOAT_PULSE_WIDTH),
+        "LineRange": (feat.IntFeature, gx.GxFeatureID.INT_LINE_RANGE),
+        "LineDelay": (feat.IntFeature, gx.GxFeatureID.INT_LINE_DELAY),
+        "LineFilterRaisingEdge": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_LINE_FILTER_RAISING_EDGE,
+        ),
+        "LineFilterFallingEdge": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_LINE_FILTER_FALLING_EDGE,
+        ),
 
         # ----------------AnalogControls Section----------------------------
-        self.GainAuto = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_GAIN_AUTO
-        )
-        self.GainSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_GAIN_SELECTOR
-        )
-        self.BlackLevelAuto = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_BLACK_LEVEL_AUTO
-        )
-        self.BlackLevelSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_BLACK_LEVEL_SELECTOR
-        )
-        self.BalanceWhiteAuto = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_BALANCE_WHITE_AUTO
-        )
-        self.BalanceRatioSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_BALANCE_RATIO_SELECTOR
-        )
-        self.BalanceRatio = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_BALANCE_RATIO
-        )
-        self.DeadPixelCorrect = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_DEAD_PIXEL_CORRECT
-        )
-        self.Gain = feat.FloatFeature(self.__dev_handle, gx.GxFeatureID.FLOAT_GAIN)
-        self.BlackLevel = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_BLACK_LEVEL
-        )
-        self.GammaEnable = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_GAMMA_ENABLE
-        )
-        self.GammaMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_GAMMA_MODE
-        )
-        self.Gamma = feat.FloatFeature(self.__dev_handle, gx.GxFeatureID.FLOAT_GAMMA)
-        self.DigitalShift = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_DIGITAL_SHIFT
-        )
-        self.LightSourcePreset = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_LIGHT_SOURCE_PRESET
-        )
-        self.BlackLevelCalibStatus = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_BLACKLEVEL_CALIB_STATUS
-        )
-        self.BlackLevelCalibValue = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_BLACKLEVEL_CALIB_VALUE
-        )
-        self.PGAGain = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_PGA_GAIN
-        )
+        "GainAuto": (feat.EnumFeature, gx.GxFeatureID.ENUM_GAIN_AUTO),
+        "GainSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_GAIN_SELECTOR),
+        "BlackLevelAuto": (feat.EnumFeature, gx.GxFeatureID.ENUM_BLACK_LEVEL_AUTO),
+        "BlackLevelSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_BLACK_LEVEL_SELECTOR,
+        ),
+        "BalanceWhiteAuto": (feat.EnumFeature, gx.GxFeatureID.ENUM_BALANCE_WHITE_AUTO),
+        "BalanceRatioSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_BALANCE_RATIO_SELECTOR,
+        ),
+        "BalanceRatio": (feat.FloatFeature, gx.GxFeatureID.FLOAT_BALANCE_RATIO),
+        "DeadPixelCorrect": (feat.EnumFeature, gx.GxFeatureID.ENUM_DEAD_PIXEL_CORRECT),
+        "Gain": (feat.FloatFeature, gx.GxFeatureID.FLOAT_GAIN),
+        "BlackLevel": (feat.FloatFeature, gx.GxFeatureID.FLOAT_BLACK_LEVEL),
+        "GammaEnable": (feat.BoolFeature, gx.GxFeatureID.BOOL_GAMMA_ENABLE),
+        "GammaMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_GAMMA_MODE),
+        "Gamma": (feat.FloatFeature, gx.GxFeatureID.FLOAT_GAMMA),
+        "DigitalShift": (feat.IntFeature, gx.GxFeatureID.INT_DIGITAL_SHIFT),
+        "LightSourcePreset": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_LIGHT_SOURCE_PRESET,
+        ),
+        "BlackLevelCalibStatus": (
+            feat.BoolFeature,
+            gx.GxFeatureID.BOOL_BLACKLEVEL_CALIB_STATUS,
+        ),
+        "BlackLevelCalibValue": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_BLACKLEVEL_CALIB_VALUE,
+        ),
+        "PGAGain": (feat.FloatFeature, gx.GxFeatureID.FLOAT_PGA_GAIN),
 
         # ---------------CustomFeature Section------------------------------
-        self.ExpectedGrayValue = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_GRAY_VALUE
-        )
-        self.AAROIOffsetX = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_AAROI_OFFSETX
-        )
-        self.AAROIOffsetY = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_AAROI_OFFSETY
-        )
-        self.AAROIWidth = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_AAROI_WIDTH
-        )
-        self.AAROIHeight = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_AAROI_HEIGHT
-        )
-        self.AutoGainMin = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_AUTO_GAIN_MIN
-        )
-        self.AutoGainMax = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_AUTO_GAIN_MAX
-        )
-        self.AutoExposureTimeMin = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_AUTO_EXPOSURE_TIME_MIN
-        )
-        self.AutoExposureTimeMax = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_AUTO_EXPOSURE_TIME_MAX
-        )
-        self.ContrastParam = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_CONTRAST_PARAM
-        )
-        self.GammaParam = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_GAMMA_PARAM
-        )
-        self.ColorCorrectionParam = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_COLOR_CORRECTION_PARAM
-        )
-        self.AWBLampHouse = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_AWB_LAMP_HOUSE
-        )
-        self.AWBROIOffsetX = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_AWBROI_OFFSETX
-        )
-        self.AWBROIOffsetY = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_AWBROI_OFFSETY
-        )
-        self.AWBROIWidth = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_AWBROI_WIDTH
-        )
-        self.AWBROIHeight = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_AWBROI_HEIGHT
-        )
-        self.SharpnessMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SHARPNESS_MODE
-        )
-        self.Sharpness = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_SHARPNESS
-        )
-        self.DataFieldSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_USER_DATA_FIELD_SELECTOR
-        )
-        self.DataFieldValue = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_USER_DATA_FIELD_VALUE
-        )
-        self.FlatFieldCorrection = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_FLAT_FIELD_CORRECTION
-        )
-        self.NoiseReductionMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_NOISE_REDUCTION_MODE
-        )
-        self.NoiseReduction = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_NOISE_REDUCTION
-        )
-        self.FFCLoad = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_FFCLOAD
-        )
-        self.FFCSave = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_FFCSAVE
-        )
-        self.StaticDefectCorrection = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_STATIC_DEFECT_CORRECTION
-        )
-        self.NoiseReductionMode2D = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_2D_NOISE_REDUCTION_MODE
-        )
-        self.NoiseReductionMode3D = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_3D_NOISE_REDUCTION_MODE
-        )
-        self.CloseISP = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_CLOSE_ISP
-        )
-        self.StaticDefectCorrectionValueAll = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_STATIC_DEFECT_CORRECTION_VALUE_ALL
-        )
-        self.StaticDefectCorrectionFlashValue = feat.BufferFeature(
-            self.__dev_handle,
+        "ExpectedGrayValue": (feat.IntFeature, gx.GxFeatureID.INT_GRAY_VALUE),
+        "AAROIOffsetX": (feat.IntFeature, gx.GxFeatureID.INT_AAROI_OFFSETX),
+        "AAROIOffsetY": (feat.IntFeature, gx.GxFeatureID.INT_AAROI_OFFSETY),
+        "AAROIWidth": (feat.IntFeature, gx.GxFeatureID.INT_AAROI_WIDTH),
+        "AAROIHeight": (feat.IntFeature, gx.GxFeatureID.INT_AAROI_HEIGHT),
+        "AutoGainMin": (feat.FloatFeature, gx.GxFeatureID.FLOAT_AUTO_GAIN_MIN),
+        "AutoGainMax": (feat.FloatFeature, gx.GxFeatureID.FLOAT_AUTO_GAIN_MAX),
+        "AutoExposureTimeMin": (
+            feat.FloatFeature,
+            gx.GxFeatureID.FLOAT_AUTO_EXPOSURE_TIME_MIN,
+        ),
+        "AutoExposureTimeMax": (
+            feat.FloatFeature,
+            gx.GxFeatureID.FLOAT_AUTO_EXPOSURE_TIME_MAX,
+        ),
+        "ContrastParam": (feat.IntFeature, gx.GxFeatureID.INT_CONTRAST_PARAM),
+        "GammaParam": (feat.FloatFeature, gx.GxFeatureID.FLOAT_GAMMA_PARAM),
+        "ColorCorrectionParam": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_COLOR_CORRECTION_PARAM,
+        ),
+        "AWBLampHouse": (feat.EnumFeature, gx.GxFeatureID.ENUM_AWB_LAMP_HOUSE),
+        "AWBROIOffsetX": (feat.IntFeature, gx.GxFeatureID.INT_AWBROI_OFFSETX),
+        "AWBROIOffsetY": (feat.IntFeature, gx.GxFeatureID.INT_AWBROI_OFFSETY),
+        "AWBROIWidth": (feat.IntFeature, gx.GxFeatureID.INT_AWBROI_WIDTH),
+        "AWBROIHeight": (feat.IntFeature, gx.GxFeatureID.INT_AWBROI_HEIGHT),
+        "SharpnessMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_SHARPNESS_MODE),
+        "Sharpness": (feat.FloatFeature, gx.GxFeatureID.FLOAT_SHARPNESS),
+        "DataFieldSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_USER_DATA_FIELD_SELECTOR,
+        ),
+        "DataFieldValue": (
+            feat.BufferFeature,
+            gx.GxFeatureID.BUFFER_USER_DATA_FIELD_VALUE,
+        ),
+        "FlatFieldCorrection": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_FLAT_FIELD_CORRECTION,
+        ),
+        "NoiseReductionMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_NOISE_REDUCTION_MODE,
+        ),
+        "NoiseReduction": (feat.FloatFeature, gx.GxFeatureID.FLOAT_NOISE_REDUCTION),
+        "FFCLoad": (feat.BufferFeature, gx.GxFeatureID.BUFFER_FFCLOAD),
+        "FFCSave": (feat.BufferFeature, gx.GxFeatureID.BUFFER_FFCSAVE),
+        "StaticDefectCorrection": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_STATIC_DEFECT_CORRECTION,
+        ),
+        "NoiseReductionMode2D": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_2D_NOISE_REDUCTION_MODE,
+        ),
+        "NoiseReductionMode3D": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_3D_NOISE_REDUCTION_MODE,
+        ),
+        "CloseISP": (feat.CommandFeature, gx.GxFeatureID.COMMAND_CLOSE_ISP),
+        "StaticDefectCorrectionValueAll": (
+            feat.BufferFeature,
+            gx.GxFeatureID.BUFFER_STATIC_DEFECT_CORRECTION_VALUE_ALL,
+        ),
+        "StaticDefectCorrectionFlashValue": (
+            feat.BufferFeature,
             gx.GxFeatureID.BUFFER_STATIC_DEFECT_CORRECTION_FLASH_VALUE,
-        )
-        self.StaticDefectCorrectionFinish = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_STATIC_DEFECT_CORRECTION_FINISH
-        )
-        self.StaticDefectCorrectionInfo = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_STATIC_DEFECT_CORRECTION_INFO
-        )
-        self.StripCalibrationStart = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_STRIP_CALIBRATION_START
-        )
-        self.StripCalibrationStop = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_STRIP_CALIBRATION_STOP
-        )
-        self.UserDataFiledValueAll = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_USER_DATA_FILED_VALUE_ALL
-        )
-        self.ShadingCorrectionMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SHADING_CORRECTION_MODE
-        )
-        self.FFCGenerate = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_FFC_GENERATE
-        )
-        self.FFCGenerateStatus = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_FFC_GENERATE_STATUS
-        )
-        self.FFCExpectedGrayValueEnable = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_FFC_EXPECTED_GRAY_VALUE_ENABLE
-        )
-        self.FFCExpectedGray = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_FFC_EXPECTED_GRAY
-        )
-        self.FFCCoeffinientsSize = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_FFC_COEFFICIENTS_SIZE
-        )
-        self.FFCValueAll = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_FFC_VALUE_ALL
-        )
-        self.DSNUSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_DSNU_SELECTOR
-        )
-        self.DSNUGenerate = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_DSNU_GENERATE
-        )
-        self.DSNUGenerateStatus = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_DSNU_GENERATE_STATUS
-        )
-        self.DSNUSave = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_DSNU_SAVE
-        )
-        self.DSNULoad = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_DSNU_LOAD
-        )
-        self.PRNUSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_PRNU_SELECTOR
-        )
-        self.PRNUGenerate = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_PRNU_GENERATE
-        )
-        self.PRNUGenerateStatus = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_PRNU_GENERATE_STATUS
-        )
-        self.PRNUSave = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_PRNU_SAVE
-        )
-        self.PRNULoad = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_PRNU_LOAD
-        )
-        self.DataFieldValueAll = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_USER_DATA_FILED_VALUE_ALL
-        )
-        self.StaticDefectCorrectionCalibStatus = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_STATIC_DEFECT_CORRECTION_CALIB_STATUS
-        )
-        self.FFCFactoryStatus = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_FFC_FACTORY_STATUS
-        )
-        self.DSNUFactoryStatus = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_DSNU_FACTORY_STATUS
-        )
-        self.PRNUFactoryStatus = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_PRNU_FACTORY_STATUS
-        )
-        self.Detect = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_DETECT
-        )
-        self.FFCCoefficient = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_FFC_COEFFICIENT
-        )
-        self.FFCFlashLoad = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_FFCFLASH_LOAD
-        )
-        self.FFCFlashSave = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_FFCFLASH_SAVE
-        )
+        ),
+        "StaticDefectCorrectionFinish": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_STATIC_DEFECT_CORRECTION_FINISH,
+        ),
+        "StaticDefectCorrectionInfo": (
+            feat.BufferFeature,
+            gx.GxFeatureID.BUFFER_STATIC_DEFECT_CORRECTION_INFO,
+        ),
+        "StripCalibrationStart": (
+            feat.CommandFeature,
+            gx.GxFeatureID.COMMAND_STRIP_CALIBRATION_START,
+        ),
+        "StripCalibrationStop": (
+            feat.CommandFeature,
+            gx.GxFeatureID.COMMAND_STRIP_CALIBRATION_STOP,
+        ),
+        "UserDataFiledValueAll": (
+            feat.BufferFeature,
+            gx.GxFeatureID.BUFFER_USER_DATA_FILED_VALUE_ALL,
+        ),
+        "ShadingCorrectionMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_SHADING_CORRECTION_MODE,
+        ),
+        "FFCGenerate": (feat.CommandFeature, gx.GxFeatureID.COMMAND_FFC_GENERATE),
+        "FFCGenerateStatus": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_FFC_GENERATE_STATUS,
+        ),
+        "FFCExpectedGrayValueEnable": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_FFC_EXPECTED_GRAY_VALUE_ENABLE,
+        ),
+        "FFCExpectedGray": (feat.IntFeature, gx.GxFeatureID.INT_FFC_EXPECTED_GRAY),
+        "FFCCoeffinientsSize": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_FFC_COEFFICIENTS_SIZE,
+        ),
+        "FFCValueAll": (feat.BufferFeature, gx.GxFeatureID.BUFFER_FFC_VALUE_ALL),
+        "DSNUSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_DSNU_SELECTOR),
+        "DSNUGenerate": (feat.CommandFeature, gx.GxFeatureID.COMMAND_DSNU_GENERATE),
+        "DSNUGenerateStatus": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_DSNU_GENERATE_STATUS,
+        ),
+        "DSNUSave": (feat.CommandFeature, gx.GxFeatureID.COMMAND_DSNU_SAVE),
+        "DSNULoad": (feat.CommandFeature, gx.GxFeatureID.COMMAND_DSNU_LOAD),
+        "PRNUSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_PRNU_SELECTOR),
+        "PRNUGenerate": (feat.CommandFeature, gx.GxFeatureID.COMMAND_PRNU_GENERATE),
+        "PRNUGenerateStatus": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_PRNU_GENERATE_STATUS,
+        ),
+        "PRNUSave": (feat.CommandFeature, gx.GxFeatureID.COMMAND_PRNU_SAVE),
+        "PRNULoad": (feat.CommandFeature, gx.GxFeatureID.COMMAND_PRNU_LOAD),
+        "DataFieldValueAll": (
+            feat.BufferFeature,
+            gx.GxFeatureID.BUFFER_USER_DATA_FILED_VALUE_ALL,
+        ),
+        "StaticDefectCorrectionCalibStatus": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_STATIC_DEFECT_CORRECTION_CALIB_STATUS,
+        ),
+        "FFCFactoryStatus": (feat.IntFeature, gx.GxFeatureID.INT_FFC_FACTORY_STATUS),
+        "DSNUFactoryStatus": (feat.IntFeature, gx.GxFeatureID.INT_DSNU_FACTORY_STATUS),
+        "PRNUFactoryStatus": (feat.IntFeature, gx.GxFeatureID.INT_PRNU_FACTORY_STATUS),
+        "Detect": (feat.BufferFeature, gx.GxFeatureID.BUFFER_DETECT),
+        "FFCCoefficient": (feat.EnumFeature, gx.GxFeatureID.ENUM_FFC_COEFFICIENT),
+        "FFCFlashLoad": (feat.BufferFeature, gx.GxFeatureID.BUFFER_FFCFLASH_LOAD),
+        "FFCFlashSave": (feat.BufferFeature, gx.GxFeatureID.BUFFER_FFCFLASH_SAVE),
 
         # ---------------UserSetControl Section-------------------------------
-        self.UserSetSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_USER_SET_SELECTOR
-        )
-        self.UserSetLoad = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_USER_SET_LOAD
-        )
-        self.UserSetSave = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_USER_SET_SAVE
-        )
-        self.UserSetDefault = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_USER_SET_DEFAULT
-        )
-        self.DataFieldValueAllUsedStatus = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_DATA_FIELD_VALUE_ALL_USED_STATUS
-        )
+        "UserSetSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_USER_SET_SELECTOR),
+        "UserSetLoad": (feat.CommandFeature, gx.GxFeatureID.COMMAND_USER_SET_LOAD),
+        "UserSetSave": (feat.CommandFeature, gx.GxFeatureID.COMMAND_USER_SET_SAVE),
+        "UserSetDefault": (feat.EnumFeature, gx.GxFeatureID.ENUM_USER_SET_DEFAULT),
+        "DataFieldValueAllUsedStatus": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_DATA_FIELD_VALUE_ALL_USED_STATUS,
+        ),
 
         # ---------------Event Section----------------------------------------
-        self.EventSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_EVENT_SELECTOR
-        )
-        self.EventNotification = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_EVENT_NOTIFICATION
-        )
-        self.EventExposureEnd = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_EXPOSURE_END
-        )
-        self.EventExposureEndTimestamp = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_EXPOSURE_END_TIMESTAMP
-        )
-        self.EventExposureEndFrameID = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_EXPOSURE_END_FRAME_ID
-        )
-        self.EventBlockDiscard = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_BLOCK_DISCARD
-        )
-        self.EventBlockDiscardTimestamp = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_BLOCK_DISCARD_TIMESTAMP
-        )
-        self.EventOverrun = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_OVERRUN
-        )
-        self.EventOverrunTimestamp = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_OVERRUN_TIMESTAMP
-        )
-        self.EventFrameStartOvertrigger = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_FRAME_START_OVER_TRIGGER
-        )
-        self.EventFrameStartOvertriggerTimestamp = feat.IntFeature(
-            self.__dev_handle,
+        "EventSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_EVENT_SELECTOR),
+        "EventNotification": (feat.EnumFeature, gx.GxFeatureID.ENUM_EVENT_NOTIFICATION),
+        "EventExposureEnd": (feat.IntFeature, gx.GxFeatureID.INT_EVENT_EXPOSURE_END),
+        "EventExposureEndTimestamp": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_EXPOSURE_END_TIMESTAMP,
+        ),
+        "EventExposureEndFrameID": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_EXPOSURE_END_FRAME_ID,
+        ),
+        "EventBlockDiscard": (feat.IntFeature, gx.GxFeatureID.INT_EVENT_BLOCK_DISCARD),
+        "EventBlockDiscardTimestamp": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_BLOCK_DISCARD_TIMESTAMP,
+        ),
+        "EventOverrun": (feat.IntFeature, gx.GxFeatureID.INT_EVENT_OVERRUN),
+        "EventOverrunTimestamp": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_OVERRUN_TIMESTAMP,
+        ),
+        "EventFrameStartOvertrigger": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_FRAME_START_OVER_TRIGGER,
+        ),
+        "EventFrameStartOvertriggerTimestamp": (
+            feat.IntFeature,
             gx.GxFeatureID.INT_EVENT_FRAME_START_OVER_TRIGGER_TIMESTAMP,
-        )
-        self.EventBlockNotEmpty = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY
-        )
-        self.EventBlockNotEmptyTimestamp = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY_TIMESTAMP
-        )
-        self.EventInternalError = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_INTERNAL_ERROR
-        )
-        self.EventInternalErrorTimestamp = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_INTERNAL_ERROR_TIMESTAMP
-        )
-        self.EventFrameBurstStartOvertrigger = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_FRAMEBURSTSTART_OVERTRIGGER
-        )
-        self.EventFrameBurstStartOvertriggerFrameID = feat.IntFeature(
-            self.__dev_handle,
+        ),
+        "EventBlockNotEmpty": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY,
+        ),
+        "EventBlockNotEmptyTimestamp": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY_TIMESTAMP,
+        ),
+        "EventInternalError": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_INTERNAL_ERROR,
+        ),
+        "EventInternalErrorTimestamp": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_INTERNAL_ERROR_TIMESTAMP,
+        ),
+        "EventFrameBurstStartOvertrigger": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_FRAMEBURSTSTART_OVERTRIGGER,
+        ),
+        "EventFrameBurstStartOvertriggerFrameID": (
+            feat.IntFeature,
             gx.GxFeatureID.INT_EVENT_FRAMEBURSTSTART_OVERTRIGGER_FRAMEID,
-        )
-        self.EventFrameBurstStartOvertriggerTimestamp = feat.IntFeature(
-            self.__dev_handle,
+        ),
+        "EventFrameBurstStartOvertriggerTimestamp": (
+            feat.IntFeature,
             gx.GxFeatureID.INT_EVENT_FRAMEBURSTSTART_OVERTRIGGER_TIMESTAMP,
-        )
-        self.EventFrameStartWait = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_FRAMESTART_WAIT
-        )
-        self.EventFrameStartWaitTimestamp = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_FRAMESTART_WAIT_TIMESTAMP
-        )
-        self.EventFrameBurstStartWait = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT
-        )
-        self.EventFrameBurstStartWaitTimestamp = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT_TIMESTAMP
-        )
-        self.EventBlockDiscardFrameID = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_BLOCK_DISCARD_FRAMEID
-        )
-        self.EventFrameStartOvertriggerFrameID = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_FRAMESTART_OVERTRIGGER_FRAMEID
-        )
-        self.EventBlockNotEmptyFrameID = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY_FRAMEID
-        )
-        self.EventFrameStartWaitFrameID = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_FRAMESTART_WAIT_FRAMEID
-        )
-        self.EventFrameBurstStartWaitFrameID = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT_FRAMEID
-        )
-        self.EventSimpleMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_EVENT_SIMPLE_MODE
-        )
+        ),
+        "EventFrameStartWait": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_FRAMESTART_WAIT,
+        ),
+        "EventFrameStartWaitTimestamp": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_FRAMESTART_WAIT_TIMESTAMP,
+        ),
+        "EventFrameBurstStartWait": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT,
+        ),
+        "EventFrameBurstStartWaitTimestamp": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT_TIMESTAMP,
+        ),
+        "EventBlockDiscardFrameID": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_BLOCK_DISCARD_FRAMEID,
+        ),
+        "EventFrameStartOvertriggerFrameID": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_FRAMESTART_OVERTRIGGER_FRAMEID,
+        ),
+        "EventBlockNotEmptyFrameID": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY_FRAMEID,
+        ),
+        "EventFrameStartWaitFrameID": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_FRAMESTART_WAIT_FRAMEID,
+        ),
+        "EventFrameBurstStartWaitFrameID": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT_FRAMEID,
+        ),
+        "EventSimpleMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_EVENT_SIMPLE_MODE),
 
         # ---------------LUT Section------------------------------------------
-        self.LUTSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_LUT_SELECTOR
-        )
-        self.LUTValueAll = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_LUT_VALUE_ALL
-        )
-        self.LUTEnable = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_LUT_ENABLE
-        )
-        self.LUTIndex = feat.IntFeature(self.__dev_handle, gx.GxFeatureID.INT_LUT_INDEX)
-        self.LUTValue = feat.IntFeature(self.__dev_handle, gx.GxFeatureID.INT_LUT_VALUE)
-        self.LUTFactoryStatus = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_LUT_FACTORY_STATUS
-        )
+        "LUTSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_LUT_SELECTOR),
+        "LUTValueAll": (feat.BufferFeature, gx.GxFeatureID.BUFFER_LUT_VALUE_ALL),
+        "LUTEnable": (feat.BoolFeature, gx.GxFeatureID.BOOL_LUT_ENABLE),
+        "LUTIndex": (feat.IntFeature, gx.GxFeatureID.INT_LUT_INDEX),
+        "LUTValue": (feat.IntFeature, gx.GxFeatureID.INT_LUT_VALUE),
+        "LUTFactoryStatus": (feat.IntFeature, gx.GxFeatureID.INT_LUT_FACTORY_STATUS),
 
         # ---------------ChunkData Section------------------------------------
-        self.ChunkModeActive = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_CHUNK_MODE_ACTIVE
-        )
-        self.ChunkSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_CHUNK_SELECTOR
-        )
-        self.ChunkEnable = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_CHUNK_ENABLE
-        )
+        "ChunkModeActive": (feat.BoolFeature, gx.GxFeatureID.BOOL_CHUNK_MODE_ACTIVE),
+        "ChunkSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_CHUNK_SELECTOR),
+        "ChunkEnable": (feat.BoolFeature, gx.GxFeatureID.BOOL_CHUNK_ENABLE),
 
         # ---------------Color Transformation Control-------------------------
-        self.ColorTransformationMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_COLOR_TRANSFORMATION_MODE
-        )
-        self.ColorTransformationEnable = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_COLOR_TRANSFORMATION_ENABLE
-        )
-        self.ColorTransformationValueSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_COLOR_TRANSFORMATION_VALUE_SELECTOR
-        )
-        self.ColorTransformationValue = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_COLOR_TRANSFORMATION_VALUE
-        )
-        self.SaturationMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SATURATION_MODE
-        )
-        self.Saturation = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SATURATION
-        )
+        "ColorTransformationMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_COLOR_TRANSFORMATION_MODE,
+        ),
+        "ColorTransformationEnable": (
+            feat.BoolFeature,
+            gx.GxFeatureID.BOOL_COLOR_TRANSFORMATION_ENABLE,
+        ),
+        "ColorTransformationValueSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_COLOR_TRANSFORMATION_VALUE_SELECTOR,
+        ),
+        "ColorTransformationValue": (
+            feat.FloatFeature,
+            gx.GxFeatureID.FLOAT_COLOR_TRANSFORMATION_VALUE,
+        ),
+        "SaturationMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_SATURATION_MODE),
+        "Saturation": (feat.IntFeature, gx.GxFeatureID.INT_SATURATION),
 
         # ---------------CounterAndTimerControl Section-----------------------
-        self.TimerSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TIMER_SELECTOR
-        )
-        self.TimerDuration = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_TIMER_DURATION
-        )
-        self.TimerDelay = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_TIMER_DELAY
-        )
-        self.TimerTriggerSource = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TIMER_TRIGGER_SOURCE
-        )
-        self.CounterSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_COUNTER_SELECTOR
-        )
-        self.CounterEventSource = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_COUNTER_EVENT_SOURCE
-        )
-        self.CounterResetSource = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_COUNTER_RESET_SOURCE
-        )
-        self.CounterResetActivation = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_COUNTER_RESET_ACTIVATION
-        )
-        self.CounterReset = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_COUNTER_RESET
-        )
-        self.CounterTriggerSource = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_COUNTER_TRIGGER_SOURCE
-        )
-        self.CounterDuration = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_COUNTER_DURATION
-        )
-        self.TimerTriggerActivation = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TIMER_TRIGGER_ACTIVATION
-        )
-        self.CounterValue = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_COUNTER_VALUE
-        )
+        "TimerSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_TIMER_SELECTOR),
+        "TimerDuration": (feat.FloatFeature, gx.GxFeatureID.FLOAT_TIMER_DURATION),
+        "TimerDelay": (feat.FloatFeature, gx.GxFeatureID.FLOAT_TIMER_DELAY),
+        "TimerTriggerSource": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_TIMER_TRIGGER_SOURCE,
+        ),
+        "CounterSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_COUNTER_SELECTOR),
+        "CounterEventSource": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_COUNTER_EVENT_SOURCE,
+        ),
+        "CounterResetSource": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_COUNTER_RESET_SOURCE,
+        ),
+        "CounterResetActivation": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_COUNTER_RESET_ACTIVATION,
+        ),
+        "CounterReset": (feat.CommandFeature, gx.GxFeatureID.COMMAND_COUNTER_RESET),
+        "CounterTriggerSource": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_COUNTER_TRIGGER_SOURCE,
+        ),
+        "CounterDuration": (feat.IntFeature, gx.GxFeatureID.INT_COUNTER_DURATION),
+        "TimerTriggerActivation": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_TIMER_TRIGGER_ACTIVATION,
+        ),
+        "CounterValue": (feat.IntFeature, gx.GxFeatureID.INT_COUNTER_VALUE),
 
         # ---------------RemoveParameterLimitControl Section------------------
-        self.RemoveParameterLimit = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_REMOVE_PARAMETER_LIMIT
-        )
+        "RemoveParameterLimit": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_REMOVE_PARAMETER_LIMIT,
+        ),
 
         # ---------------HDRControl Section------------------
-        self.HDRMode = feat.EnumFeature(self.__dev_handle, gx.GxFeatureID.ENUM_HDR_MODE)
-        self.HDRTargetLongValue = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_HDR_TARGET_LONG_VALUE
-        )
-        self.HDRTargetShortValue = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_HDR_TARGET_SHORT_VALUE
-        )
-        self.HDRTargetMainValue = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_HDR_TARGET_MAIN_VALUE
-        )
+        "HDRMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_HDR_MODE),
+        "HDRTargetLongValue": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_HDR_TARGET_LONG_VALUE,
+        ),
+        "HDRTargetShortValue": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_HDR_TARGET_SHORT_VALUE,
+        ),
+        "HDRTargetMainValue": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_HDR_TARGET_MAIN_VALUE,
+        ),
 
         # ---------------MultiGrayControl Section------------------
-        self.MGCMode = feat.EnumFeature(self.__dev_handle, gx.GxFeatureID.ENUM_MGC_MODE)
-        self.MGCSelector = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_MGC_SELECTOR
-        )
-        self.MGCExposureTime = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_MGC_EXPOSURE_TIME
-        )
-        self.MGCGain = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_MGC_GAIN
-        )
+        "MGCMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_MGC_MODE),
+        "MGCSelector": (feat.IntFeature, gx.GxFeatureID.INT_MGC_SELECTOR),
+        "MGCExposureTime": (feat.FloatFeature, gx.GxFeatureID.FLOAT_MGC_EXPOSURE_TIME),
+        "MGCGain": (feat.FloatFeature, gx.GxFeatureID.FLOAT_MGC_GAIN),
 
         # ---------------ImageQualityControl Section------------------
-        self.StripedCalibrationInfo = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_STRIPED_CALIBRATION_INFO
-        )
-        self.Contrast = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_CONTRAST
-        )
-        self.HotPixelCorrection = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_HOTPIXEL_CORRECTION
-        )
+        "StripedCalibrationInfo": (
+            feat.BufferFeature,
+            gx.GxFeatureID.BUFFER_STRIPED_CALIBRATION_INFO,
+        ),
+        "Contrast": (feat.FloatFeature, gx.GxFeatureID.FLOAT_CONTRAST),
+        "HotPixelCorrection": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_HOTPIXEL_CORRECTION,
+        ),
 
         # ---------------GyroControl Section------------------
-        self.IMUData = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_IMU_DATA
-        )
-        self.IMUConfigAccRange = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_IMU_CONFIG_ACC_RANGE
-        )
-        self.IMUConfigAccOdrLowPassFilterSwitch = feat.EnumFeature(
-            self.__dev_handle,
+        "IMUData": (feat.BufferFeature, gx.GxFeatureID.BUFFER_IMU_DATA),
+        "IMUConfigAccRange": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_IMU_CONFIG_ACC_RANGE,
+        ),
+        "IMUConfigAccOdrLowPassFilterSwitch": (
+            feat.EnumFeature,
             gx.GxFeatureID.ENUM_IMU_CONFIG_ACC_ODR_LOW_PASS_FILTER_SWITCH,
-        )
-        self.IMUConfigAccOdr = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_IMU_CONFIG_ACC_ODR
-        )
-        self.IMUConfigAccOdrLowPassFilterFrequency = feat.EnumFeature(
-            self.__dev_handle,
+        ),
+        "IMUConfigAccOdr": (feat.EnumFeature, gx.GxFeatureID.ENUM_IMU_CONFIG_ACC_ODR),
+        "IMUConfigAccOdrLowPassFilterFrequency": (
+            feat.EnumFeature,
             gx.GxFeatureID.ENUM_IMU_CONFIG_ACC_ODR_LOW_PASS_FILTER_FREQUENCY,
-        )
-        self.IMUConfigGyroXRange = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_IMU_CONFIG_GYRO_XRANGE
-        )
-        self.IMUConfigGyroYRange = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_IMU_CONFIG_GYRO_YRANGE
-        )
-        self.IMUConfigGyroZRange = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_IMU_CONFIG_GYRO_ZRANGE
-        )
-        self.IMUConfigGyroOdrLowPassFilterSwitch = feat.EnumFeature(
-            self.__dev_handle,
+        ),
+        "IMUConfigGyroXRange": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_IMU_CONFIG_GYRO_XRANGE,
+        ),
+        "IMUConfigGyroYRange": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_IMU_CONFIG_GYRO_YRANGE,
+        ),
+        "IMUConfigGyroZRange": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_IMU_CONFIG_GYRO_ZRANGE,
+        ),
+        "IMUConfigGyroOdrLowPassFilterSwitch": (
+            feat.EnumFeature,
             gx.GxFeatureID.ENUM_IMU_CONFIG_GYRO_ODR_LOW_PASS_FILTER_SWITCH,
-        )
-        self.IMUConfigGyroOdr = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_IMU_CONFIG_GYRO_ODR
-        )
-        self.IMUConfigGyroOdrLowPassFilterFrequency = feat.EnumFeature(
-            self.__dev_handle,
+        ),
+        "IMUConfigGyroOdr": (feat.EnumFeature, gx.GxFeatureID.ENUM_IMU_CONFIG_GYRO_ODR),
+        "IMUConfigGyroOdrLowPassFilterFrequency": (
+            feat.EnumFeature,
             gx.GxFeatureID.ENUM_IMU_CONFIG_GYRO_ODR_LOW_PASS_FILTER_FREQUENCY,
-        )
-        self.IMURoomTemperature = feat.FloatFeature(
-            self.__dev_handle, gx.GxFeatureID.FLOAT_IMU_ROOM_TEMPERATURE
-        )
-        self.IMUTemperatureOdr = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_IMU_TEMPERATURE_ODR
-        )
+        ),
+        "IMURoomTemperature": (
+            feat.FloatFeature,
+            gx.GxFeatureID.FLOAT_IMU_ROOM_TEMPERATURE,
+        ),
+        "IMUTemperatureOdr": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_IMU_TEMPERATURE_ODR,
+        ),
 
         # ---------------FrameBufferControl Section------------------
-        self.FrameBufferCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_FRAME_BUFFER_COUNT
-        )
-        self.FrameBufferFlush = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_FRAME_BUFFER_FLUSH
-        )
+        "FrameBufferCount": (feat.IntFeature, gx.GxFeatureID.INT_FRAME_BUFFER_COUNT),
+        "FrameBufferFlush": (
+            feat.CommandFeature,
+            gx.GxFeatureID.COMMAND_FRAME_BUFFER_FLUSH,
+        ),
 
         # ---------------SerialPortControl Section------------------
-        self.DeviceSerialPortSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SERIALPORT_SELECTOR
-        )
-        self.SerialPortSource = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SERIALPORT_SOURCE
-        )
-        self.DeviceSerialPortBaudRate = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SERIALPORT_BAUDRATE
-        )
-        self.SerialPortDataBits = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SERIALPORT_DATA_BITS
-        )
-        self.SerialPortStopBits = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SERIALPORT_STOP_BITS
-        )
-        self.SerialPortParity = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SERIALPORT_PARITY
-        )
-        self.TransmitQueueMaxCharacterCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_TRANSMIT_QUEUE_MAX_CHARACTER_COUNT
-        )
-        self.TransmitQueueCurrentCharacterCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_TRANSMIT_QUEUE_CURRENT_CHARACTER_COUNT
-        )
-        self.ReceiveQueueMaxCharacterCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_RECEIVE_QUEUE_MAX_CHARACTER_COUNT
-        )
-        self.ReceiveQueueCurrentCharacterCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_RECEIVE_QUEUE_CURRENT_CHARACTER_COUNT
-        )
-        self.ReceiveFramingErrorCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT
-        )
-        self.ReceiveParityErrorCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_RECEIVE_PARITY_ERROR_COUNT
-        )
-        self.ReceiveQueueClear = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_RECEIVE_QUEUE_CLEAR
-        )
-        self.SerialPortData = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_SERIALPORT_DATA
-        )
-        self.SerialPortDataLength = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SERIALPORT_DATA_LENGTH
-        )
-        self.SerialPortDetectionStatus = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SERIAL_PORT_DETECTION_STATUS
-        )
+        "DeviceSerialPortSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_SERIALPORT_SELECTOR,
+        ),
+        "SerialPortSource": (feat.EnumFeature, gx.GxFeatureID.ENUM_SERIALPORT_SOURCE),
+        "DeviceSerialPortBaudRate": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_SERIALPORT_BAUDRATE,
+        ),
+        "SerialPortDataBits": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_SERIALPORT_DATA_BITS,
+        ),
+        "SerialPortStopBits": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_SERIALPORT_STOP_BITS,
+        ),
+        "SerialPortParity": (feat.EnumFeature, gx.GxFeatureID.ENUM_SERIALPORT_PARITY),
+        "TransmitQueueMaxCharacterCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_TRANSMIT_QUEUE_MAX_CHARACTER_COUNT,
+        ),
+        "TransmitQueueCurrentCharacterCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_TRANSMIT_QUEUE_CURRENT_CHARACTER_COUNT,
+        ),
+        "ReceiveQueueMaxCharacterCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_RECEIVE_QUEUE_MAX_CHARACTER_COUNT,
+        ),
+        "ReceiveQueueCurrentCharacterCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_RECEIVE_QUEUE_CURRENT_CHARACTER_COUNT,
+        ),
+        "ReceiveFramingErrorCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT,
+        ),
+        "ReceiveParityErrorCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_RECEIVE_PARITY_ERROR_COUNT,
+        ),
+        "ReceiveQueueClear": (
+            feat.CommandFeature,
+            gx.GxFeatureID.COMMAND_RECEIVE_QUEUE_CLEAR,
+        ),
+        "SerialPortData": (feat.BufferFeature, gx.GxFeatureID.BUFFER_SERIALPORT_DATA),
+        "SerialPortDataLength": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_SERIALPORT_DATA_LENGTH,
+        ),
+        "SerialPortDetectionStatus": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_SERIAL_PORT_DETECTION_STATUS,
+        ),
 
         # ---------------CoaXPress Section------------------
-        self.CxpLinkConfiguration = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_CXP_LINK_CONFIGURATION
-        )
-        self.CxpLinkConfigurationPreferred = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_CXP_LINK_CONFIGURATION_PREFERRED
-        )
-        self.CxpLinkConfigurationStatus = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_CXP_LINK_CONFIGURATION_STATUS
-        )
-        self.Image1StreamID = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_IMAGE1_STREAM_ID
-        )
-        self.CxpConnectionSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_CXP_CONNECTION_SELECTOR
-        )
-        self.CxpConnectionTestMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_CXP_CONNECTION_TEST_MODE
-        )
-        self.CxpConnectionTestErrorCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT
-        )
-        self.CxpConnectionTestPacketRxCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT
-        )
-        self.CxpConnectionTestPacketTxCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT
-        )
+        "CxpLinkConfiguration": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_CXP_LINK_CONFIGURATION,
+        ),
+        "CxpLinkConfigurationPreferred": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_CXP_LINK_CONFIGURATION_PREFERRED,
+        ),
+        "CxpLinkConfigurationStatus": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_CXP_LINK_CONFIGURATION_STATUS,
+        ),
+        "Image1StreamID": (feat.IntFeature, gx.GxFeatureID.INT_IMAGE1_STREAM_ID),
+        "CxpConnectionSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_CXP_CONNECTION_SELECTOR,
+        ),
+        "CxpConnectionTestMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_CXP_CONNECTION_TEST_MODE,
+        ),
+        "CxpConnectionTestErrorCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT,
+        ),
+        "CxpConnectionTestPacketRxCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT,
+        ),
+        "CxpConnectionTestPacketTxCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT,
+        ),
 
         # ---------------SequencerControl Section------------------
-        self.SequencerMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SEQUENCER_MODE
-        )
-        self.SequencerConfigurationMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SEQUENCER_CONFIGURATION_MODE
-        )
-        self.SequencerFeatureSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SEQUENCER_FEATURE_SELECTOR
-        )
-        self.SequencerFeatureEnable = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_SEQUENCER_FEATURE_ENABLE
-        )
-        self.SequencerSetSelector = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SEQUENCER_SET_SELECTOR
-        )
-        self.SequencerSetCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SEQUENCER_SET_COUNT
-        )
-        self.SequencerSetActive = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SEQUENCER_SET_ACTIVE
-        )
-        self.SequencerSetReset = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_SEQUENCER_SET_RESET
-        )
-        self.SequencerPathSelector = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SEQUENCER_PATH_SELECTOR
-        )
-        self.SequencerSetNext = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_SEQUENCER_SET_NEXT
-        )
-        self.SequencerTriggerSource = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_SEQUENCER_TRIGGER_SOURCE
-        )
-        self.SequencerSetSave = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_SEQUENCER_SET_SAVE
-        )
-        self.SequencerSetLoad = feat.CommandFeature(
-            self.__dev_handle, gx.GxFeatureID.COMMAND_SEQUENCER_SET_LOAD
-        )
+        "SequencerMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_SEQUENCER_MODE),
+        "SequencerConfigurationMode": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_SEQUENCER_CONFIGURATION_MODE,
+        ),
+        "SequencerFeatureSelector": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_SEQUENCER_FEATURE_SELECTOR,
+        ),
+        "SequencerFeatureEnable": (
+            feat.BoolFeature,
+            gx.GxFeatureID.BOOL_SEQUENCER_FEATURE_ENABLE,
+        ),
+        "SequencerSetSelector": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_SEQUENCER_SET_SELECTOR,
+        ),
+        "SequencerSetCount": (feat.IntFeature, gx.GxFeatureID.INT_SEQUENCER_SET_COUNT),
+        "SequencerSetActive": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_SEQUENCER_SET_ACTIVE,
+        ),
+        "SequencerSetReset": (
+            feat.CommandFeature,
+            gx.GxFeatureID.COMMAND_SEQUENCER_SET_RESET,
+        ),
+        "SequencerPathSelector": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_SEQUENCER_PATH_SELECTOR,
+        ),
+        "SequencerSetNext": (feat.IntFeature, gx.GxFeatureID.INT_SEQUENCER_SET_NEXT),
+        "SequencerTriggerSource": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_SEQUENCER_TRIGGER_SOURCE,
+        ),
+        "SequencerSetSave": (
+            feat.CommandFeature,
+            gx.GxFeatureID.COMMAND_SEQUENCER_SET_SAVE,
+        ),
+        "SequencerSetLoad": (
+            feat.CommandFeature,
+            gx.GxFeatureID.COMMAND_SEQUENCER_SET_LOAD,
+        ),
 
         # ---------------EnoderControl Section------------------
-        self.EncoderSelector = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_ENCODER_SELECTOR
-        )
-        self.EncoderDirection = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_ENCODER_DIRECTION
-        )
-        self.EncoderValue = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_ENCODER_VALUE
-        )
-        self.EncoderSourceA = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_ENCODER_SOURCEA
-        )
-        self.EncoderSourceB = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_ENCODER_SOURCEB
-        )
-        self.EncoderMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_ENCODER_MODE
-        )
+        "EncoderSelector": (feat.EnumFeature, gx.GxFeatureID.ENUM_ENCODER_SELECTOR),
+        "EncoderDirection": (feat.EnumFeature, gx.GxFeatureID.ENUM_ENCODER_DIRECTION),
+        "EncoderValue": (feat.IntFeature, gx.GxFeatureID.INT_ENCODER_VALUE),
+        "EncoderSourceA": (feat.EnumFeature, gx.GxFeatureID.ENUM_ENCODER_SOURCEA),
+        "EncoderSourceB": (feat.EnumFeature, gx.GxFeatureID.ENUM_ENCODER_SOURCEB),
+        "EncoderMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_ENCODER_MODE),
+    }
+
+    def __init__(self, handle, interface_obj):
+        """
+        :brief  Constructor for instance initialization
+        :param handle:  Device handle
+        """
+        self.__dev_handle = handle
+        self.data_stream = []
+        self.__interface_obj = interface_obj
+
+        self.__c_offline_callback = gx.OFF_LINE_CALL(self.__on_device_offline_callback)
+        self.__py_offline_callback = None
+        self.__offline_callback_handle = None
+
+        self.__c_feature_callback = gx.FEATURE_CALL(self.__on_device_feature_callback)
+        self.__py_feature_callback = None
+        self.__color_correction_param = 0
+        self.__model_name = None
+        self.__local_feature_control = None
+        self.__remote_feature_control = None
+
         self.__get_stream_handle()
 
+    def __getattr__(self, name):
+        """
+        :brief      Create a feature attribute listed in FEATURES on first access
+                    The feature object is stored in the instance,
+                    so later accesses don't come here
+        :param      name:   attribute name
+        :return:    feature object
+        """
+        feature = type(self).FEATURES.get(name)
+        if feature is None:
+            raise AttributeError(
+                "'%s' object has no attribute '%s'" % (type(self).__name__, name)
+            )
+
+        feature_class, feature_id = feature
+        feature_obj = feature_class(
+            self.__dev_handle, feature_id, self.__get_model_name()
+        )
+        setattr(self, name, feature_obj)
+        return feature_obj
+
+    def __dir__(self):
+        return sorted(set(object.__dir__(self)) | set(type(self).FEATURES))
+
+    def __get_model_name(self):
+        """
+        :brief      Get the device model name, used as the feature name cache key
+        :return:    model name, None if it can't be read
+        """
+        if self.__model_name is None:
+            status, model_name = gx.gx_get_string(
+                self.__dev_handle, gx.GxFeatureID.STRING_DEVICE_MODEL_NAME
+            )
+            if status == gx.GxStatusList.SUCCESS:
+                self.__model_name = model_name
+        return self.__model_name
+
     def __get_stream_handle(self):
         """
         :brief      Get stream handle and create stream object
@@ -1156,9 +1037,22 @@ class Device:
         :brief      close device, close device handle
         :return:    None
         """
+        # the feature callbacks of the caches are unregistered while the handles are valid
+        for feature_control in (
+            self.__local_feature_control,
+            self.__remote_feature_control,
+        ):
+            if feature_control is not None:
+                feature_control.close()
+        for data_stream in self.data_stream:
+            data_stream.get_feature_control().close()
+        self.__interface_obj.close()
+
         status = gx.gx_close_device(self.__dev_handle)
         check_return_status(status, "Device", "close_device")
         self.__dev_handle = None
+        self.__local_feature_control = None
+        self.__remote_feature_control = None
         self.__py_offline_callback = None
         self.__offline_callback_handle = None
         self.__py_feature_callback = None
@@ -1202,18 +1096,24 @@ class Device:
         :brief      Get local device layer feature control object
         :return:    Local device layer feature control object
         """
-        status, local_handle = gx.gx_local_device_handle_from_device(self.__dev_handle)
-        check_return_status(status, "Device", "register_device_offline_callback")
-        feature_control = FeatureControl(local_handle)
-        return feature_control
+        if self.__local_feature_control is None:
+            status, local_handle = gx.gx_local_device_handle_from_device(
+                self.__dev_handle
+            )
+            check_return_status(status, "Device", "register_device_offline_callback")
+            self.__local_feature_control = FeatureControl(local_handle)
+
+        # the same object is returned, its feature cache lives as long as the device
+        return self.__local_feature_control
 
     def get_remote_device_feature_control(self):
         """
         :brief      Get remote device layer feature control object
         :return:    Remote device layer feature control object
         """
-        feature_control = FeatureControl(self.__dev_handle)
-        return feature_control
+        if self.__remote_feature_control is None:
+            self.__remote_feature_control = FeatureControl(self.__dev_handle)
+        return self.__remote_feature_control
 
     def register_device_offline_callback(self, callback_func):
         """
@@ -1280,6 +1180,8 @@ class Device:
                     Interface is obsolete.
         :return:    none
         """
+        self.data_stream[0].stop_grabbing()
+
         status = gx.gx_send_command(
             self.__dev_handle, gx.GxFeatureID.COMMAND_ACQUISITION_STOP
         )
@@ -1560,40 +1462,38 @@ class Device:
 
 
 class GEVDevice(Device):
+    FEATURES = {
+        **Device.FEATURES,
+        "GevCurrentIPConfigurationLLA": (
+            feat.BoolFeature,
+            gx.GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_LLA,
+        ),
+        "GevCurrentIPConfigurationDHCP": (
+            feat.BoolFeature,
+            gx.GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_DHCP,
+        ),
+        "GevCurrentIPConfigurationPersistentIP": (
+            feat.BoolFeature,
+            gx.GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_PERSISTENT_IP,
+        ),
+        "EstimatedBandwidth": (feat.IntFeature, gx.GxFeatureID.INT_ESTIMATED_BANDWIDTH),
+        "GevHeartbeatTimeout": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_GEV_HEARTBEAT_TIMEOUT,
+        ),
+        "GevSCPSPacketSize": (feat.IntFeature, gx.GxFeatureID.INT_GEV_PACKET_SIZE),
+        "GevSCPD": (feat.IntFeature, gx.GxFeatureID.INT_GEV_PACKET_DELAY),
+        "GevLinkSpeed": (feat.IntFeature, gx.GxFeatureID.INT_GEV_LINK_SPEED),
+        "DeviceCommandTimeout": (feat.IntFeature, gx.GxFeatureID.INT_COMMAND_TIMEOUT),
+        "DeviceCommandRetryCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_COMMAND_RETRY_COUNT,
+        ),
+    }
+
     def __init__(self, handle, interface_obj):
         self.__dev_handle = handle
         Device.__init__(self, self.__dev_handle, interface_obj)
-        self.GevCurrentIPConfigurationLLA = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_LLA
-        )
-        self.GevCurrentIPConfigurationDHCP = feat.BoolFeature(
-            self.__dev_handle, gx.GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_DHCP
-        )
-        self.GevCurrentIPConfigurationPersistentIP = feat.BoolFeature(
-            self.__dev_handle,
-            gx.GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_PERSISTENT_IP,
-        )
-        self.EstimatedBandwidth = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_ESTIMATED_BANDWIDTH
-        )
-        self.GevHeartbeatTimeout = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_GEV_HEARTBEAT_TIMEOUT
-        )
-        self.GevSCPSPacketSize = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_GEV_PACKET_SIZE
-        )
-        self.GevSCPD = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_GEV_PACKET_DELAY
-        )
-        self.GevLinkSpeed = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_GEV_LINK_SPEED
-        )
-        self.DeviceCommandTimeout = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_COMMAND_TIMEOUT
-        )
-        self.DeviceCommandRetryCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_COMMAND_RETRY_COUNT
-        )
 
 
 class U3VDevice(Device):
@@ -1612,46 +1512,39 @@ class U2Device(Device):
     The U2Device class inherits from the Device class
     """
 
+    FEATURES = {
+        **Device.FEATURES,
+        "AcquisitionSpeedLevel": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_ACQUISITION_SPEED_LEVEL,
+        ),
+        "AcquisitionFrameCount": (
+            feat.IntFeature,
+            gx.GxFeatureID.INT_ACQUISITION_FRAME_COUNT,
+        ),
+        "TriggerSwitch": (feat.EnumFeature, gx.GxFeatureID.ENUM_TRIGGER_SWITCH),
+        "UserOutputMode": (feat.EnumFeature, gx.GxFeatureID.ENUM_USER_OUTPUT_MODE),
+        "StrobeSwitch": (feat.EnumFeature, gx.GxFeatureID.ENUM_STROBE_SWITCH),
+        "ADCLevel": (feat.IntFeature, gx.GxFeatureID.INT_ADC_LEVEL),
+        "HBlanking": (feat.IntFeature, gx.GxFeatureID.INT_H_BLANKING),
+        "VBlanking": (feat.IntFeature, gx.GxFeatureID.INT_V_BLANKING),
+        "UserPassword": (feat.StringFeature, gx.GxFeatureID.STRING_USER_PASSWORD),
+        "VerifyPassword": (feat.StringFeature, gx.GxFeatureID.STRING_VERIFY_PASSWORD),
+        "UserData": (feat.BufferFeature, gx.GxFeatureID.BUFFER_USER_DATA),
+        "AALightEnvironment": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_AA_LIGHT_ENVIRONMENT,
+        ),
+        "FrameInformation": (
+            feat.BufferFeature,
+            gx.GxFeatureID.BUFFER_FRAME_INFORMATION,
+        ),
+        "ImageGrayRaiseSwitch": (
+            feat.EnumFeature,
+            gx.GxFeatureID.ENUM_IMAGE_GRAY_RAISE_SWITCH,
+        ),
+    }
+
     def __init__(self, handle, interface_obj):
         self.__dev_handle = handle
         Device.__init__(self, self.__dev_handle, interface_obj)
-        self.AcquisitionSpeedLevel = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_ACQUISITION_SPEED_LEVEL
-        )
-        self.AcquisitionFrameCount = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_ACQUISITION_FRAME_COUNT
-        )
-        self.TriggerSwitch = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_TRIGGER_SWITCH
-        )
-        self.UserOutputMode = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_USER_OUTPUT_MODE
-        )
-        self.StrobeSwitch = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_STROBE_SWITCH
-        )
-        self.ADCLevel = feat.IntFeature(self.__dev_handle, gx.GxFeatureID.INT_ADC_LEVEL)
-        self.HBlanking = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_H_BLANKING
-        )
-        self.VBlanking = feat.IntFeature(
-            self.__dev_handle, gx.GxFeatureID.INT_V_BLANKING
-        )
-        self.UserPassword = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_USER_PASSWORD
-        )
-        self.VerifyPassword = feat.StringFeature(
-            self.__dev_handle, gx.GxFeatureID.STRING_VERIFY_PASSWORD
-        )
-        self.UserData = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_USER_DATA
-        )
-        self.AALightEnvironment = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_AA_LIGHT_ENVIRONMENT
-        )
-        self.FrameInformation = feat.BufferFeature(
-            self.__dev_handle, gx.GxFeatureID.BUFFER_FRAME_INFORMATION
-        )
-        self.ImageGrayRaiseSwitch = feat.EnumFeature(
-            self.__dev_handle, gx.GxFeatureID.ENUM_IMAGE_GRAY_RAISE_SWITCH
-        )
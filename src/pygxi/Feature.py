@@ -11,15 +11,32 @@ from pygxi.status import check_return_status
 from .errors import InvalidAccessError, OutOfRangeError, ParameterTypeError
 
 
+# Feature names got from the SDK, key: (device model name, feature ID)
+_feature_name_cache = {}
+
+
 class Feature:
-    def __init__(self, handle, feature):
+    def __init__(self, handle, feature, model_name=None):
         """
         :param  handle:      The handle of the device
         :param  feature:     The feature code ID
+        :param  model_name:  The device model name, feature names are shared by the devices of
+                             the same model. None: the name is only cached by this object
         """
         self.__handle = handle
         self.__feature = feature
-        self.feature_name = self.get_name()
+        self.__model_name = model_name
+        self.__feature_name = None
+
+    @property
+    def feature_name(self):
+        """
+        brief:  Feature name, got from the SDK on first use
+        return: feature name
+        """
+        if self.__feature_name is None:
+            self.__feature_name = self.get_name()
+        return self.__feature_name
 
     def get_name(self):
         """
@@ -27,10 +44,16 @@ class Feature:
         return: Success:    feature name
                 Failed:     convert feature ID to string
         """
+        key = (self.__model_name, self.__feature)
+        if self.__model_name is not None and key in _feature_name_cache:
+            return _feature_name_cache[key]
+
         status, name = gx.gx_get_feature_name(self.__handle, self.__feature)
         if status != gx.GxStatusList.SUCCESS:
-            name = (hex(self.__feature)).__str__()
+            return (hex(self.__feature)).__str__()
 
+        if self.__model_name is not None:
+            _feature_name_cache[key] = name
         return name
 
     def is_implemented(self):
@@ -74,12 +97,13 @@ class Feature:
 
 
 class IntFeature(Feature):
-    def __init__(self, handle, feature):
+    def __init__(self, handle, feature, model_name=None):
         """
         :param  handle:      The handle of the device
         :param  feature:     The feature code ID
+        :param  model_name:  The device model name, See detail in Feature
         """
-        Feature.__init__(self, handle, feature)
+        Feature.__init__(self, handle, feature, model_name)
         self.__handle = handle
         self.__feature = feature
 
@@ -156,12 +180,13 @@ class IntFeature(Feature):
 
 
 class FloatFeature(Feature):
-    def __init__(self, handle, feature):
+    def __init__(self, handle, feature, model_name=None):
         """
         :param      handle:      The handle of the device
         :param      feature:     The feature code ID
+        :param      model_name:  The device model name, See detail in Feature
         """
-        Feature.__init__(self, handle, feature)
+        Feature.__init__(self, handle, feature, model_name)
         self.__handle = handle
         self.__feature = feature
 
@@ -236,12 +261,13 @@ class FloatFeature(Feature):
 
 
 class EnumFeature(Feature):
-    def __init__(self, handle, feature):
+    def __init__(self, handle, feature, model_name=None):
         """
         :param handle:      The handle of the device
         :param feature:     The feature code ID
+        :param model_name:  The device model name, See detail in Feature
         """
-        Feature.__init__(self, handle, feature)
+        Feature.__init__(self, handle, feature, model_name)
         self.__handle = handle
         self.__feature = feature
 
@@ -317,12 +343,13 @@ class EnumFeature(Feature):
 
 
 class BoolFeature(Feature):
-    def __init__(self, handle, feature):
+    def __init__(self, handle, feature, model_name=None):
         """
         :param handle:      The handle of the device
         :param feature:     The feature code ID
+        :param model_name:  The device model name, See detail in Feature
         """
-        Feature.__init__(self, handle, feature)
+        Feature.__init__(self, handle, feature, model_name)
         self.__handle = handle
         self.__feature = feature
 
@@ -360,12 +387,13 @@ class BoolFeature(Feature):
 
 
 class StringFeature(Feature):
-    def __init__(self, handle, feature):
+    def __init__(self, handle, feature, model_name=None):
         """
         :param      handle:      The handle of the device
         :param      feature:     The feature code ID
+        :param      model_name:  The device model name, See detail in Feature
         """
-        Feature.__init__(self, handle, feature)
+        Feature.__init__(self, handle, feature, model_name)
         self.__handle = handle
         self.__feature = feature
 
@@ -427,12 +455,13 @@ class StringFeature(Feature):
 
 
 class BufferFeature(Feature):
-    def __init__(self, handle, feature):
+    def __init__(self, handle, feature, model_name=None):
         """
         :param      handle:      The handle of the device
         :param      feature:     The feature code ID
+        :param      model_name:  The device model name, See detail in Feature
         """
-        Feature.__init__(self, handle, feature)
+        Feature.__init__(self, handle, feature, model_name)
         self.__handle = handle
         self.__feature = feature
 
@@ -500,12 +529,13 @@ class BufferFeature(Feature):
 
 
 class CommandFeature(Feature):
-    def __init__(self, handle, feature):
+    def __init__(self, handle, feature, model_name=None):
         """
         :param      handle:      The handle of the device
         :param      feature:     The feature code ID
+        :param      model_name:  The device model name, See detail in Feature
         """
-        Feature.__init__(self, handle, feature)
+        Feature.__init__(self, handle, feature, model_name)
         self.__handle = handle
         self.__feature = feature
 
@@ -17,6 +17,112 @@ class FeatureControl:
         """
         self.__handle = handle
 
+        # feature objects, key: (feature class, feature name)
+        self.__features = {}
+        # static feature information (access mode, enum entries), key: feature name
+        # entries are dropped by the feature callback of the SDK or by invalidate
+        self.__metadata_cache = {}
+        self.__callback_handles = {}
+        self.__c_feature_callback = gx.FEATURE_CALL_BY_STRING(
+            self.__on_feature_callback
+        )
+
+    def invalidate(self, feature_name=None):
+        """
+        :brief      Drop the cached information of a feature, read again on next use
+        :param      feature_name:   Feature node name, None: drop every feature
+        :return:    None
+        """
+        if feature_name is None:
+            self.__metadata_cache.clear()
+        else:
+            self.__metadata_cache.pop(feature_name, None)
+
+    def close(self):
+        """
+        :brief      Unregister the feature callbacks of the cache, call it before the handle is closed
+                    The cached information is dropped, the callbacks are registered again on next use
+        :return:    None
+        """
+        callback_handles = self.__callback_handles
+        self.__callback_handles = {}
+        self.__metadata_cache.clear()
+
+        failed_status = gx.GxStatusList.SUCCESS
+        for feature_name, callback_handle in callback_handles.items():
+            if callback_handle is None:
+                continue
+
+            status = gx.gx_unregister_feature_call_back_by_string(
+                self.__handle, feature_name, callback_handle
+            )
+            if status != gx.GxStatusList.SUCCESS:
+                failed_status = status
+
+        check_return_status(failed_status, "FeatureControl", "close")
+
+    def __on_feature_callback(self, c_feature_name, c_user_param):
+        """
+        :brief      Feature callback of the SDK, called when the value or the access
+                    mode of a watched feature changes
+        :param      c_feature_name:     feature node name
+        :param      c_user_param:       unused
+        :return:    None
+        """
+        self.__metadata_cache.pop(gx.string_decoding(c_feature_name), None)
+
+    def __watch_feature(self, feature_name):
+        """
+        :brief      Register the feature callback for a feature, once
+                    When the SDK refuses it, the cache only follows invalidate
+        :param      feature_name:   Feature node name
+        :return:    None
+        """
+        if feature_name in self.__callback_handles:
+            return
+
+        callback_handle = None
+        if hasattr(gx, "gx_register_feature_call_back_by_string"):
+            status, callback_handle = gx.gx_register_feature_call_back_by_string(
+                self.__handle, self.__c_feature_callback, feature_name, None
+            )
+            if status != gx.GxStatusList.SUCCESS:
+                callback_handle = None
+
+        self.__callback_handles[feature_name] = callback_handle
+
+    def __get_access_mode(self, feature_name, func_name):
+        """
+        :brief      Get the access mode of a feature node, cached
+        :param      feature_name:   Feature node name
+        :param      func_name:      calling function name, used in the error message
+        :return:    access mode, See detail in GxNodeAccessMode
+        """
+        metadata = self.__metadata_cache.get(feature_name)
+        if metadata is not None and "access_mode" in metadata:
+            return metadata["access_mode"]
+
+        # registered before reading, so a change after the read drops the entry
+        self.__watch_feature(feature_name)
+        status, node_access = gx.gx_get_node_access_mode(self.__handle, feature_name)
+        check_return_status(status, "FeatureControl", func_name)
+        self.__metadata_cache.setdefault(feature_name, {})["access_mode"] = node_access
+        return node_access
+
+    def __get_feature(self, feature_class, feature_name):
+        """
+        :brief      Get the feature object of a feature node, created once
+        :param      feature_class:  Feature_s subclass
+        :param      feature_name:   Feature node name
+        :return:    feature object
+        """
+        key = (feature_class, feature_name)
+        feature = self.__features.get(key)
+        if feature is None:
+            feature = feature_class(self.__handle, feature_name, self.__metadata_cache)
+            self.__features[key] = feature
+        return feature
+
     def is_implemented(self, feature_name: str) -> bool:
         """
         :brief      Get feature node is implemented
@@ -29,8 +135,7 @@ class FeatureControl:
                 "Expected feature_name type is str, not %s" % type(feature_name)
             )
 
-        status, node_access = gx.gx_get_node_access_mode(self.__handle, feature_name)
-        check_return_status(status, "FeatureControl", "is_implemented")
+        node_access = self.__get_access_mode(feature_name, "is_implemented")
         if (node_access == gx.GxNodeAccessMode.MODE_NI) or (
             node_access == gx.GxNodeAccessMode.MODE_UNDEF
         ):
@@ -49,8 +154,7 @@ class FeatureControl:
                 "Expected feature_name type is str, not %s" % type(feature_name)
             )
 
-        status, node_access = gx.gx_get_node_access_mode(self.__handle, feature_name)
-        check_return_status(status, "FeatureControl", "is_readable")
+        node_access = self.__get_access_mode(feature_name, "is_readable")
         if (node_access == gx.GxNodeAccessMode.MODE_RO) or (
             node_access == gx.GxNodeAccessMode.MODE_RW
         ):
@@ -69,8 +173,7 @@ class FeatureControl:
                 "Expected feature_name type is str, not %s" % type(feature_name)
             )
 
-        status, node_access = gx.gx_get_node_access_mode(self.__handle, feature_name)
-        check_return_status(status, "FeatureControl", "is_readable")
+        node_access = self.__get_access_mode(feature_name, "is_readable")
         if (node_access == gx.GxNodeAccessMode.MODE_WO) or (
             node_access == gx.GxNodeAccessMode.MODE_RW
         ):
@@ -96,8 +199,7 @@ class FeatureControl:
                 "The feature '%s' is not implemented" % feature_name
             )
 
-        int_feature = fs.IntFeature_s(self.__handle, feature_name)
-        return int_feature
+        return self.__get_feature(fs.IntFeature_s, feature_name)
 
     def get_enum_feature(self, feature_name) -> fs.EnumFeature_s:
         """
@@ -117,8 +219,7 @@ class FeatureControl:
                 "The feature '%s' is not implemented" % feature_name
             )
 
-        enum_feature = fs.EnumFeature_s(self.__handle, feature_name)
-        return enum_feature
+        return self.__get_feature(fs.EnumFeature_s, feature_name)
 
     def get_float_feature(self, feature_name: str) -> fs.FloatFeature_s:
         """
@@ -138,8 +239,7 @@ class FeatureControl:
                 "The feature '%s' is not implemented" % feature_name
             )
 
-        float_feature = fs.FloatFeature_s(self.__handle, feature_name)
-        return float_feature
+        return self.__get_feature(fs.FloatFeature_s, feature_name)
 
     def get_bool_feature(self, feature_name: str) -> fs.BoolFeature_s:
         """
@@ -159,8 +259,7 @@ class FeatureControl:
                 "The feature '%s' is not implemented" % feature_name
             )
 
-        bool_feature = fs.BoolFeature_s(self.__handle, feature_name)
-        return bool_feature
+        return self.__get_feature(fs.BoolFeature_s, feature_name)
 
     def get_string_feature(self, feature_name: str) -> fs.StringFeature_s:
         """
@@ -180,8 +279,7 @@ class FeatureControl:
                 "The feature '%s' is not implemented" % feature_name
             )
 
-        string_feature = fs.StringFeature_s(self.__handle, feature_name)
-        return string_feature
+        return self.__get_feature(fs.StringFeature_s, feature_name)
 
     def get_command_feature(self, feature_name: str) -> fs.CommandFeature_s:
         """
@@ -201,8 +299,7 @@ class FeatureControl:
                 "The feature '%s' is not implemented" % feature_name
             )
 
-        command_feature = fs.CommandFeature_s(self.__handle, feature_name)
-        return command_feature
+        return self.__get_feature(fs.CommandFeature_s, feature_name)
 
     def get_register_feature(self, feature_name: str) -> fs.RegisterFeature_s:
         """
@@ -222,8 +319,7 @@ class FeatureControl:
                 "The feature '%s' is not implemented" % feature_name
             )
 
-        register_feature = fs.RegisterFeature_s(self.__handle, feature_name)
-        return register_feature
+        return self.__get_feature(fs.RegisterFeature_s, feature_name)
 
     def feature_save(self, file_path: str) -> None:
         """
@@ -10,24 +10,29 @@ from .status import check_return_status
 
 
 class Feature_s:
-    def __init__(self, handle, feature_name):
+    def __init__(self, handle, feature_name, metadata_cache=None):
         """
         :brief  Constructor for instance initialization
         :param handle:          Interface featrue control handle\Device local layer feature control\Device remote layer featrure control\Device stream layer feature control
         :param feature_name:    Feature node name
+        :param metadata_cache:  Static feature information shared with FeatureControl,
+                                key: feature name. None: nothing is cached
         """
         self.__handle = handle
         self.__feature_name = feature_name
+        self.__metadata_cache = metadata_cache
 
 
 class IntFeature_s(Feature_s):
-    def __init__(self, handle, feature_name):
+    def __init__(self, handle, feature_name, metadata_cache=None):
         """
         :brief  Constructor for instance initialization
         :param handle:          Interface featrue control handle\Device local layer feature control\Device remote layer featrure control\Device stream layer feature control
         :param feature_name:    Feature node name
+        :param metadata_cache:  Static feature information shared with FeatureControl,
+                                key: feature name. None: nothing is cached
         """
-        Feature_s.__init__(self, handle, feature_name)
+        Feature_s.__init__(self, handle, feature_name, metadata_cache)
         self.__handle = handle
         self.__feature_name = feature_name
 
@@ -90,15 +95,18 @@ class IntFeature_s(Feature_s):
 
 
 class EnumFeature_s(Feature_s):
-    def __init__(self, handle, feature_name):
+    def __init__(self, handle, feature_name, metadata_cache=None):
         """
         :brief  Constructor for instance initialization
         :param handle:          Interface featrue control handle\Device local layer feature control\Device remote layer featrure control\Device stream layer feature control
         :param feature_name:    Feature node name
+        :param metadata_cache:  Static feature information shared with FeatureControl,
+                                key: feature name. None: nothing is cached
         """
-        Feature_s.__init__(self, handle, feature_name)
+        Feature_s.__init__(self, handle, feature_name, metadata_cache)
         self.__handle = handle
         self.__feature_name = feature_name
+        self.__metadata_cache = metadata_cache
 
     def __range_dicts(self, feature_value):
         enum_dict = []
@@ -118,12 +126,22 @@ class EnumFeature_s(Feature_s):
         :brief      Getting range of Enum feature
         :return:    enum_dict:    enum range dictionary
         """
+        # enum entries are static, cached until FeatureControl invalidates them
+        if self.__metadata_cache is not None:
+            metadata = self.__metadata_cache.get(self.__feature_name, {})
+            if "enum_entries" in metadata:
+                return [dict(entry) for entry in metadata["enum_entries"]]
+
         status, enum_feature_info = gx.gx_get_enum_feature(
             self.__handle, self.__feature_name
         )
         check_return_status(status, "FeatureControl", "gx_get_enum_feature")
 
-        return self.__range_dicts(enum_feature_info)
+        enum_dict = self.__range_dicts(enum_feature_info)
+        if self.__metadata_cache is not None:
+            metadata = self.__metadata_cache.setdefault(self.__feature_name, {})
+            metadata["enum_entries"] = [dict(entry) for entry in enum_dict]
+        return enum_dict
 
     def get(self):
         """
@@ -164,13 +182,15 @@ class EnumFeature_s(Feature_s):
 
 
 class FloatFeature_s(Feature_s):
-    def __init__(self, handle, feature_name):
+    def __init__(self, handle, feature_name, metadata_cache=None):
         """
         :brief  Constructor for instance initialization
         :param handle:          Interface featrue control handle\Device local layer feature control\Device remote layer featrure control\Device stream layer feature control
         :param feature_name:    Feature node name
+        :param metadata_cache:  Static feature information shared with FeatureControl,
+                                key: feature name. None: nothing is cached
         """
-        Feature_s.__init__(self, handle, feature_name)
+        Feature_s.__init__(self, handle, feature_name, metadata_cache)
         self.__handle = handle
         self.__feature_name = feature_name
 
@@ -232,13 +252,15 @@ class FloatFeature_s(Feature_s):
 
 
 class BoolFeature_s(Feature_s):
-    def __init__(self, handle, feature_name):
+    def __init__(self, handle, feature_name, metadata_cache=None):
         """
         :brief  Constructor for instance initialization
         :param handle:          Interface featrue control handle\Device local layer feature control\Device remote layer featrure control\Device stream layer feature control
         :param feature_name:    Feature node name
+        :param metadata_cache:  Static feature information shared with FeatureControl,
+                                key: feature name. None: nothing is cached
         """
-        Feature_s.__init__(self, handle, feature_name)
+        Feature_s.__init__(self, handle, feature_name, metadata_cache)
         self.__handle = handle
         self.__feature_name = feature_name
 
@@ -272,13 +294,15 @@ class BoolFeature_s(Feature_s):
 
 
 class StringFeature_s(Feature_s):
-    def __init__(self, handle, feature_name):
+    def __init__(self, handle, feature_name, metadata_cache=None):
         """
         :brief  Constructor for instance initialization
         :param handle:          Interface featrue control handle\Device local layer feature control\Device remote layer featrure control\Device stream layer feature control
         :param feature_name:    Feature node name
+        :param metadata_cache:  Static feature information shared with FeatureControl,
+                                key: feature name. None: nothing is cached
         """
-        Feature_s.__init__(self, handle, feature_name)
+        Feature_s.__init__(self, handle, feature_name, metadata_cache)
         self.__handle = handle
         self.__feature_name = feature_name
 
@@ -323,13 +347,15 @@ class StringFeature_s(Feature_s):
 
 
 class CommandFeature_s(Feature_s):
-    def __init__(self, handle, feature_name):
+    def __init__(self, handle, feature_name, metadata_cache=None):
         """
         :brief  Constructor for instance initialization
         :param handle:          Interface featrue control handle\Device local layer feature control\Device remote layer featrure control\Device stream layer feature control
         :param feature_name:    Feature node name
+        :param metadata_cache:  Static feature information shared with FeatureControl,
+                                key: feature name. None: nothing is cached
         """
-        Feature_s.__init__(self, handle, feature_name)
+        Feature_s.__init__(self, handle, feature_name, metadata_cache)
         self.__handle = handle
         self.__feature_name = feature_name
 
@@ -343,13 +369,15 @@ class CommandFeature_s(Feature_s):
 
 
 class RegisterFeature_s(Feature_s):
-    def __init__(self, handle, feature_name):
+    def __init__(self, handle, feature_name, metadata_cache=None):
         """
         :brief  Constructor for instance initialization
         :param handle:          Interface featrue control handle\Device local layer feature control\Device remote layer featrure control\Device stream layer feature control
         :param feature_name:    Feature node name
+        :param metadata_cache:  Static feature information shared with FeatureControl,
+                                key: feature name. None: nothing is cached
         """
-        Feature_s.__init__(self, handle, feature_name)
+        Feature_s.__init__(self, handle, feature_name, metadata_cache)
         self.__handle = handle
         self.__feature_name = feature_name
 
@@ -0,0 +1,130 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import ctypes as ct
+import threading
+
+from .errors import InvalidParameterError, ParameterTypeError
+
+
+class FrameBufferPool:
+    def __init__(self, buffer_num, buffer_size):
+        """
+        :brief  Constructor for instance initialization, allocate buffer_num buffers of buffer_size bytes
+        :param buffer_num:      number of buffers in the ring, range:[1, ...]
+        :param buffer_size:     size of every buffer in bytes, normally the payload size
+        """
+        if not isinstance(buffer_num, int):
+            raise ParameterTypeError(
+                "FrameBufferPool.__init__: "
+                "Expected buffer_num type is int, not %s" % type(buffer_num)
+            )
+
+        if not isinstance(buffer_size, int):
+            raise ParameterTypeError(
+                "FrameBufferPool.__init__: "
+                "Expected buffer_size type is int, not %s" % type(buffer_size)
+            )
+
+        if buffer_num < 1 or buffer_size < 1:
+            raise InvalidParameterError(
+                "FrameBufferPool.__init__: buffer_num and buffer_size must be positive"
+            )
+
+        self.__buffer_size = buffer_size
+        self.__buffers = [(ct.c_ubyte * buffer_size)() for _ in range(buffer_num)]
+        self.__in_use = [False] * buffer_num
+        self.__next_index = 0
+        self.__free_num = buffer_num
+        self.__acquired_count = 0
+        self.__exhausted_count = 0
+        self.__mutex = threading.Lock()
+
+    def acquire(self):
+        """
+        :brief      Take the next free buffer in round-robin order
+        :return:    buffer index, or None when every buffer is in use
+        """
+        with self.__mutex:
+            if self.__free_num == 0:
+                self.__exhausted_count += 1
+                return None
+
+            buffer_num = len(self.__buffers)
+            index = self.__next_index
+            while self.__in_use[index]:
+                index = (index + 1) % buffer_num
+
+            self.__in_use[index] = True
+            self.__free_num -= 1
+            self.__next_index = (index + 1) % buffer_num
+            self.__acquired_count += 1
+            return index
+
+    def release(self, index):
+        """
+        :brief      Return a buffer got by acquire to the pool
+        :param      index:  buffer index
+        :return:    None
+        """
+        with self.__mutex:
+            if not self.__in_use[index]:
+                raise InvalidParameterError(
+                    "FrameBufferPool.release: buffer %d is not in use" % index
+                )
+
+            self.__in_use[index] = False
+            self.__free_num += 1
+
+    def get_buffer_address(self, index):
+        """
+        :brief      Get the address of a buffer
+        :param      index:  buffer index
+        :return:    buffer address
+        """
+        return ct.addressof(self.__buffers[index])
+
+    def get_buffer_num(self):
+        """
+        :brief      Get the number of buffers in the pool
+        :return:    buffer number
+        """
+        return len(self.__buffers)
+
+    def get_buffer_size(self):
+        """
+        :brief      Get the size of every buffer
+        :return:    buffer size in bytes
+        """
+        return self.__buffer_size
+
+    def get_free_num(self):
+        """
+        :brief      Get the number of buffers not in use
+        :return:    free buffer number
+        """
+        return self.__free_num
+
+    def get_acquired_count(self):
+        """
+        :brief      Get how many times a buffer was taken from the pool
+        :return:    acquired count
+        """
+        return self.__acquired_count
+
+    def get_exhausted_count(self):
+        """
+        :brief      Get how many times acquire found every buffer in use
+        :return:    exhausted count
+        """
+        return self.__exhausted_count
+
+    def reset_statistics(self):
+        """
+        :brief      Reset the acquired and exhausted counters
+        :return:    None
+        """
+        with self.__mutex:
+            self.__acquired_count = 0
+            self.__exhausted_count = 0
@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import collections
+import threading
+
+from .errors import InvalidParameterError, ParameterTypeError
+from .gxidef import GxQueueOverflowPolicy
+
+
+class FrameQueue:
+    def __init__(self, queue_depth, overflow_policy=GxQueueOverflowPolicy.DROP_OLDEST):
+        """
+        :brief  Constructor for instance initialization, a bounded queue between one
+                producer (the grabbing thread) and one consumer
+        :param queue_depth:         maximum number of queued frames, range:[1, ...]
+        :param overflow_policy:     what to do when the queue is full, See detail in GxQueueOverflowPolicy
+        """
+        if not isinstance(queue_depth, int):
+            raise ParameterTypeError(
+                "FrameQueue.__init__: "
+                "Expected queue_depth type is int, not %s" % type(queue_depth)
+            )
+
+        if not isinstance(overflow_policy, int):
+            raise ParameterTypeError(
+                "FrameQueue.__init__: "
+                "Expected overflow_policy type is int, not %s" % type(overflow_policy)
+            )
+
+        if queue_depth < 1:
+            raise InvalidParameterError(
+                "FrameQueue.__init__: queue_depth must be positive"
+            )
+
+        self.__queue_depth = queue_depth
+        self.__overflow_policy = overflow_policy
+        self.__frames = collections.deque()
+        self.__condition = threading.Condition()
+        self.__closed = False
+        self.__dropped_oldest_count = 0
+        self.__dropped_newest_count = 0
+        self.__blocked_count = 0
+
+    def put(self, image):
+        """
+        :brief      Push a frame, applying the overflow policy when the queue is full
+        :param      image:  image object
+        :return:    True if the frame was queued, False if it was dropped or the queue is closed
+        """
+        with self.__condition:
+            if len(self.__frames) >= self.__queue_depth:
+                if self.__overflow_policy == GxQueueOverflowPolicy.DROP_OLDEST:
+                    self.__frames.popleft()
+                    self.__dropped_oldest_count += 1
+                elif self.__overflow_policy == GxQueueOverflowPolicy.DROP_NEWEST:
+                    self.__dropped_newest_count += 1
+                    return False
+                else:
+                    self.__blocked_count += 1
+                    while len(self.__frames) >= self.__queue_depth and not self.__closed:
+                        self.__condition.wait()
+
+            if self.__closed:
+                return False
+
+            self.__frames.append(image)
+            self.__condition.notify_all()
+            return True
+
+    def get(self, timeout=None):
+        """
+        :brief      Pop the oldest frame
+        :param      timeout:    maximum wait time in ms, None waits until a frame arrives
+        :return:    image object, None on timeout or when the queue is closed and empty
+        """
+        if timeout is not None:
+            timeout = timeout / 1000
+
+        with self.__condition:
+            if not self.__condition.wait_for(
+                lambda: self.__frames or self.__closed, timeout
+            ):
+                return None
+
+            if not self.__frames:
+                return None
+
+            image = self.__frames.popleft()
+            self.__condition.notify_all()
+            return image
+
+    def close(self):
+        """
+        :brief      Wake up every waiting producer and consumer, no more frames are accepted
+        :return:    None
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+    def clear(self):
+        """
+        :brief      Discard every queued frame
+        :return:    None
+        """
+        with self.__condition:
+            self.__frames.clear()
+            self.__condition.notify_all()
+
+    def get_size(self):
+        """
+        :brief      Get the number of queued frames
+        :return:    queued frame number
+        """
+        return len(self.__frames)
+
+    def get_queue_depth(self):
+        """
+        :brief      Get the maximum number of queued frames
+        :return:    queue depth
+        """
+        return self.__queue_depth
+
+    def get_overflow_policy(self):
+        """
+        :brief      Get the overflow policy
+        :return:    overflow policy, See detail in GxQueueOverflowPolicy
+        """
+        return self.__overflow_policy
+
+    def get_dropped_oldest_count(self):
+        """
+        :brief      Get how many queued frames were discarded by DROP_OLDEST
+        :return:    dropped frame number
+        """
+        return self.__dropped_oldest_count
+
+    def get_dropped_newest_count(self):
+        """
+        :brief      Get how many incoming frames were discarded by DROP_NEWEST
+        :return:    dropped frame number
+        """
+        return self.__dropped_newest_count
+
+    def get_blocked_count(self):
+        """
+        :brief      Get how many times the producer had to wait with BLOCK
+        :return:    blocked number
+        """
+        return self.__blocked_count
+
+    def reset_statistics(self):
+        """
+        :brief      Reset the drop and block counters
+        :return:    None
+        """
+        with self.__condition:
+            self.__dropped_oldest_count = 0
+            self.__dropped_newest_count = 0
+            self.__blocked_count = 0
@@ -6,7 +6,7 @@ import pygxi.dxwrapper as dx
 
 from .errors import InvalidParameterError, ParameterTypeError, UnexpectedError
 from .gxidef import DxBayerConvertType, DxValidBit, GxPixelFormatEntry
-from .ImageProc import RawImage
+from .ImageProc import RawImage, _convert_tiled, _converter_cache, _InterUtility
 
 
 class ImageFormatConvert:
@@ -331,7 +331,16 @@ class ImageFormatConvert:
                 "image_format_convert failure, Error code:%s" % hex(status).__str__()
             )
 
-    def convert(self, raw_image, output_address, output_length, flip):
+    def convert(
+        self,
+        raw_image,
+        output_address=None,
+        output_length=None,
+        flip=False,
+        out=None,
+        workers=None,
+        band_height=None,
+    ):
         """
         :brief  Image Format Convert Process
 
@@ -388,8 +397,16 @@ class ImageFormatConvert:
         :param  output_length   [in&out] Image out
         :param  nOutBufferSize  [in]     Output Image buffer size
         :param  flip           [in]     Image flip or not, true:flip false:not flip
-
-        :return emStatus
+        :param  out            [in&out] np.ndarray of dtype uint8, C-contiguous and writeable,
+                                        written instead of output_address, of at least
+                                        get_buffer_size_for_conversion(raw_image) bytes
+        :param  workers        [in]     number of threads converting bands of band_height rows,
+                                        each with ImageProc.TILE_HALO_ROWS rows above and below,
+                                        None with band_height None: the whole image in one call
+        :param  band_height    [in]     rows of every band, rounded up to even,
+                                        None: the rows divided between the workers
+
+        :return out, or None when output_address is used
         """
         if not isinstance(raw_image, RawImage):
             raise ParameterTypeError("raw_image param must be RawImage type")
@@ -397,6 +414,17 @@ class ImageFormatConvert:
         if raw_image.frame_data.image_buf is None:
             raise ParameterTypeError("raw_image.frame_data.image_buf is NULL pointer")
 
+        if out is not None:
+            if output_address is not None or output_length is not None:
+                raise InvalidParameterError(
+                    "output_address and output_length must be None when out is used"
+                )
+
+            output_length = self.get_buffer_size_for_conversion(raw_image)
+            output_address = _InterUtility.check_output_array(
+                out, None, output_length, "ImageFormatConvert", "convert"
+            )
+
         if output_address is None:
             raise ParameterTypeError("output_address is NULL pointer")
 
@@ -406,6 +434,33 @@ class ImageFormatConvert:
         if not (isinstance(flip, bool)):
             raise ParameterTypeError("flip must to be  bool type.")
 
+        if workers is not None or band_height is not None:
+            # the bands are converted by handles of the worker threads, configured as
+            # this one; _FormatConverter takes the alpha value in place of channel_order
+            converter = _converter_cache.get(
+                raw_image.get_pixel_format(),
+                self.image_pixel_format_des,
+                self.valid_bits,
+                self.interpolation_type,
+                self.alpha_value,
+                raw_image.get_width(),
+                raw_image.get_height(),
+            )
+            if output_length < converter.buffer_size:
+                raise InvalidParameterError(
+                    "output_length %d is smaller than the converted image, %d bytes"
+                    % (output_length, converter.buffer_size)
+                )
+            _convert_tiled(
+                converter,
+                raw_image.frame_data.image_buf,
+                output_address,
+                flip,
+                workers,
+                band_height,
+            )
+            return out
+
         self.__check_handle()
         input_length = self.get_buffer_size_for_conversion_ex(
             raw_image.get_width(), raw_image.get_height(), raw_image.get_pixel_format()
@@ -427,6 +482,8 @@ class ImageFormatConvert:
                 "image_format_convert failure, Error code:%s" % hex(status).__str__()
             )
 
+        return out
+
     def __check_handle(self):
         """
         :brief  The transformation handle is initialized the first time it is called
@@ -2,13 +2,20 @@
 # -*- coding:utf-8 -*-
 # -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
 
+import collections
 import ctypes as ct
+import threading
 
 import numpy as np
 
 import pygxi.dxwrapper as dx
 
-from .errors import InvalidParameterError, ParameterTypeError, UnexpectedError
+from .errors import (
+    InvalidCallError,
+    InvalidParameterError,
+    ParameterTypeError,
+    UnexpectedError,
+)
 from .gxidef import (
     CONTRAST_MAX,
     CONTRAST_MIN,
@@ -29,13 +36,38 @@ from .gxidef import (
     DxRGBChannelOrder,
     DxValidBit,
     GxFrameStatusList,
+    GxPixelColorFilterEntry,
     GxPixelFormatEntry,
     GxPixelSizeEntry,
 )
+from . import demosaic
+from .defects import DefectPixelMap
+from .flatfield import FlatFieldCoefficients
+from .flatfield import flat_field_correction as _flat_field_correction
 from .gxwrapper import GxFrameData
+from .parallel import get_default_workers, run_bands
+from .pixelformat import (
+    PACKING_NONE,
+    get_pixel_format_alignment,
+    get_pixel_format_layout,
+    get_pixel_format_size,
+    pack_pixels,
+    unpack_pixels,
+)
+from .whitebalance import estimate_white_balance
 
 COLOR_TRANSFORM_MATRIX_SIZE = 9  # 3*3
 
+# block sizes of RawImage.preview
+_PREVIEW_SCALES = (2, 4, 8)
+
+# demosaic mode of RawImage.convert(engine="numpy") for each DxBayerConvertType
+_NUMPY_DEMOSAIC_MODES = {
+    DxBayerConvertType.NEIGHBOUR: demosaic.BILINEAR,
+    DxBayerConvertType.ADAPTIVE: demosaic.EDGE_AWARE,
+    DxBayerConvertType.NEIGHBOUR3: demosaic.BILINEAR,
+}
+
 
 class Buffer:
     def __init__(self, data_array):
@@ -294,10 +326,27 @@ class RGBImage:
 
 
 class RawImage:
-    def __init__(self, frame_data):
+    def __init__(self, frame_data, zero_copy=False, numpy_view=False):
+        """
+        :brief  Constructor for instance initialization
+        :param frame_data:  GxFrameData describing the image
+        :param zero_copy:   True: wrap frame_data.image_buf in place instead of copying it,
+                            the image is only valid until its buffer is returned with q_buf
+        :param numpy_view:  zero-copy images only, True: get_numpy_array returns a view of the
+                            buffer by default, for buffers owned by pygxi which stay valid
+                            until the image is released, e.g. of the frame buffer pool
+        """
         self.frame_data = frame_data
+        self.__zero_copy = zero_copy and self.frame_data.image_buf is not None
+        self.__numpy_view = numpy_view
+        self.__buffer_valid = True
+        self.__memory_views = []
 
-        if self.frame_data.image_buf is not None:
+        if self.__zero_copy:
+            self.__image_array = (ct.c_ubyte * self.frame_data.image_size).from_address(
+                self.frame_data.image_buf
+            )
+        elif self.frame_data.image_buf is not None:
             self.__image_array = ct.string_at(
                 self.frame_data.image_buf, self.frame_data.image_size
             )
@@ -305,6 +354,54 @@ class RawImage:
             self.__image_array = (ct.c_ubyte * self.frame_data.image_size)()
             self.frame_data.image_buf = ct.addressof(self.__image_array)
 
+    def __check_buffer_valid(self, func_name):
+        """
+        :brief      Raise if the zero-copy buffer has already been returned to the driver
+        :param      func_name:  name of the calling method, used in the error message
+        :return:    None
+        """
+        if not self.__buffer_valid:
+            raise InvalidCallError(
+                "RawImage.%s: the frame buffer has been returned by q_buf, "
+                "call copy() or detach() before q_buf to keep the image data"
+                % func_name
+            )
+
+    def __release_memory_views(self):
+        """
+        :brief      Release the memoryviews handed out on the driver buffer
+        :return:    None
+        """
+        for memory_view in self.__memory_views:
+            try:
+                memory_view.release()
+            except BufferError:
+                # still exported by a derived view, it can't be released here
+                pass
+        self.__memory_views = []
+
+    def __get_writable_data(self, func_name):
+        """
+        :brief      Data of the image for the methods changing it in place
+                    The copy taken from the driver buffer is immutable, it is replaced by a
+                    ctypes array owned by the image and frame_data.image_buf is pointed to
+                    it, the driver buffer is never written
+        :param      func_name:  name of the calling method, used in the error message
+        :return:    ctypes array of the image data
+        """
+        if self.__zero_copy:
+            raise InvalidCallError(
+                "RawImage.%s: the data of a zero-copy image is read-only, "
+                "call detach() before" % func_name
+            )
+
+        if not isinstance(self.__image_array, ct.Array):
+            self.__image_array = (
+                ct.c_ubyte * self.frame_data.image_size
+            ).from_buffer_copy(self.__image_array)
+            self.frame_data.image_buf = ct.addressof(self.__image_array)
+        return self.__image_array
+
     def __pixel_format_raw16_to_raw8(self, pixel_format):
         """
         :brief      convert raw16 to raw8, the pixel format need convert to 8bit bayer format
@@ -351,12 +448,14 @@ class RawImage:
         else:
             return -1
 
-    def __raw16_to_raw8(self, pixel_bit_depth, valid_bits):
+    def __raw16_to_raw8(self, pixel_bit_depth, valid_bits, out=None):
         """
         :brief      convert raw16 to raw8
         :param      pixel_bit_depth     pixel bit depth
         :param      valid_bits:         data valid digit[DxValidBit]
-        :return:    RAWImage object
+        :param      out:                np.ndarray of shape (height, width) and dtype uint8
+                                        written in place of a new RAWImage object
+        :return:    RAWImage object, or out
         """
         if pixel_bit_depth == GxPixelSizeEntry.BPP10:
             valid_bits = min(valid_bits, DxValidBit.BIT2_9)
@@ -370,23 +469,34 @@ class RawImage:
             print("RawImage.__dx.dx_raw16_to_raw8: Only support 10bit and 12bit")
             return None
 
-        frame_data = GxFrameData()
-        frame_data.status = self.frame_data.status
-        frame_data.width = self.frame_data.width
-        frame_data.height = self.frame_data.height
-        frame_data.pixel_format = self.__pixel_format_raw16_to_raw8(
-            self.frame_data.pixel_format
-        )
-        frame_data.image_size = self.frame_data.width * self.frame_data.height
-        frame_data.frame_id = self.frame_data.frame_id
-        frame_data.timestamp = self.frame_data.timestamp
-        # frame_data.buf_id = self.frame_data.buf_id
-        frame_data.image_buf = None
-        image_raw8 = RawImage(frame_data)
+        if out is not None:
+            image_raw8 = out
+            output_address = _InterUtility.check_output_array(
+                out,
+                (self.frame_data.height, self.frame_data.width),
+                self.frame_data.width * self.frame_data.height,
+                "RawImage",
+                "convert",
+            )
+        else:
+            frame_data = GxFrameData()
+            frame_data.status = self.frame_data.status
+            frame_data.width = self.frame_data.width
+            frame_data.height = self.frame_data.height
+            frame_data.pixel_format = self.__pixel_format_raw16_to_raw8(
+                self.frame_data.pixel_format
+            )
+            frame_data.image_size = self.frame_data.width * self.frame_data.height
+            frame_data.frame_id = self.frame_data.frame_id
+            frame_data.timestamp = self.frame_data.timestamp
+            # frame_data.buf_id = self.frame_data.buf_id
+            frame_data.image_buf = None
+            image_raw8 = RawImage(frame_data)
+            output_address = image_raw8.frame_data.image_buf
 
-        status = dx.dx.dx_raw16_to_raw8(
+        status = dx.dx_raw16_to_raw8(
             self.frame_data.image_buf,
-            image_raw8.frame_data.image_buf,
+            output_address,
             self.frame_data.width,
             self.frame_data.height,
             valid_bits,
@@ -408,10 +518,18 @@ class RawImage:
         pixel_bit_depth,
         valid_bits,
         flip,
+        out=None,
+        workers=None,
+        band_height=None,
     ):
         """
         :brief      convert mono_packed to raw8
-        :return:    RAWImage object
+        :param      out:            np.ndarray of dtype uint8 written in place of a new image object,
+                                    shape (height, width, 3) for RGB8, (height, width) otherwise
+        :param      workers:        number of bands converted in parallel, see _convert_tiled,
+                                    None with band_height None: the whole frame in one call
+        :param      band_height:    rows of every band, see _convert_tiled
+        :return:    RAWImage object, RGBImage object, or out
         """
         if pixel_bit_depth == GxPixelSizeEntry.BPP8:
             valid_bits = min(valid_bits, DxValidBit.BIT0_7)
@@ -429,55 +547,26 @@ class RawImage:
             print("ImageProc.__convert_to_special_pixelformat: not support")
             return None
 
-        status, handle = dx.dx.dx_image_format_convert_create()
-        if status != dx.DxStatus.OK:
-            raise UnexpectedError(
-                "dx.dx_image_format_convert_create failure, Error code:%s"
-                % hex(status).__str__()
-            )
-
-        status = dx.dx.dx_image_format_convert_set_output_pixel_format(
-            handle, pixelformat
-        )
-        if status != dx.DxStatus.OK:
-            raise UnexpectedError(
-                "dx.dx_image_format_convert_set_output_pixel_format failure, Error code:%s"
-                % hex(status).__str__()
-            )
-
-        status = dx.dx.dx_image_format_convert_set_valid_bits(handle, valid_bits)
-        if status != dx.DxStatus.OK:
-            raise UnexpectedError(
-                "image_format_convert_set_valid_bits failure, Error code:%s"
-                % hex(status).__str__()
-            )
-
-        status = dx.dx.dx_image_format_convert_set_alpha_value(handle, channel_order)
-        if status != dx.DxStatus.OK:
-            raise UnexpectedError(
-                "image_format_convert_set_alpha_value failure, Error code:%s"
-                % hex(status).__str__()
-            )
-
-        status = dx.dx.dx_image_format_convert_set_interpolation_type(
-            handle, convert_type
+        converter = _converter_cache.get(
+            self.frame_data.pixel_format,
+            pixelformat,
+            valid_bits,
+            convert_type,
+            channel_order,
+            self.frame_data.width,
+            self.frame_data.height,
         )
-        if status != dx.DxStatus.OK:
-            raise UnexpectedError(
-                "image_format_convert_set_interpolation_type failure, Error code:%s"
-                % hex(status).__str__()
-            )
 
-        status, buffer_size_c = (
-            dx.dx.dx_image_format_convert_get_buffer_size_for_conversion(
-                handle, pixelformat, self.frame_data.width, self.frame_data.height
-            )
-        )
-        if status != dx.DxStatus.OK:
-            raise UnexpectedError(
-                "dx.dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s"
-                % hex(status).__str__()
+        if out is not None:
+            if pixelformat == GxPixelFormatEntry.RGB8:
+                shape = (self.frame_data.height, self.frame_data.width, 3)
+            else:
+                shape = (self.frame_data.height, self.frame_data.width)
+            output_address = _InterUtility.check_output_array(
+                out, shape, converter.buffer_size, "RawImage", "convert"
             )
+            self.__run_converter(converter, output_address, flip, workers, band_height)
+            return out
 
         image = None
         frame_data = GxFrameData()
@@ -485,7 +574,7 @@ class RawImage:
         frame_data.width = self.frame_data.width
         frame_data.height = self.frame_data.height
         frame_data.pixel_format = pixelformat
-        frame_data.image_size = buffer_size_c
+        frame_data.image_size = converter.buffer_size
         frame_data.frame_id = self.frame_data.frame_id
         frame_data.timestamp = self.frame_data.timestamp
         frame_data.image_buf = None
@@ -495,31 +584,28 @@ class RawImage:
         else:
             image = RawImage(frame_data)
 
-        status = dx.dx.dx_image_format_convert(
-            handle,
-            self.frame_data.image_buf,
-            self.frame_data.image_size,
-            image.frame_data.image_buf,
-            image.frame_data.image_size,
-            self.frame_data.pixel_format,
-            self.frame_data.width,
-            self.frame_data.height,
-            flip,
+        self.__run_converter(
+            converter, image.frame_data.image_buf, flip, workers, band_height
         )
-        if status != dx.DxStatus.OK:
-            raise UnexpectedError(
-                "image_format_convert failure, Error code:%s" % hex(status).__str__()
-            )
+        return image
 
-        status = dx.dx.dx_image_format_convert_destroy(handle)
-        if status != dx.DxStatus.OK:
-            raise UnexpectedError(
-                "image_format_convert_destroy failure, Error code:%s"
-                % hex(status).__str__()
+    def __run_converter(self, converter, output_address, flip, workers, band_height):
+        """
+        :brief      Convert the frame with converter, in bands when workers or band_height is set
+        :return:    None
+        """
+        if workers is None and band_height is None:
+            converter.convert(self.frame_data, output_address, flip)
+        else:
+            _convert_tiled(
+                converter,
+                self.frame_data.image_buf,
+                output_address,
+                flip,
+                workers,
+                band_height,
             )
 
-        return image
-
     def __raw8_to_rgb(self, raw8_image, convert_type, pixel_color_filter, flip):
         """
         :brief      convert raw8 to RGB
@@ -563,7 +649,13 @@ class RawImage:
         return image_rgb
 
     def __raw8_to_rgb_ex(
-        self, raw8_image, convert_type, pixel_color_filter, flip, channel_order
+        self,
+        raw8_image,
+        convert_type,
+        pixel_color_filter,
+        flip,
+        channel_order,
+        out=None,
     ):
         """
         :brief      convert raw8 to RGB with chosen RGB channel order
@@ -574,28 +666,41 @@ class RawImage:
                                         True: turn the image upside down
                                         False: do not flip
         :param      channel_order:      RGB channel order of output image
-        :return:    RAWImage object
-        """
-        frame_data = GxFrameData()
-        frame_data.status = raw8_image.frame_data.status
-        frame_data.width = raw8_image.frame_data.width
-        frame_data.height = raw8_image.frame_data.height
-        frame_data.image_size = (
-            raw8_image.frame_data.width * raw8_image.frame_data.height * 3
-        )
-        frame_data.frame_id = raw8_image.frame_data.frame_id
-        frame_data.timestamp = raw8_image.frame_data.timestamp
-        # frame_data.buf_id = self.frame_data.buf_id
-        if channel_order == DxRGBChannelOrder.ORDER_RGB:
-            frame_data.pixel_format = GxPixelFormatEntry.RGB8
+        :param      out:                np.ndarray of shape (height, width, 3) and dtype uint8
+                                        written in place of a new RGBImage object
+        :return:    RGBImage object, or out
+        """
+        if out is not None:
+            image_rgb = out
+            output_address = _InterUtility.check_output_array(
+                out,
+                (raw8_image.frame_data.height, raw8_image.frame_data.width, 3),
+                raw8_image.frame_data.width * raw8_image.frame_data.height * 3,
+                "RawImage",
+                "convert",
+            )
         else:
-            frame_data.pixel_format = GxPixelFormatEntry.BGR8
-        frame_data.image_buf = None
-        image_rgb = RGBImage(frame_data)
+            frame_data = GxFrameData()
+            frame_data.status = raw8_image.frame_data.status
+            frame_data.width = raw8_image.frame_data.width
+            frame_data.height = raw8_image.frame_data.height
+            frame_data.image_size = (
+                raw8_image.frame_data.width * raw8_image.frame_data.height * 3
+            )
+            frame_data.frame_id = raw8_image.frame_data.frame_id
+            frame_data.timestamp = raw8_image.frame_data.timestamp
+            # frame_data.buf_id = self.frame_data.buf_id
+            if channel_order == DxRGBChannelOrder.ORDER_RGB:
+                frame_data.pixel_format = GxPixelFormatEntry.RGB8
+            else:
+                frame_data.pixel_format = GxPixelFormatEntry.BGR8
+            frame_data.image_buf = None
+            image_rgb = RGBImage(frame_data)
+            output_address = image_rgb.frame_data.image_buf
 
-        status = dx.dx.dx_raw8_to_rgb24_ex(
+        status = dx.dx_raw8_to_rgb24_ex(
             raw8_image.frame_data.image_buf,
-            image_rgb.frame_data.image_buf,
+            output_address,
             raw8_image.frame_data.width,
             raw8_image.frame_data.height,
             convert_type,
@@ -726,6 +831,96 @@ class RawImage:
 
         return -1
 
+    def __convert_numpy(
+        self, mode, flip, valid_bits, demosaic_mode, channel_order, out, workers
+    ):
+        """
+        :brief      convert with NumPy: unpack, keep the valid bits, demosaic
+        :param      demosaic_mode:  demosaic.NEAREST, BILINEAR or EDGE_AWARE
+        :return:    RAWImage object, RGBImage object, or out
+        """
+        pixel_format = self.frame_data.pixel_format
+        width = self.frame_data.width
+        height = self.frame_data.height
+        layout = get_pixel_format_layout(pixel_format)
+        if layout is None:
+            print("RawImage.convert: This pixel format is not support")
+            return None
+
+        if mode == "RAW8" and layout.channels == 3:
+            raise ParameterTypeError("Unsupported pixel format conversion.")
+        if mode == "RAW8" and flip is True:
+            print("""RawImage.convert: mode="RAW8" don't support flip=True""")
+            return None
+
+        values = unpack_pixels(
+            self.__image_array, pixel_format, width, height, workers=workers
+        )
+        if layout.data_bits > 8:
+            # values is a new array, shifted in place
+            np.right_shift(values, min(valid_bits, layout.data_bits - 8), out=values)
+            np.minimum(values, 255, out=values)
+            values = values.astype(np.uint8)
+
+        if mode == "RAW8":
+            if out is not None:
+                _InterUtility.check_output_array(
+                    out, (height, width), width * height, "RawImage", "convert"
+                )
+                np.copyto(out, values)
+                return out
+
+            frame_data = GxFrameData()
+            frame_data.status = self.frame_data.status
+            frame_data.width = width
+            frame_data.height = height
+            frame_data.pixel_format = Utility.get_convert_dest_8bit_pixel_format(
+                pixel_format
+            )
+            frame_data.image_size = width * height
+            frame_data.frame_id = self.frame_data.frame_id
+            frame_data.timestamp = self.frame_data.timestamp
+            frame_data.image_buf = None
+            image_raw8 = RawImage(frame_data)
+            np.copyto(image_raw8.get_numpy_array(), values)
+            return image_raw8
+
+        if out is not None:
+            _InterUtility.check_output_array(
+                out, (height, width, 3), width * height * 3, "RawImage", "convert"
+            )
+            image_rgb = out
+            rgb = out
+        else:
+            frame_data = GxFrameData()
+            frame_data.status = self.frame_data.status
+            frame_data.width = width
+            frame_data.height = height
+            frame_data.image_size = width * height * 3
+            frame_data.frame_id = self.frame_data.frame_id
+            frame_data.timestamp = self.frame_data.timestamp
+            if channel_order == DxRGBChannelOrder.ORDER_RGB:
+                frame_data.pixel_format = GxPixelFormatEntry.RGB8
+            else:
+                frame_data.pixel_format = GxPixelFormatEntry.BGR8
+            frame_data.image_buf = None
+            image_rgb = RGBImage(frame_data)
+            rgb = image_rgb.get_numpy_array()
+
+        # flip and channel order are views of the output, written in place
+        if flip:
+            rgb = rgb[::-1]
+        if channel_order == DxRGBChannelOrder.ORDER_BGR:
+            rgb = rgb[..., ::-1]
+
+        if layout.channels == 3:
+            if pixel_format == GxPixelFormatEntry.BGR8:
+                values = values[..., ::-1]
+            np.copyto(rgb, values)
+        else:
+            demosaic.demosaic(values, layout.color_filter, demosaic_mode, rgb, workers)
+        return image_rgb
+
     def convert(
         self,
         mode,
@@ -733,6 +928,11 @@ class RawImage:
         valid_bits=DxValidBit.BIT8_15,
         convert_type=DxBayerConvertType.NEIGHBOUR,
         channel_order=DxRGBChannelOrder.ORDER_RGB,
+        out=None,
+        engine="dx",
+        workers=None,
+        band_height=None,
+        roi=None,
     ):
         """
         :brief      Image format convert
@@ -742,10 +942,35 @@ class RawImage:
                                     True: turn the image upside down
                                     False: do not flip
         :param      valid_bits:     Data valid digit, See detail in DxValidBit, raw8 don't this param
-        :param      convert_type:   Bayer convert type, See detail in DxBayerConvertType
+        :param      convert_type:   Bayer convert type, See detail in DxBayerConvertType,
+                                    with engine="numpy" also a demosaic mode:
+                                    "nearest", "bilinear" or "edge"
         :param      channel_order:  RGB channel order of output image
-        :return:    return image object according to mode parameter
-        """
+        :param      out:            np.ndarray the image is written into instead of a new image object,
+                                    dtype uint8, C-contiguous and writeable, of shape
+                                    (height, width) for "RAW8" and (height, width, 3) for "RGB",
+                                    e.g. a slice of a batch array or an array on shared memory
+        :param      engine:         "dx":       DxImageProc
+                                    "numpy":    pixelformat and demosaic, no DxImageProc needed,
+                                                NEIGHBOUR and NEIGHBOUR3 are "bilinear",
+                                                ADAPTIVE is "edge"
+        :param      workers:        engine="numpy": number of row bands converted in parallel,
+                                    None: one per CPU for large frames
+                                    engine="dx": number of threads converting bands of
+                                    band_height rows, each with TILE_HALO_ROWS rows above
+                                    and below for the interpolation,
+                                    None with band_height None: the whole frame in one call
+        :param      band_height:    engine="dx": rows of every band, rounded up to even,
+                                    None: the rows divided between the workers
+        :param      roi:            (x, y, width, height): convert only this region, cropped
+                                    from the raw data with ROI_HALO_PIXELS around it and
+                                    aligned on the bayer pattern and the packed groups;
+                                    out is then (height, width) or (height, width, 3)
+        :return:    return image object according to mode parameter, or out;
+                    with roi a np.ndarray of the region, or out
+        """
+        self.__check_buffer_valid("convert")
+
         if self.frame_data.status != GxFrameStatusList.SUCCESS:
             print("RawImage.convert: This is a incomplete image")
             return None
@@ -755,6 +980,22 @@ class RawImage:
                 "RawImage.convert: Expected flip type is bool, not %s" % type(flip)
             )
 
+        if engine not in ("dx", "numpy"):
+            print("""RawImage.convert: engine="%s", isn't support""" % engine)
+            return None
+
+        if engine == "numpy" and isinstance(convert_type, str):
+            if convert_type not in demosaic.MODES:
+                print(
+                    "RawImage.convert: convert_type out of bounds, %s"
+                    % demosaic.MODES.__str__()
+                )
+                return None
+            demosaic_mode = convert_type
+            convert_type = DxBayerConvertType.NEIGHBOUR
+        else:
+            demosaic_mode = None
+
         if not isinstance(convert_type, int):
             raise ParameterTypeError(
                 "RawImage.convert: "
@@ -802,6 +1043,38 @@ class RawImage:
             )
             return None
 
+        if roi is not None:
+            if not _check_roi(
+                roi,
+                self.frame_data.width,
+                self.frame_data.height,
+                "RawImage.convert",
+            ):
+                return None
+            if demosaic_mode is not None:
+                convert_type = demosaic_mode
+            return self.__convert_roi(
+                roi,
+                mode,
+                flip,
+                valid_bits,
+                convert_type,
+                channel_order,
+                out,
+                engine,
+                workers,
+            )
+
+        if engine == "numpy":
+            if mode not in ("RAW8", "RGB"):
+                print("""RawImage.convert: mode="%s", isn't support""" % mode)
+                return None
+            if demosaic_mode is None:
+                demosaic_mode = _NUMPY_DEMOSAIC_MODES[convert_type]
+            return self.__convert_numpy(
+                mode, flip, valid_bits, demosaic_mode, channel_order, out, workers
+            )
+
         pixel_bit_depth = _InterUtility.get_bit_depth(self.frame_data.pixel_format)
         if self.frame_data.pixel_format in (
             GxPixelFormatEntry.RGB8,
@@ -818,8 +1091,25 @@ class RawImage:
                         pixel_bit_depth,
                         valid_bits,
                         flip,
+                        out,
+                        workers,
+                        band_height,
                     )
                     return image_rgb
+                elif out is not None:
+                    output_address = _InterUtility.check_output_array(
+                        out,
+                        (self.frame_data.height, self.frame_data.width, 3),
+                        self.frame_data.image_size,
+                        "RawImage",
+                        "convert",
+                    )
+                    ct.memmove(
+                        output_address,
+                        self.frame_data.image_buf,
+                        self.frame_data.image_size,
+                    )
+                    return out
                 else:
                     frame_data = GxFrameData()
                     frame_data.status = self.frame_data.status
@@ -861,6 +1151,9 @@ class RawImage:
                 pixel_bit_depth,
                 valid_bits,
                 flip,
+                out,
+                workers,
+                band_height,
             )
             return image_raw8
         elif mode == "RGB":
@@ -871,78 +1164,547 @@ class RawImage:
                 pixel_bit_depth,
                 valid_bits,
                 flip,
+                out,
+                workers,
+                band_height,
             )
             return image_rgb
         else:
             print("""RawImage.convert: mode="%s", isn't support""" % mode)
             return None
 
-    def is_color_cam(self):
-        pixel_color_filter = _InterUtility.get_pixel_color_filter(
-            self.frame_data.pixel_format
-        )
-        if (pixel_color_filter > 0) or (
-            self.frame_data.pixel_format
-            in (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8)
-        ):
-            return True
-        else:
-            return False
-
-    def get_output_pixel_format(self):
-        return self.frame_data.pixel_format
-
-    def defective_pixel_correct(self):
+    def __convert_roi(
+        self,
+        roi,
+        mode,
+        flip,
+        valid_bits,
+        convert_type,
+        channel_order,
+        out,
+        engine,
+        workers,
+    ):
         """
-        :brief      Auto raw defective pixel correct,Support image from Raw8 to Raw16, the bit number is actual
-                    bit number, when it is more than 8, the actual bit can be every number between 9 to 16.
-                    And if image format is packed, you need convert it to Raw16.
-                    This function should be used in each frame.
-        :return:    None
+        :brief      Convert the crop of the raw data around a ROI, then keep the ROI
+        :param      roi:    (x, y, width, height), inside the image
+        :return:    np.ndarray of the ROI, or out; None when the conversion failed
         """
-        pixel_bit_depth = _InterUtility.get_bit_depth(self.frame_data.pixel_format)
-        status = dx.dx.dx_auto_raw_defective_pixel_correct(
-            self.frame_data.image_buf,
+        if mode not in ("RAW8", "RGB"):
+            print("""RawImage.convert: mode="%s", isn't support""" % mode)
+            return None
+
+        x, y, roi_width, roi_height = roi
+        channels = (3,) if mode == "RGB" else ()
+        if out is not None:
+            _InterUtility.check_output_array(
+                out,
+                (roi_height, roi_width) + channels,
+                roi_height * roi_width * (3 if channels else 1),
+                "RawImage",
+                "convert",
+            )
+
+        crop = _get_roi_crop(
+            self.frame_data.pixel_format,
             self.frame_data.width,
             self.frame_data.height,
-            pixel_bit_depth,
+            roi,
         )
+        if crop is None:
+            # rows not starting on a byte, the whole frame is converted
+            crop = (0, 0, self.frame_data.width, self.frame_data.height)
+            crop_image = self
+        else:
+            crop_image, crop_data = _crop_raw_image(self.frame_data, crop)
 
-        if status != dx.DxStatus.OK:
-            raise UnexpectedError(
-                "RawImage.defective_pixel_correct: failed, error code:%s"
-                % hex(status).__str__()
+        x0, y0, x1, y1 = crop
+        converted = np.empty((y1 - y0, x1 - x0) + channels, dtype=np.uint8)
+        if (
+            crop_image.convert(
+                mode,
+                flip,
+                valid_bits,
+                convert_type,
+                channel_order,
+                converted,
+                engine,
+                workers,
             )
+            is None
+        ):
+            return None
 
-    def raw8_rotate_90_cw(self):
-        """
-        :brief      To rotate the 8-bit image clockwise by 90 degrees
-        :return     RAWImage object
+        top = y - y0
+        if flip:
+            top = y1 - y0 - top - roi_height
+        region = converted[top : top + roi_height, x - x0 : x - x0 + roi_width]
+        if out is None:
+            return np.ascontiguousarray(region)
+        out[...] = region
+        return out
+
+    def convert_rois(
+        self,
+        mode,
+        rois,
+        flip=False,
+        valid_bits=DxValidBit.BIT8_15,
+        convert_type=DxBayerConvertType.NEIGHBOUR,
+        channel_order=DxRGBChannelOrder.ORDER_RGB,
+        out=None,
+        engine="dx",
+        workers=None,
+        stack=False,
+    ):
         """
-        if self.frame_data.pixel_format & PIXEL_BIT_MASK != GX_PIXEL_8BIT:
-            raise InvalidParameterError(
-                "RawImage.raw8_rotate_90_cw only support 8bit image"
+        :brief      Convert several regions of the image, see convert(roi=...)
+        :param      mode:           "RAW8" or "RGB", see convert
+        :param      rois:           list of (x, y, width, height)
+        :param      flip:           see convert
+        :param      valid_bits:     see convert
+        :param      convert_type:   see convert
+        :param      channel_order:  see convert
+        :param      out:            np.ndarray of dtype uint8, C-contiguous and writeable,
+                                    (N, height, width) for "RAW8" and (N, height, width, 3)
+                                    for "RGB", receiving the regions in the order of rois;
+                                    only when all regions have the same size
+        :param      engine:         see convert
+        :param      workers:        number of regions converted in parallel,
+                                    None: parallel.get_default_workers of all the regions
+        :param      stack:          True: return one np.ndarray as with out
+        :return:    list of np.ndarray, None for the regions that failed; out or a new
+                    np.ndarray with out or stack, zero for the regions that failed;
+                    None when a roi is out of bounds
+        """
+        self.__check_buffer_valid("convert_rois")
+
+        if not isinstance(rois, (list, tuple)):
+            raise ParameterTypeError(
+                "RawImage.convert_rois: Expected rois type is list, not %s" % type(rois)
             )
 
-        frame_data = GxFrameData()
-        frame_data.status = self.frame_data.status
-        frame_data.width = self.frame_data.height
-        frame_data.height = self.frame_data.width
-        frame_data.pixel_format = self.__raw8_pixel_format_rotate_90(
-            self.frame_data.pixel_format, 90
-        )
-        if frame_data.pixel_format == -1:
-            raise UnexpectedError(
-                "Rotate pixel format %s failed"
-                % hex(self.frame_data.pixel_format).__str__()
-            )
+        for roi in rois:
+            if not _check_roi(
+                roi,
+                self.frame_data.width,
+                self.frame_data.height,
+                "RawImage.convert_rois",
+            ):
+                return None
 
-        frame_data.image_size = self.frame_data.image_size
-        frame_data.frame_id = self.frame_data.frame_id
-        frame_data.timestamp = self.frame_data.timestamp
-        # frame_data.buf_id = self.frame_data.buf_id
-        frame_data.image_buf = None
-        rotate_image = RawImage(frame_data)
+        if out is not None or stack:
+            sizes = set((roi[3], roi[2]) for roi in rois)
+            if len(sizes) != 1:
+                raise InvalidParameterError(
+                    "RawImage.convert_rois: out and stack need regions of the same size"
+                )
+            shape = (len(rois),) + sizes.pop() + ((3,) if mode == "RGB" else ())
+            if out is None:
+                out = np.empty(shape, dtype=np.uint8)
+            elif not isinstance(out, np.ndarray) or out.shape != shape:
+                raise InvalidParameterError(
+                    "RawImage.convert_rois: out must be a np.ndarray of shape %s"
+                    % (shape,)
+                )
+
+        if workers is None:
+            workers = get_default_workers(sum(roi[2] * roi[3] for roi in rois))
+
+        results = [None] * len(rois)
+
+        def convert_regions(first, last):
+            for index in range(first, last):
+                results[index] = self.convert(
+                    mode,
+                    flip,
+                    valid_bits,
+                    convert_type,
+                    channel_order,
+                    None if out is None else out[index],
+                    engine,
+                    workers=1,
+                    roi=rois[index],
+                )
+                if results[index] is None and out is not None:
+                    out[index] = 0
+
+        run_bands(convert_regions, len(rois), workers)
+        if out is None:
+            return results
+        return out
+
+    def preview(
+        self,
+        scale=2,
+        lut=None,
+        gamma=None,
+        valid_bits=DxValidBit.BIT8_15,
+        channel_order=DxRGBChannelOrder.ORDER_RGB,
+        flip=False,
+        out=None,
+    ):
+        """
+        :brief      Small 8 bit image straight from the raw data, without demosaic:
+                    every scale x scale block of pixels becomes one pixel, for bayer
+                    formats the mean of its red, green and blue pixels
+        :param      scale:          2, 4 or 8
+        :param      lut:            np.ndarray or Buffer of uint8 applied to the preview,
+                                    256 entries, or 2**data_bits entries indexed by the
+                                    values before valid_bits, e.g. a contrast lookup table
+        :param      gamma:          gamma param, range(0.1 ~ 10), applied after lut as
+                                    255 * (v / 255) ** (1 / gamma); None: no gamma
+        :param      valid_bits:     Data valid digit, See detail in DxValidBit
+        :param      channel_order:  RGB channel order of the output
+        :param      flip:           True: turn the image upside down
+        :param      out:            np.ndarray of dtype uint8, C-contiguous and writeable,
+                                    (height // scale, width // scale, 3) for bayer and RGB
+                                    formats, (height // scale, width // scale) for mono
+        :return:    np.ndarray of the preview, out when given
+        """
+        self.__check_buffer_valid("preview")
+
+        if self.frame_data.status != GxFrameStatusList.SUCCESS:
+            print("RawImage.preview: This is a incomplete image")
+            return None
+
+        if not isinstance(scale, int) or isinstance(scale, bool):
+            raise ParameterTypeError(
+                "RawImage.preview: Expected scale type is int, not %s" % type(scale)
+            )
+
+        if scale not in _PREVIEW_SCALES:
+            print(
+                "RawImage.preview: scale out of bounds, %s" % _PREVIEW_SCALES.__str__()
+            )
+            return None
+
+        if not isinstance(valid_bits, int):
+            raise ParameterTypeError(
+                "RawImage.preview: "
+                "Expected valid_bits type is int, not %s" % type(valid_bits)
+            )
+
+        if not isinstance(flip, bool):
+            raise ParameterTypeError(
+                "RawImage.preview: Expected flip type is bool, not %s" % type(flip)
+            )
+
+        pixel_format = self.frame_data.pixel_format
+        layout = get_pixel_format_layout(pixel_format)
+        if layout is None:
+            print("RawImage.preview: This pixel format is not support")
+            return None
+
+        height = self.frame_data.height // scale
+        width = self.frame_data.width // scale
+        if height == 0 or width == 0:
+            print("RawImage.preview: image smaller than scale %d" % scale)
+            return None
+
+        if isinstance(lut, Buffer):
+            lut = np.frombuffer(lut.get_data(), dtype=np.uint8)
+        if lut is not None:
+            if not isinstance(lut, np.ndarray) or lut.dtype != np.uint8:
+                raise ParameterTypeError(
+                    "RawImage.preview: Expected lut type is np.ndarray of uint8 or Buffer"
+                )
+            if lut.shape not in ((256,), (1 << layout.data_bits,)):
+                raise InvalidParameterError(
+                    "RawImage.preview: lut must have 256 or %d entries"
+                    % (1 << layout.data_bits)
+                )
+
+        if gamma is not None:
+            if not isinstance(gamma, (int, float)):
+                raise ParameterTypeError(
+                    "RawImage.preview: Expected gamma type is float, not %s"
+                    % type(gamma)
+                )
+            if gamma < GAMMA_MIN or gamma > GAMMA_MAX:
+                print("RawImage.preview: gamma out of bounds, range:[0.1, 10.0]")
+                return None
+            levels = np.arange(256) / 255.0
+            gamma_lut = np.round(255 * levels ** (1.0 / gamma)).astype(np.uint8)
+            lut = gamma_lut if lut is None else gamma_lut[lut]
+
+        if layout.channels == 1 and layout.color_filter == GxPixelColorFilterEntry.NONE:
+            shape = (height, width)
+        else:
+            shape = (height, width, 3)
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8)
+        else:
+            _InterUtility.check_output_array(
+                out, shape, int(np.prod(shape)), "RawImage", "preview"
+            )
+
+        if layout.packing == PACKING_NONE:
+            # a view of the image buffer, only the binned planes are computed
+            data = np.frombuffer(self.__image_array, dtype=np.uint8)
+            count = self.frame_data.width * self.frame_data.height * layout.channels
+            if layout.data_bits > 8:
+                data = data[: count * 2].view("<u2")
+            values = data[:count].reshape(
+                (self.frame_data.height, self.frame_data.width, layout.channels)
+            )
+        else:
+            values = unpack_pixels(
+                self.__image_array,
+                pixel_format,
+                self.frame_data.width,
+                self.frame_data.height,
+            )[..., np.newaxis]
+
+        if layout.color_filter != GxPixelColorFilterEntry.NONE:
+            red_y, red_x = demosaic._RED_POSITIONS[layout.color_filter]
+            blue_y, blue_x = 1 - red_y, 1 - red_x
+            quads = scale // 2
+            channels = [
+                [(red_y, red_x)],
+                [(red_y, blue_x), (blue_y, red_x)],
+                [(blue_y, blue_x)],
+            ]
+            planes = [
+                [
+                    values[y : 2 * height * quads : 2, x : 2 * width * quads : 2, 0]
+                    for y, x in positions
+                ]
+                for positions in channels
+            ]
+            factor = quads
+        else:
+            planes = [
+                [values[: height * scale, : width * scale, channel]]
+                for channel in range(layout.channels)
+            ]
+            if pixel_format == GxPixelFormatEntry.BGR8:
+                planes = planes[::-1]
+            factor = scale
+
+        view = out[::-1] if flip else out
+        if channel_order == DxRGBChannelOrder.ORDER_BGR and view.ndim == 3:
+            view = view[..., ::-1]
+
+        data_shift = 0
+        if layout.data_bits > 8:
+            data_shift = min(valid_bits, layout.data_bits - 8)
+        full_lut = lut is not None and len(lut) != 256
+        for channel, channel_planes in enumerate(planes):
+            pixel_num = len(channel_planes) * factor * factor
+            total = _bin_sum(channel_planes, factor, height, width, layout.data_bits)
+            shift = pixel_num.bit_length() - 1
+            if not full_lut:
+                shift += data_shift
+            channel_view = view[..., channel] if view.ndim == 3 else view
+            if lut is not None:
+                # mode="clip" saturates the values above the lookup table
+                np.take(
+                    lut, np.right_shift(total, shift), out=channel_view, mode="clip"
+                )
+            elif layout.data_bits - data_shift > 8:
+                np.minimum(
+                    np.right_shift(total, shift),
+                    255,
+                    out=channel_view,
+                    casting="unsafe",
+                )
+            elif shift == 0:
+                np.copyto(channel_view, total, casting="unsafe")
+            else:
+                np.right_shift(total, shift, out=channel_view, casting="unsafe")
+        return out
+
+    def get_white_balance_ratio(self, roi=None, step=4, saturation=0.98, black_level=0):
+        """
+        :brief      Get white balance ratios from the raw bayer data, without converting it to RGB24:
+                    gray world on a sample of the 2x2 cells of the frame, saturated cells left out.
+                    Packed formats: only the sampled rows are unpacked
+        :param      roi:            (x, y, width, height) measured, None: whole frame
+        :param      step:           one 2x2 cell of step x step is read, 1: every cell
+        :param      saturation:     fraction of the full scale from which a sample is clipped
+        :param      black_level:    pixel value of black, subtracted from the channel means
+        :return:    rgb_ratio:      (r_ratio, g_ratio, b_ratio), None when every sampled cell is
+                                    saturated or dark
+        """
+        self.__check_buffer_valid("get_white_balance_ratio")
+
+        _InterUtility.check_type(
+            step, int, "step", "RawImage", "get_white_balance_ratio"
+        )
+        if step < 1:
+            print("RawImage.get_white_balance_ratio: step out of bounds, minimum=1")
+            return None
+
+        pixel_format = self.frame_data.pixel_format
+        layout = get_pixel_format_layout(pixel_format)
+        if (
+            layout is None
+            or layout.channels != 1
+            or layout.color_filter == GxPixelColorFilterEntry.NONE
+        ):
+            raise InvalidParameterError(
+                "RawImage.get_white_balance_ratio only support bayer formats"
+            )
+
+        width = self.frame_data.width
+        height = self.frame_data.height
+        if roi is None:
+            roi = (0, 0, width, height)
+        elif not _check_roi(roi, width, height, "RawImage.get_white_balance_ratio"):
+            return None
+
+        # whole 2x2 cells of the ROI, the crop keeps the CFA phase of the frame
+        x, y, roi_width, roi_height = roi
+        x0 = x + x % 2
+        y0 = y + y % 2
+        x1 = x0 + (x + roi_width - x0) // 2 * 2
+        y1 = y0 + (y + roi_height - y0) // 2 * 2
+        if x1 <= x0 or y1 <= y0:
+            print("RawImage.get_white_balance_ratio: roi %s has no 2x2 cell" % (roi,))
+            return None
+
+        if layout.packing == PACKING_NONE:
+            values = self.get_numpy_array(view=True)
+            if values is None:
+                return None
+            return estimate_white_balance(
+                values[y0:y1, x0:x1],
+                layout.color_filter,
+                layout.data_bits,
+                step,
+                saturation,
+                black_level,
+            )
+
+        first_rows = np.arange(y0, y1, 2 * step)
+        values = self.get_numpy_rows(
+            (first_rows[:, np.newaxis] + np.arange(2)).reshape(-1)
+        )
+        if values is None:
+            return None
+        return estimate_white_balance(
+            values[:, x0:x1],
+            layout.color_filter,
+            layout.data_bits,
+            (1, step),
+            saturation,
+            black_level,
+        )
+
+    def is_color_cam(self):
+        pixel_color_filter = _InterUtility.get_pixel_color_filter(
+            self.frame_data.pixel_format
+        )
+        if (pixel_color_filter > 0) or (
+            self.frame_data.pixel_format
+            in (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8)
+        ):
+            return True
+        else:
+            return False
+
+    def get_output_pixel_format(self):
+        return self.frame_data.pixel_format
+
+    def defective_pixel_correct(self, defect_map=None):
+        """
+        :brief      Auto raw defective pixel correct,Support image from Raw8 to Raw16, the bit number is actual
+                    bit number, when it is more than 8, the actual bit can be every number between 9 to 16.
+                    And if image format is packed, you need convert it to Raw16.
+                    This function should be used in each frame.
+                    With a defect_map, only the pixels of the map are replaced, in place, without
+                    detection, every mono and bayer format
+        :param      defect_map:     defects.DefectPixelMap of the sensor, None: detect the defects
+                                    of the frame with DxImageProc
+        :return:    None
+        """
+        self.__check_buffer_valid("defective_pixel_correct")
+
+        if defect_map is not None:
+            _InterUtility.check_type(
+                defect_map,
+                DefectPixelMap,
+                "defect_map",
+                "RawImage",
+                "defective_pixel_correct",
+            )
+            self.__correct_defects(defect_map)
+            return
+
+        self.__get_writable_data("defective_pixel_correct")
+        pixel_bit_depth = _InterUtility.get_bit_depth(self.frame_data.pixel_format)
+        status = dx.dx_auto_raw_defective_pixel_correct(
+            self.frame_data.image_buf,
+            self.frame_data.width,
+            self.frame_data.height,
+            pixel_bit_depth,
+        )
+
+        if status != dx.DxStatus.OK:
+            raise UnexpectedError(
+                "RawImage.defective_pixel_correct: failed, error code:%s"
+                % hex(status).__str__()
+            )
+
+    def __correct_defects(self, defect_map):
+        """
+        :brief      defective_pixel_correct with a DefectPixelMap, unpacked formats are
+                    corrected in the image data, packed ones unpacked and packed back
+        """
+        if (
+            self.frame_data.width != defect_map.width
+            or self.frame_data.height != defect_map.height
+            or self.frame_data.pixel_format != defect_map.pixel_format
+        ):
+            raise InvalidParameterError(
+                "RawImage.defective_pixel_correct, the width/height/format of raw image "
+                "and defect_map is different"
+            )
+
+        data = self.__get_writable_data("defective_pixel_correct")
+        values = self.get_numpy_array()
+        if values is None:
+            return
+
+        # unpacked formats: values is a view of data, corrected in place
+        defect_map.correct(values)
+        layout = get_pixel_format_layout(self.frame_data.pixel_format)
+        if layout.packing != PACKING_NONE:
+            packed = pack_pixels(values, self.frame_data.pixel_format)
+            ct.memmove(data, packed.ctypes.data, packed.nbytes)
+
+    def raw8_rotate_90_cw(self):
+        """
+        :brief      To rotate the 8-bit image clockwise by 90 degrees
+        :return     RAWImage object
+        """
+        self.__check_buffer_valid("raw8_rotate_90_cw")
+
+        if self.frame_data.pixel_format & PIXEL_BIT_MASK != GX_PIXEL_8BIT:
+            raise InvalidParameterError(
+                "RawImage.raw8_rotate_90_cw only support 8bit image"
+            )
+
+        frame_data = GxFrameData()
+        frame_data.status = self.frame_data.status
+        frame_data.width = self.frame_data.height
+        frame_data.height = self.frame_data.width
+        frame_data.pixel_format = self.__raw8_pixel_format_rotate_90(
+            self.frame_data.pixel_format, 90
+        )
+        if frame_data.pixel_format == -1:
+            raise UnexpectedError(
+                "Rotate pixel format %s failed"
+                % hex(self.frame_data.pixel_format).__str__()
+            )
+
+        frame_data.image_size = self.frame_data.image_size
+        frame_data.frame_id = self.frame_data.frame_id
+        frame_data.timestamp = self.frame_data.timestamp
+        # frame_data.buf_id = self.frame_data.buf_id
+        frame_data.image_buf = None
+        rotate_image = RawImage(frame_data)
 
         status = dx.dx_raw8_rotate_90_cw(
             self.frame_data.image_buf,
@@ -964,6 +1726,8 @@ class RawImage:
         :brief      To rotate the 8-bit image clockwise by -90 degrees
         :return     RAWImage object
         """
+        self.__check_buffer_valid("raw8_rotate_90_ccw")
+
         if self.frame_data.pixel_format & PIXEL_BIT_MASK != GX_PIXEL_8BIT:
             raise InvalidParameterError(
                 "RawImage.raw8_rotate_90_ccw only support 8bit image"
@@ -1010,6 +1774,8 @@ class RawImage:
         :param      factor:    factor, range(-150 ~ 150)
         :return:    None
         """
+        self.__check_buffer_valid("brightness")
+
         if not isinstance(factor, int):
             raise ParameterTypeError(
                 "RawImage.brightness: "
@@ -1019,6 +1785,7 @@ class RawImage:
         if self.frame_data.pixel_format != GxPixelFormatEntry.MONO8:
             raise InvalidParameterError("RawImage.brightness only support mono8 image")
 
+        self.__get_writable_data("brightness")
         status = dx.dx_brightness(
             self.frame_data.image_buf,
             self.frame_data.image_buf,
@@ -1037,6 +1804,8 @@ class RawImage:
         :param      factor:    factor, range(-50 ~ 100)
         :return:    None
         """
+        self.__check_buffer_valid("contrast")
+
         if not isinstance(factor, int):
             raise ParameterTypeError(
                 "RawImage.contrast: Expected factor type is int, not %s" % type(factor)
@@ -1045,6 +1814,7 @@ class RawImage:
         if self.frame_data.pixel_format != GxPixelFormatEntry.MONO8:
             raise InvalidParameterError("RawImage.contrast only support mono8 image")
 
+        self.__get_writable_data("contrast")
         status = dx.dx_contrast(
             self.frame_data.image_buf,
             self.frame_data.image_buf,
@@ -1063,6 +1833,8 @@ class RawImage:
         :param      mirror_mode:    mirror mode [reference DxImageMirrorMode]
         :return     RAWImage object
         """
+        self.__check_buffer_valid("mirror")
+
         if not isinstance(mirror_mode, int):
             raise ParameterTypeError(
                 "RawImage.mirror: "
@@ -1186,6 +1958,8 @@ class RawImage:
         :param  target_value:       correction target Value
         :return ffc_coefficients:   flat field correction coefficients Buffer
         """
+        self.__check_buffer_valid("get_ffc_coefficients")
+
         if dark_img is not None:
             _InterUtility.check_type(
                 dark_img, RawImage, "dark_img", "Utility", "get_ffc_coefficients"
@@ -1249,12 +2023,27 @@ class RawImage:
 
         return Buffer(ffc_coefficients)
 
-    def flat_field_correction(self, ffc_coefficients):
+    def flat_field_correction(self, ffc_coefficients, out=None, workers=None):
         """
         :brief      Flat Field Correction Process
-        :param      ffc_coefficients:   Flat field correction coefficients
-        :return:    None
-        """
+                    Buffer coefficients: DxImageProc, in place, raw8 raw10 raw12 only
+                    FlatFieldCoefficients: NumPy, every mono and bayer format
+        :param      ffc_coefficients:   Flat field correction coefficients, Buffer from
+                                        get_ffc_coefficients or FlatFieldCoefficients
+                                        from flatfield.FlatFieldCalibration
+        :param      out:                FlatFieldCoefficients only, np.ndarray of the
+                                        shape and dtype of get_numpy_array receiving
+                                        the corrected values, the image is unchanged;
+                                        None: correct the image data in place
+        :param      workers:            FlatFieldCoefficients only, number of row bands
+                                        corrected in parallel
+        :return:    out, None when correcting in place
+        """
+        self.__check_buffer_valid("flat_field_correction")
+
+        if isinstance(ffc_coefficients, FlatFieldCoefficients):
+            return self.__flat_field_correction_numpy(ffc_coefficients, out, workers)
+
         actual_bits = _InterUtility.get_bit_depth(self.frame_data.pixel_format)
         if actual_bits not in (
             GxPixelSizeEntry.BPP8,
@@ -1271,13 +2060,14 @@ class RawImage:
             "RawImage",
             "flat_field_correction",
         )
+        self.__get_writable_data("flat_field_correction")
         status = dx.dx_flat_field_correction(
             self.frame_data.image_buf,
             self.frame_data.image_buf,
             actual_bits,
             self.frame_data.width,
             self.frame_data.height,
-            ffc_coefficients,
+            ffc_coefficients.get_ctype_array(),
         )
         if status != dx.DxStatus.OK:
             raise UnexpectedError(
@@ -1285,16 +2075,89 @@ class RawImage:
                 % hex(status).__str__()
             )
 
-    def get_numpy_array(self):
+    def __flat_field_correction_numpy(self, ffc_coefficients, out, workers):
         """
-        :brief      Return data as a np.Array type with dimension Image.height * Image.width
-        :return:    np.Array objects
+        :brief      flat_field_correction with flatfield.flat_field_correction, packed
+                    formats are unpacked, corrected and packed back when in place
+        """
+        if (
+            self.frame_data.width != ffc_coefficients.width
+            or self.frame_data.height != ffc_coefficients.height
+            or self.frame_data.pixel_format != ffc_coefficients.pixel_format
+        ):
+            raise InvalidParameterError(
+                "RawImage.flat_field_correction, the width/height/format of raw image "
+                "and ffc_coefficients is different"
+            )
+
+        if out is not None:
+            values = self.get_numpy_array(view=True)
+            if values is None:
+                return None
+            _InterUtility.check_output_array(
+                out,
+                values.shape,
+                values.nbytes,
+                "RawImage",
+                "flat_field_correction",
+                values.dtype,
+            )
+            return _flat_field_correction(values, ffc_coefficients, out, workers)
+
+        data = self.__get_writable_data("flat_field_correction")
+        values = self.get_numpy_array()
+        if values is None:
+            return None
+
+        # unpacked formats: values is a view of data, corrected in place
+        _flat_field_correction(values, ffc_coefficients, values, workers)
+        layout = get_pixel_format_layout(self.frame_data.pixel_format)
+        if layout.packing != PACKING_NONE:
+            packed = pack_pixels(values, self.frame_data.pixel_format)
+            ct.memmove(data, packed.ctypes.data, packed.nbytes)
+        return None
+
+    def get_numpy_array(self, out=None, view=None):
         """
+        :brief      Return data as a np.Array type with dimension Image.height * Image.width
+                    GVSP packed (*_PACKED) and PFNC packed (*_P) formats are unpacked to uint16
+                    Zero-copy images return a copy of the driver buffer unless view is True
+        :param      out:    np.ndarray receiving the data instead of a new array, of the
+                            shape and dtype of the returned array, C-contiguous
+        :param      view:   zero-copy images only, True: return a read-only view of the buffer
+                            instead of a copy, None: a view for the images of the frame buffer
+                            pool, a copy for the driver buffers. The view can't be invalidated
+                            by q_buf or release_image, once the buffer is returned it shows the
+                            next frames written to it, so it must not be used after them
+        :return:    np.Array objects, out when given
+        """
+        self.__check_buffer_valid("get_numpy_array")
+
         if self.frame_data.status != GxFrameStatusList.SUCCESS:
             print("RawImage.get_numpy_array: This is a incomplete image")
             return None
 
         image_size = self.frame_data.width * self.frame_data.height
+        layout = get_pixel_format_layout(self.frame_data.pixel_format)
+
+        if layout is not None and layout.packing != PACKING_NONE:
+            shape = (self.frame_data.height, self.frame_data.width)
+            if out is not None:
+                _InterUtility.check_output_array(
+                    out,
+                    shape,
+                    image_size * 2,
+                    "RawImage",
+                    "get_numpy_array",
+                    np.uint16,
+                )
+            return unpack_pixels(
+                self.__image_array,
+                self.frame_data.pixel_format,
+                self.frame_data.width,
+                self.frame_data.height,
+                out,
+            )
 
         if self.frame_data.pixel_format & PIXEL_BIT_MASK == GX_PIXEL_8BIT:
             image_np = np.frombuffer(
@@ -1312,31 +2175,163 @@ class RawImage:
             image_np = np.frombuffer(
                 self.__image_array, dtype=np.ubyte, count=image_size * 3
             ).reshape(self.frame_data.height, self.frame_data.width, 3)
-        elif self.frame_data.pixel_format in (
-            GxPixelFormatEntry.MONO10_PACKED,
-            GxPixelFormatEntry.MONO12_PACKED,
-        ):
-            image_np = np.frombuffer(
-                self.__image_array, dtype=np.ubyte, count=image_size
-            ).reshape(self.frame_data.height, self.frame_data.width)
         else:
             image_np = None
 
+        if out is not None and image_np is not None:
+            _InterUtility.check_output_array(
+                out,
+                image_np.shape,
+                image_np.nbytes,
+                "RawImage",
+                "get_numpy_array",
+                image_np.dtype,
+            )
+            np.copyto(out, image_np)
+            return out
+
+        if self.__zero_copy and image_np is not None:
+            if view is None:
+                view = self.__numpy_view
+            if not view:
+                return image_np.copy()
+            # the view aliases the frame buffer, it must not be written
+            image_np.flags.writeable = False
+
         return image_np
 
+    def get_numpy_rows(self, rows):
+        """
+        :brief      Return the pixel values of some rows of a mono or bayer image as a np.Array with
+                    dimension len(rows) * Image.width, packed formats: only these rows are unpacked
+        :param      rows:   row indices, np.ndarray or list of int
+        :return:    np.Array of uint8 for 8 bit formats, uint16 otherwise
+        """
+        self.__check_buffer_valid("get_numpy_rows")
+
+        pixel_format = self.frame_data.pixel_format
+        layout = get_pixel_format_layout(pixel_format)
+        if layout is None or layout.channels != 1:
+            raise InvalidParameterError(
+                "RawImage.get_numpy_rows only support mono and bayer formats"
+            )
+
+        if self.frame_data.status != GxFrameStatusList.SUCCESS:
+            print("RawImage.get_numpy_rows: This is a incomplete image")
+            return None
+
+        rows = np.asarray(rows, dtype=np.intp)
+        width = self.frame_data.width
+        row_size = _get_row_size(pixel_format, width)
+        if layout.packing == PACKING_NONE or row_size is None:
+            return self.get_numpy_array(view=True)[rows]
+
+        data = np.frombuffer(
+            self.__image_array, dtype=np.uint8, count=row_size * self.frame_data.height
+        )
+        data = data.reshape(self.frame_data.height, row_size)[rows]
+        return unpack_pixels(data, pixel_format, width, rows.size)
+
     def get_data(self):
         """
         :brief      get Raw data
         :return:    raw data[string]
         """
+        self.__check_buffer_valid("get_data")
+
         image_str = ct.string_at(self.__image_array, self.frame_data.image_size)
         return image_str
 
+    def get_memoryview(self):
+        """
+        :brief      Get a read-only memoryview of the raw data without copying it
+                    For zero-copy images the view is released when the buffer is returned by q_buf
+        :return:    memoryview object
+        """
+        self.__check_buffer_valid("get_memoryview")
+
+        memory_view = memoryview(self.__image_array).cast("B").toreadonly()
+        if self.__zero_copy:
+            self.__memory_views.append(memory_view)
+        return memory_view
+
+    def is_zero_copy(self):
+        """
+        :brief      Whether the image wraps the driver buffer instead of owning a copy
+        :return:    True or False
+        """
+        return self.__zero_copy
+
+    def is_buffer_valid(self):
+        """
+        :brief      Whether the image data can still be accessed
+                    A zero-copy image becomes invalid once its buffer is returned by q_buf
+        :return:    True or False
+        """
+        return self.__buffer_valid
+
+    def invalidate_buffer(self):
+        """
+        :brief      Mark the driver buffer as returned, called by DataStream.q_buf
+                    Images owning their data are not affected
+        :return:    None
+        """
+        if not self.__zero_copy:
+            return
+
+        self.__release_memory_views()
+        self.__image_array = None
+        self.__buffer_valid = False
+
+    def copy(self):
+        """
+        :brief      Copy the image into a new RawImage which owns its data
+        :return:    RawImage object
+        """
+        self.__check_buffer_valid("copy")
+
+        frame_data = GxFrameData()
+        frame_data.status = self.frame_data.status
+        frame_data.width = self.frame_data.width
+        frame_data.height = self.frame_data.height
+        frame_data.pixel_format = self.frame_data.pixel_format
+        frame_data.image_size = self.frame_data.image_size
+        frame_data.frame_id = self.frame_data.frame_id
+        frame_data.timestamp = self.frame_data.timestamp
+        frame_data.image_buf = None
+        image = RawImage(frame_data)
+        ct.memmove(
+            image.frame_data.image_buf,
+            self.__image_array,
+            self.frame_data.image_size,
+        )
+        return image
+
+    def detach(self):
+        """
+        :brief      Copy a zero-copy image into memory owned by this object, so that it
+                    stays valid after its buffer is returned by q_buf
+        :return:    None
+        """
+        self.__check_buffer_valid("detach")
+
+        if not self.__zero_copy:
+            return
+
+        image_array = (ct.c_ubyte * self.frame_data.image_size)()
+        ct.memmove(image_array, self.__image_array, self.frame_data.image_size)
+        self.__release_memory_views()
+        self.__image_array = image_array
+        self.frame_data.image_buf = ct.addressof(self.__image_array)
+        self.__zero_copy = False
+
     def get_chunkdata(self):
         """
         :brief      get Raw data
         :return:    raw data[string]
         """
+        self.__check_buffer_valid("get_chunkdata")
+
         if self.frame_data.pixel_format & PIXEL_BIT_MASK == GX_PIXEL_8BIT:
             imagedata_size = self.frame_data.width * self.frame_data.height
         elif self.frame_data.pixel_format & PIXEL_BIT_MASK == GX_PIXEL_16BIT:
@@ -1360,6 +2355,8 @@ class RawImage:
         :param      file_path:      file path
         :return:    None
         """
+        self.__check_buffer_valid("save_raw")
+
         if not isinstance(file_path, str):
             raise ParameterTypeError(
                 "RawImage.save_raw: "
@@ -1444,7 +2441,9 @@ class Utility:
             print("Utility.get_gamma_lut: gamma out of bounds, range:[0.1, 10.0]")
             return None
 
-        status, gamma_lut, gamma_lut_len = dx.dx_get_gamma_lut(gamma)
+        status, gamma_lut, gamma_lut_len = _result_cache.call(
+            ("gamma_lut", gamma), dx.dx_get_gamma_lut, gamma
+        )
         if status != dx.DxStatus.OK:
             print(
                 "Utility.get_gamma_lut: get gamma lut failure, Error code:%s"
@@ -1471,7 +2470,9 @@ class Utility:
             print("Utility.get_contrast_lut: contrast out of bounds, range:[-50, 100]")
             return None
 
-        status, contrast_lut, contrast_lut_len = dx.dx_get_contrast_lut(contrast)
+        status, contrast_lut, contrast_lut_len = _result_cache.call(
+            ("contrast_lut", contrast), dx.dx_get_contrast_lut, contrast
+        )
         if status != dx.DxStatus.OK:
             print(
                 "Utility.get_contrast_lut: get contrast lut failure, Error code:%s"
@@ -1507,7 +2508,13 @@ class Utility:
                 "Expected lightness type is int, not %s" % type(lightness)
             )
 
-        status, lut, lut_length = dx.dx_get_lut(contrast, gamma, lightness)
+        status, lut, lut_length = _result_cache.call(
+            ("lut", contrast, gamma, lightness),
+            dx.dx_get_lut,
+            contrast,
+            gamma,
+            lightness,
+        )
         if status != dx.DxStatus.OK:
             print(
                 "Utility.get_lut: get lut failure, Error code:%s"
@@ -1537,7 +2544,12 @@ class Utility:
                 "Expected saturation type is int, not %s" % type(saturation)
             )
 
-        status, cc_param = dx.dx_calc_cc_param(color_correction_param, saturation)
+        status, cc_param = _result_cache.call(
+            ("cc_param", color_correction_param, saturation),
+            dx.dx_calc_cc_param,
+            color_correction_param,
+            saturation,
+        )
         if status != dx.DxStatus.OK:
             print(
                 "Utility.calc_cc_param: calc correction param failure, Error code:%s"
@@ -1569,8 +2581,11 @@ class Utility:
                 "color_transform_factor should be list or tuple, length = 9"
             )
 
-        status, cc_param = dx.dx_calc_user_set_cc_param(
-            color_transform_factor, saturation
+        status, cc_param = _result_cache.call(
+            ("user_cc_param", tuple(color_transform_factor), saturation),
+            dx.dx_calc_user_set_cc_param,
+            color_transform_factor,
+            saturation,
         )
         if status != dx.DxStatus.OK:
             print(
@@ -1581,6 +2596,24 @@ class Utility:
 
         return Buffer(cc_param)
 
+    @staticmethod
+    def get_result_cache_info():
+        """
+        :brief      Counters of the cache of the lookup tables and color correction
+                    params shared by Utility and ImageProcessConfig
+        :return:    dict: hits, misses, size, max_size
+        """
+        return _result_cache.get_info()
+
+    @staticmethod
+    def clear_result_cache():
+        """
+        :brief      Drop the cached lookup tables and color correction params
+                    and reset the counters
+        :return:    None
+        """
+        _result_cache.clear()
+
     @staticmethod
     def __is_bayer(pixel_format):
         bayer_gr8_id = GxPixelFormatEntry.BAYER_GR8 & PIXEL_ID_MASK
@@ -1785,6 +2818,52 @@ class _InterUtility:
                     )
                 )
 
+    @staticmethod
+    def check_output_array(
+        out, shape, buffer_size, class_name="", func_name="", dtype=np.uint8
+    ):
+        """
+        :brief      check that out can receive a converted image
+        :param      out:            np.ndarray of dtype dtype, C-contiguous and writeable
+        :param      shape:          expected shape of out, None: only check its size
+        :param      buffer_size:    number of bytes written by the conversion
+        :param      dtype:          expected dtype of out
+        :return:    address of the data of out
+        """
+        _InterUtility.check_type(out, np.ndarray, "out", class_name, func_name)
+        if out.dtype != dtype:
+            raise ParameterTypeError(
+                "{} {}: Expected out dtype is {}, not {}".format(
+                    class_name, func_name, np.dtype(dtype), out.dtype
+                )
+            )
+
+        if shape is not None and out.shape != shape:
+            raise InvalidParameterError(
+                "{} {}: Expected out shape is {}, not {}".format(
+                    class_name, func_name, shape, out.shape
+                )
+            )
+
+        if out.nbytes < buffer_size:
+            raise InvalidParameterError(
+                "{} {}: out has {} bytes, the conversion needs {}".format(
+                    class_name, func_name, out.nbytes, buffer_size
+                )
+            )
+
+        if not out.flags.c_contiguous:
+            raise InvalidParameterError(
+                "{} {}: out must be C-contiguous".format(class_name, func_name)
+            )
+
+        if not out.flags.writeable:
+            raise InvalidParameterError(
+                "{} {}: out must be writeable".format(class_name, func_name)
+            )
+
+        return out.ctypes.data
+
     @staticmethod
     def get_pixel_color_filter(pixel_format):
         """
@@ -1859,7 +2938,7 @@ class _InterUtility:
         )
 
         if pixel_format in gr_tup:
-            return dx.dx.DxPixelColorFilter.GR
+            return dx.DxPixelColorFilter.GR
         elif pixel_format in rg_tup:
             return dx.DxPixelColorFilter.RG
         elif pixel_format in gb_tup:
@@ -2078,3 +3157,671 @@ class DxMonoImgProcess:
             "DxMonoImgProcess",
             "check_param_type",
         )
+
+
+class _FormatConverter:
+    def __init__(
+        self,
+        src_pixel_format,
+        dst_pixel_format,
+        valid_bits,
+        convert_type,
+        channel_order,
+        width,
+        height,
+    ):
+        """
+        :brief  Create an image format convert handle configured for one conversion
+        :param src_pixel_format:    pixel format of the input images
+        :param dst_pixel_format:    pixel format of the output images
+        :param valid_bits:          valid bits, already clamped to the source bit depth
+        :param convert_type:        DxBayerConvertType
+        :param channel_order:       DxRGBChannelOrder
+        :param width:               image width
+        :param height:              image height
+        """
+        self.handle = None
+        self.src_pixel_format = src_pixel_format
+        self.dst_pixel_format = dst_pixel_format
+        self.valid_bits = valid_bits
+        self.convert_type = convert_type
+        self.channel_order = channel_order
+        self.width = width
+        self.height = height
+
+        status, handle = dx.dx_image_format_convert_create()
+        if status != dx.DxStatus.OK:
+            raise UnexpectedError(
+                "dx.dx_image_format_convert_create failure, Error code:%s"
+                % hex(status).__str__()
+            )
+        self.handle = handle
+
+        status = dx.dx_image_format_convert_set_output_pixel_format(
+            handle, dst_pixel_format
+        )
+        if status != dx.DxStatus.OK:
+            raise UnexpectedError(
+                "dx.dx_image_format_convert_set_output_pixel_format failure, Error code:%s"
+                % hex(status).__str__()
+            )
+
+        status = dx.dx_image_format_convert_set_valid_bits(handle, valid_bits)
+        if status != dx.DxStatus.OK:
+            raise UnexpectedError(
+                "image_format_convert_set_valid_bits failure, Error code:%s"
+                % hex(status).__str__()
+            )
+
+        status = dx.dx_image_format_convert_set_alpha_value(handle, channel_order)
+        if status != dx.DxStatus.OK:
+            raise UnexpectedError(
+                "image_format_convert_set_alpha_value failure, Error code:%s"
+                % hex(status).__str__()
+            )
+
+        status = dx.dx_image_format_convert_set_interpolation_type(handle, convert_type)
+        if status != dx.DxStatus.OK:
+            raise UnexpectedError(
+                "image_format_convert_set_interpolation_type failure, Error code:%s"
+                % hex(status).__str__()
+            )
+
+        status, buffer_size = dx.dx_image_format_convert_get_buffer_size_for_conversion(
+            handle, dst_pixel_format, width, height
+        )
+        if status != dx.DxStatus.OK:
+            raise UnexpectedError(
+                "dx.dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s"
+                % hex(status).__str__()
+            )
+        self.buffer_size = buffer_size
+
+    def __del__(self):
+        if getattr(self, "handle", None) is None:
+            return
+
+        try:
+            self.destroy()
+        except Exception:
+            # evicted from a cache or collected at interpreter shutdown, when the
+            # dx module may already be gone: there is no caller to report to
+            pass
+
+    def convert(self, src_frame_data, output_address, flip):
+        """
+        :brief      Convert one image with the configured handle
+        :param      src_frame_data:     GxFrameData of the input image
+        :param      output_address:     address of the output buffer, buffer_size bytes
+        :param      flip:               True: flip the output image vertically
+        :return:    None
+        """
+        self.convert_buffer(
+            src_frame_data.image_buf, src_frame_data.image_size, output_address, flip
+        )
+
+    def convert_buffer(self, input_address, input_length, output_address, flip):
+        """
+        :brief      Convert the image at input_address with the configured handle
+        :param      input_address:      address of the input image
+        :param      input_length:       size of the input image in bytes
+        :param      output_address:     address of the output buffer, buffer_size bytes
+        :param      flip:               True: flip the output image vertically
+        :return:    None
+        """
+        status = dx.dx_image_format_convert(
+            self.handle,
+            input_address,
+            input_length,
+            output_address,
+            self.buffer_size,
+            self.src_pixel_format,
+            self.width,
+            self.height,
+            flip,
+        )
+        if status != dx.DxStatus.OK:
+            raise UnexpectedError(
+                "image_format_convert failure, Error code:%s" % hex(status).__str__()
+            )
+
+    def destroy(self):
+        """
+        :brief      Destroy the image format convert handle
+        :return:    None
+        """
+        if self.handle is not None:
+            handle = self.handle
+            self.handle = None
+            status = dx.dx_image_format_convert_destroy(handle)
+            if status != dx.DxStatus.OK:
+                raise UnexpectedError(
+                    "image_format_convert_destroy failure, Error code:%s"
+                    % hex(status).__str__()
+                )
+
+
+class _FormatConverterCache:
+    def __init__(self, max_size):
+        """
+        :brief  Least recently used _FormatConverter objects, one cache per thread
+                a handle is only ever used by the thread that created it
+        :param max_size:    number of converters kept by every thread
+        """
+        self.__max_size = max_size
+        self.__local = threading.local()
+
+    def __get_converters(self):
+        converters = getattr(self.__local, "converters", None)
+        if converters is None:
+            converters = collections.OrderedDict()
+            self.__local.converters = converters
+        return converters
+
+    def get(
+        self,
+        src_pixel_format,
+        dst_pixel_format,
+        valid_bits,
+        convert_type,
+        channel_order,
+        width,
+        height,
+    ):
+        """
+        :brief      Get the converter of the calling thread for these parameters,
+                    create it on the first call and destroy the least recently used one
+                    when the cache is full
+        :return:    _FormatConverter object
+        """
+        key = (
+            src_pixel_format,
+            dst_pixel_format,
+            valid_bits,
+            convert_type,
+            channel_order,
+            width,
+            height,
+        )
+        converters = self.__get_converters()
+        converter = converters.get(key)
+        if converter is not None:
+            converters.move_to_end(key)
+            return converter
+
+        converter = _FormatConverter(*key)
+        converters[key] = converter
+        if len(converters) > self.__max_size:
+            _, evicted = converters.popitem(last=False)
+            evicted.destroy()
+        return converter
+
+    def clear(self):
+        """
+        :brief      Destroy the converters of the calling thread
+        :return:    None
+        """
+        converters = self.__get_converters()
+        while converters:
+            _, converter = converters.popitem()
+            converter.destroy()
+
+
+CONVERTER_CACHE_SIZE = 8
+_converter_cache = _FormatConverterCache(CONVERTER_CACHE_SIZE)
+
+
+class _ResultCache:
+    def __init__(self, max_size):
+        """
+        :brief  Least recently used results of DxImageProc calculations, shared by
+                every thread: lookup tables and color correction params. The ctypes
+                arrays of the results are kept as immutable bytes, every caller gets
+                its own copy
+        :param max_size:    number of results kept
+        """
+        self.__max_size = max_size
+        self.__results = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    @staticmethod
+    def __freeze(result):
+        """
+        :brief      (array type, bytes) of the ctypes arrays of a result and
+                    (None, value) of its other values
+        """
+        return tuple(
+            (type(item), bytes(item)) if isinstance(item, ct.Array) else (None, item)
+            for item in result
+        )
+
+    @staticmethod
+    def __thaw(frozen):
+        """
+        :brief      Result of a frozen result, with new ctypes arrays
+        """
+        return tuple(
+            value if array_type is None else array_type.from_buffer_copy(value)
+            for array_type, value in frozen
+        )
+
+    def call(self, key, function, *args):
+        """
+        :brief      Return the result of function(*args) of an earlier call with the
+                    same key, else call it and keep the result when its status is OK
+        :param      key:        hashable, the name of the calculation and its params
+        :param      function:   dxwrapper function returning (status, ...)
+        :return:    the return value of function, ctypes arrays are new copies
+        """
+        with self.__lock:
+            frozen = self.__results.get(key)
+            if frozen is not None:
+                self.__results.move_to_end(key)
+                self.__hits += 1
+        if frozen is not None:
+            return self.__thaw(frozen)
+
+        with self.__lock:
+            self.__misses += 1
+
+        result = function(*args)
+        if result[0] != dx.DxStatus.OK:
+            return result
+
+        with self.__lock:
+            self.__results[key] = self.__freeze(result)
+            self.__results.move_to_end(key)
+            if len(self.__results) > self.__max_size:
+                self.__results.popitem(last=False)
+        return result
+
+    def get_info(self):
+        """
+        :brief      Counters of the cache
+        :return:    dict: hits, misses, size, max_size
+        """
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "size": len(self.__results),
+                "max_size": self.__max_size,
+            }
+
+    def clear(self):
+        """
+        :brief      Drop the results and reset the counters
+        :return:    None
+        """
+        with self.__lock:
+            self.__results.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+
+RESULT_CACHE_SIZE = 64
+_result_cache = _ResultCache(RESULT_CACHE_SIZE)
+
+
+# rows converted above and below every band of a tiled conversion and then
+# dropped, for the interpolation at the band edges; even, the bands keep the CFA phase
+TILE_HALO_ROWS = 4
+
+# output pixel formats of DxImageFormatConvert stored row after row, without planes
+_TILED_OUTPUT_FORMATS = (
+    GxPixelFormatEntry.RGBA8,
+    GxPixelFormatEntry.BGRA8,
+    GxPixelFormatEntry.ARGB8,
+    GxPixelFormatEntry.ABGR8,
+)
+
+_tile_scratch = threading.local()
+
+
+def _get_tile_scratch(size):
+    """
+    :brief      Output buffer of a band, one per thread, grown on demand
+    :return:    address of at least size bytes
+    """
+    scratch = getattr(_tile_scratch, "buffer", None)
+    if scratch is None or len(scratch) < size:
+        scratch = (ct.c_ubyte * size)()
+        _tile_scratch.buffer = scratch
+    return ct.addressof(scratch)
+
+
+def _get_row_size(pixel_format, width):
+    """
+    :brief      Bytes of one row of an image stored row after row
+    :return:    size, None when rows do not start on a byte or the layout is unknown
+    """
+    row_size = get_pixel_format_size(pixel_format, width, 1)
+    if row_size is None:
+        return None
+    if get_pixel_format_size(pixel_format, width, 2) != 2 * row_size:
+        return None
+    return row_size
+
+
+def _is_tileable(converter):
+    """
+    :brief      Whether a conversion can be split in bands of rows
+    """
+    layout = get_pixel_format_layout(converter.dst_pixel_format)
+    if layout is None and converter.dst_pixel_format not in _TILED_OUTPUT_FORMATS:
+        return False
+    return (
+        _get_row_size(converter.src_pixel_format, converter.width) is not None
+        and converter.height > 2 * TILE_HALO_ROWS
+    )
+
+
+def _convert_tiled(
+    converter, input_address, output_address, flip, workers, band_height
+):
+    """
+    :brief      Convert an image in horizontal bands on the shared thread pool.
+                Every band is converted with TILE_HALO_ROWS more rows above and below,
+                by a converter of the worker thread, then its own rows are copied to
+                the output. Falls back to one call when the formats are not tileable
+    :param      converter:          _FormatConverter of the whole image
+    :param      input_address:      address of the input image
+    :param      output_address:     output buffer, converter.buffer_size bytes
+    :param      flip:               True: flip the output image vertically
+    :param      workers:            number of threads,
+                                    None: parallel.get_default_workers
+    :param      band_height:        rows of every band, rounded up to even,
+                                    None: the rows divided between the workers
+    :return:    None
+    """
+    width = converter.width
+    height = converter.height
+    if workers is None:
+        workers = get_default_workers(width * height)
+    if band_height is None:
+        band_height = -(-height // max(workers, 1))
+    band_height = max(2, band_height + band_height % 2)
+
+    if not _is_tileable(converter) or band_height >= height:
+        converter.convert_buffer(
+            input_address,
+            get_pixel_format_size(converter.src_pixel_format, width, height),
+            output_address,
+            flip,
+        )
+        return
+
+    input_row_size = _get_row_size(converter.src_pixel_format, width)
+    output_row_size = converter.buffer_size // height
+    bands = [
+        (first, min(first + band_height, height))
+        for first in range(0, height, band_height)
+    ]
+
+    def convert_bands(first_band, last_band):
+        for first, last in bands[first_band:last_band]:
+            top = max(0, first - TILE_HALO_ROWS)
+            bottom = min(height, last + TILE_HALO_ROWS)
+            band_converter = _converter_cache.get(
+                converter.src_pixel_format,
+                converter.dst_pixel_format,
+                converter.valid_bits,
+                converter.convert_type,
+                converter.channel_order,
+                width,
+                bottom - top,
+            )
+            scratch_address = _get_tile_scratch(band_converter.buffer_size)
+            band_converter.convert_buffer(
+                input_address + top * input_row_size,
+                (bottom - top) * input_row_size,
+                scratch_address,
+                flip,
+            )
+            if flip:
+                scratch_row = bottom - last
+                output_row = height - last
+            else:
+                scratch_row = first - top
+                output_row = first
+            ct.memmove(
+                output_address + output_row * output_row_size,
+                scratch_address + scratch_row * output_row_size,
+                (last - first) * output_row_size,
+            )
+
+    run_bands(convert_bands, len(bands), workers)
+
+
+def _bin_sum(planes, factor, height, width, data_bits):
+    """
+    :brief      Sum every factor x factor block of planes, one strided view at a time
+    :param      planes:     list of np.ndarray (height * factor, width * factor) or larger
+    :param      data_bits:  bits of the values of the planes
+    :return:    np.ndarray (height, width) of uint16, or uint32 when the sums need it;
+                a view of the plane for a single plane and factor 1
+    """
+    blocks = [
+        plane[y::factor, x::factor][:height, :width]
+        for plane in planes
+        for y in range(factor)
+        for x in range(factor)
+    ]
+    if len(blocks) == 1:
+        return blocks[0]
+
+    if data_bits + len(blocks).bit_length() - 1 <= 16:
+        dtype = np.uint16
+    else:
+        dtype = np.uint32
+    total = np.add(blocks[0], blocks[1], dtype=dtype)
+    for block in blocks[2:]:
+        np.add(total, block, out=total)
+    return total
+
+
+# pixels converted around a ROI and dropped, for the interpolation at its edges
+ROI_HALO_PIXELS = TILE_HALO_ROWS
+
+
+def _get_roi_crop(pixel_format, width, height, roi):
+    """
+    :brief      Region of the raw image converted for a ROI: the ROI and ROI_HALO_PIXELS
+                around it, widened to the alignment of the pixel format, so that bayer
+                crops keep the CFA phase and have an even size
+    :param      roi:        (x, y, width, height) inside the image
+    :return:    (x0, y0, x1, y1), None when the rows of the image or of the region
+                do not start on a byte
+    """
+    alignment = get_pixel_format_alignment(pixel_format)
+    if alignment is None or _get_row_size(pixel_format, width) is None:
+        return None
+
+    column_step, row_step = alignment
+    x, y, roi_width, roi_height = roi
+    x0 = max(0, x - ROI_HALO_PIXELS) // column_step * column_step
+    y0 = max(0, y - ROI_HALO_PIXELS) // row_step * row_step
+    x1 = min(width, -(-(x + roi_width + ROI_HALO_PIXELS) // column_step) * column_step)
+    y1 = min(height, -(-(y + roi_height + ROI_HALO_PIXELS) // row_step) * row_step)
+    if _get_row_size(pixel_format, x1 - x0) is None:
+        return None
+    return x0, y0, x1, y1
+
+
+def _crop_raw_image(frame_data, crop):
+    """
+    :brief      Copy a region of a raw image into a new RawImage
+    :param      frame_data:     GxFrameData of the image
+    :param      crop:           (x0, y0, x1, y1) from _get_roi_crop
+    :return:    (RawImage, np.ndarray), the array holds the image data and must
+                be kept while the image is used
+    """
+    x0, y0, x1, y1 = crop
+    pixel_format = frame_data.pixel_format
+    row_size = _get_row_size(pixel_format, frame_data.width)
+    first = get_pixel_format_size(pixel_format, x0, 1)
+    size = get_pixel_format_size(pixel_format, x1 - x0, 1)
+    rows = (ct.c_ubyte * (row_size * y1)).from_address(frame_data.image_buf)
+    data = np.frombuffer(rows, dtype=np.uint8).reshape(y1, row_size)
+    data = np.ascontiguousarray(data[y0:, first : first + size])
+
+    crop_frame_data = GxFrameData()
+    crop_frame_data.status = frame_data.status
+    crop_frame_data.width = x1 - x0
+    crop_frame_data.height = y1 - y0
+    crop_frame_data.pixel_format = pixel_format
+    crop_frame_data.image_size = data.size
+    crop_frame_data.frame_id = frame_data.frame_id
+    crop_frame_data.timestamp = frame_data.timestamp
+    crop_frame_data.image_buf = data.ctypes.data
+    return RawImage(crop_frame_data), data
+
+
+def _check_roi(roi, width, height, func_name):
+    """
+    :brief      Check a ROI (x, y, width, height) against the image size
+    :return:    True when the ROI is inside the image
+    """
+    if not isinstance(roi, (list, tuple)) or len(roi) != 4:
+        raise ParameterTypeError(
+            "%s: Expected roi type is (x, y, width, height), not %s"
+            % (func_name, roi.__str__())
+        )
+
+    for value in roi:
+        if not isinstance(value, int):
+            raise ParameterTypeError(
+                "%s: Expected roi item type is int, not %s" % (func_name, type(value))
+            )
+
+    x, y, roi_width, roi_height = roi
+    if (
+        x < 0
+        or y < 0
+        or roi_width < 1
+        or roi_height < 1
+        or x + roi_width > width
+        or y + roi_height > height
+    ):
+        print("%s: roi %s out of bounds, image %dx%d" % (func_name, roi, width, height))
+        return False
+    return True
+
+
+def convert_batch(
+    images,
+    mode,
+    flip=False,
+    valid_bits=DxValidBit.BIT8_15,
+    convert_type=DxBayerConvertType.NEIGHBOUR,
+    channel_order=DxRGBChannelOrder.ORDER_RGB,
+    out=None,
+    engine="dx",
+    workers=None,
+):
+    """
+    :brief      Convert a list of RawImage objects with RawImage.convert, the frames in
+                parallel on the shared thread pool, each worker thread with its own
+                converter handles. A frame that fails does not stop the batch
+    :param      images:         list of RawImage objects, e.g. a burst or the frames
+                                of several cameras
+    :param      mode:           "RAW8" or "RGB", see RawImage.convert
+    :param      flip:           see RawImage.convert
+    :param      valid_bits:     see RawImage.convert
+    :param      convert_type:   see RawImage.convert
+    :param      channel_order:  see RawImage.convert
+    :param      out:            np.ndarray of dtype uint8, C-contiguous and writeable,
+                                (N, height, width) for "RAW8" and (N, height, width, 3)
+                                for "RGB", receiving the frames in the order of images;
+                                None to allocate it. Only when all frames have the same size
+    :param      engine:         see RawImage.convert
+    :param      workers:        number of frames converted in parallel,
+                                None: parallel.get_default_workers of the whole batch
+    :return:    (converted, failures)
+                converted:  out or a new np.ndarray when all frames have the same size,
+                            the entries of the failed frames are zero;
+                            else a list of np.ndarray, None for the failed frames
+                failures:   dict of the index of every failed frame to the reason
+    """
+    if not isinstance(images, (list, tuple)):
+        raise ParameterTypeError(
+            "convert_batch: Expected images type is list, not %s" % type(images)
+        )
+
+    for image in images:
+        if not isinstance(image, RawImage):
+            raise ParameterTypeError(
+                "convert_batch: Expected images item type is RawImage, not %s"
+                % type(image)
+            )
+
+    if mode not in ("RAW8", "RGB"):
+        print("""convert_batch: mode="%s", isn't support""" % mode)
+        return None
+
+    channels = (3,) if mode == "RGB" else ()
+    sizes = set((image.frame_data.height, image.frame_data.width) for image in images)
+    if len(sizes) == 1:
+        shape = (len(images),) + sizes.pop() + channels
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8)
+        elif not isinstance(out, np.ndarray) or out.shape != shape:
+            raise InvalidParameterError(
+                "convert_batch: out must be a np.ndarray of shape %s" % (shape,)
+            )
+        converted = out
+    elif out is not None:
+        raise InvalidParameterError(
+            "convert_batch: out needs frames of the same size, got %s" % sorted(sizes)
+        )
+    else:
+        converted = [None] * len(images)
+
+    if workers is None:
+        workers = get_default_workers(
+            sum(image.frame_data.width * image.frame_data.height for image in images)
+        )
+
+    failures = {}
+
+    def convert_frames(first, last):
+        for index in range(first, last):
+            image = images[index]
+            frame_data = image.frame_data
+            if isinstance(converted, np.ndarray):
+                frame_out = converted[index]
+            else:
+                frame_out = np.empty(
+                    (frame_data.height, frame_data.width) + channels, dtype=np.uint8
+                )
+
+            if frame_data.status != GxFrameStatusList.SUCCESS:
+                result, reason = None, "incomplete frame"
+            else:
+                # one frame per thread, the frame itself is not split again
+                try:
+                    result = image.convert(
+                        mode,
+                        flip,
+                        valid_bits,
+                        convert_type,
+                        channel_order,
+                        frame_out,
+                        engine,
+                        workers=1,
+                    )
+                    reason = "convert failed"
+                except Exception as error:
+                    result, reason = None, "%s: %s" % (type(error).__name__, error)
+
+            if result is None:
+                failures[index] = reason
+                if isinstance(converted, np.ndarray):
+                    frame_out[...] = 0
+            elif not isinstance(converted, np.ndarray):
+                converted[index] = frame_out
+
+    run_bands(convert_frames, len(images), workers)
+    return converted, failures
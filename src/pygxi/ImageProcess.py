@@ -6,6 +6,8 @@
 import ctypes as ct
 import os
 
+import numpy as np
+
 import pygxi
 import pygxi.dxwrapper as dx
 from pygxi.errors import ParameterTypeError, UnexpectedError
@@ -15,18 +17,37 @@ from pygxi.gxidef import (
     PIXEL_MONO,
     DxRGBChannelOrder,
     DxValidBit,
+    GxFrameStatusList,
     GxImageInfo,
     GxPixelFormatEntry,
 )
+from pygxi.gxwrapper import GxFrameData
 from pygxi.ImageProc import Utility
 
-from .ImageProc import RawImage, RGBImage
+from .ImageProc import (
+    RawImage,
+    RGBImage,
+    _check_roi,
+    _crop_raw_image,
+    _get_roi_crop,
+)
 from .ImageProcessConfig import ImageProcessConfig
 
+# (pixel format, width, height) buffer sizes kept by an ImageProcess object
+BUFFER_SIZE_CACHE_SIZE = 16
+
 
 class ImageProcess:
     def __init__(self):
+        """
+        :brief  Image processing with a conversion handle and scratch buffers reused
+                from frame to frame, use one ImageProcess object per thread
+        """
         self.image_convert_handle = None
+        self.__output_pixel_format = None
+        self.__valid_bits = None
+        self.__buffer_sizes = {}
+        self.__scratch_buffers = {}
 
     def __new__(cls, *args, **kw):
         return object.__new__(cls, *args)
@@ -34,21 +55,23 @@ class ImageProcess:
     def __del__(self):
         if self.image_convert_handle is not None:
             status = dx.dx_image_format_convert_destroy(self.image_convert_handle)
-            if status != dx.dx.DxStatus.OK:
+            if status != dx.DxStatus.OK:
                 raise UnexpectedError(
                     "dx_image_format_convert_destroy failure, Error code:%s"
                     % hex(status).__str__()
                 )
             self.image_convert_handle = None
 
-    def image_improvement(self, image, output_address, image_process_config):
+    def image_improvement(self, image, output_address, image_process_config, roi=None):
         """
         :brief:     Improve image quality of the raw_image
         :param      image: image is RawImage or GXImageInfo
 
         :param      output_address: output image
         :param      image_process_config: image process config
-        :param
+        :param      roi: (x, y, width, height): process only this region, cropped from
+                    the raw data with ImageProc.ROI_HALO_PIXELS around it and aligned
+                    on the bayer pattern; output_address receives width*height pixels
         :return:    None
         """
         if output_address is None:
@@ -78,6 +101,21 @@ class ImageProcess:
         if input_image_buffer is None:
             raise ParameterTypeError("input_image_buffer param is null pointer.")
 
+        if roi is not None:
+            frame_data = GxFrameData()
+            frame_data.status = GxFrameStatusList.SUCCESS
+            frame_data.width = raw_image_width
+            frame_data.height = raw_image_height
+            frame_data.pixel_format = pixel_format
+            frame_data.image_size = 0
+            frame_data.frame_id = 0
+            frame_data.timestamp = 0
+            frame_data.image_buf = input_image_buffer
+            self.__image_improvement_roi(
+                frame_data, output_address, image_process_config, roi
+            )
+            return
+
         if pixel_format == GxPixelFormatEntry.RGB8:
             channel_order = DxRGBChannelOrder.ORDER_RGB
         elif pixel_format == GxPixelFormatEntry.BGR8:
@@ -85,75 +123,14 @@ class ImageProcess:
 
         if pixel_format in (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8):
             if pixel_format == GxPixelFormatEntry.BGR8:
-                self.__check_handle()
-                status = dx.dx_image_format_convert_set_output_pixel_format(
-                    self.image_convert_handle, GxPixelFormatEntry.RGB8
-                )
-                if status != dx.DxStatus.OK:
-                    raise UnexpectedError(
-                        "dx.dx_image_format_convert_set_output_pixel_format failure, Error code:%s"
-                        % hex(status).__str__()
-                    )
-
-                status = dx.dx_image_format_convert_set_valid_bits(
-                    self.image_convert_handle, DxValidBit.BIT0_7
-                )
-                if status != dx.DxStatus.OK:
-                    raise UnexpectedError(
-                        "image_format_convert_set_alpha_value failure, Error code:%s"
-                        % hex(status).__str__()
-                    )
-
-                status, out_lenght = (
-                    dx.dx_image_format_convert_get_buffer_size_for_conversion(
-                        self.image_convert_handle,
-                        GxPixelFormatEntry.RGB8,
-                        image.frame_data.width,
-                        image.frame_data.height,
-                    )
-                )
-                if status != dx.DxStatus.OK:
-                    raise UnexpectedError(
-                        "dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s"
-                        % hex(status).__str__()
-                    )
-
-                image_temp = (ct.c_ubyte * out_lenght)()
-                output_image_temp = ct.addressof(image_temp)
-
-                status, input_length = (
-                    dx.dx_image_format_convert_get_buffer_size_for_conversion(
-                        self.image_convert_handle,
-                        image.frame_data.pixel_format,
-                        image.frame_data.width,
-                        image.frame_data.height,
-                    )
-                )
-                if status != dx.DxStatus.OK:
-                    raise UnexpectedError(
-                        "dx.dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s"
-                        % hex(status).__str__()
-                    )
-
-                status = dx.dx_image_format_convert(
-                    self.image_convert_handle,
-                    image.frame_data.image_buf,
-                    input_length,
-                    output_image_temp,
-                    out_lenght,
-                    image.frame_data.pixel_format,
-                    image.frame_data.width,
-                    image.frame_data.height,
-                    False,
+                input_image_buffer = self.__convert(
+                    input_image_buffer,
+                    pixel_format,
+                    raw_image_width,
+                    raw_image_height,
+                    GxPixelFormatEntry.RGB8,
+                    DxValidBit.BIT0_7,
                 )
-
-                if status != dx.DxStatus.OK:
-                    raise UnexpectedError(
-                        "image_format_convert failure, Error code:%s"
-                        % hex(status).__str__()
-                    )
-
-                input_image_buffer = output_image_temp
             status = dx.dx_image_improvement_ex(
                 input_image_buffer,
                 output_address,
@@ -171,147 +148,94 @@ class ImageProcess:
                 )
             return
 
+        # the 8 bit image goes to a scratch buffer, the image itself is not modified
         if (pixel_format & PIXEL_BIT_MASK) != GX_PIXEL_8BIT:
             dest_pixel_format = Utility.get_convert_dest_8bit_pixel_format(pixel_format)
             if dest_pixel_format == GxPixelFormatEntry.UNDEFINED:
                 raise UnexpectedError("__convert_to_raw8 get dest pixel format failure")
 
-            self.__check_handle()
-            status = dx.dx_image_format_convert_set_output_pixel_format(
-                self.image_convert_handle, dest_pixel_format
-            )
-            if status != dx.DxStatus.OK:
-                raise UnexpectedError(
-                    "dx.dx_image_format_convert_set_output_pixel_format failure, Error code:%s"
-                    % hex(status).__str__()
-                )
-
-            status = dx.dx_image_format_convert_set_valid_bits(
-                self.image_convert_handle, image_process_config.get_valid_bits()
-            )
-            if status != dx.DxStatus.OK:
-                raise UnexpectedError(
-                    "dx.dx_image_format_convert_set_output_pixel_format failure, Error code:%s"
-                    % hex(status).__str__()
-                )
-
-            "Get the buffer length of the input pixel format"
-            status, input_length = (
-                dx.dx_image_format_convert_get_buffer_size_for_conversion(
-                    self.image_convert_handle,
-                    pixel_format,
-                    raw_image_width,
-                    raw_image_height,
-                )
-            )
-            if status != dx.DxStatus.OK:
-                raise UnexpectedError(
-                    "dx.dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s"
-                    % hex(status).__str__()
-                )
-
-            "Get the buffer length of the output pixel format and allocate the output image buffer  output_image_temp"
-            status, out_lenght = (
-                dx.dx_image_format_convert_get_buffer_size_for_conversion(
-                    self.image_convert_handle,
-                    dest_pixel_format,
-                    raw_image_width,
-                    raw_image_height,
-                )
-            )
-            if status != dx.DxStatus.OK:
-                raise UnexpectedError(
-                    "dx.dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s"
-                    % hex(status).__str__()
-                )
-            image_temp = (ct.c_ubyte * out_lenght)()
-            output_8bit_image = ct.addressof(image_temp)
-
-            status = dx.dx_image_format_convert(
-                self.image_convert_handle,
+            input_image_buffer = self.__convert(
                 input_image_buffer,
-                input_length,
-                output_8bit_image,
-                out_lenght,
                 pixel_format,
                 raw_image_width,
                 raw_image_height,
-                False,
+                dest_pixel_format,
+                image_process_config.get_valid_bits(),
             )
-            if status != dx.DxStatus.OK:
-                raise UnexpectedError(
-                    "image_format_convert failure, Error code:%s"
-                    % hex(status).__str__()
-                )
-
-            if isinstance(image, (RawImage, RGBImage)):
-                image.frame_data.image_buf = output_8bit_image
-            elif isinstance(image, GxImageInfo):
-                image.image_buf = output_8bit_image
 
         if Utility.is_gray(pixel_format):
             ImageProcess.__mono_image_process(
-                self, output_address, image, image_process_config
+                output_address,
+                input_image_buffer,
+                raw_image_width,
+                raw_image_height,
+                image_process_config,
             )
         else:
-            rgb_image_array_temp = (
-                ct.c_ubyte * image.frame_data.height * image.frame_data.width * 3
-            )()
-            rgb_image_array_temp_address = ct.addressof(rgb_image_array_temp)
-            ImageProcess.__raw_image_process(
-                rgb_image_array_temp_address, image, image_process_config
+            # dx_raw8_image_process writes BGR8, converted to RGB8 in the output
+            bgr_image_buffer = self.__get_scratch_buffer(
+                GxPixelFormatEntry.BGR8,
+                self.__get_buffer_size(
+                    GxPixelFormatEntry.BGR8, raw_image_width, raw_image_height
+                ),
             )
-
-            # convert to rgb
-            self.__check_handle()
-            status = dx.dx_image_format_convert_set_output_pixel_format(
-                self.image_convert_handle, GxPixelFormatEntry.RGB8
+            ImageProcess.__raw_image_process(
+                bgr_image_buffer,
+                input_image_buffer,
+                pixel_format,
+                raw_image_width,
+                raw_image_height,
+                image_process_config,
             )
-            if status != dx.DxStatus.OK:
-                raise UnexpectedError(
-                    "dx.dx_image_format_convert_set_output_pixel_format failure, Error code:%s"
-                    % hex(status).__str__()
-                )
-            status = dx.dx_image_format_convert_set_valid_bits(
-                self.image_convert_handle, DxValidBit.BIT0_7
+            self.__convert(
+                bgr_image_buffer,
+                GxPixelFormatEntry.BGR8,
+                raw_image_width,
+                raw_image_height,
+                GxPixelFormatEntry.RGB8,
+                DxValidBit.BIT0_7,
+                output_address,
             )
-            if status != dx.DxStatus.OK:
-                raise UnexpectedError(
-                    "image_format_convert_set_alpha_value failure, Error code:%s"
-                    % hex(status).__str__()
-                )
 
-            status, out_lenght = (
-                dx.dx_image_format_convert_get_buffer_size_for_conversion(
-                    self.image_convert_handle,
-                    GxPixelFormatEntry.BGR8,
-                    image.frame_data.width,
-                    image.frame_data.height,
-                )
-            )
-            if status != dx.DxStatus.OK:
-                raise UnexpectedError(
-                    "dx.dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s"
-                    % hex(status).__str__()
-                )
+    def __image_improvement_roi(
+        self, frame_data, output_address, image_process_config, roi
+    ):
+        """
+        :brief  Improve the crop of the raw data around a ROI, then keep the ROI
+        :param  frame_data:     GxFrameData of the image
+        :param  roi:            (x, y, width, height)
+        :return None
+        """
+        if not _check_roi(
+            roi, frame_data.width, frame_data.height, "ImageProcess.image_improvement"
+        ):
+            return
 
-            input_length = image.frame_data.width * image.frame_data.height * 3
-            status = dx.dx_image_format_convert(
-                self.image_convert_handle,
-                rgb_image_array_temp_address,
-                input_length,
-                output_address,
-                out_lenght,
-                GxPixelFormatEntry.BGR8,
-                image.frame_data.width,
-                image.frame_data.height,
-                False,
-            )
-            if status != dx.DxStatus.OK:
-                raise UnexpectedError(
-                    "image_format_convert failure, Error code:%s"
-                    % hex(status).__str__()
-                )
+        crop = _get_roi_crop(
+            frame_data.pixel_format, frame_data.width, frame_data.height, roi
+        )
+        if crop is None:
+            # rows not starting on a byte, the whole frame is processed
+            crop = (0, 0, frame_data.width, frame_data.height)
+            crop_image = RawImage(frame_data)
+        else:
+            crop_image, crop_data = _crop_raw_image(frame_data, crop)
+
+        x, y, roi_width, roi_height = roi
+        x0, y0, x1, y1 = crop
+        channels = 1 if Utility.is_gray(frame_data.pixel_format) else 3
+        improved = np.empty((y1 - y0, x1 - x0, channels), dtype=np.uint8)
+        self.image_improvement(crop_image, improved.ctypes.data, image_process_config)
+
+        output = np.frombuffer(
+            (ct.c_ubyte * (roi_height * roi_width * channels)).from_address(
+                output_address
+            ),
+            dtype=np.uint8,
+        ).reshape(roi_height, roi_width, channels)
+        output[...] = improved[
+            y - y0 : y - y0 + roi_height, x - x0 : x - x0 + roi_width
+        ]
 
     def static_defect_correction(
         self,
@@ -521,25 +445,20 @@ class ImageProcess:
             return -1
 
     @staticmethod
-    def __raw_image_process(output_address, image, image_process_config):
+    def __raw_image_process(
+        output_address,
+        input_image_buffer,
+        pixel_format,
+        raw_image_width,
+        raw_image_height,
+        image_process_config,
+    ):
         """
         :brief  Raw8 image process
-        :param  color_img_process_param:  image process param, refer to DxColorImgProcess
-        :return img_rgb
+        :param  pixel_format:   pixel format of the image before the conversion to 8 bit,
+                                gives the color filter
+        :return None
         """
-        if isinstance(image, (RawImage, RGBImage)):
-            pixel_format = image.frame_data.pixel_format
-            raw_image_width = image.frame_data.width
-            raw_image_height = image.frame_data.height
-            input_image_buffer = image.frame_data.image_buf
-        elif isinstance(image, GxImageInfo):
-            pixel_format = image.image_pixel_format
-            raw_image_width = image.image_width
-            raw_image_height = image.image_height
-            input_image_buffer = image.image_buf
-        else:
-            raise ParameterTypeError("image param must be RawImage or GxImageInfo type")
-
         if input_image_buffer is None or output_address is None:
             raise ParameterTypeError(
                 "input_image_buffer or output_address is NULL pointer"
@@ -564,23 +483,18 @@ class ImageProcess:
                     % hex(status).__str__()
                 )
 
-    def __mono_image_process(self, output_address, image, image_process_config):
+    @staticmethod
+    def __mono_image_process(
+        output_address,
+        input_image_buffer,
+        raw_image_width,
+        raw_image_height,
+        image_process_config,
+    ):
         """
         :brief  mono8 image process
-        :param  mono_img_process_param:  image process param, refer to DxMonoImgProcess
-        :return img_mono
+        :return None
         """
-        if isinstance(image, (RawImage, RGBImage)):
-            raw_image_width = image.frame_data.width
-            raw_image_height = image.frame_data.height
-            input_image_buffer = image.frame_data.image_buf
-        elif isinstance(image, GxImageInfo):
-            raw_image_width = image.image_width
-            raw_image_height = image.image_height
-            input_image_buffer = image.image_buf
-        else:
-            raise ParameterTypeError("image param must be RawImage or GxImageInfo type")
-
         if input_image_buffer is None or output_address is None:
             raise ParameterTypeError(
                 "input_image_buffer or output_address is NULL pointer"
@@ -602,6 +516,107 @@ class ImageProcess:
                     % hex(status).__str__()
                 )
 
+    def __get_scratch_buffer(self, key, size):
+        """
+        :brief  Buffer of at least size bytes owned by this object and reused by the
+                next frames, reallocated when the image grows
+        :param  key:    use of the buffer, the pixel format written to it
+        :return address of the buffer
+        """
+        scratch = self.__scratch_buffers.get(key)
+        if scratch is None or scratch[1] < size:
+            buffer = (ct.c_ubyte * size)()
+            scratch = (ct.addressof(buffer), size, buffer)
+            self.__scratch_buffers[key] = scratch
+        return scratch[0]
+
+    def __get_buffer_size(self, pixel_format, width, height):
+        """
+        :brief  Size of an image for the conversion handle, kept for the next frames
+        :return size in bytes
+        """
+        key = (pixel_format, width, height)
+        size = self.__buffer_sizes.get(key)
+        if size is not None:
+            return size
+
+        self.__check_handle()
+        status, size = dx.dx_image_format_convert_get_buffer_size_for_conversion(
+            self.image_convert_handle, pixel_format, width, height
+        )
+        if status != dx.DxStatus.OK:
+            raise UnexpectedError(
+                "dx_image_format_convert_get_buffer_size_for_conversion failure, "
+                "Error code:%s" % hex(status).__str__()
+            )
+        if len(self.__buffer_sizes) >= BUFFER_SIZE_CACHE_SIZE:
+            self.__buffer_sizes.clear()
+        self.__buffer_sizes[key] = size
+        return size
+
+    def __convert(
+        self,
+        input_address,
+        input_pixel_format,
+        width,
+        height,
+        output_pixel_format,
+        valid_bits,
+        output_address=None,
+    ):
+        """
+        :brief  Convert an image with the handle of this object, the output pixel format
+                and valid bits are only set on the handle when they change
+        :param  output_address: address of the output, None: a scratch buffer
+        :return output address
+        """
+        self.__check_handle()
+        if self.__output_pixel_format != output_pixel_format:
+            status = dx.dx_image_format_convert_set_output_pixel_format(
+                self.image_convert_handle, output_pixel_format
+            )
+            if status != dx.DxStatus.OK:
+                raise UnexpectedError(
+                    "dx.dx_image_format_convert_set_output_pixel_format failure, "
+                    "Error code:%s" % hex(status).__str__()
+                )
+            self.__output_pixel_format = output_pixel_format
+
+        if self.__valid_bits != valid_bits:
+            status = dx.dx_image_format_convert_set_valid_bits(
+                self.image_convert_handle, valid_bits
+            )
+            if status != dx.DxStatus.OK:
+                raise UnexpectedError(
+                    "dx.dx_image_format_convert_set_valid_bits failure, Error code:%s"
+                    % hex(status).__str__()
+                )
+            self.__valid_bits = valid_bits
+
+        input_length = self.__get_buffer_size(input_pixel_format, width, height)
+        output_length = self.__get_buffer_size(output_pixel_format, width, height)
+        if output_address is None:
+            output_address = self.__get_scratch_buffer(
+                output_pixel_format, output_length
+            )
+
+        status = dx.dx_image_format_convert(
+            self.image_convert_handle,
+            input_address,
+            input_length,
+            output_address,
+            output_length,
+            input_pixel_format,
+            width,
+            height,
+            False,
+        )
+        if status != dx.DxStatus.OK:
+            raise UnexpectedError(
+                "image_format_convert failure, Error code:%s" % hex(status).__str__()
+            )
+        return output_address
+
     def __check_handle(self):
         """
         :brief  The transformation handle is initialized the first time it is called
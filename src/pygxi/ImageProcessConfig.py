@@ -8,7 +8,7 @@ import pygxi.dxwrapper as dx
 
 from .errors import ParameterTypeError, UnexpectedError
 from .gxidef import DxBayerConvertType, DxValidBit
-from .ImageProc import Buffer, DxColorImgProcess, DxMonoImgProcess
+from .ImageProc import Buffer, DxColorImgProcess, DxMonoImgProcess, _result_cache
 
 
 class ImageProcessConfig:
@@ -46,7 +46,9 @@ class ImageProcessConfig:
         self.gamma_lut_length = 0
         self.contrast_lut = None
         self.contrast_lut_length = 0
-        self.mutex = threading.Lock()
+        # reentrant: the lookup tables are calculated on first use, also by
+        # get_color_image_process and get_mono_image_process called under the mutex
+        self.mutex = threading.RLock()
 
         self.__sharp_factor_min = 0.1
         self.__sharp_factor_max = 5.0
@@ -59,11 +61,6 @@ class ImageProcessConfig:
         self.__saturation_factor_min = 0
         self.__saturation_factor_max = 128
 
-        self.set_gamma_param(self.gamma_factor)
-        self.set_contrast_param(self.contrast_factor)
-        self.set_lightness_param(self.lightness_factor)
-        self.set_saturation_param(self.saturation_factor)
-
     def set_valid_bits(self, valid_bits):
         """
         :brief    Select Get the specified 8-bit valid data bits. This interface is set up for non-8-bit raw data
@@ -155,9 +152,6 @@ class ImageProcessConfig:
                 % (self.__contrast_factor_min, self.__contrast_factor_max)
             )
 
-        self.__calc_lut()
-        self.__calc_contrast_lut()
-
     def get_contrast_param(self):
         """
         :brief     get contrast param
@@ -181,9 +175,6 @@ class ImageProcessConfig:
                 % (self.__gamma_factor_min, self.__gamma_factor_max)
             )
 
-        self.__calc_lut()
-        self.__calc_gamma_lut()
-
     def get_gamma_param(self):
         """
         :brief     get contrast param factor
@@ -210,8 +201,6 @@ class ImageProcessConfig:
                 % (self.__lightness_factor_min, self.__lightness_factor_max)
             )
 
-        self.__calc_lut()
-
     def get_lightness_param(self):
         """
         :brief     get lightness param factor
@@ -255,11 +244,6 @@ class ImageProcessConfig:
                 % (self.__saturation_factor_min, self.__saturation_factor_max)
             )
 
-        if self.is_user_set_ccparam():
-            self.__calc_user_set_cc_param()
-        else:
-            self.__calc_cc_param()
-
     def get_saturation_param(self):
         """
         :brief     get saturation param  【not support mono camera】
@@ -331,11 +315,6 @@ class ImageProcessConfig:
 
         self.b_color_correction = enable
 
-        if self.is_user_set_ccparam():
-            self.__calc_user_set_cc_param()
-        else:
-            self.__calc_cc_param()
-
     def is_color_correction(self):
         """
         :brief     get accelerate status 【not support mono camera】
@@ -395,24 +374,18 @@ class ImageProcessConfig:
         """
         :brief   Calculating gamma lookup table (RGB24)
         :param   self.gamma_factor:  gamma param,range(0.1 ~ 10)
-        :return: gamma_lut buffer
+        :return: gamma_lut buffer, a copy of the cached table owned by this config
         """
-        if self.gamma_lut is None:
-            raise UnexpectedError(
-                "Gamma Lut is empty. You should first call set_gamma_param to calculate it."
-            )
+        self.__calc_gamma_lut()
         return Buffer(self.gamma_lut)
 
     def get_contrast_lut(self):
         """
         :brief   Calculating contrast lookup table (RGB24)
         :param   self.contrast_factor:   contrast param,range(-50 ~ 100)
-        :return: contrast_lut buffer
+        :return: contrast_lut buffer, a copy of the cached table owned by this config
         """
-        if self.contrast_lut is None:
-            raise UnexpectedError(
-                "contrast lut Lut is empty. You should first call set_contrast_param to calculate it."
-            )
+        self.__calc_contrast_lut()
         return Buffer(self.contrast_lut)
 
     def get_color_image_process(self, color_filter_layout):
@@ -486,6 +459,10 @@ class ImageProcessConfig:
         :brief      calculating array of image processing color adjustment
         :return:    cc param buffer
         """
+        if self.is_user_set_ccparam():
+            self.__calc_user_set_cc_param()
+        else:
+            self.__calc_cc_param()
         return Buffer(self.cc_param_buffer)
 
     def __calc_cc_param(self):
@@ -496,8 +473,11 @@ class ImageProcessConfig:
         :return:    void
         """
         with self.mutex:
-            status, cc_param = dx.dx_calc_cc_param(
-                self.get_color_correction_param(), self.saturation_factor
+            status, cc_param = _result_cache.call(
+                ("cc_param", self.get_color_correction_param(), self.saturation_factor),
+                dx.dx_calc_cc_param,
+                self.get_color_correction_param(),
+                self.saturation_factor,
             )
             if status != dx.DxStatus.OK:
                 print(
@@ -516,9 +496,24 @@ class ImageProcessConfig:
         :param      self.saturation_factor:             saturation factor,Range(0~128)
         :return:    void
         """
+        factor = self.color_transform_factor
+        color_transform_factor = (
+            factor.fGain00,
+            factor.fGain01,
+            factor.fGain02,
+            factor.fGain10,
+            factor.fGain11,
+            factor.fGain12,
+            factor.fGain20,
+            factor.fGain21,
+            factor.fGain22,
+        )
         with self.mutex:
-            status, cc_param = dx.dx_calc_user_set_cc_param(
-                self.color_transform_factor, self.saturation_factor
+            status, cc_param = _result_cache.call(
+                ("user_cc_param", color_transform_factor, self.saturation_factor),
+                dx.dx_calc_user_set_cc_param,
+                color_transform_factor,
+                self.saturation_factor,
             )
             if status != dx.DxStatus.OK:
                 print(
@@ -534,7 +529,7 @@ class ImageProcessConfig:
         :brief      Calculating lookup table of 8bit image
         :return:    lut buffer, lut length
         """
-
+        self.__calc_lut()
         return Buffer(self.lut), self.lut_length
 
     def __calc_lut(self):
@@ -543,8 +538,12 @@ class ImageProcessConfig:
         :return NONE
         """
         with self.mutex:
-            status, self.lut, self.lut_length = dx.dx_get_lut(
-                self.contrast_factor, self.gamma_factor, self.lightness_factor
+            status, self.lut, self.lut_length = _result_cache.call(
+                ("lut", self.contrast_factor, self.gamma_factor, self.lightness_factor),
+                dx.dx_get_lut,
+                self.contrast_factor,
+                self.gamma_factor,
+                self.lightness_factor,
             )
             if status != dx.DxStatus.OK:
                 raise UnexpectedError(
@@ -557,8 +556,8 @@ class ImageProcessConfig:
         :return NONE
         """
         with self.mutex:
-            status, self.gamma_lut, self.gamma_lut_length = dx.dx_get_gamma_lut(
-                self.gamma_factor
+            status, self.gamma_lut, self.gamma_lut_length = _result_cache.call(
+                ("gamma_lut", self.gamma_factor), dx.dx_get_gamma_lut, self.gamma_factor
             )
             if status != dx.DxStatus.OK:
                 raise UnexpectedError(
@@ -571,8 +570,10 @@ class ImageProcessConfig:
         :return NONE
         """
         with self.mutex:
-            status, self.contrast_lut, self.contrast_lut_length = (
-                dx.dx_get_contrast_lut(self.contrast_factor)
+            status, self.contrast_lut, self.contrast_lut_length = _result_cache.call(
+                ("contrast_lut", self.contrast_factor),
+                dx.dx_get_contrast_lut,
+                self.contrast_factor,
             )
             if status != dx.DxStatus.OK:
                 raise UnexpectedError(
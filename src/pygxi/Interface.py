@@ -14,6 +14,7 @@ class Interface:
         """
         self.__interface_handle = handle
         self.__interface_info = interface_info
+        self.__feature_control = None
 
     def get_interface_info(self):
         """
@@ -30,5 +31,15 @@ class Interface:
         :brief  Get interface feature control object
         :return: Interface feature control object
         """
-        feature_control = FeatureControl(self.__interface_handle)
-        return feature_control
+        if self.__feature_control is None:
+            self.__feature_control = FeatureControl(self.__interface_handle)
+        return self.__feature_control
+
+    def close(self):
+        """
+        :brief  Unregister the feature callbacks of the interface feature control
+        :return: None
+        """
+        if self.__feature_control is not None:
+            self.__feature_control.close()
+            self.__feature_control = None
@@ -0,0 +1,20 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import os
+
+# Library behind gxwrapper.dll and dxwrapper.dll, selected once at import
+# with the PYGXI_BACKEND environment variable
+GALAXY = "galaxy"  # GxIAPI and DxImageProc of the Galaxy SDK
+SIMULATED = "simulated"  # gxsimulator and dxsimulator, no SDK and no camera needed
+
+BACKENDS = (GALAXY, SIMULATED)
+BACKEND = os.environ.get("PYGXI_BACKEND", GALAXY).strip().lower()
+
+if BACKEND not in BACKENDS:
+    print(
+        "Unknown PYGXI_BACKEND %s, expected one of %s, using %s."
+        % (BACKEND, BACKENDS.__str__(), GALAXY)
+    )
+    BACKEND = GALAXY
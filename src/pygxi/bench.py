@@ -0,0 +1,503 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+"""
+Cost per frame of the hot paths of pygxi, on a camera or on the simulated backend.
+
+Every case is timed over --frames iterations (fps, p50 and p99 latency), then
+run --alloc-frames more times under tracemalloc:
+  allocs          memory blocks allocated by one iteration and still alive at
+                  its end, result included
+  bytes_copied    peak of the memory allocated during one iteration; every copy
+                  of pixel data needs a buffer of its size, so buffers reused
+                  with out= or the frame buffer pool and zero-copy views do not
+                  count
+
+Cases that fail are reported with their error instead of their figures. Cases
+needing DxImageProc functions the simulated backend does not implement are
+reported as skipped.
+
+Usage: python -m pygxi.bench [--backend simulated] [--frames N] [--output FILE]
+                             [--baseline FILE] [--threshold T] [--case PATTERN]
+Exits with status 1 when a case regressed by more than the threshold against the
+baseline, a JSON report saved earlier with --output.
+"""
+
+import argparse
+import ctypes as ct
+import fnmatch
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from . import __version__, backend
+from .gxidef import GxPixelFormatEntry
+
+# tracemalloc bookkeeping, not allocations of the measured path
+_ALLOC_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+)
+
+# metric: (sign of a regression, absolute change ignored as noise); the
+# tracemalloc figures move with interpreter caches, a few blocks and a page
+_COMPARED_METRICS = {
+    "fps": (-1, 0),
+    "p99_us": (1, 0),
+    "allocs": (1, 2),
+    "bytes_copied": (1, 4096),
+}
+
+
+def _time_case(case, frames):
+    """
+    :brief  Latency of every iteration of a case
+    :param  case:       callable, one iteration
+    :param  frames:     number of iterations
+    :return np.ndarray of the latencies in seconds
+    """
+    latencies = np.empty(frames)
+    for index in range(frames):
+        start = time.perf_counter()
+        case()
+        latencies[index] = time.perf_counter() - start
+    return latencies
+
+
+def _trace_case(case, frames):
+    """
+    :brief  Memory allocated by every iteration of a case, see the module doc
+    :param  case:       callable, one iteration, returns what it produced
+    :param  frames:     number of iterations
+    :return (allocs, bytes_copied), means over the iterations
+    """
+    allocs = 0
+    bytes_copied = 0
+    tracemalloc.start()
+    try:
+        for _ in range(frames):
+            before = tracemalloc.take_snapshot().filter_traces(_ALLOC_FILTERS)
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            result = case()
+            peak = tracemalloc.get_traced_memory()[1]
+            after = tracemalloc.take_snapshot().filter_traces(_ALLOC_FILTERS)
+            del result
+
+            bytes_copied += peak - current
+            for statistic in after.compare_to(before, "traceback"):
+                allocs += max(statistic.count_diff, 0)
+    finally:
+        tracemalloc.stop()
+    return allocs / frames, bytes_copied / frames
+
+
+def measure(case, frames=100, alloc_frames=10, warmup=3):
+    """
+    :brief  Figures of one case
+    :param  case:           callable, one iteration, returns what it produced
+    :param  frames:         number of timed iterations
+    :param  alloc_frames:   number of iterations traced by tracemalloc, 0 to skip
+    :param  warmup:         number of iterations run first and not measured
+    :return dict: frames, fps, p50_us, p99_us, mean_us, allocs, bytes_copied
+    """
+    for _ in range(warmup):
+        case()
+
+    latencies = _time_case(case, frames)
+    result = {
+        "frames": frames,
+        "fps": frames / latencies.sum(),
+        "p50_us": float(np.percentile(latencies, 50)) * 1e6,
+        "p99_us": float(np.percentile(latencies, 99)) * 1e6,
+        "mean_us": float(latencies.mean()) * 1e6,
+    }
+    if alloc_frames > 0:
+        result["allocs"], result["bytes_copied"] = _trace_case(case, alloc_frames)
+    return result
+
+
+class _Runner:
+    def __init__(self, frames, alloc_frames, patterns):
+        """
+        :brief  Runs the selected cases and collects their figures
+        :param  frames:         number of timed iterations of the frame cases
+        :param  alloc_frames:   number of iterations traced by tracemalloc
+        :param  patterns:       fnmatch patterns of the case names to run,
+                                None to run every case
+        """
+        self.frames = frames
+        self.alloc_frames = alloc_frames
+        self.patterns = patterns
+        self.results = {}
+
+    def selected(self, name):
+        if self.patterns is None:
+            return True
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in self.patterns)
+
+    def run(self, name, case, frames=None):
+        """
+        :brief  Measure a case when it is selected, a failure is recorded as its result
+        :param  name:       case name, key of the results
+        :param  case:       callable, one iteration
+        :param  frames:     number of timed iterations, None for self.frames
+        """
+        if not self.selected(name):
+            return
+
+        if frames is None:
+            frames = self.frames
+        try:
+            self.results[name] = measure(
+                case, frames, min(frames, self.alloc_frames), min(frames, 3)
+            )
+        except Exception as error:
+            self.fail(name, error)
+
+    def fail(self, name, error):
+        """
+        :brief  Record the error of a case that could not be measured
+        """
+        self.results[name] = {"error": "%s: %s" % (type(error).__name__, error)}
+
+    def skip(self, name, reason):
+        """
+        :brief  Record why a selected case is not run
+        """
+        if self.selected(name):
+            self.results[name] = {"skipped": reason}
+
+
+def _get_resolution(device):
+    return device.Width.get(), device.Height.get()
+
+
+def _configure(device, pixel_format, resolution):
+    """
+    :brief  Set the pixel format and the resolution, acquisition stopped
+    """
+    width, height = resolution
+    if device.Width.get() != width or device.Height.get() != height:
+        device.OffsetX.set(0)
+        device.OffsetY.set(0)
+        device.Width.set(width)
+        device.Height.set(height)
+    if device.PixelFormat.get()[0] != pixel_format:
+        device.PixelFormat.set(pixel_format)
+
+
+def _acquisition_cases(runner, device, data_stream):
+    runner.run("DataStream.get_image", lambda: data_stream.get_image())
+
+    def dq_buf_q_buf(zero_copy):
+        image = data_stream.dq_buf(zero_copy=zero_copy)
+        data_stream.q_buf(image)
+        return image
+
+    runner.run("DataStream.dq_buf+q_buf", lambda: dq_buf_q_buf(False))
+    runner.run("DataStream.dq_buf+q_buf zero_copy", lambda: dq_buf_q_buf(True))
+
+    image = data_stream.get_image()
+    runner.run("RawImage.get_numpy_array", image.get_numpy_array)
+
+
+def _image_improvement_case(runner, device, data_stream):
+    name = "ImageProcess.image_improvement"
+    if not runner.selected(name):
+        return
+
+    if backend.BACKEND == backend.SIMULATED:
+        # the simulated DxImageProc only converts, it has no lookup table,
+        # color correction or image improvement function
+        runner.skip(name, "not simulated")
+        return
+
+    # imported on use, pygxi.ImageProcess needs the library of the backend
+    from .ImageProcess import ImageProcess
+
+    try:
+        image = data_stream.get_image()
+        output = (ct.c_ubyte * (image.get_width() * image.get_height() * 3))()
+        image_process = ImageProcess()
+        image_process_config = device.create_image_process_config()
+    except Exception as error:
+        runner.fail(name, error)
+        return
+
+    runner.run(
+        name,
+        lambda: image_process.image_improvement(
+            image, ct.addressof(output), image_process_config
+        ),
+    )
+
+
+def _convert_cases(runner, device, data_stream, pixel_formats, resolutions):
+    pixel_format_names = {
+        value: name
+        for name, value in vars(GxPixelFormatEntry).items()
+        if not name.startswith("_")
+    }
+    for width, height in resolutions:
+        for pixel_format in pixel_formats:
+            suffix = "%s %dx%d" % (
+                pixel_format_names.get(pixel_format, hex(pixel_format)),
+                width,
+                height,
+            )
+            cases = [
+                ('RawImage.convert("RGB") ' + suffix, lambda: image.convert("RGB")),
+                ("RawImage.preview(2) " + suffix, lambda: image.preview(2)),
+            ]
+            cases = [case for case in cases if runner.selected(case[0])]
+            if not cases:
+                continue
+
+            try:
+                _configure(device, pixel_format, (width, height))
+                device.stream_on()
+            except Exception as error:
+                for name, _ in cases:
+                    runner.fail(name, error)
+                continue
+            try:
+                image = data_stream.get_image()
+                for name, function in cases:
+                    runner.run(name, function)
+            finally:
+                device.stream_off()
+
+
+def run_benchmarks(
+    device_index=1,
+    frames=100,
+    alloc_frames=10,
+    startup_frames=5,
+    pixel_formats=None,
+    resolutions=None,
+    patterns=None,
+):
+    """
+    :brief  Measure the hot paths of pygxi on a device
+    :param  device_index:   index of the device, starts from 1
+    :param  frames:         number of timed iterations of the frame and feature cases
+    :param  alloc_frames:   number of iterations traced by tracemalloc
+    :param  startup_frames: number of timed iterations of update_device_list and
+                            open_device_by_index
+    :param  pixel_formats:  GxPixelFormatEntry list of the convert cases,
+                            None for every format of PixelFormat pygxi can unpack
+    :param  resolutions:    (width, height) list of the convert cases,
+                            None for the current resolution
+    :param  patterns:       fnmatch patterns of the case names to run, None for all
+    :return report dict: environment and "results", key: case name,
+            value: dict of figures, or dict with "error" or "skipped"
+    """
+    # imported on use, the backend is chosen by the first import of gxwrapper
+    from .DeviceManager import DeviceManager
+    from .pixelformat import get_pixel_format_layout
+
+    runner = _Runner(frames, alloc_frames, patterns)
+    device_manager = DeviceManager()
+    device_num, device_info_list = device_manager.update_device_list()
+    if device_num < device_index:
+        raise RuntimeError(
+            "run_benchmarks: device %d not found, %d device(s) connected"
+            % (device_index, device_num)
+        )
+
+    runner.run(
+        "DeviceManager.update_device_list",
+        device_manager.update_device_list,
+        startup_frames,
+    )
+
+    def open_close():
+        device_manager.open_device_by_index(device_index).close_device()
+
+    runner.run("DeviceManager.open_device_by_index", open_close, startup_frames)
+
+    device = device_manager.open_device_by_index(device_index)
+    try:
+        width = device.Width.get()
+        runner.run("IntFeature.get", device.Width.get)
+        runner.run("IntFeature.set", lambda: device.Width.set(width))
+        feature_control = device.get_remote_device_feature_control()
+        runner.run(
+            "FeatureControl.get_float_feature.get",
+            lambda: feature_control.get_float_feature("ExposureTime").get(),
+        )
+
+        initial_pixel_format = device.PixelFormat.get()[0]
+        initial_resolution = _get_resolution(device)
+        data_stream = device.data_stream[0]
+        device.stream_on()
+        try:
+            _acquisition_cases(runner, device, data_stream)
+            _image_improvement_case(runner, device, data_stream)
+        finally:
+            device.stream_off()
+
+        if pixel_formats is None:
+            pixel_formats = [
+                value
+                for value in device.PixelFormat.get_range().values()
+                if get_pixel_format_layout(value) is not None
+            ]
+        if resolutions is None:
+            resolutions = [initial_resolution]
+        try:
+            _convert_cases(runner, device, data_stream, pixel_formats, resolutions)
+        finally:
+            _configure(device, initial_pixel_format, initial_resolution)
+
+        device_info = device_info_list[device_index - 1]
+    finally:
+        device.close_device()
+
+    return {
+        "pygxi": __version__,
+        "backend": backend.BACKEND,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "device": {
+            "model_name": device_info.get("model_name"),
+            "sn": device_info.get("sn"),
+        },
+        "results": runner.results,
+    }
+
+
+def compare_results(report, baseline, threshold=0.1):
+    """
+    :brief  Regressions of a report against a baseline report
+    :param  report:     report of run_benchmarks
+    :param  baseline:   report of run_benchmarks, saved earlier
+    :param  threshold:  relative change tolerated, 0.1: fps 10% lower, p99 latency,
+                        allocs and bytes copied 10% higher
+    :return list of dict: case, metric, baseline, value, change
+    """
+    regressions = []
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        if base is None or "error" in base or "error" in result or "skipped" in result:
+            continue
+
+        for metric, (sign, noise) in _COMPARED_METRICS.items():
+            if metric not in result or metric not in base:
+                continue
+            value = result[metric]
+            base_value = base[metric]
+            if abs(value - base_value) <= noise:
+                continue
+            change = (value - base_value) / max(base_value, 1)
+            if change * sign > threshold:
+                regressions.append(
+                    {
+                        "case": name,
+                        "metric": metric,
+                        "baseline": base_value,
+                        "value": value,
+                        "change": change,
+                    }
+                )
+    return regressions
+
+
+def _parse_resolution(text):
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m pygxi.bench",
+        description=__doc__.strip().splitlines()[0],
+    )
+    parser.add_argument(
+        "--backend",
+        choices=backend.BACKENDS,
+        help="library behind pygxi, default: PYGXI_BACKEND or galaxy",
+    )
+    parser.add_argument("--device", type=int, default=1, help="device index")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--alloc-frames", type=int, default=10)
+    parser.add_argument("--startup-frames", type=int, default=5)
+    parser.add_argument(
+        "--pixel-format",
+        action="append",
+        help="GxPixelFormatEntry name of the convert cases, repeatable",
+    )
+    parser.add_argument(
+        "--resolution",
+        action="append",
+        type=_parse_resolution,
+        help="WIDTHxHEIGHT of the convert cases, repeatable",
+    )
+    parser.add_argument(
+        "--case", action="append", help="fnmatch pattern of the cases, repeatable"
+    )
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    if args.backend is not None:
+        if "pygxi.gxwrapper" in sys.modules and args.backend != backend.BACKEND:
+            parser.error("--backend: pygxi is already loaded with %s" % backend.BACKEND)
+        # read by gxwrapper and dxwrapper when they are imported below
+        backend.BACKEND = args.backend
+
+    import pygxi.gxwrapper as gx
+
+    pixel_formats = None
+    if args.pixel_format:
+        pixel_formats = [getattr(GxPixelFormatEntry, n) for n in args.pixel_format]
+
+    if backend.BACKEND == backend.SIMULATED:
+        from .gxsimulator import SimulatedCamera
+
+        # unlimited frame rate, the figures are the cost of pygxi
+        gx.dll.set_cameras([SimulatedCamera(frame_rate=None)])
+
+    report = run_benchmarks(
+        args.device,
+        args.frames,
+        args.alloc_frames,
+        args.startup_frames,
+        pixel_formats,
+        args.resolution,
+        args.case,
+    )
+
+    regressions = []
+    if args.baseline is not None:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare_results(report, baseline, args.threshold)
+        report["baseline"] = args.baseline
+        report["regressions"] = regressions
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    for regression in regressions:
+        sys.stderr.write(
+            "regression: %(case)s %(metric)s %(baseline).6g -> %(value).6g"
+            " (%(change)+.1f%%)\n" % dict(regression, change=regression["change"] * 100)
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+
+from .errors import InvalidParameterError
+from .gxidef import GxPixelColorFilterEntry
+from .pixelformat import get_pixel_format_layout
+
+# Same-color neighbours a defect is replaced from, (dy, dx) in CFA cells:
+# the four nearest first, then the diagonals when some of them are defects
+# or out of the frame
+_NEIGHBOR_OFFSETS = (
+    (0, -1),
+    (0, 1),
+    (-1, 0),
+    (1, 0),
+    (-1, -1),
+    (-1, 1),
+    (1, -1),
+    (1, 1),
+    (0, -2),
+    (0, 2),
+    (-2, 0),
+    (2, 0),
+)
+NEIGHBOR_NUM = 4
+
+
+def _get_cfa_step(pixel_format):
+    """
+    :brief  Distance between two pixels of the same color, 1 mono, 2 bayer
+    """
+    layout = get_pixel_format_layout(pixel_format)
+    if layout is None or layout.channels != 1:
+        raise InvalidParameterError(
+            "pixel format %s is not mono or bayer" % hex(pixel_format)
+        )
+    return 1 if layout.color_filter == GxPixelColorFilterEntry.NONE else 2
+
+
+class DefectPixelMap:
+    def __init__(self, width, height, pixel_format, indices, neighbors=None):
+        """
+        :brief  Positions of the defect pixels of a sensor and of the same-color
+                pixels each one is replaced from
+        :param  width:          frame width
+        :param  height:         frame height
+        :param  pixel_format:   GxPixelFormatEntry, mono or bayer
+        :param  indices:        linear indices y * width + x of the defects
+        :param  neighbors:      np.ndarray (defect number, NEIGHBOR_NUM) of the linear
+                                indices of the replacing pixels, None: computed
+        """
+        self.width = width
+        self.height = height
+        self.pixel_format = pixel_format
+        self.indices = np.unique(np.asarray(indices, dtype=np.uint32))
+        if neighbors is None:
+            neighbors = self.__find_neighbors(_get_cfa_step(pixel_format))
+        self.neighbors = np.asarray(neighbors, dtype=np.uint32)
+
+    def __len__(self):
+        return self.indices.size
+
+    def __find_neighbors(self, step):
+        """
+        :brief  NEIGHBOR_NUM nearest same-color pixels of every defect that are in
+                the frame and are not defects; when there are fewer, the ones found
+                are repeated, a defect without any keeps its own index
+        """
+        defect_num = self.indices.size
+        y, x = np.divmod(self.indices.astype(np.int64), self.width)
+        is_defect = np.zeros(self.height * self.width, dtype=bool)
+        is_defect[self.indices] = True
+
+        candidates = np.empty((defect_num, len(_NEIGHBOR_OFFSETS)), dtype=np.int64)
+        valid = np.empty(candidates.shape, dtype=bool)
+        for column, (dy, dx) in enumerate(_NEIGHBOR_OFFSETS):
+            neighbor_y = y + dy * step
+            neighbor_x = x + dx * step
+            inside = (
+                (neighbor_y >= 0)
+                & (neighbor_y < self.height)
+                & (neighbor_x >= 0)
+                & (neighbor_x < self.width)
+            )
+            index = np.where(inside, neighbor_y * self.width + neighbor_x, 0)
+            candidates[:, column] = index
+            valid[:, column] = inside & ~is_defect[index]
+
+        # valid candidates first, in the order of _NEIGHBOR_OFFSETS
+        order = np.argsort(~valid, axis=1, kind="stable")
+        candidates = np.take_along_axis(candidates, order, axis=1)
+        valid_num = valid.sum(axis=1)
+
+        neighbors = np.empty((defect_num, NEIGHBOR_NUM), dtype=np.int64)
+        for column in range(NEIGHBOR_NUM):
+            source = column % np.maximum(valid_num, 1)
+            neighbors[:, column] = np.where(
+                valid_num > 0,
+                candidates[np.arange(defect_num), source],
+                self.indices,
+            )
+        return neighbors
+
+    def correct(self, values):
+        """
+        :brief  Replace the defects of a frame in place by the median of their
+                neighbours; only the defects and their neighbours are read
+        :param  values:     np.ndarray (height, width) of uint8 or uint16,
+                            C-contiguous and writeable
+        :return None
+        """
+        if values.shape != (self.height, self.width):
+            raise InvalidParameterError(
+                "DefectPixelMap.correct: Expected values shape is %s, not %s"
+                % ((self.height, self.width), values.shape)
+            )
+        if not values.flags.c_contiguous or not values.flags.writeable:
+            raise InvalidParameterError(
+                "DefectPixelMap.correct: values must be C-contiguous and writeable"
+            )
+
+        if self.indices.size == 0:
+            return
+        flat = values.reshape(-1)
+        samples = flat[self.neighbors].astype(np.int32)
+        samples.sort(axis=1)
+        middle = NEIGHBOR_NUM // 2
+        flat[self.indices] = (samples[:, middle - 1] + samples[:, middle] + 1) >> 1
+
+    def save(self, path):
+        """
+        :brief  Write the map in a .npz file
+        :param  path:   file path
+        :return None
+        """
+        np.savez(
+            path,
+            geometry=np.array(
+                [self.width, self.height, self.pixel_format], dtype=np.int64
+            ),
+            indices=self.indices,
+            neighbors=self.neighbors,
+        )
+
+
+def load_defect_map(path):
+    """
+    :brief  Read a map written by DefectPixelMap.save
+    :param  path:   file path
+    :return DefectPixelMap
+    """
+    with np.load(path) as data:
+        width, height, pixel_format = (int(value) for value in data["geometry"])
+        return DefectPixelMap(
+            width, height, pixel_format, data["indices"], data["neighbors"]
+        )
+
+
+def _local_median(plane):
+    """
+    :brief  Median of the 3 x 3 neighbourhood of every pixel of a color plane,
+            edges repeated
+    """
+    height, width = plane.shape
+    padded = np.pad(plane, 1, mode="edge")
+    stack = np.stack(
+        [
+            padded[dy : dy + height, dx : dx + width]
+            for dy in range(3)
+            for dx in range(3)
+        ]
+    )
+    return np.median(stack, axis=0)
+
+
+def _mean_of(frames):
+    """
+    :brief  Mean frame of a TemporalSnapshot, or the array itself
+    """
+    if frames is None:
+        return None
+    if not isinstance(frames, np.ndarray):
+        frames = frames.mean
+    return np.asarray(frames, dtype=np.float32)
+
+
+def build_defect_map(
+    width,
+    height,
+    pixel_format,
+    dark=None,
+    flat=None,
+    hot_threshold=0.05,
+    dead_threshold=0.5,
+    stuck_threshold=0.5,
+):
+    """
+    :brief  Find the defect pixels of a sensor from mean frames, every pixel is
+            compared with the median of the 3 x 3 same-color pixels around it,
+            which follows vignetting and the color of bayer frames
+    :param  width:              frame width
+    :param  height:             frame height
+    :param  pixel_format:       GxPixelFormatEntry, mono or bayer
+    :param  dark:               mean of frames with the lens covered, np.ndarray
+                                (height, width) or temporal.TemporalSnapshot;
+                                None: no hot pixel search
+    :param  flat:               mean of frames of a uniformly lit target, np.ndarray
+                                or TemporalSnapshot; None: no dead pixel search
+    :param  hot_threshold:      hot pixel: dark value above the neighbours by more
+                                than this fraction of the full scale
+    :param  dead_threshold:     dead pixel: flat signal, dark subtracted, below the
+                                neighbours by more than this fraction of theirs
+    :param  stuck_threshold:    stuck pixel: flat signal above the neighbours by more
+                                than this fraction of theirs
+    :return DefectPixelMap
+    """
+    step = _get_cfa_step(pixel_format)
+    max_value = (1 << get_pixel_format_layout(pixel_format).data_bits) - 1
+    dark = _mean_of(dark)
+    flat = _mean_of(flat)
+    for name, frame in (("dark", dark), ("flat", flat)):
+        if frame is not None and frame.shape != (height, width):
+            raise InvalidParameterError(
+                "build_defect_map: Expected %s shape is %s, not %s"
+                % (name, (height, width), frame.shape)
+            )
+
+    defects = np.zeros((height, width), dtype=bool)
+    for y in range(step):
+        for x in range(step):
+            plane = defects[y::step, x::step]
+            if dark is not None:
+                dark_plane = dark[y::step, x::step]
+                plane |= dark_plane - _local_median(dark_plane) > (
+                    hot_threshold * max_value
+                )
+            if flat is not None:
+                signal = flat[y::step, x::step]
+                if dark is not None:
+                    signal = signal - dark[y::step, x::step]
+                reference = _local_median(signal)
+                plane |= signal < reference * (1 - dead_threshold)
+                plane |= signal > reference * (1 + stuck_threshold)
+
+    return DefectPixelMap(width, height, pixel_format, np.flatnonzero(defects))
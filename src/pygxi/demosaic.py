@@ -0,0 +1,254 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+
+from .gxidef import GxPixelColorFilterEntry
+from .parallel import get_default_workers, run_bands
+
+# Interpolation of the missing colors
+NEAREST = "nearest"  # colors of the 2x2 bayer cell of the pixel
+BILINEAR = "bilinear"  # mean of the nearest pixels of each color
+EDGE_AWARE = "edge"  # green along edges, red and blue by color difference
+MODES = (NEAREST, BILINEAR, EDGE_AWARE)
+
+# (dy, dx) of the red pixel of the 2x2 cell, blue is at (1 - dy, 1 - dx)
+_RED_POSITIONS = {
+    GxPixelColorFilterEntry.BAYER_RG: (0, 0),
+    GxPixelColorFilterEntry.BAYER_GB: (1, 0),
+    GxPixelColorFilterEntry.BAYER_GR: (0, 1),
+    GxPixelColorFilterEntry.BAYER_BG: (1, 1),
+}
+
+# rows and columns of neighbours read around a band, even to keep the CFA phase
+_PADDING = {NEAREST: 2, BILINEAR: 2, EDGE_AWARE: 4}
+
+RED, GREEN, BLUE = 0, 1, 2
+
+
+class _Plane:
+    def __init__(self, data, origin, height, width):
+        """
+        :brief  Region of height x width pixels of data starting at (origin, origin),
+                its first row and column have the CFA phase of raw row and column 0
+        """
+        self.data = data
+        self.origin = origin
+        self.height = height
+        self.width = width
+
+    def at(self, y, x, dy=0, dx=0):
+        """
+        :brief  Quarter plane of the pixels at phase (y, x) of the region,
+                moved by (dy, dx)
+        """
+        origin = self.origin
+        return self.data[
+            origin + y + dy : origin + self.height + dy : 2,
+            origin + x + dx : origin + self.width + dx : 2,
+        ]
+
+
+def _mean(*planes):
+    """
+    :brief  Rounded mean of quarter planes
+    """
+    total = planes[0].astype(np.int32)
+    for plane in planes[1:]:
+        total += plane
+    return (total + len(planes) // 2) // len(planes)
+
+
+def _cross(plane, y, x):
+    return (
+        plane.at(y, x, -1, 0),
+        plane.at(y, x, 1, 0),
+        plane.at(y, x, 0, -1),
+        plane.at(y, x, 0, 1),
+    )
+
+
+def _diagonals(plane, y, x):
+    return (
+        plane.at(y, x, -1, -1),
+        plane.at(y, x, -1, 1),
+        plane.at(y, x, 1, -1),
+        plane.at(y, x, 1, 1),
+    )
+
+
+def _demosaic_nearest(raw, rgb, red, blue):
+    """
+    :brief  Every pixel gets the red, blue and same row green of its 2x2 cell
+    """
+    (ry, rx), (by, bx) = red, blue
+    out = _Plane(rgb, 0, rgb.shape[0], rgb.shape[1])
+    for y, x in ((ry, rx), (ry, bx), (by, rx), (by, bx)):
+        green_x = bx if y == ry else rx
+        out.at(y, x)[..., RED] = raw.at(y, x, ry - y, rx - x)
+        out.at(y, x)[..., GREEN] = raw.at(y, x, 0, green_x - x)
+        out.at(y, x)[..., BLUE] = raw.at(y, x, by - y, bx - x)
+
+
+def _demosaic_bilinear(raw, rgb, red, blue):
+    """
+    :brief  Missing colors are the mean of the nearest pixels of that color:
+            the 4 direct or diagonal neighbours, or the 2 neighbours of the row
+            or of the column
+    """
+    (ry, rx), (by, bx) = red, blue
+    out = _Plane(rgb, 0, rgb.shape[0], rgb.shape[1])
+    for (y, x), native, other in (((ry, rx), RED, BLUE), ((by, bx), BLUE, RED)):
+        site = out.at(y, x)
+        site[..., native] = raw.at(y, x)
+        site[..., GREEN] = _mean(*_cross(raw, y, x))
+        site[..., other] = _mean(*_diagonals(raw, y, x))
+
+    # green pixels of the red rows, then of the blue rows
+    for (y, x), row_color, column_color in (
+        ((ry, bx), RED, BLUE),
+        ((by, rx), BLUE, RED),
+    ):
+        site = out.at(y, x)
+        site[..., GREEN] = raw.at(y, x)
+        site[..., row_color] = _mean(raw.at(y, x, 0, -1), raw.at(y, x, 0, 1))
+        site[..., column_color] = _mean(raw.at(y, x, -1, 0), raw.at(y, x, 1, 0))
+
+
+def _demosaic_edge_aware(raw, rgb, red, blue, max_value):
+    """
+    :brief  Hamilton-Adams: green at red and blue pixels along the direction of the
+            smaller gradient, corrected by the laplacian of the native color, then
+            red and blue as green plus the bilinear mean of the color differences
+    """
+    (ry, rx), (by, bx) = red, blue
+    height, width = rgb.shape[:2]
+
+    # green on the band and one pixel around it, region origin 2 in the raw window
+    green = np.empty((height + 4, width + 4), dtype=np.int32)
+    green_plane = _Plane(green, 2, height, width)
+    wide_raw = _Plane(raw.data, raw.origin - 2, height + 4, width + 4)
+    wide_green = _Plane(green, 0, height + 4, width + 4)
+    for y, x in ((ry, bx), (by, rx)):
+        wide_green.at(y, x)[...] = wide_raw.at(y, x)
+    for y, x in ((ry, rx), (by, bx)):
+        center = wide_raw.at(y, x).astype(np.int32)
+        west, east = wide_raw.at(y, x, 0, -1), wide_raw.at(y, x, 0, 1)
+        north, south = wide_raw.at(y, x, -1, 0), wide_raw.at(y, x, 1, 0)
+        laplacian_h = 2 * center - wide_raw.at(y, x, 0, -2) - wide_raw.at(y, x, 0, 2)
+        laplacian_v = 2 * center - wide_raw.at(y, x, -2, 0) - wide_raw.at(y, x, 2, 0)
+        gradient_h = np.abs(west.astype(np.int32) - east) + np.abs(laplacian_h)
+        gradient_v = np.abs(north.astype(np.int32) - south) + np.abs(laplacian_v)
+        green_h = (2 * (west.astype(np.int32) + east) + laplacian_h + 2) // 4
+        green_v = (2 * (north.astype(np.int32) + south) + laplacian_v + 2) // 4
+        value = np.where(
+            gradient_h < gradient_v,
+            green_h,
+            np.where(gradient_v < gradient_h, green_v, (green_h + green_v + 1) // 2),
+        )
+        wide_green.at(y, x)[...] = np.clip(value, 0, max_value)
+
+    out = _Plane(rgb, 0, height, width)
+
+    def difference(y, x, dy, dx):
+        return raw.at(y, x, dy, dx) - green_plane.at(y, x, dy, dx)
+
+    def put(site, color, y, x, differences):
+        value = green_plane.at(y, x) + _mean(*differences)
+        site[..., color] = np.clip(value, 0, max_value)
+
+    for (y, x), native, other in (((ry, rx), RED, BLUE), ((by, bx), BLUE, RED)):
+        site = out.at(y, x)
+        site[..., native] = raw.at(y, x)
+        site[..., GREEN] = green_plane.at(y, x)
+        put(
+            site,
+            other,
+            y,
+            x,
+            [difference(y, x, dy, dx) for dy in (-1, 1) for dx in (-1, 1)],
+        )
+
+    for (y, x), row_color, column_color in (
+        ((ry, bx), RED, BLUE),
+        ((by, rx), BLUE, RED),
+    ):
+        site = out.at(y, x)
+        site[..., GREEN] = raw.at(y, x)
+        put(site, row_color, y, x, [difference(y, x, 0, -1), difference(y, x, 0, 1)])
+        put(
+            site,
+            column_color,
+            y,
+            x,
+            [difference(y, x, -1, 0), difference(y, x, 1, 0)],
+        )
+
+
+def demosaic(raw, color_filter, mode=BILINEAR, out=None, workers=None):
+    """
+    :brief  Bayer to RGB interpolation with NumPy, without DxImageProc.
+            The frame is interpolated in bands of rows, in parallel when workers > 1;
+            the borders are extended by reflection, which keeps the CFA phase
+    :param  raw:            np.ndarray (height, width) of uint8 or uint16
+    :param  color_filter:   GxPixelColorFilterEntry of the first 2x2 cell,
+                            NONE: mono, the value is copied to the three channels
+    :param  mode:           NEAREST, BILINEAR or EDGE_AWARE
+    :param  out:            np.ndarray (height, width, 3) of the dtype of raw receiving
+                            the R, G, B channels, may be a view, e.g. out[::-1] to flip
+                            or out[..., ::-1] for BGR; None to allocate it
+    :param  workers:        number of row bands interpolated in parallel,
+                            None: parallel.get_default_workers
+    :return out, or a new np.ndarray (height, width, 3); None when mode or
+            color_filter is not supported
+    """
+    if mode not in MODES:
+        print("demosaic: mode out of bounds, %s" % MODES.__str__())
+        return None
+
+    if (
+        color_filter != GxPixelColorFilterEntry.NONE
+        and color_filter not in _RED_POSITIONS
+    ):
+        print("demosaic: color_filter %s is not a bayer layout" % color_filter)
+        return None
+
+    height, width = raw.shape
+    if out is None:
+        out = np.empty((height, width, 3), dtype=raw.dtype)
+    if workers is None:
+        workers = get_default_workers(height * width)
+
+    if color_filter == GxPixelColorFilterEntry.NONE:
+
+        def copy_band(first, last):
+            for channel in range(3):
+                out[first:last, :, channel] = raw[first:last]
+
+        run_bands(copy_band, height, workers)
+        return out
+
+    red = _RED_POSITIONS[color_filter]
+    blue = (1 - red[0], 1 - red[1])
+    padding = _PADDING[mode]
+    padded = np.pad(raw, padding, mode="reflect")
+    max_value = np.iinfo(raw.dtype).max
+
+    def demosaic_band(first_cell, last_cell):
+        first = 2 * first_cell
+        last = min(2 * last_cell, height)
+        raw_band = _Plane(
+            padded[first : last + 2 * padding], padding, last - first, width
+        )
+        rgb = out[first:last]
+        if mode == NEAREST:
+            _demosaic_nearest(raw_band, rgb, red, blue)
+        elif mode == BILINEAR:
+            _demosaic_bilinear(raw_band, rgb, red, blue)
+        else:
+            _demosaic_edge_aware(raw_band, rgb, red, blue, max_value)
+
+    # bands start on even rows, every band has the CFA phase of the frame
+    run_bands(demosaic_band, (height + 1) // 2, workers)
+    return out
@@ -0,0 +1,319 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import ctypes as ct
+import threading
+
+import numpy as np
+
+import pygxi.dxwrapper as dx
+
+from .gxidef import DxRGBChannelOrder, DxValidBit, GxPixelFormatEntry
+from .pixelformat import get_pixel_format_layout, get_pixel_format_size, unpack_pixels
+
+# output pixel format: channel order, "L": mono or raw bayer, "A": alpha
+_OUTPUT_CHANNELS = {
+    GxPixelFormatEntry.MONO8: "L",
+    GxPixelFormatEntry.BAYER_RG8: "L",
+    GxPixelFormatEntry.BAYER_GB8: "L",
+    GxPixelFormatEntry.BAYER_GR8: "L",
+    GxPixelFormatEntry.BAYER_BG8: "L",
+    GxPixelFormatEntry.RGB8: "RGB",
+    GxPixelFormatEntry.BGR8: "BGR",
+    GxPixelFormatEntry.RGBA8: "RGBA",
+    GxPixelFormatEntry.BGRA8: "BGRA",
+    GxPixelFormatEntry.ARGB8: "ARGB",
+    GxPixelFormatEntry.ABGR8: "ABGR",
+}
+
+# (dy, dx) of the red, first green, second green and blue pixel of a 2x2 bayer cell
+_BAYER_CELL_POSITIONS = {
+    1: ((0, 0), (0, 1), (1, 0), (1, 1)),  # RG
+    2: ((1, 0), (0, 0), (1, 1), (0, 1)),  # GB
+    3: ((0, 1), (0, 0), (1, 1), (1, 0)),  # GR
+    4: ((1, 1), (0, 1), (1, 0), (0, 0)),  # BG
+}
+
+
+def _value(argument):
+    """
+    :brief  Python value of an argument, passed as a ctypes object or as a Python value
+    """
+    if isinstance(argument, ct._SimpleCData):
+        return argument.value
+    return argument
+
+
+def _address(argument):
+    """
+    :brief  Memory address of a buffer argument: int, c_void_p, ctypes array or byref
+    """
+    argument = getattr(argument, "_obj", argument)
+    if isinstance(argument, ct.Array):
+        return ct.addressof(argument)
+    return _value(argument)
+
+
+def _as_array(address, size):
+    """
+    :brief  np.ndarray of uint8 on size bytes of memory
+    """
+    return np.ctypeslib.as_array((ct.c_ubyte * size).from_address(address))
+
+
+def _to_8bit(values, valid_bits):
+    """
+    :brief  8 bit pixel values: bits valid_bits to valid_bits + 7 of values
+    """
+    if values.dtype == np.uint8:
+        return values
+    return np.minimum(values >> valid_bits, 255).astype(np.uint8)
+
+
+def _demosaic(raw, color_filter):
+    """
+    :brief  Reference demosaic, every pixel of a 2x2 cell gets the red, the mean of
+            the greens and the blue of the cell
+    :param  raw:            np.ndarray (height, width), width and height even
+    :param  color_filter:   DxPixelColorFilter
+    :return np.ndarray (height, width, 3) RGB
+    """
+    height, width = raw.shape
+    cells = raw.reshape(height // 2, 2, width // 2, 2)
+    red, green_1, green_2, blue = [
+        cells[:, dy, :, dx] for dy, dx in _BAYER_CELL_POSITIONS[color_filter]
+    ]
+    green = ((green_1.astype(np.uint32) + green_2 + 1) >> 1).astype(raw.dtype)
+
+    rgb = np.empty((height // 2, 2, width // 2, 2, 3), dtype=raw.dtype)
+    for channel, plane in enumerate((red, green, blue)):
+        rgb[..., channel] = plane[:, np.newaxis, :, np.newaxis]
+    return rgb.reshape(height, width, 3)
+
+
+def _to_rgb(values, color_filter):
+    """
+    :brief  RGB image of mono, bayer or RGB pixel values
+    """
+    if values.ndim == 3:
+        return values
+    if color_filter == dx.DxPixelColorFilter.NONE:
+        return np.repeat(values[:, :, np.newaxis], 3, axis=2)
+    return _demosaic(values, color_filter)
+
+
+class _ConverterState:
+    def __init__(self):
+        self.output_pixel_format = GxPixelFormatEntry.RGB8
+        self.valid_bits = DxValidBit.BIT0_7
+        self.alpha_value = 255
+        self.interpolation_type = 0
+
+
+class SimulatedDxLibrary:
+    def __init__(self):
+        """
+        :brief  Stand-in for the DxImageProc library, numpy reference implementation
+                of the format conversion and of the raw8 and raw16 conversions.
+                Interpolation types are accepted, the demosaic is always the cell
+                replication of _demosaic. The other DxImageProc functions return
+                DxStatus.STATUS_NOT_SUPPORTED
+        """
+        self.__converters = {}
+        self.__next_handle = 0x20000
+        self.__lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name.startswith("Dx"):
+            return self.__not_supported
+        raise AttributeError(name)
+
+    @staticmethod
+    def __not_supported(*args):
+        return dx.DxStatus.STATUS_NOT_SUPPORTED
+
+    def __get_converter(self, handle):
+        return self.__converters.get(_value(handle))
+
+    def DxImageFormatConvertCreate(self, p_handle):
+        with self.__lock:
+            self.__next_handle += 1
+            handle = self.__next_handle
+            self.__converters[handle] = _ConverterState()
+        p_handle.contents.value = handle
+        return dx.DxStatus.OK
+
+    def DxImageFormatConvertDestroy(self, handle):
+        with self.__lock:
+            if self.__converters.pop(_value(handle), None) is None:
+                return dx.DxStatus.PARAMETER_INVALID
+        return dx.DxStatus.OK
+
+    def DxImageFormatConvertSetOutputPixelFormat(self, handle, pixel_format):
+        converter = self.__get_converter(handle)
+        if converter is None:
+            return dx.DxStatus.PARAMETER_INVALID
+        if _value(pixel_format) not in _OUTPUT_CHANNELS:
+            return dx.DxStatus.STATUS_NOT_SUPPORTED
+        converter.output_pixel_format = _value(pixel_format)
+        return dx.DxStatus.OK
+
+    def DxImageFormatConvertGetOutputPixelFormat(self, handle, p_pixel_format):
+        converter = self.__get_converter(handle)
+        if converter is None:
+            return dx.DxStatus.PARAMETER_INVALID
+        p_pixel_format._obj.value = converter.output_pixel_format
+        return dx.DxStatus.OK
+
+    def DxImageFormatConvertSetValidBits(self, handle, valid_bits):
+        converter = self.__get_converter(handle)
+        if converter is None or not (
+            DxValidBit.BIT0_7 <= _value(valid_bits) <= DxValidBit.BIT8_15
+        ):
+            return dx.DxStatus.PARAMETER_INVALID
+        converter.valid_bits = _value(valid_bits)
+        return dx.DxStatus.OK
+
+    def DxImageFormatConvertSetAlphaValue(self, handle, alpha_value):
+        converter = self.__get_converter(handle)
+        if converter is None:
+            return dx.DxStatus.PARAMETER_INVALID
+        converter.alpha_value = _value(alpha_value) & 0xFF
+        return dx.DxStatus.OK
+
+    def DxImageFormatConvertSetInterpolationType(self, handle, interpolation_type):
+        converter = self.__get_converter(handle)
+        if converter is None:
+            return dx.DxStatus.PARAMETER_INVALID
+        converter.interpolation_type = _value(interpolation_type)
+        return dx.DxStatus.OK
+
+    def DxImageFormatConvertGetBufferSizeForConversion(
+        self, handle, pixel_format, width, height, p_buffer_size
+    ):
+        if self.__get_converter(handle) is None:
+            return dx.DxStatus.PARAMETER_INVALID
+        bits = (_value(pixel_format) >> 16) & 0xFF
+        p_buffer_size._obj.value = (_value(width) * _value(height) * bits + 7) // 8
+        return dx.DxStatus.OK
+
+    def DxImageFormatConvert(
+        self,
+        handle,
+        input_address,
+        input_length,
+        output_address,
+        output_length,
+        pixel_format,
+        width,
+        height,
+        flip,
+    ):
+        converter = self.__get_converter(handle)
+        if converter is None:
+            return dx.DxStatus.PARAMETER_INVALID
+
+        pixel_format = _value(pixel_format)
+        width = _value(width)
+        height = _value(height)
+        layout = get_pixel_format_layout(pixel_format)
+        if layout is None or (layout.channels == 3 and layout.data_bits != 8):
+            return dx.DxStatus.STATUS_NOT_SUPPORTED
+
+        input_size = get_pixel_format_size(pixel_format, width, height)
+        channels = _OUTPUT_CHANNELS[converter.output_pixel_format]
+        output_size = width * height * len(channels)
+        if (
+            _value(input_length) < input_size
+            or _value(output_length) < output_size
+            or (layout.color_filter and (width % 2 or height % 2))
+        ):
+            return dx.DxStatus.PARAMETER_INVALID
+
+        values = unpack_pixels(
+            _as_array(_address(input_address), input_size), pixel_format, width, height
+        )
+        values = _to_8bit(values, converter.valid_bits)
+        if pixel_format == GxPixelFormatEntry.BGR8:
+            values = values[:, :, ::-1]
+
+        output = _as_array(_address(output_address), output_size).reshape(
+            height, width, len(channels)
+        )
+        if _value(flip):
+            output = output[::-1]
+
+        if channels == "L":
+            if values.ndim == 3:
+                return dx.DxStatus.STATUS_NOT_SUPPORTED
+            output[:, :, 0] = values
+            return dx.DxStatus.OK
+
+        rgb = _to_rgb(values, layout.color_filter)
+        for index, channel in enumerate(channels):
+            if channel == "A":
+                output[:, :, index] = converter.alpha_value
+            else:
+                output[:, :, index] = rgb[:, :, "RGB".index(channel)]
+        return dx.DxStatus.OK
+
+    def DxRaw8toRGB24(
+        self,
+        input_address,
+        output_address,
+        width,
+        height,
+        convert_type,
+        bayer_type,
+        flip,
+    ):
+        return self.DxRaw8toRGB24Ex(
+            input_address,
+            output_address,
+            width,
+            height,
+            convert_type,
+            bayer_type,
+            flip,
+            DxRGBChannelOrder.ORDER_BGR,
+        )
+
+    def DxRaw8toRGB24Ex(
+        self,
+        input_address,
+        output_address,
+        width,
+        height,
+        convert_type,
+        bayer_type,
+        flip,
+        channel_order,
+    ):
+        width = _value(width)
+        height = _value(height)
+        bayer_type = _value(bayer_type)
+        if bayer_type and (width % 2 or height % 2):
+            return dx.DxStatus.PARAMETER_INVALID
+        if bayer_type not in (dx.DxPixelColorFilter.NONE, *_BAYER_CELL_POSITIONS):
+            return dx.DxStatus.PARAMETER_INVALID
+
+        raw = _as_array(_address(input_address), width * height).reshape(height, width)
+        rgb = _to_rgb(raw, bayer_type)
+        if _value(channel_order) == DxRGBChannelOrder.ORDER_BGR:
+            rgb = rgb[:, :, ::-1]
+
+        output = _as_array(_address(output_address), width * height * 3).reshape(
+            height, width, 3
+        )
+        if _value(flip):
+            output = output[::-1]
+        output[...] = rgb
+        return dx.DxStatus.OK
+
+    def DxRaw16toRaw8(self, input_address, output_address, width, height, valid_bits):
+        pixel_num = _value(width) * _value(height)
+        raw = _as_array(_address(input_address), pixel_num * 2).view("<u2")
+        output = _as_array(_address(output_address), pixel_num)
+        output[...] = _to_8bit(raw, _value(valid_bits))
+        return dx.DxStatus.OK
@@ -7,7 +7,14 @@ import ctypes as ct
 import os
 import sys
 
-if sys.platform == "linux2" or sys.platform == "linux":
+from .backend import BACKEND, SIMULATED
+from .prototypes import bind_prototypes
+
+if BACKEND == SIMULATED:
+    from .dxsimulator import SimulatedDxLibrary
+
+    dll = SimulatedDxLibrary()
+elif sys.platform == "linux2" or sys.platform == "linux":
     if os.path.exists("/usr/lib/libdximageproc.so"):
         filepath = "/usr/lib/libdximageproc.so"
     else:
@@ -16,6 +23,7 @@ if sys.platform == "linux2" or sys.platform == "linux":
         dll = ct.CDLL(filepath)
     except OSError:
         print("Cannot find libdximageproc.so or libgxiapi.so.")
+        dll = None
 
 else:
     try:
@@ -27,6 +35,7 @@ else:
             dll = ct.WinDLL("DxImageProc.dll")
     except OSError:
         print("Cannot find DxImageProc.dll.")
+        dll = None
 
 
 # image format handle
@@ -209,6 +218,226 @@ class StaticDefectCorrection(ct.Structure):
         )
 
 
+# Prototypes of the DxImageProc functions, name: (restype, argtypes).
+# Pointers are declared as c_void_p so that byref(), arrays, addresses
+# and None are all accepted.
+DX_FUNCTION_PROTOTYPES = {
+    "DxGetLut": (
+        ct.c_int,
+        [ct.c_int32, ct.c_double, ct.c_int32, ct.c_void_p, ct.c_void_p],
+    ),
+    "DxCalcCCParam": (ct.c_int, [ct.c_int64, ct.c_int16, ct.c_void_p, ct.c_uint8]),
+    "DxCalcUserSetCCParam": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_int16, ct.c_void_p, ct.c_uint8],
+    ),
+    "DxGetGammatLut": (ct.c_int, [ct.c_double, ct.c_void_p, ct.c_void_p]),
+    "DxGetContrastLut": (ct.c_int, [ct.c_int, ct.c_void_p, ct.c_void_p]),
+    "DxRaw8toRGB24": (
+        ct.c_int,
+        [
+            ct.c_void_p,
+            ct.c_void_p,
+            ct.c_uint32,
+            ct.c_uint32,
+            ct.c_uint,
+            ct.c_uint,
+            ct.c_bool,
+        ],
+    ),
+    "DxRaw8toRGB24Ex": (
+        ct.c_int,
+        [
+            ct.c_void_p,
+            ct.c_void_p,
+            ct.c_uint32,
+            ct.c_uint32,
+            ct.c_uint,
+            ct.c_uint,
+            ct.c_bool,
+            ct.c_uint,
+        ],
+    ),
+    "DxRaw16toRaw8": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32, ct.c_uint],
+    ),
+    "DxRotate90CW8B": (ct.c_int, [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32]),
+    "DxRotate90CCW8B": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32],
+    ),
+    "DxRotate90CW16B": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32],
+    ),
+    "DxRotate90CCW16B": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32],
+    ),
+    "DxImageImprovment": (
+        ct.c_int,
+        [
+            ct.c_void_p,
+            ct.c_void_p,
+            ct.c_uint32,
+            ct.c_uint32,
+            ct.c_int64,
+            ct.c_void_p,
+            ct.c_void_p,
+        ],
+    ),
+    "DxImageImprovmentEx": (
+        ct.c_int,
+        [
+            ct.c_void_p,
+            ct.c_void_p,
+            ct.c_uint32,
+            ct.c_uint32,
+            ct.c_int64,
+            ct.c_void_p,
+            ct.c_void_p,
+            ct.c_uint,
+        ],
+    ),
+    "DxBrightness": (ct.c_int, [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_int32]),
+    "DxContrast": (ct.c_int, [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_int32]),
+    "DxSaturation": (ct.c_int, [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_int32]),
+    "DxAutoRawDefectivePixelCorrect": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_uint32, ct.c_uint32, ct.c_int32],
+    ),
+    "DxSharpen24B": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32, ct.c_float],
+    ),
+    "DxGetWhiteBalanceRatio": (
+        ct.c_int,
+        [
+            ct.c_void_p,
+            ct.c_uint32,
+            ct.c_uint32,
+            ct.c_void_p,
+            ct.c_void_p,
+            ct.c_void_p,
+        ],
+    ),
+    "DxImageMirror": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32, ct.c_uint],
+    ),
+    "DxImageMirror16B": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32, ct.c_uint],
+    ),
+    "DxRaw8ImgProcess": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32, ct.c_void_p],
+    ),
+    "DxMono8ImgProcess": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32, ct.c_void_p],
+    ),
+    "DxGetFFCCoefficients": (
+        ct.c_int,
+        [FieldCorrectionProcess, ct.c_void_p, ct.c_void_p, ct.c_void_p],
+    ),
+    "DxFlatFieldCorrection": (
+        ct.c_int,
+        [
+            ct.c_void_p,
+            ct.c_void_p,
+            ct.c_uint,
+            ct.c_uint32,
+            ct.c_uint32,
+            ct.c_void_p,
+            ct.c_void_p,
+        ],
+    ),
+    "DxRaw12PackedToRaw16": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32],
+    ),
+    "DxRaw10PackedToRaw16": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32],
+    ),
+    "DxRGB48toRGB24": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_uint32, ct.c_uint32, ct.c_uint],
+    ),
+    "DxRaw16toRGB48": (
+        ct.c_int,
+        [
+            ct.c_void_p,
+            ct.c_void_p,
+            ct.c_uint32,
+            ct.c_uint32,
+            ct.c_uint,
+            ct.c_uint,
+            ct.c_uint,
+            ct.c_bool,
+        ],
+    ),
+    "DxRaw8toARGB32": (
+        ct.c_int,
+        [
+            ct.c_void_p,
+            ct.c_void_p,
+            ct.c_uint32,
+            ct.c_uint32,
+            ct.c_uint32,
+            ct.c_uint,
+            ct.c_uint,
+            ct.c_bool,
+            ct.c_uint32,
+        ],
+    ),
+    "DxStaticDefectCorrection": (
+        ct.c_int,
+        [
+            ct.c_void_p,
+            ct.c_void_p,
+            StaticDefectCorrection,
+            ct.c_void_p,
+            ct.c_uint32,
+        ],
+    ),
+    "DxCalcCameraLutBuffer": (
+        ct.c_int,
+        [ct.c_int32, ct.c_double, ct.c_int32, ct.c_void_p, ct.c_void_p],
+    ),
+    "DxReadLutFile": (ct.c_int, [ct.c_char_p, ct.c_void_p, ct.c_void_p]),
+    "DxImageFormatConvertCreate": (ct.c_int, [ct.c_void_p]),
+    "DxImageFormatConvertDestroy": (ct.c_int, [ct.c_void_p]),
+    "DxImageFormatConvert": (
+        ct.c_int,
+        [
+            ct.c_void_p,
+            ct.c_void_p,
+            ct.c_uint32,
+            ct.c_void_p,
+            ct.c_uint32,
+            ct.c_uint,
+            ct.c_uint32,
+            ct.c_uint32,
+            ct.c_bool,
+        ],
+    ),
+    "DxImageFormatConvertSetOutputPixelFormat": (ct.c_int, [ct.c_void_p, ct.c_uint]),
+    "DxImageFormatConvertSetAlphaValue": (ct.c_int, [ct.c_void_p, ct.c_uint]),
+    "DxImageFormatConvertSetInterpolationType": (ct.c_int, [ct.c_void_p, ct.c_uint]),
+    "DxImageFormatConvertSetValidBits": (ct.c_int, [ct.c_void_p, ct.c_uint]),
+    "DxImageFormatConvertGetOutputPixelFormat": (ct.c_int, [ct.c_void_p, ct.c_void_p]),
+    "DxImageFormatConvertGetBufferSizeForConversion": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_uint, ct.c_uint, ct.c_uint, ct.c_void_p],
+    ),
+}
+if isinstance(dll, ct.CDLL):
+    bind_prototypes(dll, DX_FUNCTION_PROTOTYPES)
+
+
 if hasattr(dll, "DxGetLut"):
 
     def dx_get_lut(contrast_param, gamma, lightness):
@@ -392,35 +621,8 @@ if hasattr(dll, "DxRaw8toRGB24"):
         :return: status         State return value, See detail in DxStatus
                  data_array     Array of output images, buff size = width * height * 3
         """
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        convert_type_c = ct.c_uint()
-        convert_type_c.value = convert_type
-
-        bayer_type_c = ct.c_uint()
-        bayer_type_c.value = bayer_type
-
-        flip_c = ct.c_bool()
-        flip_c.value = flip
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
         status = dll.DxRaw8toRGB24(
-            input_address_p,
-            output_address_p,
-            width_c,
-            height_c,
-            convert_type_c,
-            bayer_type_c,
-            flip_c,
+            input_address, output_address, width, height, convert_type, bayer_type, flip
         )
         return status
 
@@ -452,39 +654,15 @@ if hasattr(dll, "DxRaw8toRGB24Ex"):
         :return: status         State return value, See detail in DxStatus
                  data_array     Array of output images, buff size = width * height * 3
         """
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        convert_type_c = ct.c_uint()
-        convert_type_c.value = convert_type
-
-        bayer_type_c = ct.c_uint()
-        bayer_type_c.value = bayer_type
-
-        flip_c = ct.c_bool()
-        flip_c.value = flip
-
-        channel_order_c = ct.c_uint()
-        channel_order_c.value = channel_order
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
         status = dll.DxRaw8toRGB24Ex(
-            input_address_p,
-            output_address_p,
-            width_c,
-            height_c,
-            convert_type_c,
-            bayer_type_c,
-            flip_c,
-            channel_order_c,
+            input_address,
+            output_address,
+            width,
+            height,
+            convert_type,
+            bayer_type,
+            flip,
+            channel_order,
         )
         return status
 
@@ -502,23 +680,8 @@ if hasattr(dll, "DxRaw16toRaw8"):
         :return: status         State return value, See detail in DxStatus
                  data_array     Array of output images, buff size = width * height
         """
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        valid_bits_c = ct.c_uint()
-        valid_bits_c.value = valid_bits
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        out_address_p = ct.c_void_p()
-        out_address_p.value = out_address
-
         status = dll.DxRaw16toRaw8(
-            input_address_p, out_address_p, width_c, height_c, valid_bits_c
+            input_address, out_address, width, height, valid_bits
         )
         return status
 
@@ -535,19 +698,7 @@ if hasattr(dll, "DxRotate90CW8B"):
         :return: status         State return value, See detail in DxStatus
                  data_array     Array of output images, buff size = width * height
         """
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        out_address_p = ct.c_void_p()
-        out_address_p.value = out_address
-
-        status = dll.DxRotate90CW8B(input_address_p, out_address_p, width_c, height_c)
+        status = dll.DxRotate90CW8B(input_address, out_address, width, height)
         return status
 
 
@@ -563,19 +714,7 @@ if hasattr(dll, "DxRotate90CCW8B"):
         :return: status         State return value, See detail in DxStatus
                  data_array     Array of output images, buff size = width * height
         """
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        out_address_p = ct.c_void_p()
-        out_address_p.value = out_address
-
-        status = dll.DxRotate90CCW8B(input_address_p, out_address_p, width_c, height_c)
+        status = dll.DxRotate90CCW8B(input_address, out_address, width, height)
         return status
 
 
@@ -602,27 +741,12 @@ if hasattr(dll, "DxImageImprovment"):
         :return:    status                      State return value, See detail in DxStatus
                     data_array                  Array of output images, buff size = width * height * 3
         """
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        color_correction_param_c = ct.c_int64()
-        color_correction_param_c.value = color_correction_param
-
         status = dll.DxImageImprovment(
-            input_address_p,
-            output_address_p,
-            width_c,
-            height_c,
-            color_correction_param_c,
+            input_address,
+            output_address,
+            width,
+            height,
+            color_correction_param,
             contrast_lut,
             gamma_lut,
         )
@@ -654,33 +778,15 @@ if hasattr(dll, "DxImageImprovmentEx"):
         :return:    status                      State return value, See detail in DxStatus
                     data_array                  Array of output images, buff size = width * height * 3
         """
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        color_correction_param_c = ct.c_int64()
-        color_correction_param_c.value = color_correction_param
-
-        channel_order_c = ct.c_uint()
-        channel_order_c.value = channel_order
-
         status = dll.DxImageImprovmentEx(
-            input_address_p,
-            output_address_p,
-            width_c,
-            height_c,
-            color_correction_param_c,
+            input_address,
+            output_address,
+            width,
+            height,
+            color_correction_param,
             contrast_lut,
             gamma_lut,
-            channel_order_c,
+            channel_order,
         )
         return status
 
@@ -696,21 +802,7 @@ if hasattr(dll, "DxBrightness"):
         :param      factor:                 brightness factor,range(-150 ~ 150)
         :return:    status:                 State return value, See detail in DxStatus
         """
-        image_size_c = ct.c_uint32()
-        image_size_c.value = image_size
-
-        factor_c = ct.c_int32()
-        factor_c.value = factor
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        status = dll.DxBrightness(
-            input_address_p, output_address_p, image_size_c, factor_c
-        )
+        status = dll.DxBrightness(input_address, output_address, image_size, factor)
         return status
 
 
@@ -725,21 +817,7 @@ if hasattr(dll, "DxContrast"):
         :param      factor:                 contrast factor,range(-50 ~ 100)
         :return:    status:                 State return value, See detail in DxStatus
         """
-        image_size_c = ct.c_uint32()
-        image_size_c.value = image_size
-
-        factor_c = ct.c_int32()
-        factor_c.value = factor
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        status = dll.DxContrast(
-            input_address_p, output_address_p, image_size_c, factor_c
-        )
+        status = dll.DxContrast(input_address, output_address, image_size, factor)
         return status
 
 
@@ -754,21 +832,7 @@ if hasattr(dll, "DxSaturation"):
         :param      factor:                 saturation factor,range(0 ~ 128)
         :return:    status:                 State return value, See detail in DxStatus
         """
-        image_size_c = ct.c_uint32()
-        image_size_c.value = image_size
-
-        factor_c = ct.c_int32()
-        factor_c.value = factor
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        status = dll.DxSaturation(
-            input_address_p, output_address_p, image_size_c, factor_c
-        )
+        status = dll.DxSaturation(input_address, output_address, image_size, factor)
         return status
 
 
@@ -788,20 +852,8 @@ if hasattr(dll, "DxAutoRawDefectivePixelCorrect"):
                                                                           range:8 ~ 16)
         :return:    status:                 State return value, See detail in DxStatus
         """
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        bit_num_c = ct.c_int32()
-        bit_num_c.value = bit_num
-
-        inout_address_p = ct.c_void_p()
-        inout_address_p.value = inout_address
-
         status = dll.DxAutoRawDefectivePixelCorrect(
-            inout_address_p, width_c, height_c, bit_num_c
+            inout_address, width, height, bit_num
         )
         return status
 
@@ -818,24 +870,7 @@ if hasattr(dll, "DxSharpen24B"):
         :param      factor:                 sharpen factor, range(0.1~5.0)
         :return:    status:                 State return value, See detail in DxStatus
         """
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        factor_c = ct.c_float()
-        factor_c.value = factor
-
-        status = dll.DxSharpen24B(
-            input_address_p, output_address_p, width_c, height_c, factor_c
-        )
+        status = dll.DxSharpen24B(input_address, output_address, width, height, factor)
         return status
 
 
@@ -893,25 +928,9 @@ if hasattr(dll, "DxImageMirror"):
         :param      mirror_mode:            mirror mode
         :return:    status:                 State return value, See detail in DxStatus
         """
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        mirror_mode_c = ct.c_uint()
-        mirror_mode_c.value = mirror_mode
-
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
         status = dll.DxImageMirror(
-            input_address_p, output_address_p, width_c, height_c, mirror_mode_c
+            input_address, output_address, width, height, mirror_mode
         )
-
         return status
 
 
@@ -1162,22 +1181,7 @@ if hasattr(dll, "DxRaw12PackedToRaw16"):
         :param      height:                 image height
         :return:    status:                 State return value, See detail in DxStatus
         """
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        status = dll.DxRaw12PackedToRaw16(
-            input_address_p, output_address_p, width_c, height_c
-        )
-
+        status = dll.DxRaw12PackedToRaw16(input_address, output_address, width, height)
         return status
 
 
@@ -1192,22 +1196,7 @@ if hasattr(dll, "DxRaw10PackedToRaw16"):
         :param      height:                 image height
         :return:    status:                 State return value, See detail in DxStatus
         """
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        status = dll.DxRaw10PackedToRaw16(
-            input_address_p, output_address_p, width_c, height_c
-        )
-
+        status = dll.DxRaw10PackedToRaw16(input_address, output_address, width, height)
         return status
 
 
@@ -1223,25 +1212,9 @@ if hasattr(dll, "DxRGB48toRGB24"):
         :param      valid_bit:             image valid bit
         :return:    status:                 State return value, See detail in DxStatus
         """
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        valid_bit_c = ct.c_uint()
-        valid_bit_c.value = valid_bit
-
         status = dll.DxRGB48toRGB24(
-            input_address_p, output_address_p, width_c, height_c, valid_bit_c
+            input_address, output_address, width, height, valid_bit
         )
-
         return status
 
 
@@ -1272,39 +1245,15 @@ if hasattr(dll, "DxRaw16toRGB48"):
         :return: status            State return value, See detail in DxStatus
                  data_array        Array of output images, buff size = width * height * 3
         """
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        actual_bits_c = ct.c_uint()
-        actual_bits_c.value = actual_bits
-
-        convert_type_c = ct.c_uint()
-        convert_type_c.value = convert_type
-
-        bayer_type_c = ct.c_uint()
-        bayer_type_c.value = bayer_type
-
-        flip_c = ct.c_bool()
-        flip_c.value = flip
-
         status = dll.DxRaw16toRGB48(
-            input_address_p,
-            output_address_p,
-            width_c,
-            height_c,
-            actual_bits_c,
-            convert_type_c,
-            bayer_type_c,
-            flip_c,
+            input_address,
+            output_address,
+            width,
+            height,
+            actual_bits,
+            convert_type,
+            bayer_type,
+            flip,
         )
         return status
 
@@ -1338,43 +1287,16 @@ if hasattr(dll, "DxRaw8toARGB32"):
         :return: status            State return value, See detail in DxStatus
                  data_array        Array of output images, buff size = width * height * 3
         """
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        stride_c = ct.c_uint32()
-        stride_c.value = stride
-
-        convert_type_c = ct.c_uint()
-        convert_type_c.value = convert_type
-
-        bayer_type_c = ct.c_uint()
-        bayer_type_c.value = bayer_type
-
-        flip_c = ct.c_bool()
-        flip_c.value = flip
-
-        alpha_c = ct.c_uint32()
-        alpha_c.value = alpha
-
         status = dll.DxRaw8toARGB32(
-            input_address_p,
-            output_address_p,
-            width_c,
-            height_c,
-            stride_c,
-            convert_type_c,
-            bayer_type_c,
-            flip_c,
-            alpha_c,
+            input_address,
+            output_address,
+            width,
+            height,
+            stride,
+            convert_type,
+            bayer_type,
+            flip,
+            alpha,
         )
         return status
 
@@ -1521,34 +1443,16 @@ if hasattr(dll, "DxImageFormatConvert"):
         """
         :brief Image Format Convert Process
         """
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        fixel_format_c = ct.c_uint()
-        fixel_format_c.value = fixel_format
-
-        flip_c = ct.c_bool()
-        flip_c.value = flip
-
         status = dll.DxImageFormatConvert(
             handle,
-            input_address_p,
+            input_address,
             input_length,
-            output_address_p,
+            output_address,
             output_length,
-            fixel_format_c,
-            width_c,
-            height_c,
-            flip_c,
+            fixel_format,
+            width,
+            height,
+            flip,
         )
         return status
 
@@ -1561,11 +1465,7 @@ if hasattr(dll, "DxImageFormatConvertSetOutputPixelFormat"):
         :param  handle          [in] Image Format convert handle
         :param  pixel_format   [in] Pixel Format
         """
-
-        pixel_format_c = ct.c_uint()
-        pixel_format_c.value = pixel_format
-
-        status = dll.DxImageFormatConvertSetOutputPixelFormat(handle, pixel_format_c)
+        status = dll.DxImageFormatConvertSetOutputPixelFormat(handle, pixel_format)
         return status
 
 
@@ -1577,11 +1477,7 @@ if hasattr(dll, "DxImageFormatConvertSetAlphaValue"):
         :param  handle          [in] Image Format convert handle
         :param  alpha_value     [in] Alpha channel value(range of 0~255)
         """
-
-        alpha_value_c = ct.c_uint()
-        alpha_value_c.value = alpha_value
-
-        status = dll.DxImageFormatConvertSetAlphaValue(handle, alpha_value_c)
+        status = dll.DxImageFormatConvertSetAlphaValue(handle, alpha_value)
         return status
 
 
@@ -1641,19 +1537,10 @@ if hasattr(dll, "DxImageFormatConvertGetBufferSizeForConversion"):
         :param  height          [in]   Image Height
         :param  buffer_size_address     [out]  Image buffer size
         """
-        pixel_format_c = ct.c_uint()
-        pixel_format_c.value = pixel_format
-
-        width_c = ct.c_uint()
-        width_c.value = width
-
-        height_c = ct.c_uint()
-        height_c.value = height
-
         buffer_size_c = ct.c_int()
 
         status = dll.DxImageFormatConvertGetBufferSizeForConversion(
-            handle, pixel_format_c, width_c, height_c, ct.byref(buffer_size_c)
+            handle, pixel_format, width, height, ct.byref(buffer_size_c)
         )
         return status, buffer_size_c.value
 
@@ -1670,22 +1557,7 @@ if hasattr(dll, "DxRotate90CW8B"):
 
         :return emStatus
         """
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        status = dll.DxRotate90CW8B(
-            input_address_p, output_address_p, width_c, height_c
-        )
-
+        status = dll.DxRotate90CW8B(input_address, output_address, width, height)
         return status
 
 
@@ -1701,22 +1573,7 @@ if hasattr(dll, "DxRotate90CCW8B"):
 
         :return emStatus
         """
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        status = dll.DxRotate90CCW8B(
-            input_address_p, output_address_p, width_c, height_c
-        )
-
+        status = dll.DxRotate90CCW8B(input_address, output_address, width, height)
         return status
 
 
@@ -1732,22 +1589,7 @@ if hasattr(dll, "DxRotate90CW16B"):
 
         :return emStatus
         """
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        status = dll.DxRotate90CW16B(
-            input_address_p, output_address_p, width_c, height_c
-        )
-
+        status = dll.DxRotate90CW16B(input_address, output_address, width, height)
         return status
 
 
@@ -1763,22 +1605,7 @@ if hasattr(dll, "DxRotate90CCW16B"):
 
         :return emStatus
         """
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
-        status = dll.DxRotate90CCW16B(
-            input_address_p, output_address_p, width_c, height_c
-        )
-
+        status = dll.DxRotate90CCW16B(input_address, output_address, width, height)
         return status
 
 
@@ -1795,20 +1622,7 @@ if hasattr(dll, "DxImageMirror16B"):
 
         :return emStatus
         """
-        input_address_p = ct.c_void_p()
-        input_address_p.value = input_address
-
-        output_address_p = ct.c_void_p()
-        output_address_p.value = output_address
-
-        width_c = ct.c_uint32()
-        width_c.value = width
-
-        height_c = ct.c_uint32()
-        height_c.value = height
-
         status = dll.DxImageMirror16B(
-            input_address_p, output_address_p, width_c, height_c, mirro_mode
+            input_address, output_address, width, height, mirro_mode
         )
-
         return status
@@ -0,0 +1,342 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import os
+import threading
+
+import numpy as np
+
+from .errors import InvalidParameterError
+from .gxidef import GxFrameStatusList, GxPixelColorFilterEntry
+from .parallel import get_default_workers, run_bands
+from .pixelformat import get_pixel_format_layout, get_pixel_values
+
+# File name of the coefficients of a camera, ROI and pixel format in a directory
+COEFFICIENTS_FILE_NAME = "ffc_%s_%dx%d+%d+%d_%08x.npy"
+
+
+class FlatFieldCoefficients:
+    def __init__(self, gain, dark, pixel_format, serial="", roi=None):
+        """
+        :brief  Flat field correction coefficients, corrected = (raw - dark) * gain
+        :param  gain:           np.ndarray (height, width) of float32
+        :param  dark:           np.ndarray (height, width) of float32, dark level
+        :param  pixel_format:   GxPixelFormatEntry of the calibrated frames
+        :param  serial:         serial number of the camera, part of the file name
+        :param  roi:            (offset_x, offset_y, width, height) of the sensor
+                                region, None: (0, 0, width, height)
+        """
+        self.gain = gain
+        self.dark = dark
+        self.pixel_format = pixel_format
+        self.height, self.width = gain.shape
+        self.serial = serial
+        if roi is None:
+            roi = (0, 0, self.width, self.height)
+        self.roi = tuple(roi)
+
+    def save(self, directory):
+        """
+        :brief  Write the coefficients in directory, gain and dark stacked in one
+                (2, height, width) float32 .npy file named after the serial number,
+                the ROI and the pixel format
+        :param  directory:  directory path, created when missing
+        :return path of the file
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = get_coefficients_path(
+            directory, self.serial, self.roi, self.pixel_format
+        )
+        np.save(path, np.stack((self.gain, self.dark)).astype(np.float32, copy=False))
+        return path
+
+
+def get_coefficients_path(directory, serial, roi, pixel_format):
+    """
+    :brief  Path of the coefficients of a camera, ROI and pixel format
+    :param  directory:      directory path
+    :param  serial:         serial number of the camera
+    :param  roi:            (offset_x, offset_y, width, height) of the sensor region
+    :param  pixel_format:   GxPixelFormatEntry
+    :return path of the .npy file
+    """
+    offset_x, offset_y, width, height = roi
+    return os.path.join(
+        directory,
+        COEFFICIENTS_FILE_NAME
+        % (serial, width, height, offset_x, offset_y, pixel_format),
+    )
+
+
+def get_device_key(device):
+    """
+    :brief  Serial number, ROI and pixel format of a device, the coefficients of
+            another sensor region or pixel format do not apply
+    :param  device:     Device object
+    :return (serial, (offset_x, offset_y, width, height), pixel_format)
+    """
+    roi = (
+        device.OffsetX.get(),
+        device.OffsetY.get(),
+        device.Width.get(),
+        device.Height.get(),
+    )
+    return device.DeviceSerialNumber.get(), roi, device.PixelFormat.get()[0]
+
+
+def load_coefficients(directory, serial, roi, pixel_format):
+    """
+    :brief  Map the coefficients saved by FlatFieldCoefficients.save, read-only;
+            the pages are read from the file on first access
+    :param  directory:      directory path
+    :param  serial:         serial number of the camera
+    :param  roi:            (offset_x, offset_y, width, height) of the sensor region
+    :param  pixel_format:   GxPixelFormatEntry
+    :return FlatFieldCoefficients, None when no coefficients were saved for them
+    """
+    path = get_coefficients_path(directory, serial, roi, pixel_format)
+    if not os.path.exists(path):
+        return None
+
+    coefficients = np.load(path, mmap_mode="r")
+    if coefficients.shape != (2, roi[3], roi[2]) or coefficients.dtype != np.float32:
+        print("load_coefficients: %s is not a coefficients file of the ROI" % path)
+        return None
+    return FlatFieldCoefficients(
+        coefficients[0], coefficients[1], pixel_format, serial, roi
+    )
+
+
+class _RunningMean:
+    def __init__(self, height, width):
+        """
+        :brief  Mean of frames updated in place, mean += (frame - mean) / n
+        """
+        self.mean = np.zeros((height, width), dtype=np.float32)
+        self.count = 0
+        self.__scratch = np.empty((height, width), dtype=np.float32)
+
+    def add(self, values, workers):
+        self.count += 1
+        weight = np.float32(1.0 / self.count)
+        mean = self.mean
+        scratch = self.__scratch
+
+        def add_band(first, last):
+            delta = scratch[first:last]
+            np.subtract(values[first:last], mean[first:last], out=delta)
+            delta *= weight
+            mean[first:last] += delta
+
+        run_bands(add_band, mean.shape[0], workers)
+
+
+class FlatFieldCalibration:
+    def __init__(self, width, height, pixel_format):
+        """
+        :brief  Builder of flat field correction coefficients from the means of
+                bright frames, a uniformly lit target, and dark frames, the lens
+                covered. The frames are added one at a time into running float32
+                means and are not kept
+        :param  width:          frame width
+        :param  height:         frame height
+        :param  pixel_format:   GxPixelFormatEntry of the frames, mono or bayer
+        """
+        layout = get_pixel_format_layout(pixel_format)
+        if layout is None or layout.channels != 1:
+            raise InvalidParameterError(
+                "FlatFieldCalibration: pixel format %s is not mono or bayer"
+                % hex(pixel_format)
+            )
+
+        self.__width = width
+        self.__height = height
+        self.__pixel_format = pixel_format
+        self.__layout = layout
+        self.__bright = _RunningMean(height, width)
+        self.__dark = _RunningMean(height, width)
+        self.__scratch = np.empty((height, width), dtype=np.uint16)
+        self.__mutex = threading.Lock()
+
+    def get_bright_count(self):
+        """
+        :brief  Number of bright frames added
+        """
+        return self.__bright.count
+
+    def get_dark_count(self):
+        """
+        :brief  Number of dark frames added
+        """
+        return self.__dark.count
+
+    def reset(self):
+        """
+        :brief  Forget the frames added
+        :return None
+        """
+        with self.__mutex:
+            self.__bright = _RunningMean(self.__height, self.__width)
+            self.__dark = _RunningMean(self.__height, self.__width)
+
+    def __add(self, image, dark, workers, func_name):
+        with self.__mutex:
+            values = get_pixel_values(
+                image,
+                self.__width,
+                self.__height,
+                self.__pixel_format,
+                self.__scratch,
+                func_name,
+            )
+            if values is None:
+                return False
+
+            if workers is None:
+                workers = get_default_workers(self.__width * self.__height)
+            running_mean = self.__dark if dark else self.__bright
+            running_mean.add(values, workers)
+            return True
+
+    def add_bright(self, image, workers=None):
+        """
+        :brief  Add a frame of a uniformly lit target
+        :param  image:      RawImage, or np.ndarray (height, width) of the pixel values
+        :param  workers:    number of row bands added in parallel,
+                            None: parallel.get_default_workers
+        :return True, False when the image does not match the calibration
+        """
+        return self.__add(image, False, workers, "FlatFieldCalibration.add_bright")
+
+    def add_dark(self, image, workers=None):
+        """
+        :brief  Add a frame taken with the lens covered
+        :param  image:      RawImage, or np.ndarray (height, width) of the pixel values
+        :param  workers:    number of row bands added in parallel,
+                            None: parallel.get_default_workers
+        :return True, False when the image does not match the calibration
+        """
+        return self.__add(image, True, workers, "FlatFieldCalibration.add_dark")
+
+    def add_frames(self, data_stream, count, dark=False, timeout=1000, workers=None):
+        """
+        :brief  Add count frames of a started data stream. The frames are read in
+                the driver buffers, with dq_buf(zero_copy=True), and queued back
+                once added; incomplete frames are skipped
+        :param  data_stream:    DataStream object, acquisition started
+        :param  count:          number of frames to add
+        :param  dark:           True: dark frames, False: bright frames
+        :param  timeout:        acquisition timeout of each frame, in ms
+        :param  workers:        number of row bands added in parallel,
+                                None: parallel.get_default_workers
+        :return number of frames added, less than count after a timeout or count
+                incomplete frames
+        """
+        added = 0
+        skipped = 0
+        while added < count and skipped < count:
+            image = data_stream.dq_buf(timeout, zero_copy=True)
+            if image is None:
+                print("FlatFieldCalibration.add_frames: acquisition timeout")
+                break
+
+            try:
+                if image.get_status() != GxFrameStatusList.SUCCESS:
+                    skipped += 1
+                elif self.__add(
+                    image, dark, workers, "FlatFieldCalibration.add_frames"
+                ):
+                    added += 1
+                else:
+                    break
+            finally:
+                data_stream.q_buf(image)
+        return added
+
+    def get_coefficients(self, target_value=None, serial="", roi=None):
+        """
+        :brief  Flat field correction coefficients of the frames added,
+                gain = target / (bright - dark); pixels not brighter than the dark
+                level keep a gain of 1
+        :param  target_value:   corrected value of the bright frames, None: mean of
+                                bright - dark of each color plane, which keeps the
+                                white balance of bayer frames
+        :param  serial:         serial number of the camera, see get_device_key
+        :param  roi:            (offset_x, offset_y, width, height) of the sensor region
+        :return FlatFieldCoefficients, None when no bright frame was added
+        """
+        with self.__mutex:
+            if self.__bright.count == 0:
+                print("FlatFieldCalibration.get_coefficients: no bright frame added")
+                return None
+
+            dark = self.__dark.mean.copy()
+            signal = self.__bright.mean - dark
+            valid = signal > 0
+            gain = np.ones_like(signal)
+
+            if target_value is not None:
+                np.divide(np.float32(target_value), signal, out=gain, where=valid)
+            elif self.__layout.color_filter == GxPixelColorFilterEntry.NONE:
+                target = signal[valid].mean() if valid.any() else 1.0
+                np.divide(np.float32(target), signal, out=gain, where=valid)
+            else:
+                for y in (0, 1):
+                    for x in (0, 1):
+                        plane_signal = signal[y::2, x::2]
+                        plane_valid = valid[y::2, x::2]
+                        if not plane_valid.any():
+                            continue
+                        np.divide(
+                            plane_signal[plane_valid].mean(),
+                            plane_signal,
+                            out=gain[y::2, x::2],
+                            where=plane_valid,
+                        )
+
+        return FlatFieldCoefficients(gain, dark, self.__pixel_format, serial, roi)
+
+
+def flat_field_correction(values, coefficients, out=None, workers=None):
+    """
+    :brief  Flat field correction with NumPy, without DxImageProc, for every mono
+            and bayer bit depth: round((values - dark) * gain), clipped to the
+            range of the pixel format
+    :param  values:         np.ndarray (height, width) of uint8 or uint16, the pixel
+                            values of an image of the calibrated pixel format
+    :param  coefficients:   FlatFieldCoefficients of the image geometry
+    :param  out:            np.ndarray of the shape and dtype of values receiving the
+                            corrected values, values itself to correct in place;
+                            None to allocate it
+    :param  workers:        number of row bands corrected in parallel,
+                            None: parallel.get_default_workers
+    :return out, or a new np.ndarray; None when the shapes are different
+    """
+    height, width = values.shape
+    if (coefficients.height, coefficients.width) != (height, width):
+        print(
+            "flat_field_correction: Expected values shape is %s, not %s"
+            % ((coefficients.height, coefficients.width), values.shape)
+        )
+        return None
+
+    if out is None:
+        out = np.empty_like(values)
+    if workers is None:
+        workers = get_default_workers(height * width)
+
+    layout = get_pixel_format_layout(coefficients.pixel_format)
+    max_value = np.float32((1 << layout.data_bits) - 1)
+    gain = coefficients.gain
+    dark = coefficients.dark
+
+    def correct_band(first, last):
+        corrected = np.subtract(values[first:last], dark[first:last], dtype=np.float32)
+        corrected *= gain[first:last]
+        corrected += np.float32(0.5)
+        np.clip(corrected, 0, max_value, out=corrected)
+        np.copyto(out[first:last], corrected, casting="unsafe")
+
+    run_bands(correct_band, height, workers)
+    return out
@@ -0,0 +1,256 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import collections
+import threading
+
+import numpy as np
+
+from .demosaic import _RED_POSITIONS
+from .errors import InvalidParameterError
+from .gxidef import GxFrameStatusList
+from .pixelformat import PACKING_NONE, get_pixel_format_layout
+
+# Channels of the histograms of bayer frames, mono frames have one GRAY channel
+RGB = "rgb"  # R, G, B, the two greens of the 2x2 cell together
+CFA = "cfa"  # R, Gr, Gb, B, one per position of the 2x2 cell
+GRAY = "gray"  # every sample together
+CHANNEL_LAYOUTS = (RGB, CFA, GRAY)
+
+FrameStatistics = collections.namedtuple(
+    "FrameStatistics",
+    [
+        "frame_id",
+        "timestamp",
+        "channels",
+        "histograms",
+        "bin_width",
+        "sample_count",
+        "means",
+        "mean",
+        "percentiles",
+        "clipped_low",
+        "clipped_high",
+    ],
+)
+
+
+def _get_cfa_names(color_filter):
+    """
+    :brief  Name of the color at every (dy, dx) of the 2x2 cell
+    """
+    red = _RED_POSITIONS[color_filter]
+    blue = (1 - red[0], 1 - red[1])
+    names = {red: "R", blue: "B", (red[0], blue[1]): "Gr", (blue[0], red[1]): "Gb"}
+    return [names[(dy, dx)] for dy in (0, 1) for dx in (0, 1)]
+
+
+class FrameStatisticsEngine:
+    def __init__(
+        self,
+        step=4,
+        bins=256,
+        channels=RGB,
+        roi=None,
+        weight_roi=None,
+        weight=1,
+        percentiles=(1, 50, 99),
+    ):
+        """
+        :brief  Histograms and exposure statistics of raw frames, computed with
+                np.bincount on strided views of every CFA position, without
+                converting the frames. Attach it with DataStream.set_frame_statistics
+                or call process with the frames
+        :param  step:           one sample of step x step is read in every CFA plane,
+                                i.e. one 2x2 cell of step x step for bayer frames
+        :param  bins:           number of histogram bins, a power of 2, values are
+                                binned on their high bits
+        :param  channels:       RGB, CFA or GRAY, for bayer frames
+        :param  roi:            (x, y, width, height) measured, None: whole frame
+        :param  weight_roi:     (x, y, width, height) of the samples counted weight
+                                times, e.g. the center for center-weighted metering
+        :param  weight:         int, weight of the samples of weight_roi
+        :param  percentiles:    percentiles of the pixel values returned, in [0, 100]
+        """
+        if not isinstance(step, int) or step < 1:
+            raise InvalidParameterError(
+                "FrameStatisticsEngine: step must be an int of at least 1"
+            )
+
+        if not isinstance(bins, int) or bins < 2 or bins & (bins - 1) or bins > 65536:
+            raise InvalidParameterError(
+                "FrameStatisticsEngine: bins must be a power of 2 in [2, 65536]"
+            )
+
+        if channels not in CHANNEL_LAYOUTS:
+            raise InvalidParameterError(
+                "FrameStatisticsEngine: channels out of bounds, %s"
+                % CHANNEL_LAYOUTS.__str__()
+            )
+
+        if not isinstance(weight, int) or weight < 1:
+            raise InvalidParameterError(
+                "FrameStatisticsEngine: weight must be an int of at least 1"
+            )
+
+        self.__step = step
+        self.__bins = bins
+        self.__channels = channels
+        self.__roi = roi
+        self.__weight_roi = weight_roi
+        self.__weight = weight
+        self.__percentiles = np.asarray(percentiles, dtype=np.float64)
+        self.__last = None
+        self.__mutex = threading.Lock()
+
+    def get_last(self):
+        """
+        :brief  Statistics of the last frame processed
+        :return FrameStatistics, None before the first frame
+        """
+        return self.__last
+
+    def __histogram(self, plane, shift, total):
+        """
+        :brief  Add the histogram of the samples of a strided view to total
+        """
+        samples = plane.reshape(-1)
+        if shift:
+            samples = samples >> shift
+        total += np.bincount(samples, minlength=self.__bins)
+
+    @staticmethod
+    def __plane_range(first, last, origin, stride):
+        """
+        :brief  Sample indices of a CFA plane starting at origin with stride that
+                fall in [first, last)
+        """
+        first_index = -(-(first - origin) // stride)
+        last_index = -(-(last - origin) // stride)
+        return max(0, first_index), max(0, last_index)
+
+    def process(self, image):
+        """
+        :brief  Compute the statistics of a frame, packed formats: only the sampled
+                rows are unpacked
+        :param  image:  RawImage, mono or bayer, 8 to 16 bit
+        :return FrameStatistics(frame_id, timestamp, channels, histograms, bin_width,
+                sample_count, means, mean, percentiles, clipped_low, clipped_high):
+                histograms is an np.ndarray (channel number, bins) of int64 counts,
+                bin i holds the values [i * bin_width, (i + 1) * bin_width);
+                means per channel and mean of every sample in pixel values,
+                percentiles in pixel values (bin centers), clipped_low and
+                clipped_high the fractions of samples in the first and last bin.
+                None for incomplete frames and formats that are not mono or bayer
+        """
+        if image.get_status() != GxFrameStatusList.SUCCESS:
+            return None
+
+        layout = get_pixel_format_layout(image.get_pixel_format())
+        if layout is None or layout.channels != 1:
+            return None
+
+        width = image.get_width()
+        height = image.get_height()
+        cfa = 1 if layout.color_filter not in _RED_POSITIONS else 2
+        stride = cfa * self.__step
+        shift = max(0, layout.data_bits - self.__bins.bit_length() + 1)
+
+        # measured region, whole CFA cells
+        x, y, roi_width, roi_height = self.__roi or (0, 0, width, height)
+        x0 = x + x % cfa
+        y0 = y + y % cfa
+        x1 = x0 + (min(x + roi_width, width) - x0) // cfa * cfa
+        y1 = y0 + (min(y + roi_height, height) - y0) // cfa * cfa
+        if x1 <= x0 or y1 <= y0:
+            return None
+
+        if layout.packing == PACKING_NONE:
+            values = image.get_numpy_array(view=True)
+        else:
+            first_rows = np.arange(y0, y1, stride)
+            rows = (first_rows[:, np.newaxis] + np.arange(cfa)).reshape(-1)
+            values = image.get_numpy_rows(rows)
+        if values is None:
+            return None
+
+        histograms = np.zeros((cfa * cfa, self.__bins), dtype=np.int64)
+        for position in range(cfa * cfa):
+            dy, dx = divmod(position, cfa)
+            if layout.packing == PACKING_NONE:
+                plane = values[y0 + dy : y1 : stride, x0 + dx : x1 : stride]
+            else:
+                plane = values[dy::cfa, x0 + dx : x1 : stride]
+            self.__histogram(plane, shift, histograms[position])
+
+            if self.__weight_roi is not None and self.__weight > 1:
+                wx, wy, weight_width, weight_height = self.__weight_roi
+                row_first, row_last = self.__plane_range(
+                    wy, wy + weight_height, y0 + dy, stride
+                )
+                column_first, column_last = self.__plane_range(
+                    wx, wx + weight_width, x0 + dx, stride
+                )
+                weighted = np.zeros(self.__bins, dtype=np.int64)
+                self.__histogram(
+                    plane[row_first:row_last, column_first:column_last],
+                    shift,
+                    weighted,
+                )
+                histograms[position] += (self.__weight - 1) * weighted
+
+        if cfa == 1 or self.__channels == GRAY:
+            names = ("gray",)
+            histograms = histograms.sum(axis=0, keepdims=True)
+        else:
+            cfa_names = _get_cfa_names(layout.color_filter)
+            if self.__channels == CFA:
+                names = tuple(cfa_names)
+            else:
+                names = ("R", "G", "B")
+                histograms = np.stack(
+                    [
+                        histograms[cfa_names.index("R")],
+                        histograms[cfa_names.index("Gr")]
+                        + histograms[cfa_names.index("Gb")],
+                        histograms[cfa_names.index("B")],
+                    ]
+                )
+
+        statistics = self.__summarize(image, names, histograms, 1 << shift)
+        with self.__mutex:
+            self.__last = statistics
+        return statistics
+
+    def __summarize(self, image, names, histograms, bin_width):
+        """
+        :brief  FrameStatistics of the channel histograms
+        """
+        centers = np.arange(self.__bins) * bin_width + (bin_width - 1) / 2
+        counts = histograms.sum(axis=1)
+        means = histograms @ centers / np.maximum(counts, 1)
+
+        total = histograms.sum(axis=0)
+        sample_count = int(total.sum())
+        if sample_count == 0:
+            return None
+        cumulative = np.cumsum(total)
+        percentiles = centers[
+            np.searchsorted(cumulative, self.__percentiles / 100 * sample_count).clip(
+                0, self.__bins - 1
+            )
+        ]
+        return FrameStatistics(
+            image.get_frame_id(),
+            image.get_timestamp(),
+            names,
+            histograms,
+            bin_width,
+            sample_count,
+            means,
+            float(total @ centers / sample_count),
+            percentiles,
+            total[0] / sample_count,
+            total[-1] / sample_count,
+        )
@@ -1291,6 +1291,15 @@ class DxRGBChannelOrder:
         pass
 
 
+class GxQueueOverflowPolicy:
+    DROP_OLDEST = 0  # discard the oldest queued frame to make room
+    DROP_NEWEST = 1  # discard the incoming frame
+    BLOCK = 2  # wait until the consumer makes room
+
+    def __init__(self):
+        pass
+
+
 # Image Info
 class GxImageInfo:
     image_width = 0
@@ -0,0 +1,2032 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import collections
+import ctypes as ct
+import math
+import threading
+import time
+
+import numpy as np
+
+import pygxi.gxwrapper as gx
+
+from .gxidef import (
+    GxAccessStatus,
+    GxAcquisitionModeEntry,
+    GxAutoEntry,
+    GxBalanceRatioSelectorEntry,
+    GxDeviceClassList,
+    GxDSStreamBufferHandlingModeEntry,
+    GxFrameStatusList,
+    GxGainSelectorEntry,
+    GxPixelColorFilterEntry,
+    GxPixelFormatEntry,
+    GxSwitchEntry,
+    GxTLClassList,
+    GxTriggerSelectorEntry,
+    GxTriggerSourceEntry,
+)
+from .pixelformat import (
+    get_pixel_format_layout,
+    get_pixel_format_size,
+    pack_pixels,
+)
+
+INTERFACE_HANDLE = 0x1000
+TIMESTAMP_TICK_FREQUENCY = 1000000000
+STRING_MAX_LENGTH = 64
+
+# (dy, dx) of the red, green and blue pixel of a 2x2 bayer cell, red first row
+_BAYER_CELL_CHANNELS = {
+    GxPixelColorFilterEntry.BAYER_RG: ((0, 1), (1, 2)),
+    GxPixelColorFilterEntry.BAYER_GB: ((1, 2), (0, 1)),
+    GxPixelColorFilterEntry.BAYER_GR: ((1, 0), (2, 1)),
+    GxPixelColorFilterEntry.BAYER_BG: ((2, 1), (1, 0)),
+}
+
+
+def _value(argument):
+    """
+    :brief  Python value of an argument, passed as a ctypes object or as a Python value
+    """
+    if isinstance(argument, ct._SimpleCData):
+        return argument.value
+    return argument
+
+
+def _target(pointer):
+    """
+    :brief  ctypes object an argument points to, passed with ct.byref or ct.pointer
+    """
+    obj = getattr(pointer, "_obj", None)
+    if obj is not None:
+        return obj
+    return pointer.contents
+
+
+def _string(argument):
+    """
+    :brief  str of an argument, passed as bytes, c_char_p, a string buffer or byref of it
+    """
+    argument = getattr(argument, "_obj", argument)
+    if isinstance(argument, (ct.Array, ct.c_char_p)):
+        argument = argument.value
+    return argument.decode("utf-8")
+
+
+def _write_string(buffer, size, content):
+    """
+    :brief  Two-call string protocol of GxIAPI: with buffer None only the size is set
+    :param  buffer:     byref of the string buffer, or None
+    :param  size:       byref of the c_size_t buffer size, set to the size needed
+    :param  content:    str
+    :return GxStatusList
+    """
+    data = content.encode("utf-8") + b"\0"
+    size = _target(size)
+    if buffer is None:
+        size.value = len(data)
+        return gx.GxStatusList.SUCCESS
+
+    if size.value < len(data):
+        size.value = len(data)
+        return gx.GxStatusList.NEED_MORE_BUFFER
+
+    ct.memmove(_target(buffer), data, len(data))
+    size.value = len(data)
+    return gx.GxStatusList.SUCCESS
+
+
+class SimulatedCamera:
+    def __init__(
+        self,
+        serial_number="SIM0000001",
+        model_name="MER2-SIM-U3C",
+        vendor_name="Simulated",
+        user_id="",
+        width=1920,
+        height=1080,
+        pixel_format=GxPixelFormatEntry.BAYER_RG8,
+        frame_rate=30.0,
+        packet_loss_rate=0.0,
+        packet_size=16384,
+        incomplete_frame_rate=0.0,
+        timestamp_jitter=0.0,
+        buffer_number=5,
+        scene_color=(0.55, 1.0, 0.75),
+        seed=0,
+    ):
+        """
+        :brief  Configuration of a camera of the simulated backend
+        :param serial_number:           device serial number
+        :param model_name:              device model name
+        :param vendor_name:             device vendor name
+        :param user_id:                 user defined device name
+        :param width:                   sensor width, multiple of 8
+        :param height:                  sensor height, multiple of 2
+        :param pixel_format:            pixel format after opening, mono, bayer, RGB8 or BGR8
+                                        PixelFormat offers the 8, 10 and 12 bit variants of it
+        :param frame_rate:              frames per second, None: a frame is ready whenever
+                                        a driver buffer is free
+        :param packet_loss_rate:        probability that a packet is lost, lost packets are
+                                        zeroed and the frame is delivered incomplete
+        :param packet_size:             bytes per packet
+        :param incomplete_frame_rate:   probability that a frame is cut short, the rest of
+                                        the frame is zeroed and it is delivered incomplete
+        :param timestamp_jitter:        standard deviation of the timestamps in seconds
+        :param buffer_number:           number of driver buffers
+        :param scene_color:             (red, green, blue) reflectance of the scene,
+                                        applied before BalanceRatio
+        :param seed:                    seed of the random packet loss, frame cuts and jitter,
+                                        the same seed gives the same frames
+        """
+        # errors imports gxwrapper, which imports this module
+        from .errors import InvalidParameterError
+
+        layout = get_pixel_format_layout(pixel_format)
+        if layout is None or (layout.channels == 3 and layout.data_bits != 8):
+            raise InvalidParameterError(
+                "SimulatedCamera: unsupported pixel format %s" % hex(pixel_format)
+            )
+
+        if width < 8 or width % 8 or height < 2 or height % 2:
+            raise InvalidParameterError(
+                "SimulatedCamera: width must be a multiple of 8 and height a multiple of 2"
+            )
+
+        if frame_rate is not None and frame_rate <= 0:
+            raise InvalidParameterError("SimulatedCamera: frame_rate must be positive")
+
+        if not (0 <= packet_loss_rate <= 1 and 0 <= incomplete_frame_rate <= 1):
+            raise InvalidParameterError(
+                "SimulatedCamera: packet_loss_rate and incomplete_frame_rate "
+                "must be in [0, 1]"
+            )
+
+        if packet_size < 1 or buffer_number < 1:
+            raise InvalidParameterError(
+                "SimulatedCamera: packet_size and buffer_number must be positive"
+            )
+
+        self.serial_number = serial_number
+        self.model_name = model_name
+        self.vendor_name = vendor_name
+        self.user_id = user_id
+        self.width = width
+        self.height = height
+        self.pixel_format = pixel_format
+        self.frame_rate = frame_rate
+        self.packet_loss_rate = packet_loss_rate
+        self.packet_size = packet_size
+        self.incomplete_frame_rate = incomplete_frame_rate
+        self.timestamp_jitter = timestamp_jitter
+        self.buffer_number = buffer_number
+        self.scene_color = tuple(scene_color)
+        self.seed = seed
+
+    def get_pixel_formats(self):
+        """
+        :brief  Pixel formats offered by PixelFormat: the 8, 10 and 12 bit variants,
+                unpacked and packed, of the configured pixel format
+        :return list of GxPixelFormatEntry
+        """
+        layout = get_pixel_format_layout(self.pixel_format)
+        if layout.channels == 3:
+            return [GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8]
+
+        pixel_formats = []
+        for name in dir(GxPixelFormatEntry):
+            if name.startswith("_"):
+                continue
+            pixel_format = getattr(GxPixelFormatEntry, name)
+            candidate = get_pixel_format_layout(pixel_format)
+            if (
+                candidate is not None
+                and candidate.channels == 1
+                and candidate.color_filter == layout.color_filter
+                and candidate.data_bits in (8, 10, 12)
+                and name.startswith(("MONO", "BAYER"))
+            ):
+                pixel_formats.append(pixel_format)
+        return sorted(pixel_formats)
+
+
+class _SimulatedNode:
+    def __init__(
+        self,
+        name,
+        feature_id,
+        value=None,
+        limits=None,
+        entries=None,
+        unit="",
+        read_only=False,
+        locked=False,
+        getter=None,
+        setter=None,
+    ):
+        """
+        :brief  Feature node of a simulated camera
+        :param name:        GenICam feature name
+        :param feature_id:  GxFeatureID, the feature type is read from it
+        :param value:       initial value, unused with a getter
+        :param limits:      int and float nodes: (min, max, inc) or a function returning it
+        :param entries:     enum nodes: list of (value, symbolic)
+        :param unit:        float nodes: unit
+        :param read_only:   True: the node can't be written
+        :param locked:      True: the node is read-only while acquiring
+        :param getter:      function returning the value
+        :param setter:      function called with the checked new value,
+                            commands: function called when the command is executed
+        """
+        self.name = name
+        self.feature_id = feature_id
+        self.feature_type = feature_id & gx.GxFrameMask.TYPE_MASK
+        self.value = value
+        self.entries = entries or []
+        self.unit = unit
+        self.read_only = read_only
+        self.locked = locked
+        self.__limits = limits
+        self.__getter = getter
+        self.__setter = setter
+
+    def get_access_mode(self, acquiring):
+        """
+        :brief  GxNodeAccessMode of the node
+        """
+        if self.feature_type == gx.GxFeatureType.COMMAND:
+            return gx.GxNodeAccessMode.MODE_WO
+        if self.read_only or (self.locked and acquiring):
+            return gx.GxNodeAccessMode.MODE_RO
+        return gx.GxNodeAccessMode.MODE_RW
+
+    def get_limits(self):
+        """
+        :brief  (min, max, inc) of an int or float node
+        """
+        if callable(self.__limits):
+            return self.__limits()
+        return self.__limits
+
+    def get_value(self):
+        if self.__getter is not None:
+            return self.__getter()
+        return self.value
+
+    def get_symbolic(self, value):
+        for entry_value, symbolic in self.entries:
+            if entry_value == value:
+                return symbolic
+        return ""
+
+    def check_value(self, value):
+        """
+        :brief  Check a new value against the node type and range
+        :return GxStatusList
+        """
+        if self.feature_type == gx.GxFeatureType.INT:
+            minimum, maximum, increment = self.get_limits()
+            if value < minimum or value > maximum or (value - minimum) % increment:
+                return gx.GxStatusList.OUT_OF_RANGE
+        elif self.feature_type == gx.GxFeatureType.FLOAT:
+            minimum, maximum, _ = self.get_limits()
+            if not (minimum <= value <= maximum):
+                return gx.GxStatusList.OUT_OF_RANGE
+        elif self.feature_type == gx.GxFeatureType.ENUM:
+            if value not in [entry_value for entry_value, _ in self.entries]:
+                return gx.GxStatusList.OUT_OF_RANGE
+        elif self.feature_type == gx.GxFeatureType.STRING:
+            if len(value.encode("utf-8")) > STRING_MAX_LENGTH:
+                return gx.GxStatusList.OUT_OF_RANGE
+        return gx.GxStatusList.SUCCESS
+
+    def set_value(self, value):
+        if self.__setter is not None:
+            self.__setter(value)
+        else:
+            self.value = value
+
+    def execute(self):
+        if self.__setter is not None:
+            self.__setter(None)
+
+
+class _SimulatedDevice:
+    def __init__(self, camera):
+        """
+        :brief  State of an opened simulated camera: feature nodes, driver buffers
+                and the frame clock
+        :param camera:  SimulatedCamera
+        """
+        self.camera = camera
+        self.__condition = threading.Condition(threading.RLock())
+        self.__clock_start = time.perf_counter()
+
+        self.__acquiring = False
+        self.__acquisition_start = 0.0
+        self.__next_frame_index = 0
+        self.__frame_id = 0
+        self.__triggers = collections.deque()
+
+        # driver buffers: (GxFrameBuffer, c_ubyte array), indexed by buf_id
+        self.__buffers = []
+        self.__buffer_number = camera.buffer_number
+        self.__free_buffers = collections.deque()
+        self.__output_buffers = collections.deque()
+        self.__user_buffers = set()
+
+        self.__pattern = None
+        self.__pattern_key = None
+
+        self.__delivered_frame_count = 0
+        self.__lost_frame_count = 0
+        self.__incomplete_frame_count = 0
+        self.__delivered_packet_count = 0
+        self.__timestamp_latch_value = 0
+
+        self.__capture_callback = None
+        self.__capture_user_param = None
+        self.__capture_thread = None
+
+        # key: feature name, value: dict of callback handle: (callback, user param, by name)
+        self.__feature_callbacks = collections.defaultdict(dict)
+        self.__balance_ratios = {
+            GxBalanceRatioSelectorEntry.RED: 1.0,
+            GxBalanceRatioSelectorEntry.GREEN: 1.0,
+            GxBalanceRatioSelectorEntry.BLUE: 1.0,
+        }
+
+        self.__nodes = {}
+        self.__nodes_by_id = {}
+        self.__build_nodes()
+
+    def __add_node(self, node):
+        self.__nodes[node.name] = node
+        self.__nodes_by_id[node.feature_id] = node
+
+    def __build_nodes(self):
+        camera = self.camera
+        layout = get_pixel_format_layout(camera.pixel_format)
+        is_color = layout.channels == 3 or (
+            layout.color_filter != GxPixelColorFilterEntry.NONE
+        )
+        feature_id = gx.GxFeatureID
+        node = _SimulatedNode
+
+        for name, feature, value in (
+            (
+                "DeviceVendorName",
+                feature_id.STRING_DEVICE_VENDOR_NAME,
+                camera.vendor_name,
+            ),
+            ("DeviceModelName", feature_id.STRING_DEVICE_MODEL_NAME, camera.model_name),
+            ("DeviceFirmwareVersion", feature_id.STRING_DEVICE_FIRMWARE_VERSION, "1.0"),
+            ("DeviceVersion", feature_id.STRING_DEVICE_VERSION, "1.0"),
+            (
+                "DeviceSerialNumber",
+                feature_id.STRING_DEVICE_SERIAL_NUMBER,
+                camera.serial_number,
+            ),
+        ):
+            self.__add_node(node(name, feature, value, read_only=True))
+        self.__add_node(
+            node(
+                "DeviceUserID",
+                feature_id.STRING_DEVICE_USER_ID,
+                getter=lambda: camera.user_id,
+                setter=lambda value: setattr(camera, "user_id", value),
+            )
+        )
+
+        self.__add_node(
+            node(
+                "SensorWidth", feature_id.INT_SENSOR_WIDTH, camera.width, read_only=True
+            )
+        )
+        self.__add_node(
+            node(
+                "SensorHeight",
+                feature_id.INT_SENSOR_HEIGHT,
+                camera.height,
+                read_only=True,
+            )
+        )
+        self.__add_node(
+            node(
+                "WidthMax",
+                feature_id.INT_WIDTH_MAX,
+                getter=lambda: camera.width - self.get_value("OffsetX"),
+                read_only=True,
+            )
+        )
+        self.__add_node(
+            node(
+                "HeightMax",
+                feature_id.INT_HEIGHT_MAX,
+                getter=lambda: camera.height - self.get_value("OffsetY"),
+                read_only=True,
+            )
+        )
+        self.__add_node(
+            node(
+                "Width",
+                feature_id.INT_WIDTH,
+                camera.width,
+                limits=lambda: (8, camera.width - self.get_value("OffsetX"), 8),
+                locked=True,
+            )
+        )
+        self.__add_node(
+            node(
+                "Height",
+                feature_id.INT_HEIGHT,
+                camera.height,
+                limits=lambda: (2, camera.height - self.get_value("OffsetY"), 2),
+                locked=True,
+            )
+        )
+        self.__add_node(
+            node(
+                "OffsetX",
+                feature_id.INT_OFFSET_X,
+                0,
+                limits=lambda: (0, camera.width - self.get_value("Width"), 8),
+                locked=True,
+            )
+        )
+        self.__add_node(
+            node(
+                "OffsetY",
+                feature_id.INT_OFFSET_Y,
+                0,
+                limits=lambda: (0, camera.height - self.get_value("Height"), 2),
+                locked=True,
+            )
+        )
+
+        pixel_format_entries = [
+            (pixel_format, _pixel_format_symbolic(pixel_format))
+            for pixel_format in camera.get_pixel_formats()
+        ]
+        self.__add_node(
+            node(
+                "PixelFormat",
+                feature_id.ENUM_PIXEL_FORMAT,
+                camera.pixel_format,
+                entries=pixel_format_entries,
+                locked=True,
+            )
+        )
+        self.__add_node(
+            node(
+                "PixelSize",
+                feature_id.ENUM_PIXEL_SIZE,
+                getter=lambda: (self.get_value("PixelFormat") >> 16) & 0xFF,
+                entries=[(bits, "Bpp%d" % bits) for bits in (8, 10, 12, 16, 24)],
+                read_only=True,
+            )
+        )
+        self.__add_node(
+            node(
+                "PixelColorFilter",
+                feature_id.ENUM_PIXEL_COLOR_FILTER,
+                layout.color_filter,
+                entries=[
+                    (GxPixelColorFilterEntry.NONE, "None"),
+                    (GxPixelColorFilterEntry.BAYER_RG, "BayerRG"),
+                    (GxPixelColorFilterEntry.BAYER_GB, "BayerGB"),
+                    (GxPixelColorFilterEntry.BAYER_GR, "BayerGR"),
+                    (GxPixelColorFilterEntry.BAYER_BG, "BayerBG"),
+                ],
+                read_only=True,
+            )
+        )
+        self.__add_node(
+            node(
+                "PayloadSize",
+                feature_id.INT_PAYLOAD_SIZE,
+                getter=self.get_payload_size,
+                read_only=True,
+            )
+        )
+
+        self.__add_node(
+            node(
+                "AcquisitionMode",
+                feature_id.ENUM_ACQUISITION_MODE,
+                GxAcquisitionModeEntry.CONTINUOUS,
+                entries=[(GxAcquisitionModeEntry.CONTINUOUS, "Continuous")],
+                locked=True,
+            )
+        )
+        self.__add_node(
+            node(
+                "AcquisitionStart",
+                feature_id.COMMAND_ACQUISITION_START,
+                setter=lambda _: self.start_acquisition(),
+            )
+        )
+        self.__add_node(
+            node(
+                "AcquisitionStop",
+                feature_id.COMMAND_ACQUISITION_STOP,
+                setter=lambda _: self.stop_acquisition(),
+            )
+        )
+        self.__add_node(
+            node(
+                "AcquisitionFrameRateMode",
+                feature_id.ENUM_ACQUISITION_FRAME_RATE_MODE,
+                GxSwitchEntry.OFF,
+                entries=[(GxSwitchEntry.OFF, "Off"), (GxSwitchEntry.ON, "On")],
+            )
+        )
+        self.__add_node(
+            node(
+                "AcquisitionFrameRate",
+                feature_id.FLOAT_ACQUISITION_FRAME_RATE,
+                float(camera.frame_rate or 1000.0),
+                limits=(0.1, 100000.0, 0.0),
+                unit="Hz",
+            )
+        )
+        self.__add_node(
+            node(
+                "CurrentAcquisitionFrameRate",
+                feature_id.FLOAT_CURRENT_ACQUISITION_FRAME_RATE,
+                getter=self.get_frame_rate,
+                limits=(0.0, math.inf, 0.0),
+                unit="Hz",
+                read_only=True,
+            )
+        )
+
+        self.__add_node(
+            node(
+                "TriggerSelector",
+                feature_id.ENUM_TRIGGER_SELECTOR,
+                GxTriggerSelectorEntry.FRAME_START,
+                entries=[(GxTriggerSelectorEntry.FRAME_START, "FrameStart")],
+            )
+        )
+        self.__add_node(
+            node(
+                "TriggerMode",
+                feature_id.ENUM_TRIGGER_MODE,
+                GxSwitchEntry.OFF,
+                entries=[(GxSwitchEntry.OFF, "Off"), (GxSwitchEntry.ON, "On")],
+            )
+        )
+        self.__add_node(
+            node(
+                "TriggerSource",
+                feature_id.ENUM_TRIGGER_SOURCE,
+                GxTriggerSourceEntry.SOFTWARE,
+                entries=[(GxTriggerSourceEntry.SOFTWARE, "Software")],
+            )
+        )
+        self.__add_node(
+            node(
+                "TriggerSoftware",
+                feature_id.COMMAND_TRIGGER_SOFTWARE,
+                setter=lambda _: self.trigger_software(),
+            )
+        )
+
+        self.__add_node(
+            node(
+                "ExposureTime",
+                feature_id.FLOAT_EXPOSURE_TIME,
+                10000.0,
+                limits=(20.0, 1000000.0, 0.0),
+                unit="us",
+            )
+        )
+        self.__add_node(
+            node(
+                "ExposureAuto",
+                feature_id.ENUM_EXPOSURE_AUTO,
+                GxAutoEntry.OFF,
+                entries=[(GxAutoEntry.OFF, "Off")],
+            )
+        )
+        self.__add_node(
+            node(
+                "GainSelector",
+                feature_id.ENUM_GAIN_SELECTOR,
+                GxGainSelectorEntry.ALL,
+                entries=[(GxGainSelectorEntry.ALL, "AnalogAll")],
+            )
+        )
+        self.__add_node(
+            node(
+                "Gain",
+                feature_id.FLOAT_GAIN,
+                0.0,
+                limits=(0.0, 24.0, 0.0),
+                unit="dB",
+            )
+        )
+        self.__add_node(
+            node(
+                "GainAuto",
+                feature_id.ENUM_GAIN_AUTO,
+                GxAutoEntry.OFF,
+                entries=[(GxAutoEntry.OFF, "Off")],
+            )
+        )
+        if is_color:
+            self.__add_node(
+                node(
+                    "BalanceWhiteAuto",
+                    feature_id.ENUM_BALANCE_WHITE_AUTO,
+                    GxAutoEntry.OFF,
+                    entries=[(GxAutoEntry.OFF, "Off")],
+                )
+            )
+            self.__add_node(
+                node(
+                    "BalanceRatioSelector",
+                    feature_id.ENUM_BALANCE_RATIO_SELECTOR,
+                    GxBalanceRatioSelectorEntry.RED,
+                    entries=[
+                        (GxBalanceRatioSelectorEntry.RED, "Red"),
+                        (GxBalanceRatioSelectorEntry.GREEN, "Green"),
+                        (GxBalanceRatioSelectorEntry.BLUE, "Blue"),
+                    ],
+                )
+            )
+            self.__add_node(
+                node(
+                    "BalanceRatio",
+                    feature_id.FLOAT_BALANCE_RATIO,
+                    getter=lambda: self.__balance_ratios[
+                        self.get_value("BalanceRatioSelector")
+                    ],
+                    setter=lambda value: self.__balance_ratios.__setitem__(
+                        self.get_value("BalanceRatioSelector"), value
+                    ),
+                    limits=(0.0, 15.998, 0.0),
+                )
+            )
+
+        self.__add_node(
+            node(
+                "TimestampTickFrequency",
+                feature_id.INT_TIMESTAMP_TICK_FREQUENCY,
+                TIMESTAMP_TICK_FREQUENCY,
+                read_only=True,
+            )
+        )
+        self.__add_node(
+            node(
+                "TimestampLatch",
+                feature_id.COMMAND_TIMESTAMP_LATCH,
+                setter=lambda _: self.__latch_timestamp(),
+            )
+        )
+        self.__add_node(
+            node(
+                "TimestampLatchValue",
+                feature_id.INT_TIMESTAMP_LATCH_VALUE,
+                getter=lambda: self.__timestamp_latch_value,
+                read_only=True,
+            )
+        )
+
+        for name, feature, getter in (
+            (
+                "StreamAnnouncedBufferCount",
+                feature_id.INT_ANNOUNCED_BUFFER_COUNT,
+                lambda: len(self.__buffers),
+            ),
+            (
+                "StreamDeliveredFrameCount",
+                feature_id.INT_DELIVERED_FRAME_COUNT,
+                lambda: self.__delivered_frame_count,
+            ),
+            (
+                "StreamLostFrameCount",
+                feature_id.INT_LOST_FRAME_COUNT,
+                lambda: self.__lost_frame_count,
+            ),
+            (
+                "StreamIncompleteFrameCount",
+                feature_id.INT_INCOMPLETE_FRAME_COUNT,
+                lambda: self.__incomplete_frame_count,
+            ),
+            (
+                "StreamDeliveredPacketCount",
+                feature_id.INT_DELIVERED_PACKET_COUNT,
+                lambda: self.__delivered_packet_count,
+            ),
+        ):
+            self.__add_node(node(name, feature, getter=getter, read_only=True))
+        self.__add_node(
+            node(
+                "StreamBufferHandlingMode",
+                feature_id.ENUM_STREAM_BUFFER_HANDLING_MODE,
+                GxDSStreamBufferHandlingModeEntry.OLDEST_FIRST,
+                entries=[
+                    (GxDSStreamBufferHandlingModeEntry.OLDEST_FIRST, "OldestFirst"),
+                    (
+                        GxDSStreamBufferHandlingModeEntry.OLDEST_FIRST_OVERWRITE,
+                        "OldestFirstOverwrite",
+                    ),
+                    (GxDSStreamBufferHandlingModeEntry.NEWEST_ONLY, "NewestOnly"),
+                ],
+            )
+        )
+
+    def get_node(self, key):
+        """
+        :brief  Feature node by GenICam name or by GxFeatureID
+        :return _SimulatedNode, None when the feature is not implemented
+        """
+        if isinstance(key, str):
+            return self.__nodes.get(key)
+        return self.__nodes_by_id.get(key)
+
+    def get_value(self, name):
+        return self.__nodes[name].get_value()
+
+    def get_access_mode(self, node):
+        return node.get_access_mode(self.__acquiring)
+
+    def is_readable(self, node):
+        return self.get_access_mode(node) in (
+            gx.GxNodeAccessMode.MODE_RO,
+            gx.GxNodeAccessMode.MODE_RW,
+        )
+
+    def is_writable(self, node):
+        return self.get_access_mode(node) in (
+            gx.GxNodeAccessMode.MODE_WO,
+            gx.GxNodeAccessMode.MODE_RW,
+        )
+
+    def read(self, node):
+        """
+        :brief  Read a node value
+        :return status, value
+        """
+        if not self.is_readable(node):
+            return gx.GxStatusList.INVALID_ACCESS, None
+        with self.__condition:
+            return gx.GxStatusList.SUCCESS, node.get_value()
+
+    def write(self, node, value):
+        """
+        :brief  Write a node value or execute a command node, then call the
+                feature callbacks registered on it
+        :return GxStatusList
+        """
+        if not self.is_writable(node):
+            return gx.GxStatusList.INVALID_ACCESS
+
+        with self.__condition:
+            if node.feature_type == gx.GxFeatureType.COMMAND:
+                node.execute()
+            else:
+                status = node.check_value(value)
+                if status != gx.GxStatusList.SUCCESS:
+                    return status
+                node.set_value(value)
+
+        if node.feature_type != gx.GxFeatureType.COMMAND:
+            self.__call_feature_callbacks([node])
+        return gx.GxStatusList.SUCCESS
+
+    def register_feature_callback(
+        self, node, callback_handle, callback, user_param, by_name
+    ):
+        self.__feature_callbacks[node.name][callback_handle] = (
+            callback,
+            user_param,
+            by_name,
+        )
+
+    def unregister_feature_callback(self, node, callback_handle):
+        return (
+            self.__feature_callbacks[node.name].pop(callback_handle, None) is not None
+        )
+
+    def __call_feature_callbacks(self, nodes):
+        for node in nodes:
+            callbacks = list(self.__feature_callbacks.get(node.name, {}).values())
+            for callback, user_param, by_name in callbacks:
+                if by_name:
+                    callback(node.name.encode("utf-8"), user_param)
+                else:
+                    callback(node.feature_id, user_param)
+
+    def __latch_timestamp(self):
+        self.__timestamp_latch_value = self.__get_timestamp(time.perf_counter())
+
+    def __get_timestamp(self, clock_time):
+        return max(int((clock_time - self.__clock_start) * TIMESTAMP_TICK_FREQUENCY), 0)
+
+    def get_payload_size(self):
+        return get_pixel_format_size(
+            self.get_value("PixelFormat"),
+            self.get_value("Width"),
+            self.get_value("Height"),
+        )
+
+    def get_frame_period(self):
+        """
+        :brief  Seconds between two frames in continuous mode
+        :return period, None when the frame rate is unlimited
+        """
+        frame_rate = self.camera.frame_rate
+        if self.get_value("AcquisitionFrameRateMode") == GxSwitchEntry.ON:
+            requested = self.get_value("AcquisitionFrameRate")
+            frame_rate = requested if frame_rate is None else min(frame_rate, requested)
+        if frame_rate is None:
+            return None
+        return 1.0 / frame_rate
+
+    def get_frame_rate(self):
+        period = self.get_frame_period()
+        return 0.0 if period is None else 1.0 / period
+
+    def set_buffer_number(self, buffer_number):
+        """
+        :brief  Number of driver buffers allocated on the next acquisition start
+        :return GxStatusList
+        """
+        if buffer_number < 1:
+            return gx.GxStatusList.OUT_OF_RANGE
+        if self.__acquiring:
+            return gx.GxStatusList.INVALID_CALL
+        self.__buffer_number = buffer_number
+        return gx.GxStatusList.SUCCESS
+
+    def is_acquiring(self):
+        return self.__acquiring
+
+    def start_acquisition(self):
+        with self.__condition:
+            if self.__acquiring:
+                return
+
+            payload_size = self.get_payload_size()
+            if (
+                len(self.__buffers) != self.__buffer_number
+                or ct.sizeof(self.__buffers[0][1]) != payload_size
+            ):
+                # buffers of the previous acquisition are kept until here,
+                # images still wrapping them stay readable
+                self.__buffers = []
+                for buf_id in range(self.__buffer_number):
+                    frame_buffer = gx.GxFrameBuffer()
+                    data = (ct.c_ubyte * payload_size)()
+                    frame_buffer.buf_id = buf_id
+                    frame_buffer.image_buf = ct.addressof(data)
+                    self.__buffers.append((frame_buffer, data))
+
+            self.__free_buffers = collections.deque(range(len(self.__buffers)))
+            self.__output_buffers.clear()
+            self.__user_buffers.clear()
+            self.__triggers.clear()
+            self.__next_frame_index = 0
+            self.__acquisition_start = time.perf_counter()
+            self.__acquiring = True
+            self.__condition.notify_all()
+
+        self.__call_feature_callbacks(self.__get_locked_nodes())
+
+    def stop_acquisition(self):
+        with self.__condition:
+            if not self.__acquiring:
+                return
+            self.__acquiring = False
+            self.__output_buffers.clear()
+            self.__user_buffers.clear()
+            self.__free_buffers = collections.deque(range(len(self.__buffers)))
+            self.__condition.notify_all()
+
+        self.__call_feature_callbacks(self.__get_locked_nodes())
+
+    def __get_locked_nodes(self):
+        return [node for node in self.__nodes.values() if node.locked]
+
+    def trigger_software(self):
+        with self.__condition:
+            if (
+                self.__acquiring
+                and self.get_value("TriggerMode") == GxSwitchEntry.ON
+                and self.get_value("TriggerSource") == GxTriggerSourceEntry.SOFTWARE
+            ):
+                self.__triggers.append(time.perf_counter())
+                self.__condition.notify_all()
+
+    def __get_due_frames(self, now):
+        """
+        :brief  Frames the camera has sent since the last call
+        :return list of (frame id, nominal capture time)
+        """
+        if self.get_value("TriggerMode") == GxSwitchEntry.ON:
+            capture_times = list(self.__triggers)
+            self.__triggers.clear()
+        else:
+            period = self.get_frame_period()
+            if period is None:
+                if (
+                    self.get_value("StreamBufferHandlingMode")
+                    == GxDSStreamBufferHandlingModeEntry.NEWEST_ONLY
+                ):
+                    count = 0 if self.__output_buffers else 1
+                else:
+                    count = len(self.__free_buffers)
+                capture_times = [now] * count
+            else:
+                last_index = int((now - self.__acquisition_start) / period)
+                capture_times = [
+                    self.__acquisition_start + index * period
+                    for index in range(self.__next_frame_index, last_index + 1)
+                ]
+                self.__next_frame_index = max(self.__next_frame_index, last_index + 1)
+
+        frames = []
+        for capture_time in capture_times:
+            self.__frame_id += 1
+            frames.append((self.__frame_id, capture_time))
+        return frames
+
+    def __get_next_due_time(self, now):
+        """
+        :brief  Time of the next frame, None when it depends on a trigger or on a
+                buffer given back
+        """
+        if self.get_value("TriggerMode") == GxSwitchEntry.ON:
+            return None
+        period = self.get_frame_period()
+        if period is None:
+            return now if self.__free_buffers else None
+        return self.__acquisition_start + self.__next_frame_index * period
+
+    def __produce(self, now):
+        """
+        :brief  Fill the driver buffers with the frames sent since the last call,
+                the buffer handling mode decides which frames are kept
+        """
+        if not self.__acquiring:
+            return
+
+        frames = self.__get_due_frames(now)
+        if not frames:
+            return
+
+        mode = self.get_value("StreamBufferHandlingMode")
+        if mode == GxDSStreamBufferHandlingModeEntry.NEWEST_ONLY:
+            while self.__output_buffers:
+                self.__free_buffers.append(self.__output_buffers.popleft())
+                self.__lost_frame_count += 1
+            kept = frames[-1:] if self.__free_buffers else []
+        elif mode == GxDSStreamBufferHandlingModeEntry.OLDEST_FIRST_OVERWRITE:
+            capacity = len(self.__free_buffers) + len(self.__output_buffers)
+            kept = frames[len(frames) - min(capacity, len(frames)) :]
+            while len(self.__free_buffers) < len(kept):
+                self.__free_buffers.append(self.__output_buffers.popleft())
+                self.__lost_frame_count += 1
+        else:
+            kept = frames[: len(self.__free_buffers)]
+        self.__lost_frame_count += len(frames) - len(kept)
+
+        for frame_id, capture_time in kept:
+            buf_id = self.__free_buffers.popleft()
+            self.__fill(self.__buffers[buf_id][0], frame_id, capture_time)
+            self.__output_buffers.append(buf_id)
+        self.__condition.notify_all()
+
+    def __get_pattern(self):
+        """
+        :brief  Image data of the scene, two frames high: frame n is the frame-sized
+                window starting 2 * n rows down, the scene scrolls and keeps its bayer phase
+        :return np.ndarray of uint8
+        """
+        pixel_format = self.get_value("PixelFormat")
+        width = self.get_value("Width")
+        height = self.get_value("Height")
+        offset_x = self.get_value("OffsetX")
+        offset_y = self.get_value("OffsetY")
+        exposure_scale = (self.get_value("ExposureTime") / 10000.0) * (
+            10.0 ** (self.get_value("Gain") / 20.0)
+        )
+        key = (
+            pixel_format,
+            width,
+            height,
+            offset_x,
+            offset_y,
+            exposure_scale,
+            tuple(self.__balance_ratios.values()),
+        )
+        if key == self.__pattern_key:
+            return self.__pattern
+
+        camera = self.camera
+        layout = get_pixel_format_layout(pixel_format)
+        x = (np.arange(width, dtype=np.float32) + offset_x) / camera.width
+        y = (np.arange(height, dtype=np.float32) + offset_y) / camera.height
+        scene = (
+            0.1
+            + 0.4 * x[np.newaxis, :]
+            + 0.35
+            * (0.5 + 0.5 * np.sin(2 * np.pi * y[:, np.newaxis]))
+            * (0.75 + 0.25 * np.cos(6 * np.pi * x[np.newaxis, :]))
+        )
+        scene *= exposure_scale
+
+        channel_gains = np.array(
+            [
+                camera.scene_color[0]
+                * self.__balance_ratios[GxBalanceRatioSelectorEntry.RED],
+                camera.scene_color[1]
+                * self.__balance_ratios[GxBalanceRatioSelectorEntry.GREEN],
+                camera.scene_color[2]
+                * self.__balance_ratios[GxBalanceRatioSelectorEntry.BLUE],
+            ],
+            dtype=np.float32,
+        )
+        if layout.channels == 3:
+            scene = scene[:, :, np.newaxis] * channel_gains
+            if pixel_format == GxPixelFormatEntry.BGR8:
+                scene = scene[:, :, ::-1]
+        elif layout.color_filter != GxPixelColorFilterEntry.NONE:
+            cell = channel_gains[np.array(_BAYER_CELL_CHANNELS[layout.color_filter])]
+            scene = scene * np.tile(cell, (height // 2, width // 2))
+
+        max_code = (1 << layout.data_bits) - 1
+        values = (np.clip(scene, 0.0, 1.0) * max_code + 0.5).astype(np.uint16)
+        data = pack_pixels(values, pixel_format)
+
+        self.__pattern = np.concatenate((data, data))
+        self.__pattern_key = key
+        return self.__pattern
+
+    def __fill(self, frame_buffer, frame_id, capture_time):
+        """
+        :brief  Write a frame into a driver buffer, with its packet loss, cut and jitter
+        """
+        camera = self.camera
+        width = self.get_value("Width")
+        height = self.get_value("Height")
+        payload_size = self.get_payload_size()
+        pattern = self.__get_pattern()
+
+        row_size = payload_size // height
+        offset = (2 * frame_id) % height * row_size
+        ct.memmove(frame_buffer.image_buf, pattern.ctypes.data + offset, payload_size)
+
+        status = GxFrameStatusList.SUCCESS
+        packet_num = -(-payload_size // camera.packet_size)
+        received = np.ones(packet_num, dtype=bool)
+        jitter = 0.0
+        if (
+            camera.packet_loss_rate
+            or camera.incomplete_frame_rate
+            or camera.timestamp_jitter
+        ):
+            rng = np.random.default_rng((camera.seed, frame_id))
+            if camera.packet_loss_rate:
+                received &= rng.random(packet_num) >= camera.packet_loss_rate
+            if (
+                camera.incomplete_frame_rate
+                and rng.random() < camera.incomplete_frame_rate
+            ):
+                received[int(rng.integers(0, packet_num)) :] = False
+            if camera.timestamp_jitter:
+                jitter = rng.normal(0.0, camera.timestamp_jitter)
+
+            for packet in np.flatnonzero(~received):
+                start = int(packet) * camera.packet_size
+                ct.memset(
+                    frame_buffer.image_buf + start,
+                    0,
+                    min(camera.packet_size, payload_size - start),
+                )
+            if not received.all():
+                status = GxFrameStatusList.INCOMPLETE
+                self.__incomplete_frame_count += 1
+
+        self.__delivered_frame_count += 1
+        self.__delivered_packet_count += int(received.sum())
+
+        frame_buffer.frame_id = frame_id
+        frame_buffer.timestamp = self.__get_timestamp(capture_time + jitter)
+        frame_buffer.status = status
+        frame_buffer.width = width
+        frame_buffer.height = height
+        frame_buffer.pixel_format = self.get_value("PixelFormat")
+        frame_buffer.image_size = payload_size
+        frame_buffer.offset_x = self.get_value("OffsetX")
+        frame_buffer.offset_y = self.get_value("OffsetY")
+
+    def dequeue(self, timeout):
+        """
+        :brief  Wait for a filled driver buffer and hand it to the user
+        :param  timeout:    timeout in ms
+        :return GxFrameBuffer, None on timeout
+        """
+        deadline = time.perf_counter() + timeout / 1000.0
+        with self.__condition:
+            while True:
+                now = time.perf_counter()
+                self.__produce(now)
+                if self.__output_buffers:
+                    buf_id = self.__output_buffers.popleft()
+                    self.__user_buffers.add(buf_id)
+                    return self.__buffers[buf_id][0]
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    return None
+
+                next_due_time = (
+                    self.__get_next_due_time(now) if self.__acquiring else None
+                )
+                if next_due_time is not None:
+                    remaining = min(remaining, max(next_due_time - now, 0.0))
+                self.__condition.wait(remaining)
+
+    def dequeue_all(self, timeout, max_count):
+        """
+        :brief  Wait for a filled driver buffer, then hand every filled one to the user
+        :return list of GxFrameBuffer, empty on timeout
+        """
+        with self.__condition:
+            frame_buffer = self.dequeue(timeout)
+            if frame_buffer is None:
+                return []
+            frame_buffers = [frame_buffer]
+            while self.__output_buffers and len(frame_buffers) < max_count:
+                buf_id = self.__output_buffers.popleft()
+                self.__user_buffers.add(buf_id)
+                frame_buffers.append(self.__buffers[buf_id][0])
+            return frame_buffers
+
+    def queue(self, buf_id):
+        """
+        :brief  Give a driver buffer back
+        :return GxStatusList
+        """
+        with self.__condition:
+            if buf_id not in self.__user_buffers:
+                return gx.GxStatusList.INVALID_PARAMETER
+            self.__user_buffers.remove(buf_id)
+            self.__free_buffers.append(buf_id)
+            self.__condition.notify_all()
+            return gx.GxStatusList.SUCCESS
+
+    def queue_all(self):
+        with self.__condition:
+            self.__free_buffers.extend(self.__user_buffers)
+            self.__user_buffers.clear()
+            self.__condition.notify_all()
+
+    def flush(self):
+        with self.__condition:
+            self.__produce(time.perf_counter())
+            self.__free_buffers.extend(self.__output_buffers)
+            self.__output_buffers.clear()
+
+    def has_capture_callback(self):
+        return self.__capture_callback is not None
+
+    def register_capture_callback(self, callback, user_param):
+        self.unregister_capture_callback()
+        self.__capture_callback = callback
+        self.__capture_user_param = user_param
+        self.__capture_thread = threading.Thread(
+            target=self.__capture_loop, args=(callback,), daemon=True
+        )
+        self.__capture_thread.start()
+
+    def unregister_capture_callback(self):
+        thread = self.__capture_thread
+        self.__capture_callback = None
+        self.__capture_thread = None
+        with self.__condition:
+            self.__condition.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def __capture_loop(self, callback):
+        param = gx.GxFrameCallbackParam()
+        while self.__capture_callback is callback:
+            frame_buffer = self.dequeue(100)
+            if frame_buffer is None:
+                continue
+
+            param.user_param_index = self.__capture_user_param
+            param.status = frame_buffer.status
+            param.image_buf = frame_buffer.image_buf
+            param.image_size = frame_buffer.image_size
+            param.width = frame_buffer.width
+            param.height = frame_buffer.height
+            param.pixel_format = frame_buffer.pixel_format
+            param.frame_id = frame_buffer.frame_id
+            param.timestamp = frame_buffer.timestamp
+            try:
+                callback(ct.pointer(param))
+            finally:
+                self.queue(frame_buffer.buf_id)
+
+    def close(self):
+        self.unregister_capture_callback()
+        self.stop_acquisition()
+
+
+def _pixel_format_symbolic(pixel_format):
+    """
+    :brief  GenICam name of a pixel format, BAYER_RG12_PACKED: BayerRG12Packed
+    """
+    for name in dir(GxPixelFormatEntry):
+        if name.startswith("_") or getattr(GxPixelFormatEntry, name) != pixel_format:
+            continue
+        symbolic = ""
+        for part in name.split("_"):
+            if part == "P":
+                symbolic += "p"
+            elif part.startswith(("BAYER", "MONO", "PACKED")):
+                symbolic += part.capitalize()
+            else:
+                symbolic += part
+        return symbolic
+    return ""
+
+
+class SimulatedGxLibrary:
+    def __init__(self, cameras=None):
+        """
+        :brief  Stand-in for the GxIAPI library, drives simulated cameras
+                Only USB3 Vision cameras on one interface are simulated; the GxIAPI
+                functions that aren't simulated return GxStatusList.NOT_IMPLEMENTED
+        :param cameras: list of SimulatedCamera, None: one SimulatedCamera with default settings
+        """
+        self.__cameras = list(cameras) if cameras is not None else None
+        self.__device_list = []
+        self.__devices = {}
+        self.__handles = {}
+        self.__next_handle = 0x10000
+        self.__feature_names = None
+        self.__lock = threading.RLock()
+        self.__log_type = 0
+        self.__last_error = (0, "")
+
+    def __getattr__(self, name):
+        if name.startswith("GX"):
+            return self.__not_implemented
+        raise AttributeError(name)
+
+    def __not_implemented(self, *args):
+        return self.__error(
+            gx.GxStatusList.NOT_IMPLEMENTED,
+            "Function is not implemented by the simulated backend",
+        )
+
+    def __error(self, status, message):
+        self.__last_error = (status, message)
+        return status
+
+    def set_cameras(self, cameras):
+        """
+        :brief  Replace the simulated cameras, found by the next device list update
+        :param  cameras:    list of SimulatedCamera
+        """
+        with self.__lock:
+            self.__cameras = list(cameras)
+
+    def get_cameras(self):
+        with self.__lock:
+            if self.__cameras is None:
+                self.__cameras = [SimulatedCamera()]
+            return list(self.__cameras)
+
+    def __new_handle(self, device):
+        self.__next_handle += 1
+        self.__handles[self.__next_handle] = device
+        return self.__next_handle
+
+    def __get_device(self, handle):
+        return self.__handles.get(_value(handle))
+
+    def __get_node(self, handle, key, feature_type=None):
+        """
+        :brief  Device and feature node of a handle and a feature name or id
+        :return status, device, node
+        """
+        device = self.__get_device(handle)
+        if device is None:
+            return (
+                self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle"),
+                None,
+                None,
+            )
+
+        key = _value(key)
+        if not isinstance(key, int):
+            key = _string(key)
+        node = device.get_node(key)
+        if node is None:
+            return (
+                self.__error(
+                    gx.GxStatusList.NOT_IMPLEMENTED,
+                    "Feature %s is not implemented" % key,
+                ),
+                device,
+                None,
+            )
+
+        if feature_type is not None and node.feature_type != feature_type:
+            return (
+                self.__error(
+                    gx.GxStatusList.ERROR_TYPE,
+                    "Feature %s is not of the requested type" % node.name,
+                ),
+                device,
+                None,
+            )
+        return gx.GxStatusList.SUCCESS, device, node
+
+    def __read(self, handle, key, feature_type):
+        status, device, node = self.__get_node(handle, key, feature_type)
+        if status != gx.GxStatusList.SUCCESS:
+            return status, None, None
+        status, value = device.read(node)
+        if status != gx.GxStatusList.SUCCESS:
+            return (
+                self.__error(status, "Feature %s is not readable" % node.name),
+                None,
+                None,
+            )
+        return status, node, value
+
+    def __write(self, handle, key, feature_type, value):
+        status, device, node = self.__get_node(handle, key, feature_type)
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+        status = device.write(node, value)
+        if status != gx.GxStatusList.SUCCESS:
+            return self.__error(
+                status, "Feature %s can't be set to %s" % (node.name, value)
+            )
+        return status
+
+    # Library
+    def GXInitLib(self):
+        return gx.GxStatusList.SUCCESS
+
+    def GXCloseLib(self):
+        with self.__lock:
+            for device in set(self.__handles.values()):
+                device.close()
+            self.__handles.clear()
+            self.__devices.clear()
+        return gx.GxStatusList.SUCCESS
+
+    def GXSetLogType(self, log_type):
+        self.__log_type = _value(log_type)
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetLogType(self, p_log_type):
+        _target(p_log_type).value = self.__log_type
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetLastError(self, p_error_code, p_content, p_size):
+        error_code, content = self.__last_error
+        if p_error_code is not None:
+            _target(p_error_code).value = error_code
+        if p_size is None:
+            return gx.GxStatusList.SUCCESS
+
+        data = content.encode("utf-8")
+        size = _target(p_size)
+        if p_content is not None:
+            data = data[: max(size.value - 1, 0)]
+            ct.memmove(_target(p_content), data + b"\0", len(data) + 1)
+        size.value = len(data) + 1
+        return gx.GxStatusList.SUCCESS
+
+    # Device list
+    def GXUpdateDeviceList(self, p_device_num, timeout):
+        with self.__lock:
+            self.__device_list = self.get_cameras()
+            _target(p_device_num).value = len(self.__device_list)
+        return gx.GxStatusList.SUCCESS
+
+    def GXUpdateAllDeviceList(self, p_device_num, timeout):
+        return self.GXUpdateDeviceList(p_device_num, timeout)
+
+    def GXUpdateAllDeviceListEx(self, tl_type, p_device_num, timeout):
+        if _value(tl_type) & GxTLClassList.TL_TYPE_U3V:
+            return self.GXUpdateDeviceList(p_device_num, timeout)
+        _target(p_device_num).value = 0
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetInterfaceNum(self, p_interface_num):
+        _target(p_interface_num).value = 1
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetInterfaceInfo(self, index, p_interface_info):
+        if _value(index) != 1:
+            return self.__error(
+                gx.GxStatusList.INVALID_PARAMETER, "Invalid interface index"
+            )
+        interface_info = _target(p_interface_info)
+        interface_info.TLayer_type = GxTLClassList.TL_TYPE_U3V
+        u3v_info = interface_info.IF_info.U3V_interface_info
+        u3v_info.interface_id = b"SIM-U3V-0"
+        u3v_info.display_name = b"Simulated USB3 Vision interface"
+        u3v_info.serial_number = b"SIM-U3V-0"
+        u3v_info.description = b"pygxi simulated backend"
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetInterfaceHandle(self, index, p_handle):
+        if _value(index) != 1:
+            return self.__error(
+                gx.GxStatusList.INVALID_PARAMETER, "Invalid interface index"
+            )
+        _target(p_handle).value = INTERFACE_HANDLE
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetAllDeviceBaseInfo(self, p_device_info, p_size):
+        device_info = _target(p_device_info)
+        size = _target(p_size)
+        with self.__lock:
+            cameras = self.__device_list
+            needed = ct.sizeof(gx.GxDeviceBaseInfo) * len(cameras)
+            if size.value < needed:
+                size.value = needed
+                return self.__error(
+                    gx.GxStatusList.NEED_MORE_BUFFER, "Buffer too small"
+                )
+
+            for info, camera in zip(device_info, cameras):
+                info.vendor_name = camera.vendor_name.encode("utf-8")
+                info.model_name = camera.model_name.encode("utf-8")
+                info.serial_number = camera.serial_number.encode("utf-8")
+                info.display_name = (
+                    "%s(%s)" % (camera.model_name, camera.serial_number)
+                ).encode("utf-8")
+                info.device_id = ("SIM:%s" % camera.serial_number).encode("utf-8")
+                info.user_id = camera.user_id.encode("utf-8")
+                info.access_status = GxAccessStatus.READWRITE
+                info.device_class = GxDeviceClassList.U3V
+            size.value = needed
+        return gx.GxStatusList.SUCCESS
+
+    # Device
+    def GXOpenDevice(self, p_open_param, p_handle):
+        open_param = _target(p_open_param)
+        content = open_param.content.decode("utf-8")
+        with self.__lock:
+            camera = None
+            if open_param.open_mode == gx.GxOpenMode.INDEX:
+                device_list = self.__device_list or self.get_cameras()
+                if content.isdigit() and 1 <= int(content) <= len(device_list):
+                    camera = device_list[int(content) - 1]
+            elif open_param.open_mode == gx.GxOpenMode.SN:
+                for candidate in self.get_cameras():
+                    if candidate.serial_number == content:
+                        camera = candidate
+            elif open_param.open_mode == gx.GxOpenMode.USER_ID:
+                for candidate in self.get_cameras():
+                    if candidate.user_id == content:
+                        camera = candidate
+
+            if camera is None:
+                return self.__error(
+                    gx.GxStatusList.NOT_FOUND_DEVICE, "Device not found"
+                )
+            if camera.serial_number in self.__devices:
+                return self.__error(
+                    gx.GxStatusList.REPEAT_OPENED, "Device has been opened"
+                )
+
+            device = _SimulatedDevice(camera)
+            handle = self.__new_handle(device)
+            self.__devices[camera.serial_number] = handle
+            _target(p_handle).value = handle
+        return gx.GxStatusList.SUCCESS
+
+    def GXOpenDeviceByIndex(self, index, p_handle):
+        open_param = gx.GxOpenParam()
+        open_param.content = str(_value(index)).encode("utf-8")
+        open_param.open_mode = gx.GxOpenMode.INDEX
+        return self.GXOpenDevice(ct.byref(open_param), p_handle)
+
+    def GXCloseDevice(self, handle):
+        with self.__lock:
+            device = self.__get_device(handle)
+            if device is None:
+                return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+            device.close()
+            for key in [
+                key for key, value in self.__handles.items() if value is device
+            ]:
+                del self.__handles[key]
+            del self.__devices[device.camera.serial_number]
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetParentInterfaceFromDev(self, handle, p_interface_handle):
+        if self.__get_device(handle) is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        _target(p_interface_handle).value = INTERFACE_HANDLE
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetLocalDeviceHandleFromDev(self, handle, p_local_handle):
+        device = self.__get_device(handle)
+        if device is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        with self.__lock:
+            _target(p_local_handle).value = self.__new_handle(device)
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetDataStreamNumFromDev(self, handle, p_stream_num):
+        if self.__get_device(handle) is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        _target(p_stream_num).value = 1
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetDataStreamHandleFromDev(self, handle, stream_index, p_stream_handle):
+        device = self.__get_device(handle)
+        if device is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        if _value(stream_index) != 1:
+            return self.__error(
+                gx.GxStatusList.INVALID_PARAMETER, "Invalid stream index"
+            )
+        with self.__lock:
+            _target(p_stream_handle).value = self.__new_handle(device)
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetPayLoadSize(self, handle, p_payload_size):
+        device = self.__get_device(handle)
+        if device is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        _target(p_payload_size).value = device.get_payload_size()
+        return gx.GxStatusList.SUCCESS
+
+    # Features by name
+    def GXGetNodeAccessMode(self, handle, feature_name, p_access_mode):
+        device = self.__get_device(handle)
+        if device is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        node = device.get_node(_string(feature_name))
+        if node is None:
+            _target(p_access_mode).value = gx.GxNodeAccessMode.MODE_NI
+        else:
+            _target(p_access_mode).value = device.get_access_mode(node)
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetIntValue(self, handle, feature_name, p_int_feature):
+        status, node, value = self.__read(handle, feature_name, gx.GxFeatureType.INT)
+        if status == gx.GxStatusList.SUCCESS:
+            int_feature = _target(p_int_feature)
+            int_feature.value = value
+            int_feature.min, int_feature.max, int_feature.inc = node.get_limits() or (
+                value,
+                value,
+                1,
+            )
+        return status
+
+    def GXSetIntValue(self, handle, feature_name, value):
+        return self.__write(handle, feature_name, gx.GxFeatureType.INT, _value(value))
+
+    def GXGetFloatValue(self, handle, feature_name, p_float_feature):
+        status, node, value = self.__read(handle, feature_name, gx.GxFeatureType.FLOAT)
+        if status == gx.GxStatusList.SUCCESS:
+            float_feature = _target(p_float_feature)
+            float_feature.cur_value = value
+            minimum, maximum, increment = node.get_limits()
+            float_feature.min = minimum
+            float_feature.max = maximum
+            float_feature.inc = increment
+            float_feature.inc_is_valid = increment > 0
+            float_feature.unit = node.unit.encode("utf-8")
+        return status
+
+    def GXSetFloatValue(self, handle, feature_name, value):
+        return self.__write(
+            handle, feature_name, gx.GxFeatureType.FLOAT, float(_value(value))
+        )
+
+    def GXGetEnumValue(self, handle, feature_name, p_enum_feature):
+        status, node, value = self.__read(handle, feature_name, gx.GxFeatureType.ENUM)
+        if status == gx.GxStatusList.SUCCESS:
+            enum_feature = _target(p_enum_feature)
+            enum_feature.cur_value.cur_value = value
+            enum_feature.cur_value.cur_symbolic = node.get_symbolic(value).encode(
+                "utf-8"
+            )
+            enum_feature.supported_number = len(node.entries)
+            for index, (entry_value, symbolic) in enumerate(node.entries):
+                enum_feature.supported_value[index].cur_value = entry_value
+                enum_feature.supported_value[index].cur_symbolic = symbolic.encode(
+                    "utf-8"
+                )
+        return status
+
+    def GXSetEnumValue(self, handle, feature_name, value):
+        return self.__write(handle, feature_name, gx.GxFeatureType.ENUM, _value(value))
+
+    def GXSetEnumValueByString(self, handle, feature_name, value):
+        status, device, node = self.__get_node(
+            handle, feature_name, gx.GxFeatureType.ENUM
+        )
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+        symbolic = _string(value)
+        for entry_value, entry_symbolic in node.entries:
+            if entry_symbolic == symbolic:
+                return self.__write(handle, node.name, None, entry_value)
+        return self.__error(
+            gx.GxStatusList.INVALID_PARAMETER,
+            "Feature %s has no entry %s" % (node.name, symbolic),
+        )
+
+    def GXGetBoolValue(self, handle, feature_name, p_value):
+        status, _, value = self.__read(handle, feature_name, gx.GxFeatureType.BOOL)
+        if status == gx.GxStatusList.SUCCESS:
+            _target(p_value).value = value
+        return status
+
+    def GXSetBoolValue(self, handle, feature_name, value):
+        return self.__write(
+            handle, feature_name, gx.GxFeatureType.BOOL, bool(_value(value))
+        )
+
+    def GXGetStringValue(self, handle, feature_name, p_string_feature):
+        status, _, value = self.__read(handle, feature_name, gx.GxFeatureType.STRING)
+        if status == gx.GxStatusList.SUCCESS:
+            string_feature = _target(p_string_feature)
+            string_feature.cur_value = value.encode("utf-8")
+            string_feature.max_length = STRING_MAX_LENGTH
+        return status
+
+    def GXSetStringValue(self, handle, feature_name, value):
+        return self.__write(
+            handle, feature_name, gx.GxFeatureType.STRING, _string(value)
+        )
+
+    def GXSetCommandValue(self, handle, feature_name):
+        return self.__write(handle, feature_name, gx.GxFeatureType.COMMAND, None)
+
+    def GXRegisterFeatureCallbackByString(
+        self, handle, user_param, callback, feature_name, p_callback_handle
+    ):
+        status, device, node = self.__get_node(handle, feature_name)
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+        with self.__lock:
+            self.__next_handle += 1
+            callback_handle = self.__next_handle
+        device.register_feature_callback(
+            node, callback_handle, callback, user_param, True
+        )
+        _target(p_callback_handle).value = callback_handle
+        return gx.GxStatusList.SUCCESS
+
+    def GXUnregisterFeatureCallbackByString(
+        self, handle, feature_name, callback_handle
+    ):
+        status, device, node = self.__get_node(handle, feature_name)
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+        if not device.unregister_feature_callback(node, _value(callback_handle)):
+            return self.__error(
+                gx.GxStatusList.INVALID_PARAMETER, "Invalid callback handle"
+            )
+        return gx.GxStatusList.SUCCESS
+
+    # Features by id
+    def __get_feature_names(self):
+        if self.__feature_names is None:
+            self.__feature_names = dict(
+                (value, name)
+                for name, value in vars(gx.GxFeatureID).items()
+                if isinstance(value, int)
+            )
+        return self.__feature_names
+
+    def GXGetFeatureName(self, handle, feature_id, p_name, p_size):
+        status, _, node = self.__get_node(handle, feature_id)
+        if node is not None:
+            return _write_string(p_name, p_size, node.name)
+        name = self.__get_feature_names().get(_value(feature_id))
+        if status == gx.GxStatusList.NOT_IMPLEMENTED and name is not None:
+            return _write_string(p_name, p_size, name)
+        _target(p_size).value = 1
+        return status
+
+    def GXIsImplemented(self, handle, feature_id, p_value):
+        if self.__get_device(handle) is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        _, _, node = self.__get_node(handle, feature_id)
+        _target(p_value).value = node is not None
+        return gx.GxStatusList.SUCCESS
+
+    def GXIsReadable(self, handle, feature_id, p_value):
+        status, device, node = self.__get_node(handle, feature_id)
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+        _target(p_value).value = device.is_readable(node)
+        return status
+
+    def GXIsWritable(self, handle, feature_id, p_value):
+        status, device, node = self.__get_node(handle, feature_id)
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+        _target(p_value).value = device.is_writable(node)
+        return status
+
+    def GXGetIntRange(self, handle, feature_id, p_int_range):
+        status, _, node = self.__get_node(handle, feature_id, gx.GxFeatureType.INT)
+        if status == gx.GxStatusList.SUCCESS:
+            value = node.get_value()
+            int_range = _target(p_int_range)
+            int_range.min, int_range.max, int_range.inc = node.get_limits() or (
+                value,
+                value,
+                1,
+            )
+        return status
+
+    def GXGetInt(self, handle, feature_id, p_value):
+        status, _, value = self.__read(handle, feature_id, gx.GxFeatureType.INT)
+        if status == gx.GxStatusList.SUCCESS:
+            _target(p_value).value = value
+        return status
+
+    def GXSetInt(self, handle, feature_id, value):
+        return self.__write(handle, feature_id, gx.GxFeatureType.INT, _value(value))
+
+    def GXGetFloatRange(self, handle, feature_id, p_float_range):
+        status, _, node = self.__get_node(handle, feature_id, gx.GxFeatureType.FLOAT)
+        if status == gx.GxStatusList.SUCCESS:
+            float_range = _target(p_float_range)
+            minimum, maximum, increment = node.get_limits()
+            float_range.min = minimum
+            float_range.max = maximum
+            float_range.inc = increment
+            float_range.inc_is_valid = increment > 0
+            float_range.unit = node.unit.encode("utf-8")
+        return status
+
+    def GXGetFloat(self, handle, feature_id, p_value):
+        status, _, value = self.__read(handle, feature_id, gx.GxFeatureType.FLOAT)
+        if status == gx.GxStatusList.SUCCESS:
+            _target(p_value).value = value
+        return status
+
+    def GXSetFloat(self, handle, feature_id, value):
+        return self.__write(
+            handle, feature_id, gx.GxFeatureType.FLOAT, float(_value(value))
+        )
+
+    def GXGetEnumEntryNums(self, handle, feature_id, p_entry_num):
+        status, _, node = self.__get_node(handle, feature_id, gx.GxFeatureType.ENUM)
+        if status == gx.GxStatusList.SUCCESS:
+            _target(p_entry_num).value = len(node.entries)
+        return status
+
+    def GXGetEnumDescription(self, handle, feature_id, p_description, p_size):
+        status, _, node = self.__get_node(handle, feature_id, gx.GxFeatureType.ENUM)
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+
+        size = _target(p_size)
+        needed = ct.sizeof(gx.GxEnumDescription) * len(node.entries)
+        if p_description is None or size.value < needed:
+            size.value = needed
+            if p_description is None:
+                return gx.GxStatusList.SUCCESS
+            return self.__error(gx.GxStatusList.NEED_MORE_BUFFER, "Buffer too small")
+
+        description = _target(p_description)
+        for index, (entry_value, symbolic) in enumerate(node.entries):
+            description[index].value = entry_value
+            description[index].symbolic = symbolic.encode("utf-8")
+        size.value = needed
+        return gx.GxStatusList.SUCCESS
+
+    def GXGetEnum(self, handle, feature_id, p_value):
+        status, _, value = self.__read(handle, feature_id, gx.GxFeatureType.ENUM)
+        if status == gx.GxStatusList.SUCCESS:
+            _target(p_value).value = value
+        return status
+
+    def GXSetEnum(self, handle, feature_id, value):
+        return self.__write(handle, feature_id, gx.GxFeatureType.ENUM, _value(value))
+
+    def GXGetBool(self, handle, feature_id, p_value):
+        status, _, value = self.__read(handle, feature_id, gx.GxFeatureType.BOOL)
+        if status == gx.GxStatusList.SUCCESS:
+            _target(p_value).value = value
+        return status
+
+    def GXSetBool(self, handle, feature_id, value):
+        return self.__write(
+            handle, feature_id, gx.GxFeatureType.BOOL, bool(_value(value))
+        )
+
+    def GXGetStringLength(self, handle, feature_id, p_size):
+        status, _, value = self.__read(handle, feature_id, gx.GxFeatureType.STRING)
+        if status == gx.GxStatusList.SUCCESS:
+            _target(p_size).value = len(value.encode("utf-8")) + 1
+        return status
+
+    def GXGetStringMaxLength(self, handle, feature_id, p_size):
+        status, _, _ = self.__get_node(handle, feature_id, gx.GxFeatureType.STRING)
+        if status == gx.GxStatusList.SUCCESS:
+            _target(p_size).value = STRING_MAX_LENGTH + 1
+        return status
+
+    def GXGetString(self, handle, feature_id, p_content, p_size):
+        status, _, value = self.__read(handle, feature_id, gx.GxFeatureType.STRING)
+        if status != gx.GxStatusList.SUCCESS:
+            _target(p_size).value = 1
+            return status
+        return _write_string(p_content, p_size, value)
+
+    def GXSetString(self, handle, feature_id, p_content):
+        return self.__write(
+            handle, feature_id, gx.GxFeatureType.STRING, _string(p_content)
+        )
+
+    def GXSendCommand(self, handle, feature_id):
+        return self.__write(handle, feature_id, gx.GxFeatureType.COMMAND, None)
+
+    def GXRegisterFeatureCallback(
+        self, handle, user_param, callback, feature_id, p_callback_handle
+    ):
+        status, device, node = self.__get_node(handle, feature_id)
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+        with self.__lock:
+            self.__next_handle += 1
+            callback_handle = self.__next_handle
+        device.register_feature_callback(
+            node, callback_handle, callback, user_param, False
+        )
+        _target(p_callback_handle).value = callback_handle
+        return gx.GxStatusList.SUCCESS
+
+    def GXUnregisterFeatureCallback(self, handle, feature_id, callback_handle):
+        status, device, node = self.__get_node(handle, feature_id)
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+        if not device.unregister_feature_callback(node, _value(callback_handle)):
+            return self.__error(
+                gx.GxStatusList.INVALID_PARAMETER, "Invalid callback handle"
+            )
+        return gx.GxStatusList.SUCCESS
+
+    def GXRegisterDeviceOfflineCallback(
+        self, handle, user_param, callback, p_callback_handle
+    ):
+        if self.__get_device(handle) is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        # a simulated camera never goes offline
+        with self.__lock:
+            self.__next_handle += 1
+            _target(p_callback_handle).value = self.__next_handle
+        return gx.GxStatusList.SUCCESS
+
+    def GXUnregisterDeviceOfflineCallback(self, handle, callback_handle):
+        if self.__get_device(handle) is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        return gx.GxStatusList.SUCCESS
+
+    # Acquisition
+    def GXSetAcqusitionBufferNumber(self, handle, buffer_number):
+        device = self.__get_device(handle)
+        if device is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        status = device.set_buffer_number(_value(buffer_number))
+        if status != gx.GxStatusList.SUCCESS:
+            return self.__error(status, "Can't set the buffer number now")
+        return status
+
+    def __get_acquiring_device(self, handle):
+        """
+        :return status, device
+        """
+        device = self.__get_device(handle)
+        if device is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle"), None
+        if device.has_capture_callback():
+            return (
+                self.__error(
+                    gx.GxStatusList.INVALID_CALL, "A capture callback is registered"
+                ),
+                None,
+            )
+        if not device.is_acquiring():
+            return (
+                self.__error(gx.GxStatusList.INVALID_CALL, "Acquisition not started"),
+                None,
+            )
+        return gx.GxStatusList.SUCCESS, device
+
+    def GXGetImage(self, handle, p_frame_data, timeout):
+        status, device = self.__get_acquiring_device(handle)
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+
+        frame_data = _target(p_frame_data)
+        if not frame_data.image_buf:
+            return self.__error(gx.GxStatusList.INVALID_PARAMETER, "image_buf is NULL")
+
+        frame_buffer = device.dequeue(_value(timeout))
+        if frame_buffer is None:
+            return self.__error(gx.GxStatusList.TIMEOUT, "Timeout")
+        try:
+            if frame_data.image_size < frame_buffer.image_size:
+                return self.__error(
+                    gx.GxStatusList.NEED_MORE_BUFFER,
+                    "image_size is smaller than payload",
+                )
+            ct.memmove(
+                frame_data.image_buf, frame_buffer.image_buf, frame_buffer.image_size
+            )
+            frame_data.status = frame_buffer.status
+            frame_data.width = frame_buffer.width
+            frame_data.height = frame_buffer.height
+            frame_data.pixel_format = frame_buffer.pixel_format
+            frame_data.image_size = frame_buffer.image_size
+            frame_data.frame_id = frame_buffer.frame_id
+            frame_data.timestamp = frame_buffer.timestamp
+            frame_data.buf_id = frame_buffer.buf_id
+        finally:
+            device.queue(frame_buffer.buf_id)
+        return gx.GxStatusList.SUCCESS
+
+    def GXDQBuf(self, handle, pp_frame_buffer, timeout):
+        status, device = self.__get_acquiring_device(handle)
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+
+        frame_buffer = device.dequeue(_value(timeout))
+        if frame_buffer is None:
+            return self.__error(gx.GxStatusList.TIMEOUT, "Timeout")
+        _target(pp_frame_buffer).contents = frame_buffer
+        return gx.GxStatusList.SUCCESS
+
+    def GXQBuf(self, handle, p_frame_buffer):
+        device = self.__get_device(handle)
+        if device is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        status = device.queue(p_frame_buffer.contents.buf_id)
+        if status != gx.GxStatusList.SUCCESS:
+            return self.__error(status, "Buffer is not owned by the user")
+        return status
+
+    def GXDQAllBufs(self, handle, p_frame_buffers, array_size, p_frame_count, timeout):
+        status, device = self.__get_acquiring_device(handle)
+        if status != gx.GxStatusList.SUCCESS:
+            return status
+
+        frame_buffers = device.dequeue_all(_value(timeout), _value(array_size))
+        if not frame_buffers:
+            _target(p_frame_count).value = 0
+            return self.__error(gx.GxStatusList.TIMEOUT, "Timeout")
+        for index, frame_buffer in enumerate(frame_buffers):
+            p_frame_buffers[index] = ct.pointer(frame_buffer)
+        _target(p_frame_count).value = len(frame_buffers)
+        return gx.GxStatusList.SUCCESS
+
+    def GXQAllBufs(self, handle):
+        device = self.__get_device(handle)
+        if device is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        device.queue_all()
+        return gx.GxStatusList.SUCCESS
+
+    def GXFlushQueue(self, handle):
+        device = self.__get_device(handle)
+        if device is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        device.flush()
+        return gx.GxStatusList.SUCCESS
+
+    def GXRegisterCaptureCallback(self, handle, user_param, callback):
+        device = self.__get_device(handle)
+        if device is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        device.register_capture_callback(callback, user_param)
+        return gx.GxStatusList.SUCCESS
+
+    def GXUnregisterCaptureCallback(self, handle):
+        device = self.__get_device(handle)
+        if device is None:
+            return self.__error(gx.GxStatusList.INVALID_HANDLE, "Invalid handle")
+        device.unregister_capture_callback()
+        return gx.GxStatusList.SUCCESS
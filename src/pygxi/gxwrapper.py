@@ -9,12 +9,19 @@ import os
 import sys
 from typing import TYPE_CHECKING, Any
 
+from .backend import BACKEND, SIMULATED
+from .prototypes import bind_prototypes
+
 if TYPE_CHECKING:
     from .gxidef import GxIPConfigureModeList
 
 NODE_FEATURE_RESERVED_16 = 16
 
-if sys.platform == "linux2" or sys.platform == "linux":
+if BACKEND == SIMULATED:
+    from .gxsimulator import SimulatedGxLibrary
+
+    dll = SimulatedGxLibrary()
+elif sys.platform == "linux2" or sys.platform == "linux":
     try:
         dll = ct.CDLL("/usr/lib/libgxiapi.so")
     except OSError:
@@ -1099,6 +1106,164 @@ class GxEnumDescription(ct.Structure):
         )
 
 
+# Prototypes of the GxIAPI functions, name: (restype, argtypes).
+# Pointers are declared as c_void_p so that byref(), arrays, callbacks,
+# addresses and None are all accepted.
+GX_FUNCTION_PROTOTYPES = {
+    "GXSetLogType": (ct.c_int, [ct.c_uint]),
+    "GXGetLogType": (ct.c_int, [ct.c_void_p]),
+    "GXInitLib": (ct.c_int, []),
+    "GXCloseLib": (ct.c_int, []),
+    "GXGetLastError": (ct.c_int, [ct.c_void_p, ct.c_void_p, ct.c_void_p]),
+    "GXUpdateDeviceList": (ct.c_int, [ct.c_void_p, ct.c_uint]),
+    "GXUpdateAllDeviceList": (ct.c_int, [ct.c_void_p, ct.c_uint]),
+    "GXUpdateAllDeviceListEx": (ct.c_int, [ct.c_uint, ct.c_void_p, ct.c_uint]),
+    "GXGetInterfaceNum": (ct.c_int, [ct.c_void_p]),
+    "GXGetInterfaceInfo": (ct.c_int, [ct.c_size_t, ct.c_void_p]),
+    "GXGetInterfaceHandle": (ct.c_int, [ct.c_uint, ct.c_void_p]),
+    "GXGetAllDeviceBaseInfo": (ct.c_int, [ct.c_void_p, ct.c_void_p]),
+    "GXGetDeviceIPInfo": (ct.c_int, [ct.c_uint, ct.c_void_p]),
+    "GXOpenDeviceByIndex": (ct.c_int, [ct.c_uint, ct.c_void_p]),
+    "GXOpenDevice": (ct.c_int, [ct.c_void_p, ct.c_void_p]),
+    "GXCloseDevice": (ct.c_int, [ct.c_void_p]),
+    "GXGetParentInterfaceFromDev": (ct.c_int, [ct.c_void_p, ct.c_void_p]),
+    "GXGetLocalDeviceHandleFromDev": (ct.c_int, [ct.c_void_p, ct.c_void_p]),
+    "GXGetDataStreamNumFromDev": (ct.c_int, [ct.c_void_p, ct.c_void_p]),
+    "GXGetPayLoadSize": (ct.c_int, [ct.c_void_p, ct.c_void_p]),
+    "GXGetDataStreamHandleFromDev": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_uint32, ct.c_void_p],
+    ),
+    "GXFeatureSave": (ct.c_int, [ct.c_void_p, ct.c_char_p]),
+    "GXFeatureLoad": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_bool]),
+    "GXGetNodeAccessMode": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_void_p]),
+    "GXGetIntValue": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_void_p]),
+    "GXSetIntValue": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_int64]),
+    "GXGetEnumValue": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_void_p]),
+    "GXSetEnumValue": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_int64]),
+    "GXSetEnumValueByString": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_char_p]),
+    "GXGetFloatValue": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_void_p]),
+    "GXSetFloatValue": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_double]),
+    "GXGetBoolValue": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_void_p]),
+    "GXSetBoolValue": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_bool]),
+    "GXGetStringValue": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_void_p]),
+    "GXSetStringValue": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_char_p]),
+    "GXSetCommandValue": (ct.c_int, [ct.c_void_p, ct.c_char_p]),
+    "GXGetRegisterLength": (ct.c_int, [ct.c_void_p, ct.c_char_p, ct.c_void_p]),
+    "GXGetRegisterValue": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_char_p, ct.c_void_p, ct.c_void_p],
+    ),
+    "GXSetRegisterValue": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_char_p, ct.c_void_p, ct.c_int64],
+    ),
+    "GXReadPort": (ct.c_int, [ct.c_void_p, ct.c_ulonglong, ct.c_void_p, ct.c_void_p]),
+    "GXWritePort": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_ulonglong, ct.c_void_p, ct.c_void_p],
+    ),
+    "GXReadPortStacked": (ct.c_int, [ct.c_void_p, ct.c_void_p, ct.c_void_p]),
+    "GXWritePortStacked": (ct.c_int, [ct.c_void_p, ct.c_void_p, ct.c_void_p]),
+    "GXRegisterFeatureCallbackByString": (
+        ct.c_int,
+        [ct.c_void_p, ct.py_object, ct.c_void_p, ct.c_char_p, ct.c_void_p],
+    ),
+    "GXUnregisterFeatureCallbackByString": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_char_p, ct.c_void_p],
+    ),
+    "GXGetDevicePersistentIpAddress": (ct.c_int, [ct.c_void_p] * 7),
+    "GXSetDevicePersistentIpAddress": (ct.c_int, [ct.c_void_p] * 4),
+    "GXGetFeatureName": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p, ct.c_void_p]),
+    "GXIsImplemented": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXIsReadable": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXIsWritable": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXGetIntRange": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXGetInt": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXSetInt": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_int64]),
+    "GXGetFloatRange": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXSetFloat": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_double]),
+    "GXGetFloat": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXGetEnumEntryNums": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXGetEnumDescription": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_int, ct.c_void_p, ct.c_void_p],
+    ),
+    "GXGetEnum": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXSetEnum": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_int64]),
+    "GXGetBool": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXSetBool": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_bool]),
+    "GXGetStringLength": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXGetStringMaxLength": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXGetString": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p, ct.c_void_p]),
+    "GXSetString": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXGetBufferLength": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXGetBuffer": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p, ct.c_void_p]),
+    "GXSetBuffer": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p, ct.c_size_t]),
+    "GXSendCommand": (ct.c_int, [ct.c_void_p, ct.c_int]),
+    "GXRegisterCaptureCallback": (ct.c_int, [ct.c_void_p, ct.c_void_p, ct.c_void_p]),
+    "GXUnregisterCaptureCallback": (ct.c_int, [ct.c_void_p]),
+    "GXGetImage": (ct.c_int, [ct.c_void_p, ct.POINTER(GxFrameData), ct.c_uint]),
+    "GXDQBuf": (
+        ct.c_int,
+        [ct.c_void_p, ct.POINTER(ct.POINTER(GxFrameBuffer)), ct.c_uint],
+    ),
+    "GXQBuf": (ct.c_int, [ct.c_void_p, ct.POINTER(GxFrameBuffer)]),
+    "GXDQAllBufs": (
+        ct.c_int,
+        [
+            ct.c_void_p,
+            ct.POINTER(ct.POINTER(GxFrameBuffer)),
+            ct.c_uint,
+            ct.POINTER(ct.c_uint),
+            ct.c_uint,
+        ],
+    ),
+    "GXQAllBufs": (ct.c_int, [ct.c_void_p]),
+    "GXFlushQueue": (ct.c_int, [ct.c_void_p]),
+    "GXRegisterDeviceOfflineCallback": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_void_p, ct.c_void_p],
+    ),
+    "GXUnregisterDeviceOfflineCallback": (ct.c_int, [ct.c_void_p, ct.c_void_p]),
+    "GXFlushEvent": (ct.c_int, [ct.c_void_p]),
+    "GXGetEventNumInQueue": (ct.c_int, [ct.c_void_p, ct.c_void_p]),
+    "GXRegisterFeatureCallback": (
+        ct.c_int,
+        [ct.c_void_p, ct.py_object, ct.c_void_p, ct.c_int, ct.c_void_p],
+    ),
+    "GXUnregisterFeatureCallback": (ct.c_int, [ct.c_void_p, ct.c_int, ct.c_void_p]),
+    "GXExportConfigFile": (ct.c_int, [ct.c_void_p, ct.c_void_p]),
+    "GXImportConfigFile": (ct.c_int, [ct.c_void_p, ct.c_void_p, ct.c_bool]),
+    "GXReadRemoteDevicePort": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_ulonglong, ct.c_void_p, ct.c_void_p],
+    ),
+    "GXWriteRemoteDevicePort": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_ulonglong, ct.c_void_p, ct.c_void_p],
+    ),
+    "GXGigEIpConfiguration": (
+        ct.c_int,
+        [ct.c_char_p, ct.c_int, ct.c_char_p, ct.c_char_p, ct.c_char_p, ct.c_char_p],
+    ),
+    "GXGigEForceIp": (ct.c_int, [ct.c_char_p] * 4),
+    "GXGigEResetDevice": (ct.c_int, [ct.c_char_p, ct.c_uint]),
+    "GXSetAcqusitionBufferNumber": (ct.c_int, [ct.c_void_p, ct.c_uint64]),
+    "GXReadRemoteDevicePortStacked": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_void_p],
+    ),
+    "GXWriteRemoteDevicePortStacked": (
+        ct.c_int,
+        [ct.c_void_p, ct.c_void_p, ct.c_void_p],
+    ),
+}
+if isinstance(dll, ct.CDLL):
+    bind_prototypes(dll, GX_FUNCTION_PROTOTYPES)
+
+
 if hasattr(dll, "GXSetLogType"):
 
     def gx_set_log_type(log_type):
@@ -1553,14 +1718,11 @@ if hasattr(dll, "GXGetIntValue"):
         :return:    status:     State return value
                                 int feature info
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_name_c = ct.create_string_buffer(feature_name.encode("utf-8"))
-
         int_feature_c = GxIntFeatrue()
 
-        status = dll.GXGetIntValue(handle_c, feature_name_c, ct.byref(int_feature_c))
+        status = dll.GXGetIntValue(
+            handle, feature_name.encode("utf-8"), ct.byref(int_feature_c)
+        )
         return status, int_feature_c
 
 
@@ -1577,15 +1739,7 @@ if hasattr(dll, "GXSetIntValue"):
                                 Type: int
         :return:    status:     State return value
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_name_c = ct.create_string_buffer(feature_name.encode("utf-8"))
-
-        feature_value_c = ct.c_int64()
-        feature_value_c.value = feature_value
-
-        status = dll.GXSetIntValue(handle_c, feature_name_c, feature_value_c)
+        status = dll.GXSetIntValue(handle, feature_name.encode("utf-8"), feature_value)
         return status
 
 
@@ -1601,14 +1755,11 @@ if hasattr(dll, "GXGetEnumValue"):
         :return:    status:     State return value
                                 enum info
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_name_c = ct.create_string_buffer(feature_name.encode("utf-8"))
-
         enum_feature_c = GxEnumFeatrue()
 
-        status = dll.GXGetEnumValue(handle_c, feature_name_c, ct.byref(enum_feature_c))
+        status = dll.GXGetEnumValue(
+            handle, feature_name.encode("utf-8"), ct.byref(enum_feature_c)
+        )
         return status, enum_feature_c
 
 
@@ -1625,15 +1776,7 @@ if hasattr(dll, "GXSetEnumValue"):
                                 Type: string
         :return:    status:     State return value
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_name_c = ct.create_string_buffer(feature_name.encode("utf-8"))
-
-        feature_value_c = ct.c_int64()
-        feature_value_c.value = feature_value
-
-        status = dll.GXSetEnumValue(handle_c, feature_name_c, feature_value_c)
+        status = dll.GXSetEnumValue(handle, feature_name.encode("utf-8"), feature_value)
         return status
 
 
@@ -1676,13 +1819,10 @@ if hasattr(dll, "GXGetFloatValue"):
         :return:    status:     State return value
                                 float value
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-        feature_name_c = ct.create_string_buffer(feature_name.encode())
         float_feature_c = GxFloatFeature()
 
         status = dll.GXGetFloatValue(
-            handle_c, feature_name_c, ct.byref(float_feature_c)
+            handle, feature_name.encode("utf-8"), ct.byref(float_feature_c)
         )
         return status, float_feature_c
 
@@ -1702,11 +1842,9 @@ if hasattr(dll, "GXSetFloatValue"):
                                 Type: float
         :return:    status:     State return value
         """
-        handle_c = ct.c_void_p(handle)
-        feature_name_c = ct.create_string_buffer(feature_name.encode("utf-8"))
-        feature_value_c = ct.c_double(feature_value)
-
-        status = dll.GXSetFloatValue(handle_c, feature_name_c, feature_value_c)
+        status = dll.GXSetFloatValue(
+            handle, feature_name.encode("utf-8"), feature_value
+        )
         return status
 
 
@@ -1724,11 +1862,11 @@ if hasattr(dll, "GXGetBoolValue"):
         :return:    status:     State return value
                                 bool value
         """
-        handle_c = ct.c_void_p(handle)
-        feature_name_c = ct.create_string_buffer(feature_name.encode("utf-8"))
         bool_feature_c = ct.c_bool()
 
-        status = dll.GXGetBoolValue(handle_c, feature_name_c, ct.byref(bool_feature_c))
+        status = dll.GXGetBoolValue(
+            handle, feature_name.encode("utf-8"), ct.byref(bool_feature_c)
+        )
         return status, bool_feature_c.value
 
 
@@ -1747,12 +1885,7 @@ if hasattr(dll, "GXSetBoolValue"):
                                 Type: bool
         :return:    status:     State return value
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-        feature_name_c = ct.create_string_buffer(feature_name.encode("utf-8"))
-        feature_value_c = ct.c_bool(feature_value)
-
-        status = dll.GXSetBoolValue(handle_c, feature_name_c, feature_value_c)
+        status = dll.GXSetBoolValue(handle, feature_name.encode("utf-8"), feature_value)
         return status
 
 
@@ -1816,11 +1949,7 @@ if hasattr(dll, "GXSetCommandValue"):
                                 Type: char*
         :return:    status:     State return value
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-        feature_name_c = ct.create_string_buffer(feature_name.encode("utf-8"))
-
-        status = dll.GXSetCommandValue(handle_c, feature_name_c)
+        status = dll.GXSetCommandValue(handle, feature_name.encode("utf-8"))
         return status
 
 
@@ -2042,7 +2171,7 @@ if hasattr(dll, "GXWritePortStacked"):
         return status
 
 
-FEATURE_CALL = ct.CFUNCTYPE(None, ct.c_char_p, ct.py_object)
+FEATURE_CALL_BY_STRING = ct.CFUNCTYPE(None, ct.c_char_p, ct.py_object)
 if hasattr(dll, "GXRegisterFeatureCallbackByString"):
 
     def gx_register_feature_call_back_by_string(
@@ -2301,14 +2430,8 @@ if hasattr(dll, "GXGetInt"):
         :return:    status:         State return value, See detail in GxStatusList
                     int_value:      Get the current value of the int type
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_id_c = ct.c_int()
-        feature_id_c.value = feature_id
-
         int_value = ct.c_int64()
-        status = dll.GXGetInt(handle_c, feature_id_c, ct.byref(int_value))
+        status = dll.GXGetInt(handle, feature_id, ct.byref(int_value))
         return status, int_value.value
 
 
@@ -2325,16 +2448,7 @@ if hasattr(dll, "GXSetInt"):
                                     Type: long, minnum:0
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_id_c = ct.c_int()
-        feature_id_c.value = feature_id
-
-        value_c = ct.c_int64()
-        value_c.value = int_value
-
-        status = dll.GXSetInt(handle_c, feature_id_c, value_c)
+        status = dll.GXSetInt(handle, feature_id, int_value)
         return status
 
 
@@ -2374,16 +2488,7 @@ if hasattr(dll, "GXSetFloat"):
                                     Type: double
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_id_c = ct.c_int()
-        feature_id_c.value = feature_id
-
-        value_c = ct.c_double()
-        value_c.value = float_value
-
-        status = dll.GXSetFloat(handle_c, feature_id_c, value_c)
+        status = dll.GXSetFloat(handle, feature_id, float_value)
         return status
 
 
@@ -2398,14 +2503,8 @@ if hasattr(dll, "GXGetFloat"):
                                     Type: int, Greater than 0
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_id_c = ct.c_int()
-        feature_id_c.value = feature_id
-
         float_value = ct.c_double()
-        status = dll.GXGetFloat(handle_c, feature_id_c, ct.byref(float_value))
+        status = dll.GXGetFloat(handle, feature_id, ct.byref(float_value))
 
         return status, float_value.value
 
@@ -2477,13 +2576,8 @@ if hasattr(dll, "GXGetEnum"):
         :return:    status:         State return value, See detail in GxStatusList
                     enum_value:     Get the current enumeration value
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-        feature_id_c = ct.c_int()
-        feature_id_c.value = feature_id
-
         enum_value = ct.c_int64()
-        status = dll.GXGetEnum(handle_c, feature_id_c, ct.byref(enum_value))
+        status = dll.GXGetEnum(handle, feature_id, ct.byref(enum_value))
 
         return status, enum_value.value
 
@@ -2501,16 +2595,7 @@ if hasattr(dll, "GXSetEnum"):
                                     Type: int
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_id_c = ct.c_int()
-        feature_id_c.value = feature_id
-
-        value_c = ct.c_int64()
-        value_c.value = enum_value
-
-        status = dll.GXSetEnum(handle_c, feature_id_c, value_c)
+        status = dll.GXSetEnum(handle, feature_id, enum_value)
         return status
 
 
@@ -2526,14 +2611,8 @@ if hasattr(dll, "GXGetBool"):
         :return:    status:         State return value, See detail in GxStatusList
                     boot_value:     the value of bool type
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_id_c = ct.c_int()
-        feature_id_c.value = feature_id
-
         boot_value = ct.c_bool()
-        status = dll.GXGetBool(handle_c, feature_id_c, ct.byref(boot_value))
+        status = dll.GXGetBool(handle, feature_id, ct.byref(boot_value))
         return status, boot_value.value
 
 
@@ -2550,16 +2629,7 @@ if hasattr(dll, "GXSetBool"):
                                     Type: Bool
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_id_c = ct.c_int()
-        feature_id_c.value = feature_id
-
-        value_c = ct.c_bool()
-        value_c.value = bool_value
-
-        status = dll.GXSetBool(handle_c, feature_id_c, value_c)
+        status = dll.GXSetBool(handle, feature_id, bool_value)
         return status
 
 
@@ -2754,13 +2824,7 @@ if hasattr(dll, "GXSendCommand"):
                                     Type: int, Greater than 0
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        feature_id_c = ct.c_int()
-        feature_id_c.value = feature_id
-
-        status = dll.GXSendCommand(handle_c, feature_id_c)
+        status = dll.GXSendCommand(handle, feature_id)
         return status
 
 
@@ -2810,13 +2874,7 @@ if hasattr(dll, "GXGetImage"):
                                     Type: int, minnum: 0
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        timeout_c = ct.c_uint()
-        timeout_c.value = timeout
-
-        status = dll.GXGetImage(handle_c, ct.byref(frame_data), timeout_c)
+        status = dll.GXGetImage(handle, ct.byref(frame_data), timeout)
         return status
 
 
@@ -2834,20 +2892,7 @@ if hasattr(dll, "GXDQBuf"):
                                     Type: int, minnum: 0
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        timeout_c = ct.c_uint()
-        timeout_c.value = timeout
-
-        dll.GXDQBuf.argtypes = [
-            ct.c_void_p,
-            ct.POINTER(ct.POINTER(GxFrameBuffer)),
-            ct.c_uint,
-        ]
-        dll.GXDQBuf.restype = ct.c_int
-
-        status = dll.GXDQBuf(handle_c, pp_frame_buffer, timeout_c)
+        status = dll.GXDQBuf(handle, pp_frame_buffer, timeout)
         return status
 
 
@@ -2862,13 +2907,45 @@ if hasattr(dll, "GXQBuf"):
                                     Type: First level pointer
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
+        status = dll.GXQBuf(handle, p_frame_buffer)
+        return status
+
 
-        dll.GXQBuf.argtypes = [ct.c_void_p, ct.POINTER(GxFrameBuffer)]
-        dll.GXQBuf.restype = ct.c_int
+if hasattr(dll, "GXDQAllBufs"):
 
-        status = dll.GXQBuf(handle_c, p_frame_buffer)
+    def gx_dq_all_bufs(handle, frame_buffer_array, array_size, timeout=200):
+        """
+        :brief      Get all the images currently available in the output queue at once,
+                    wait for timeout when it is empty. Return them with gx_q_all_bufs.
+        :param      handle:             The handle of the device
+                                        Type: Long, Greater than 0
+        :param      frame_buffer_array: [out]Array of GxFrameBuffer pointers receiving the images
+                                        Type: POINTER(GxFrameBuffer) array
+        :param      array_size:         Number of elements of frame_buffer_array can receive
+                                        Type: int, minnum: 1
+        :param      timeout:            The timeout time of capture image.(unit: ms)
+                                        Type: int, minnum: 0
+        :return:    status:             State return value, See detail in GxStatusList
+                    frame_count:        Number of images got
+        """
+        frame_count_c = ct.c_uint()
+
+        status = dll.GXDQAllBufs(
+            handle, frame_buffer_array, array_size, ct.byref(frame_count_c), timeout
+        )
+        return status, frame_count_c.value
+
+
+if hasattr(dll, "GXQAllBufs"):
+
+    def gx_q_all_bufs(handle):
+        """
+        :brief      Return all the images got by gx_dq_all_bufs
+        :param      handle:     The handle of the device
+                                Type: Long, Greater than 0
+        :return:    status:     State return value, See detail in GxStatusList
+        """
+        status = dll.GXQAllBufs(handle)
         return status
 
 
@@ -2881,10 +2958,7 @@ if hasattr(dll, "GXFlushQueue"):
                                 Type: Long, Greater than 0
         :return:    status:     State return value, See detail in GxStatusList
         """
-        handle_c = ct.c_void_p()
-        handle_c.value = handle
-
-        status = dll.GXFlushQueue(handle_c)
+        status = dll.GXFlushQueue(handle)
         return status
 
 
@@ -0,0 +1,93 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import concurrent.futures
+import os
+import threading
+
+# Frames of at least PARALLEL_MIN_PIXELS pixels are processed in bands, in
+# parallel, when the number of workers is not given
+PARALLEL_MIN_PIXELS = 1 << 20
+DEFAULT_THREAD_POOL_SIZE = 8
+
+_thread_pool = None
+_thread_pool_size = DEFAULT_THREAD_POOL_SIZE
+_thread_pool_lock = threading.Lock()
+
+
+def _get_thread_pool():
+    """
+    :brief  Thread pool shared by the unpackers, the NumPy demosaic and the tiled
+            DxImageProc conversions, created on first use. The NumPy operations
+            and the ctypes calls release the GIL, the bands run in parallel
+    """
+    global _thread_pool
+    with _thread_pool_lock:
+        if _thread_pool is None:
+            _thread_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_thread_pool_size, thread_name_prefix="pygxi-band"
+            )
+        return _thread_pool
+
+
+def set_thread_pool_size(size):
+    """
+    :brief  Set the number of threads of the shared thread pool, the bands of a
+            frame never run on more threads than this
+    :param  size:   number of threads, at least 1
+    :return None
+    """
+    global _thread_pool, _thread_pool_size
+    if not isinstance(size, int) or size < 1:
+        print("set_thread_pool_size: size must be an int of at least 1")
+        return
+
+    with _thread_pool_lock:
+        thread_pool = _thread_pool
+        _thread_pool = None
+        _thread_pool_size = size
+    if thread_pool is not None:
+        thread_pool.shutdown(wait=False)
+
+
+def get_thread_pool_size():
+    """
+    :brief  Number of threads of the shared thread pool
+    """
+    return _thread_pool_size
+
+
+def get_default_workers(pixel_num):
+    """
+    :brief  Number of bands a frame is split into when workers is None
+    :param  pixel_num:  number of pixels of the frame
+    :return 1 below PARALLEL_MIN_PIXELS, else the number of CPUs up to the
+            thread pool size
+    """
+    if pixel_num < PARALLEL_MIN_PIXELS:
+        return 1
+    return max(1, min(os.cpu_count() or 1, _thread_pool_size))
+
+
+def run_bands(function, size, workers):
+    """
+    :brief  Call function(first, last) on bands of [0, size), rows or pixel groups,
+            in parallel when workers > 1, and wait for every band
+    :param  function:   callable(first, last), last excluded
+    :param  size:       number of rows or groups
+    :param  workers:    number of bands
+    """
+    workers = max(1, min(workers, size))
+    bounds = [size * index // workers for index in range(workers + 1)]
+    if workers == 1:
+        function(0, size)
+        return
+
+    thread_pool = _get_thread_pool()
+    futures = [
+        thread_pool.submit(function, bounds[index], bounds[index + 1])
+        for index in range(workers)
+    ]
+    for future in futures:
+        future.result()
@@ -0,0 +1,334 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import collections
+import math
+import re
+
+import numpy as np
+
+from .gxidef import GxPixelColorFilterEntry, GxPixelFormatEntry
+from .parallel import get_default_workers, run_bands
+
+# Packing of the pixel data in the image buffer
+PACKING_NONE = 0  # one pixel in one byte, or in two bytes little endian
+PACKING_GVSP = 1  # *_PACKED: two 10 or 12 bit pixels in three bytes
+PACKING_PFNC = 2  # *_P: pixels packed LSB first, without padding
+
+PixelFormatLayout = collections.namedtuple(
+    "PixelFormatLayout", ["data_bits", "packing", "color_filter", "channels"]
+)
+
+_PIXEL_FORMAT_NAME = re.compile(
+    r"^(MONO|BAYER_(RG|GB|GR|BG)|RGB|BGR)(\d+)(_P|_PACKED)?$"
+)
+
+
+def _build_pixel_format_layouts():
+    """
+    :brief  Layout of the mono, bayer and RGB pixel formats, parsed from the
+            GxPixelFormatEntry names
+    :return dict, key: pixel format, value: PixelFormatLayout
+    """
+    layouts = {}
+    for name in dir(GxPixelFormatEntry):
+        match = _PIXEL_FORMAT_NAME.match(name)
+        if match is None:
+            continue
+
+        family, bayer, data_bits, suffix = match.groups()
+        if suffix == "_P":
+            packing = PACKING_PFNC
+        elif suffix == "_PACKED":
+            packing = PACKING_GVSP
+        else:
+            packing = PACKING_NONE
+
+        if bayer is not None:
+            color_filter = getattr(GxPixelColorFilterEntry, "BAYER_" + bayer)
+        else:
+            color_filter = GxPixelColorFilterEntry.NONE
+
+        channels = 3 if family in ("RGB", "BGR") else 1
+        layouts[getattr(GxPixelFormatEntry, name)] = PixelFormatLayout(
+            int(data_bits), packing, color_filter, channels
+        )
+    return layouts
+
+
+_PIXEL_FORMAT_LAYOUTS = _build_pixel_format_layouts()
+
+
+def get_pixel_format_layout(pixel_format):
+    """
+    :brief  Layout of the pixel data of a mono, bayer or RGB pixel format
+    :param  pixel_format:   GxPixelFormatEntry
+    :return PixelFormatLayout(data_bits, packing, color_filter, channels),
+            None when the pixel format is not supported
+    """
+    return _PIXEL_FORMAT_LAYOUTS.get(pixel_format)
+
+
+def get_pixel_format_size(pixel_format, width, height):
+    """
+    :brief  Size in bytes of an image
+    :param  pixel_format:   GxPixelFormatEntry
+    :param  width:          image width
+    :param  height:         image height
+    :return size in bytes, None when the pixel format is not supported
+    """
+    layout = get_pixel_format_layout(pixel_format)
+    if layout is None:
+        return None
+
+    pixel_num = width * height * layout.channels
+    if layout.packing == PACKING_GVSP:
+        return (pixel_num + 1) // 2 * 3
+    if layout.packing == PACKING_PFNC:
+        return (pixel_num * layout.data_bits + 7) // 8
+    if layout.data_bits <= 8:
+        return pixel_num
+    return pixel_num * 2
+
+
+def get_pixel_format_alignment(pixel_format):
+    """
+    :brief  Pixel steps a crop of an image starts on, to keep the bayer pattern and,
+            for packed layouts, to start its rows on a byte
+    :param  pixel_format:   GxPixelFormatEntry
+    :return (column step, row step), None when the pixel format is not supported
+    """
+    layout = get_pixel_format_layout(pixel_format)
+    if layout is None:
+        return None
+
+    cfa_step = 1 if layout.color_filter == GxPixelColorFilterEntry.NONE else 2
+    if layout.packing == PACKING_NONE:
+        return cfa_step, cfa_step
+    group_pixel_num = _get_group_size(layout)[0]
+    return cfa_step * group_pixel_num // math.gcd(cfa_step, group_pixel_num), cfa_step
+
+
+def pack_pixels(values, pixel_format):
+    """
+    :brief  Write pixel values in the layout of a pixel format
+    :param  values:         np.ndarray of the pixel values, uint8 or uint16,
+                            (height, width) or (height, width, 3)
+    :param  pixel_format:   GxPixelFormatEntry
+    :return np.ndarray of uint8, the image data
+    """
+    layout = get_pixel_format_layout(pixel_format)
+    values = np.ascontiguousarray(values).reshape(-1)
+    if layout.packing == PACKING_NONE:
+        if layout.data_bits <= 8:
+            return values.astype(np.uint8)
+        return values.astype("<u2").view(np.uint8)
+
+    values = values.astype(np.uint16)
+    if layout.packing == PACKING_GVSP:
+        if values.size % 2:
+            values = np.append(values, np.uint16(0))
+        first = values[0::2]
+        second = values[1::2]
+        data = np.empty((first.size, 3), dtype=np.uint8)
+        low_bits = layout.data_bits - 8
+        low_mask = (1 << low_bits) - 1
+        data[:, 0] = first >> low_bits
+        data[:, 1] = (first & low_mask) | ((second & low_mask) << 4)
+        data[:, 2] = second >> low_bits
+        return data.reshape(-1)
+
+    shifts = np.arange(layout.data_bits, dtype=np.uint16)
+    bits = ((values[:, np.newaxis] >> shifts) & 1).astype(np.uint8)
+    return np.packbits(bits.reshape(-1), bitorder="little")
+
+
+def _get_group_size(layout):
+    """
+    :brief  Smallest run of pixels of a packed layout that starts on a byte
+    :return (pixel number, byte number) of the group
+    """
+    if layout.packing == PACKING_GVSP:
+        return 2, 3
+    pixel_num = 8 // math.gcd(layout.data_bits, 8)
+    return pixel_num, pixel_num * layout.data_bits // 8
+
+
+def _unpack_gvsp_groups(data, values, data_bits):
+    """
+    :brief  Unpack GVSP groups: byte 0 and 2 hold the high bits of the two pixels,
+            byte 1 their low bits, in its low and high nibble
+    :param  data:       np.ndarray uint8 (group number, 3)
+    :param  values:     np.ndarray uint16 (group number, 2), receives the pixels
+    """
+    low_bits = data_bits - 8
+    low_mask = (1 << low_bits) - 1
+    low = np.empty(data.shape[0], dtype=np.uint16)
+
+    np.left_shift(data[:, 0], low_bits, out=values[:, 0], dtype=np.uint16)
+    np.bitwise_and(data[:, 1], low_mask, out=low, dtype=np.uint16)
+    np.bitwise_or(values[:, 0], low, out=values[:, 0])
+
+    np.left_shift(data[:, 2], low_bits, out=values[:, 1], dtype=np.uint16)
+    np.right_shift(data[:, 1], 4, out=low, dtype=np.uint16)
+    if low_bits < 4:
+        np.bitwise_and(low, low_mask, out=low)
+    np.bitwise_or(values[:, 1], low, out=values[:, 1])
+
+
+def _unpack_pfnc_groups(data, values, data_bits):
+    """
+    :brief  Unpack PFNC groups: the pixels follow each other LSB first, pixel k of
+            a group starts at bit k * data_bits of the group
+    :param  data:       np.ndarray uint8 (group number, group bytes)
+    :param  values:     np.ndarray uint16 (group number, group pixels), receives the pixels
+    """
+    mask = (1 << data_bits) - 1
+    part = np.empty(data.shape[0], dtype=np.uint16)
+    for index in range(values.shape[1]):
+        first_bit = index * data_bits
+        last_bit = first_bit + data_bits - 1
+        first_byte = first_bit // 8
+        shift = first_bit % 8
+
+        value = values[:, index]
+        np.right_shift(data[:, first_byte], shift, out=value, dtype=np.uint16)
+        for byte in range(first_byte + 1, last_bit // 8 + 1):
+            np.left_shift(
+                data[:, byte],
+                8 * (byte - first_byte) - shift,
+                out=part,
+                dtype=np.uint16,
+            )
+            np.bitwise_or(value, part, out=value)
+        if (last_bit + 1) % 8:
+            np.bitwise_and(value, mask, out=value)
+
+
+def _unpack_groups(data, values, layout):
+    """
+    :brief  Unpack whole groups of a packed layout
+    :param  data:       np.ndarray uint8, the bytes of the groups
+    :param  values:     np.ndarray uint16, C-contiguous, receives the pixels of the groups
+    :param  layout:     PixelFormatLayout
+    """
+    group_pixels, group_bytes = _get_group_size(layout)
+    data = data.reshape(-1, group_bytes)
+    values = values.reshape(-1, group_pixels)
+    if layout.packing == PACKING_GVSP:
+        _unpack_gvsp_groups(data, values, layout.data_bits)
+    else:
+        _unpack_pfnc_groups(data, values, layout.data_bits)
+
+
+def _unpack_packed(data, layout, pixel_num, values, workers):
+    """
+    :brief  Unpack the pixels of a packed layout, the groups are split in bands
+    :param  data:       np.ndarray uint8, the image data
+    :param  values:     np.ndarray uint16, C-contiguous, of pixel_num elements
+    """
+    values = values.reshape(-1)
+    group_pixels, group_bytes = _get_group_size(layout)
+    group_num = pixel_num // group_pixels
+
+    def unpack_band(first_group, last_group):
+        _unpack_groups(
+            data[first_group * group_bytes : last_group * group_bytes],
+            values[first_group * group_pixels : last_group * group_pixels],
+            layout,
+        )
+
+    if group_num > 0:
+        run_bands(unpack_band, group_num, workers)
+
+    # pixels of a last, incomplete group
+    tail_pixels = pixel_num - group_num * group_pixels
+    if tail_pixels:
+        tail_data = np.zeros(group_bytes, dtype=np.uint8)
+        tail_bytes = data[group_num * group_bytes :]
+        tail_data[: tail_bytes.size] = tail_bytes[:group_bytes]
+        tail_values = np.empty(group_pixels, dtype=np.uint16)
+        _unpack_groups(tail_data, tail_values, layout)
+        values[group_num * group_pixels :] = tail_values[:tail_pixels]
+
+
+def unpack_pixels(data, pixel_format, width, height, out=None, workers=None):
+    """
+    :brief  Read the pixel values of an image, packed formats with vectorized NumPy,
+            without DxImageProc
+    :param  data:           image data, np.ndarray of uint8 or bytes-like object
+    :param  pixel_format:   GxPixelFormatEntry
+    :param  width:          image width
+    :param  height:         image height
+    :param  out:            np.ndarray receiving the pixel values, C-contiguous, of
+                            the shape and dtype of the result; None to allocate it
+    :param  workers:        number of row bands unpacked in parallel,
+                            None: parallel.get_default_workers
+    :return np.ndarray of the pixel values, (height, width) or (height, width, 3),
+            uint8 for 8 bit formats, uint16 otherwise; out when given
+    """
+    layout = get_pixel_format_layout(pixel_format)
+    data = np.frombuffer(data, dtype=np.uint8)
+    pixel_num = width * height * layout.channels
+    if layout.channels == 3:
+        shape = (height, width, 3)
+    else:
+        shape = (height, width)
+
+    if layout.packing == PACKING_NONE:
+        if layout.data_bits <= 8:
+            values = data[:pixel_num].reshape(shape)
+        else:
+            values = data[: pixel_num * 2].view("<u2").reshape(shape)
+            if out is None:
+                return values.astype(np.uint16)
+        if out is None:
+            return values
+        np.copyto(out, values)
+        return out
+
+    if out is None:
+        out = np.empty(shape, dtype=np.uint16)
+    if workers is None:
+        workers = get_default_workers(pixel_num)
+    _unpack_packed(data, layout, pixel_num, out, workers)
+    return out
+
+
+def get_pixel_values(
+    image, width, height, pixel_format, scratch=None, func_name="get_pixel_values"
+):
+    """
+    :brief  Pixel values of a frame given as a RawImage or an np.ndarray, checked
+            against the expected geometry; the values of a zero-copy RawImage are a
+            view of its buffer, only valid until q_buf
+    :param  image:          RawImage, or np.ndarray (height, width) of pixel values
+    :param  width:          expected width
+    :param  height:         expected height
+    :param  pixel_format:   expected GxPixelFormatEntry of a RawImage
+    :param  scratch:        np.ndarray (height, width) of uint16 the values of more
+                            than 8 bit are written to, None: a new array or a view
+    :param  func_name:      name of the caller, used in the messages
+    :return np.ndarray (height, width), None when the image does not match
+    """
+    if isinstance(image, np.ndarray):
+        if image.shape != (height, width):
+            print(
+                "%s: Expected image shape is %s, not %s"
+                % (func_name, (height, width), image.shape)
+            )
+            return None
+        return image
+
+    if (
+        image.get_width() != width
+        or image.get_height() != height
+        or image.get_pixel_format() != pixel_format
+    ):
+        print("%s: the width/height/format of the image is different" % func_name)
+        return None
+
+    if get_pixel_format_layout(pixel_format).data_bits <= 8 or scratch is None:
+        return image.get_numpy_array(view=True)
+    return image.get_numpy_array(out=scratch)
@@ -0,0 +1,31 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+from typing import Any
+
+
+def bind_prototypes(library: Any, prototypes: dict[str, tuple[Any, list[Any]]]) -> None:
+    """
+    Declare restype and argtypes of the functions exported by a shared library.
+
+    Parameters
+    ----------
+    library : ctypes.CDLL
+        The loaded library. ctypes caches its function objects, so the
+        declarations are done once and reused by every later call.
+    prototypes : dict
+        Function name mapped to a (restype, argtypes) tuple. Functions the
+        library doesn't export are skipped.
+
+    Notes
+    -----
+    With declared argtypes, ctypes converts plain Python values (int, float,
+    bytes, None) itself. The wrappers don't need to build a ctypes object for
+    every input argument of every call.
+    """
+    for name, (restype, argtypes) in prototypes.items():
+        if hasattr(library, name):
+            function = getattr(library, name)
+            function.restype = restype
+            function.argtypes = argtypes
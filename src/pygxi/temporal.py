@@ -0,0 +1,228 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import collections
+import threading
+
+import numpy as np
+
+from .errors import InvalidParameterError
+from .parallel import get_default_workers, run_bands
+from .pixelformat import get_pixel_format_layout, get_pixel_values
+
+TemporalSnapshot = collections.namedtuple(
+    "TemporalSnapshot", ["count", "mean", "variance", "minimum", "maximum"]
+)
+
+
+class _Accumulators:
+    def __init__(self, height, width, dtype):
+        """
+        :brief  Per-pixel state of one window: mean and, for the cumulative mean,
+                the sum of squared differences to it (Welford), for the exponential
+                moving average the variance itself
+        """
+        self.count = 0
+        self.mean = np.empty((height, width), dtype=np.float32)
+        self.m2 = np.empty((height, width), dtype=np.float32)
+        self.minimum = np.empty((height, width), dtype=dtype)
+        self.maximum = np.empty((height, width), dtype=dtype)
+
+
+class TemporalStatistics:
+    def __init__(self, width, height, pixel_format, alpha=None, window=None):
+        """
+        :brief  Per-pixel running mean, variance, minimum and maximum of a stream of
+                frames, updated in place in float32, without keeping the frames
+        :param  width:          frame width
+        :param  height:         frame height
+        :param  pixel_format:   GxPixelFormatEntry of the frames, mono or bayer
+        :param  alpha:          None: cumulative mean and sample variance (Welford),
+                                float in (0, 1]: exponential moving average and
+                                variance, weight of the newest frame
+        :param  window:         None: one window, int: the statistics restart after
+                                every window frames, the last full window is kept
+        """
+        layout = get_pixel_format_layout(pixel_format)
+        if layout is None or layout.channels != 1:
+            raise InvalidParameterError(
+                "TemporalStatistics: pixel format %s is not mono or bayer"
+                % hex(pixel_format)
+            )
+
+        if alpha is not None and not 0 < alpha <= 1:
+            raise InvalidParameterError(
+                "TemporalStatistics: alpha must be in (0, 1], not %s" % alpha
+            )
+
+        if window is not None and (not isinstance(window, int) or window < 1):
+            raise InvalidParameterError(
+                "TemporalStatistics: window must be an int of at least 1, not %s"
+                % window
+            )
+
+        self.__width = width
+        self.__height = height
+        self.__pixel_format = pixel_format
+        self.__alpha = alpha
+        self.__window = window
+        self.__dtype = np.uint8 if layout.data_bits <= 8 else np.uint16
+        self.__current = _Accumulators(height, width, self.__dtype)
+        self.__last_window = None
+        self.__unpacked = np.empty((height, width), dtype=np.uint16)
+        self.__delta = np.empty((height, width), dtype=np.float32)
+        self.__scratch = np.empty((height, width), dtype=np.float32)
+        self.__mutex = threading.Lock()
+
+    def get_count(self):
+        """
+        :brief  Number of frames of the current window
+        """
+        return self.__current.count
+
+    def reset(self):
+        """
+        :brief  Restart the statistics, the last full window is forgotten
+        :return None
+        """
+        with self.__mutex:
+            self.__current.count = 0
+            self.__last_window = None
+
+    def __next_window(self):
+        """
+        :brief  Keep the full window and restart, the arrays of the window kept
+                before are reused
+        """
+        last_window = self.__last_window
+        if last_window is None:
+            last_window = _Accumulators(self.__height, self.__width, self.__dtype)
+        self.__last_window = self.__current
+        self.__current = last_window
+        self.__current.count = 0
+
+    def add(self, image, workers=None):
+        """
+        :brief  Add a frame, the pixel values are read in place; packed formats are
+                unpacked into a buffer of the accumulator
+        :param  image:      RawImage, or np.ndarray (height, width) of the pixel values
+        :param  workers:    number of row bands updated in parallel,
+                            None: parallel.get_default_workers
+        :return True, False when the image does not match the accumulator
+        """
+        with self.__mutex:
+            values = get_pixel_values(
+                image,
+                self.__width,
+                self.__height,
+                self.__pixel_format,
+                self.__unpacked,
+                "TemporalStatistics.add",
+            )
+            if values is None:
+                return False
+
+            if self.__window is not None and self.__current.count == self.__window:
+                self.__next_window()
+            if workers is None:
+                workers = get_default_workers(self.__width * self.__height)
+
+            state = self.__current
+            state.count += 1
+            if state.count == 1:
+                update_band = self.__first_band
+            elif self.__alpha is None:
+                update_band = self.__welford_band
+            else:
+                update_band = self.__ema_band
+            run_bands(
+                lambda first, last: update_band(state, values, first, last),
+                self.__height,
+                workers,
+            )
+            return True
+
+    @staticmethod
+    def __first_band(state, values, first, last):
+        state.mean[first:last] = values[first:last]
+        state.m2[first:last] = 0
+        state.minimum[first:last] = values[first:last]
+        state.maximum[first:last] = values[first:last]
+
+    def __welford_band(self, state, values, first, last):
+        value = values[first:last]
+        mean = state.mean[first:last]
+        delta = self.__delta[first:last]
+        scratch = self.__scratch[first:last]
+
+        # mean += (x - mean) / n, m2 += (x - old mean) * (x - new mean)
+        np.subtract(value, mean, out=delta)
+        np.multiply(delta, np.float32(1.0 / state.count), out=scratch)
+        mean += scratch
+        np.subtract(value, mean, out=scratch)
+        scratch *= delta
+        state.m2[first:last] += scratch
+        self.__update_extremes(state, value, first, last)
+
+    def __ema_band(self, state, values, first, last):
+        value = values[first:last]
+        mean = state.mean[first:last]
+        variance = state.m2[first:last]
+        delta = self.__delta[first:last]
+        scratch = self.__scratch[first:last]
+        alpha = np.float32(self.__alpha)
+
+        # mean += alpha * d, variance = (1 - alpha) * (variance + alpha * d * d)
+        np.subtract(value, mean, out=delta)
+        np.multiply(delta, alpha, out=scratch)
+        mean += scratch
+        scratch *= delta
+        variance += scratch
+        variance *= np.float32(1) - alpha
+        self.__update_extremes(state, value, first, last)
+
+    @staticmethod
+    def __update_extremes(state, value, first, last):
+        minimum = state.minimum[first:last]
+        maximum = state.maximum[first:last]
+        np.minimum(minimum, value, out=minimum)
+        np.maximum(maximum, value, out=maximum)
+
+    def __snapshot(self, state, out):
+        if out is None:
+            out = TemporalSnapshot(
+                0,
+                np.empty((self.__height, self.__width), dtype=np.float32),
+                np.empty((self.__height, self.__width), dtype=np.float32),
+                np.empty((self.__height, self.__width), dtype=self.__dtype),
+                np.empty((self.__height, self.__width), dtype=self.__dtype),
+            )
+
+        np.copyto(out.mean, state.mean)
+        np.copyto(out.minimum, state.minimum)
+        np.copyto(out.maximum, state.maximum)
+        if self.__alpha is not None:
+            np.copyto(out.variance, state.m2)
+        elif state.count > 1:
+            np.multiply(state.m2, np.float32(1.0 / (state.count - 1)), out=out.variance)
+        else:
+            out.variance.fill(0)
+        return out._replace(count=state.count)
+
+    def snapshot(self, out=None, last_window=False):
+        """
+        :brief  Copy of the statistics, taken between two frames, while frames are
+                still added from other threads
+        :param  out:            TemporalSnapshot returned before, its arrays receive
+                                the copy instead of new arrays
+        :param  last_window:    True: statistics of the last full window
+        :return TemporalSnapshot(count, mean, variance, minimum, maximum), float32
+                mean and variance, the sample variance for the cumulative mean;
+                minimum and maximum of the pixel dtype; None when no frame was added
+        """
+        with self.__mutex:
+            state = self.__last_window if last_window else self.__current
+            if state is None or state.count == 0:
+                return None
+            return self.__snapshot(state, out)
@@ -0,0 +1,190 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import threading
+import time
+
+import numpy as np
+
+from .demosaic import _RED_POSITIONS
+from .errors import InvalidParameterError
+from .gxidef import GxAutoEntry, GxBalanceRatioSelectorEntry
+
+_BALANCE_RATIO_CHANNELS = (
+    GxBalanceRatioSelectorEntry.RED,
+    GxBalanceRatioSelectorEntry.GREEN,
+    GxBalanceRatioSelectorEntry.BLUE,
+)
+
+
+def estimate_white_balance(
+    values, color_filter, data_bits, step=1, saturation=0.98, black_level=0
+):
+    """
+    :brief  Gray world white balance ratios of raw bayer data, from strided views of
+            the four CFA positions, without demosaicing. 2x2 cells with a sample at
+            or above the saturation level are left out
+    :param  values:         np.ndarray (height, width) of uint8 or uint16, its first
+                            2x2 cell has the layout of color_filter, e.g. a crop of a
+                            frame starting on an even row and column
+    :param  color_filter:   GxPixelColorFilterEntry of the first 2x2 cell, bayer
+    :param  data_bits:      bits of the pixel values
+    :param  step:           one 2x2 cell of step x step is read, int or
+                            (row step, column step)
+    :param  saturation:     fraction of the full scale from which a sample is clipped
+    :param  black_level:    pixel value of black, subtracted from the means
+    :return (r_ratio, g_ratio, b_ratio), the gains giving red and blue the mean of
+            green; None when every cell is saturated or dark
+    """
+    if color_filter not in _RED_POSITIONS:
+        raise InvalidParameterError(
+            "estimate_white_balance: color_filter %s is not a bayer layout"
+            % color_filter
+        )
+
+    if isinstance(step, int):
+        row_step, column_step = step, step
+    else:
+        row_step, column_step = step
+    height, width = values.shape
+    height -= height % 2
+    width -= width % 2
+
+    def plane(y, x):
+        return values[y : height : 2 * row_step, x : width : 2 * column_step]
+
+    red_y, red_x = _RED_POSITIONS[color_filter]
+    red = plane(red_y, red_x)
+    blue = plane(1 - red_y, 1 - red_x)
+    green = (plane(red_y, 1 - red_x), plane(1 - red_y, red_x))
+
+    limit = saturation * ((1 << data_bits) - 1)
+    brightest = np.maximum(np.maximum(red, blue), np.maximum(*green))
+    valid = brightest < limit
+    count = np.count_nonzero(valid)
+    if count == 0:
+        return None
+
+    def mean(samples):
+        return np.sum(samples, where=valid, dtype=np.float64) / count - black_level
+
+    red_mean = mean(red)
+    blue_mean = mean(blue)
+    green_mean = (mean(green[0]) + mean(green[1])) / 2
+    if min(red_mean, green_mean, blue_mean) <= 0:
+        return None
+    return float(green_mean / red_mean), 1.0, float(green_mean / blue_mean)
+
+
+class WhiteBalanceController:
+    def __init__(
+        self,
+        device,
+        interval=0.5,
+        smoothing=0.5,
+        tolerance=0.005,
+        roi=None,
+        step=4,
+        saturation=0.98,
+        black_level=0,
+    ):
+        """
+        :brief  Software auto white balance: the ratios estimated on raw frames by
+                RawImage.get_white_balance_ratio are written to the BalanceRatio
+                features of the device, at most once per interval. The camera
+                auto white balance is turned off
+        :param  device:         Device object of a color camera
+        :param  interval:       minimum time between two writes, in seconds; frames
+                                given in between are not read
+        :param  smoothing:      in [0, 1), part of the correction left for the next
+                                updates, 0: the estimate is applied at once
+        :param  tolerance:      relative change of the ratios below which they are
+                                not written
+        :param  roi:            (x, y, width, height) measured, None: whole frame
+        :param  step:           one 2x2 cell of step x step is read
+        :param  saturation:     fraction of the full scale from which a sample is clipped
+        :param  black_level:    pixel value of black
+        """
+        if not 0 <= smoothing < 1:
+            raise InvalidParameterError(
+                "WhiteBalanceController: smoothing must be in [0, 1), not %s"
+                % smoothing
+            )
+
+        self.__device = device
+        self.__interval = interval
+        self.__smoothing = smoothing
+        self.__tolerance = tolerance
+        self.__options = dict(
+            roi=roi, step=step, saturation=saturation, black_level=black_level
+        )
+        self.__last_update = None
+        self.__mutex = threading.Lock()
+
+        balance_white_auto = device.BalanceWhiteAuto
+        if balance_white_auto.is_implemented() and balance_white_auto.is_writable():
+            balance_white_auto.set(GxAutoEntry.OFF)
+
+        ratio_range = device.BalanceRatio.get_range()
+        self.__ratio_min = ratio_range["min"]
+        self.__ratio_max = ratio_range["max"]
+        self.__ratios = []
+        for channel in _BALANCE_RATIO_CHANNELS:
+            device.BalanceRatioSelector.set(channel)
+            self.__ratios.append(device.BalanceRatio.get())
+
+    def get_ratios(self):
+        """
+        :brief  Balance ratios last written or read from the device
+        :return (r_ratio, g_ratio, b_ratio)
+        """
+        return tuple(self.__ratios)
+
+    def update(self, image, timestamp=None):
+        """
+        :brief  Estimate the white balance of a frame and correct the device ratios,
+                call it with the acquired frames, e.g. from a capture callback
+        :param  image:      RawImage of the camera, bayer
+        :param  timestamp:  time of the frame in seconds, None: time.monotonic()
+        :return (r_ratio, g_ratio, b_ratio) written, None when the interval has not
+                elapsed, the frame can't be measured or the change is below tolerance
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        with self.__mutex:
+            if (
+                self.__last_update is not None
+                and timestamp - self.__last_update < self.__interval
+            ):
+                return None
+            self.__last_update = timestamp
+
+            # the frame was taken with the current ratios, the estimate is what is left
+            residual = image.get_white_balance_ratio(**self.__options)
+            if residual is None:
+                return None
+
+            ratios = [
+                min(
+                    max(ratio * factor ** (1 - self.__smoothing), self.__ratio_min),
+                    self.__ratio_max,
+                )
+                for ratio, factor in zip(self.__ratios, residual)
+            ]
+            change = max(
+                abs(new - old) / old if old > 0 else abs(new)
+                for new, old in zip(ratios, self.__ratios)
+            )
+            if change < self.__tolerance:
+                return None
+
+            for channel, ratio, old in zip(
+                _BALANCE_RATIO_CHANNELS, ratios, self.__ratios
+            ):
+                if ratio != old:
+                    self.__device.BalanceRatioSelector.set(channel)
+                    self.__device.BalanceRatio.set(ratio)
+            self.__ratios = ratios
+            return tuple(ratios)
@@ -0,0 +1,81 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import os
+
+# the backend is selected when pygxi is imported, the tests run without the Galaxy SDK
+os.environ.setdefault("PYGXI_BACKEND", "simulated")
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+import pygxi.gxwrapper as gx  # noqa: E402
+from pygxi.DeviceManager import DeviceManager  # noqa: E402
+from pygxi.gxidef import GxFrameStatusList, GxPixelFormatEntry  # noqa: E402
+from pygxi.gxsimulator import SimulatedCamera  # noqa: E402
+from pygxi.gxwrapper import GxFrameData  # noqa: E402
+from pygxi.ImageProc import RawImage  # noqa: E402
+from pygxi.pixelformat import pack_pixels  # noqa: E402
+
+
+@pytest.fixture
+def make_raw_image():
+    """
+    Build copy-mode or zero-copy RawImages on NumPy arrays of pixel values; the
+    packed source buffers are kept alive until the end of the test and are
+    returned with the image, to check that they are not written.
+    """
+    sources = []
+
+    def make(values, pixel_format, zero_copy=False, frame_id=0):
+        height, width = values.shape[:2]
+        data = pack_pixels(np.ascontiguousarray(values), pixel_format)
+        sources.append(data)
+
+        frame_data = GxFrameData()
+        frame_data.status = GxFrameStatusList.SUCCESS
+        frame_data.width = width
+        frame_data.height = height
+        frame_data.pixel_format = pixel_format
+        frame_data.image_size = data.size
+        frame_data.frame_id = frame_id
+        frame_data.timestamp = 0
+        frame_data.image_buf = data.ctypes.data
+        return RawImage(frame_data, zero_copy), data
+
+    return make
+
+
+@pytest.fixture
+def device_manager():
+    """
+    Device manager listing one small simulated camera, delivering frames as fast
+    as buffers are queued.
+    """
+    gx.dll.set_cameras(
+        [
+            SimulatedCamera(
+                width=64,
+                height=48,
+                pixel_format=GxPixelFormatEntry.BAYER_RG8,
+                frame_rate=None,
+            )
+        ]
+    )
+    return DeviceManager()
+
+
+@pytest.fixture
+def camera(device_manager):
+    """
+    Open the simulated camera, closed at the end of the test.
+    """
+    device_num, _ = device_manager.update_device_list()
+    assert device_num == 1
+
+    device = device_manager.open_device_by_index(1)
+    yield device
+    if device.data_stream[0].acquisition_flag:
+        device.stream_off()
+    device.close_device()
@@ -0,0 +1,120 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import asyncio
+import threading
+
+import pytest
+
+from pygxi.AsyncFrameQueue import AsyncFrameQueue
+from pygxi.errors import InvalidCallError, InvalidParameterError
+
+
+class Frame:
+    def __init__(self, frame_id):
+        self.frame_id = frame_id
+
+    def copy(self):
+        return Frame(self.frame_id)
+
+
+def test_full_queue_blocks_the_producer():
+    async def run():
+        queue = AsyncFrameQueue(asyncio.get_running_loop(), 1)
+        producer = threading.Thread(
+            target=lambda: [queue.put(Frame(frame_id)) for frame_id in range(3)]
+        )
+        producer.start()
+        while queue.get_blocked_count() == 0:
+            await asyncio.sleep(0.01)
+
+        # the producer waits for room instead of dropping a frame
+        assert queue.get_size() == 1
+        frame_ids = [(await queue.get(1000)).frame_id for _ in range(3)]
+        producer.join(1)
+        return frame_ids, producer.is_alive(), queue.get_blocked_count()
+
+    frame_ids, producer_alive, blocked_count = asyncio.run(run())
+    assert frame_ids == [0, 1, 2]
+    assert not producer_alive
+    assert blocked_count >= 1
+
+
+def test_close_releases_the_blocked_producer():
+    async def run():
+        queue = AsyncFrameQueue(asyncio.get_running_loop(), 1)
+        queue.put(Frame(0))
+        results = []
+        producer = threading.Thread(target=lambda: results.append(queue.put(Frame(1))))
+        producer.start()
+        while queue.get_blocked_count() == 0:
+            await asyncio.sleep(0.01)
+
+        queue.close()
+        producer.join(1)
+        return results, await queue.get(), await queue.get()
+
+    results, first, second = asyncio.run(run())
+    assert results == [False]
+    assert first.frame_id == 0
+    assert second is None
+
+
+def test_get_times_out_and_can_be_cancelled():
+    async def run():
+        queue = AsyncFrameQueue(asyncio.get_running_loop(), 1)
+        assert await queue.get(10) is None
+
+        task = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # a cancelled consumer doesn't lose the next frame
+        queue.put(Frame(0))
+        return await queue.get(1000)
+
+    assert asyncio.run(run()).frame_id == 0
+
+
+def test_invalid_queue_depth():
+    with pytest.raises(InvalidParameterError):
+        AsyncFrameQueue(None, 0)
+
+
+def test_frames_need_start_async_frames(camera):
+    data_stream = camera.data_stream[0]
+
+    async def run():
+        with pytest.raises(InvalidCallError):
+            await data_stream.aget_image()
+        with pytest.raises(InvalidCallError):
+            async for _ in data_stream.aiter_frames():
+                pass
+
+    asyncio.run(run())
+
+
+def test_async_frames(camera):
+    data_stream = camera.data_stream[0]
+
+    async def run():
+        data_stream.start_async_frames(queue_depth=2)
+        camera.stream_on()
+        try:
+            image = await data_stream.aget_image()
+            frame_ids = [image.get_frame_id()]
+            async for image in data_stream.aiter_frames():
+                frame_ids.append(image.get_frame_id())
+                if len(frame_ids) == 4:
+                    break
+        finally:
+            camera.stream_off()
+            data_stream.stop_async_frames()
+        return frame_ids
+
+    frame_ids = asyncio.run(run())
+    assert frame_ids == sorted(frame_ids)
+    assert len(set(frame_ids)) == 4
@@ -0,0 +1,57 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+
+from pygxi import backend
+from pygxi.bench import compare_results, measure, run_benchmarks
+
+
+def test_measure():
+    result = measure(
+        lambda: np.zeros(1 << 16, dtype=np.uint8), frames=5, alloc_frames=2
+    )
+
+    assert result["frames"] == 5
+    assert result["fps"] > 0
+    assert result["p50_us"] <= result["p99_us"]
+    assert result["bytes_copied"] >= 1 << 16
+
+
+def test_compare_results():
+    baseline = {
+        "results": {
+            "fast": {"fps": 1000.0, "p99_us": 1000.0},
+            "failed": {"error": "RuntimeError: failure"},
+            "skipped": {"fps": 1000.0},
+        }
+    }
+    report = {
+        "results": {
+            "fast": {"fps": 500.0, "p99_us": 1050.0},
+            "failed": {"fps": 1.0},
+            "skipped": {"skipped": "not simulated"},
+        }
+    }
+
+    regressions = compare_results(report, baseline, threshold=0.1)
+    assert [(item["case"], item["metric"]) for item in regressions] == [("fast", "fps")]
+    assert compare_results(report, baseline, threshold=1.0) == []
+
+
+def test_run_benchmarks(device_manager):
+    report = run_benchmarks(
+        frames=3,
+        alloc_frames=1,
+        startup_frames=1,
+        patterns=["IntFeature.get", "ImageProcess.*", "DataStream.get_image*"],
+    )
+
+    results = report["results"]
+    assert report["backend"] == backend.BACKEND
+    assert results["IntFeature.get"]["frames"] == 3
+    assert not any("error" in result for result in results.values())
+    assert "DeviceManager.update_device_list" not in results
+    if backend.BACKEND == backend.SIMULATED:
+        assert results["ImageProcess.image_improvement"] == {"skipped": "not simulated"}
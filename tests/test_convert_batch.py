@@ -0,0 +1,75 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+from pygxi.errors import InvalidParameterError, ParameterTypeError
+from pygxi.gxidef import GxFrameStatusList, GxPixelFormatEntry
+from pygxi.ImageProc import convert_batch
+
+WIDTH, HEIGHT = 16, 12
+
+
+@pytest.fixture
+def images(make_raw_image):
+    rng = np.random.default_rng(0)
+    return [
+        make_raw_image(
+            rng.integers(0, 256, (HEIGHT, WIDTH), dtype=np.uint8),
+            GxPixelFormatEntry.BAYER_RG8,
+            frame_id=frame_id,
+        )[0]
+        for frame_id in range(5)
+    ]
+
+
+@pytest.mark.parametrize("workers", [None, 1, 3])
+def test_frames_keep_their_order(images, workers):
+    converted, failures = convert_batch(images, "RGB", workers=workers)
+
+    assert failures == {}
+    assert converted.shape == (5, HEIGHT, WIDTH, 3)
+    for frame, image in zip(converted, images):
+        np.testing.assert_array_equal(frame, image.convert("RGB").get_numpy_array())
+
+
+def test_failed_frames_are_reported(images):
+    images[1].frame_data.status = GxFrameStatusList.INCOMPLETE
+    out = np.full((5, HEIGHT, WIDTH, 3), 7, dtype=np.uint8)
+
+    converted, failures = convert_batch(images, "RGB", out=out, workers=2)
+    assert converted is out
+    assert failures == {1: "incomplete frame"}
+    assert not out[1].any()
+    np.testing.assert_array_equal(out[2], images[2].convert("RGB").get_numpy_array())
+
+
+def test_frames_of_several_sizes(images, make_raw_image):
+    small, _ = make_raw_image(
+        np.zeros((HEIGHT // 2, WIDTH // 2), dtype=np.uint8),
+        GxPixelFormatEntry.BAYER_RG8,
+    )
+    images.insert(2, small)
+    images[0].frame_data.status = GxFrameStatusList.INCOMPLETE
+
+    converted, failures = convert_batch(images, "RAW8")
+    assert isinstance(converted, list)
+    assert converted[0] is None
+    assert list(failures) == [0]
+    assert converted[2].shape == (HEIGHT // 2, WIDTH // 2)
+    assert converted[3].shape == (HEIGHT, WIDTH)
+
+    with pytest.raises(InvalidParameterError):
+        convert_batch(images, "RAW8", out=np.zeros((6, HEIGHT, WIDTH), np.uint8))
+
+
+def test_invalid_parameters(images):
+    with pytest.raises(ParameterTypeError):
+        convert_batch(images[0], "RGB")
+    with pytest.raises(ParameterTypeError):
+        convert_batch(images + [None], "RGB")
+    with pytest.raises(InvalidParameterError):
+        convert_batch(images, "RGB", out=np.zeros((4, HEIGHT, WIDTH, 3), np.uint8))
+    assert convert_batch(images, "YUV") is None
@@ -0,0 +1,83 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+from pygxi.DeviceManager import DeviceManager
+from pygxi.errors import InvalidParameterError, ParameterTypeError
+from pygxi.gxidef import DxValidBit, GxPixelFormatEntry
+
+WIDTH, HEIGHT = 16, 8
+
+
+@pytest.fixture
+def bayer_image(make_raw_image):
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 256, (HEIGHT, WIDTH), dtype=np.uint8)
+    image, _ = make_raw_image(values, GxPixelFormatEntry.BAYER_RG8)
+    return image
+
+
+def test_convert_into_out(bayer_image):
+    expected = bayer_image.convert("RGB").get_numpy_array()
+    out = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+
+    assert bayer_image.convert("RGB", out=out) is out
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_convert_into_a_batch_slice(bayer_image):
+    expected = bayer_image.convert("RGB").get_numpy_array()
+    batch = np.zeros((3, HEIGHT, WIDTH, 3), dtype=np.uint8)
+
+    bayer_image.convert("RGB", out=batch[1])
+    np.testing.assert_array_equal(batch[1], expected)
+    assert not batch[0].any() and not batch[2].any()
+
+
+def test_raw8_into_out(make_raw_image):
+    values = np.arange(HEIGHT * WIDTH, dtype=np.uint16).reshape(HEIGHT, WIDTH) << 4
+    image, _ = make_raw_image(values, GxPixelFormatEntry.MONO12)
+    expected = image.convert("RAW8", valid_bits=DxValidBit.BIT4_11).get_numpy_array()
+    out = np.zeros((HEIGHT, WIDTH), dtype=np.uint8)
+
+    image.convert("RAW8", valid_bits=DxValidBit.BIT4_11, out=out)
+    np.testing.assert_array_equal(out, expected)
+
+
+@pytest.mark.parametrize(
+    "out, error",
+    [
+        (np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint16), ParameterTypeError),
+        (np.zeros((HEIGHT, WIDTH), dtype=np.uint8), InvalidParameterError),
+        (
+            np.zeros((HEIGHT, 2 * WIDTH, 3), dtype=np.uint8)[:, ::2],
+            InvalidParameterError,
+        ),
+    ],
+)
+def test_invalid_out(bayer_image, out, error):
+    with pytest.raises(error):
+        bayer_image.convert("RGB", out=out)
+
+
+def test_read_only_out(bayer_image):
+    out = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    out.flags.writeable = False
+    with pytest.raises(InvalidParameterError):
+        bayer_image.convert("RGB", out=out)
+
+
+def test_image_format_convert_into_out(bayer_image):
+    image_format_convert = DeviceManager().create_image_format_convert()
+    image_format_convert.set_dest_format(GxPixelFormatEntry.RGB8)
+    expected = bayer_image.convert("RGB").get_numpy_array()
+    out = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+
+    assert image_format_convert.convert(bayer_image, out=out) is out
+    np.testing.assert_array_equal(out, expected)
+
+    with pytest.raises(InvalidParameterError):
+        image_format_convert.convert(bayer_image, out=out[:1])
@@ -0,0 +1,103 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+import pygxi.dxwrapper as dx
+from pygxi.errors import UnexpectedError
+from pygxi.gxidef import (
+    DxBayerConvertType,
+    DxRGBChannelOrder,
+    DxValidBit,
+    GxPixelFormatEntry,
+)
+from pygxi.ImageProc import _converter_cache, _FormatConverter, _FormatConverterCache
+
+
+@pytest.fixture
+def created_handles(monkeypatch):
+    handles = []
+    convert_create = dx.dx_image_format_convert_create
+
+    def create():
+        status, handle = convert_create()
+        handles.append(handle)
+        return status, handle
+
+    monkeypatch.setattr(dx, "dx_image_format_convert_create", create)
+    _converter_cache.clear()
+    yield handles
+    _converter_cache.clear()
+
+
+def make_converter(width=8, height=8):
+    return _FormatConverter(
+        GxPixelFormatEntry.BAYER_RG8,
+        GxPixelFormatEntry.RGB8,
+        DxValidBit.BIT0_7,
+        DxBayerConvertType.NEIGHBOUR,
+        DxRGBChannelOrder.ORDER_RGB,
+        width,
+        height,
+    )
+
+
+def test_convert_reuses_the_converter(make_raw_image, created_handles):
+    values = np.arange(16 * 8, dtype=np.uint8).reshape(8, 16)
+    image, _ = make_raw_image(values, GxPixelFormatEntry.BAYER_RG8)
+
+    first = image.convert("RGB").get_numpy_array()
+    second = image.convert("RGB").get_numpy_array()
+    assert len(created_handles) == 1
+    np.testing.assert_array_equal(first, second)
+
+    image.convert("RGB", valid_bits=DxValidBit.BIT0_7, flip=True)
+    assert len(created_handles) == 1
+    image.convert("RGB", convert_type=DxBayerConvertType.ADAPTIVE)
+    assert len(created_handles) == 2
+
+
+def test_least_recently_used_converter_is_destroyed(created_handles, monkeypatch):
+    destroyed = []
+    convert_destroy = dx.dx_image_format_convert_destroy
+
+    def destroy(handle):
+        destroyed.append(handle)
+        return convert_destroy(handle)
+
+    monkeypatch.setattr(dx, "dx_image_format_convert_destroy", destroy)
+    cache = _FormatConverterCache(2)
+    key = (
+        GxPixelFormatEntry.BAYER_RG8,
+        GxPixelFormatEntry.RGB8,
+        DxValidBit.BIT0_7,
+        DxBayerConvertType.NEIGHBOUR,
+        DxRGBChannelOrder.ORDER_RGB,
+    )
+
+    first = cache.get(*key, 8, 8)
+    cache.get(*key, 16, 8)
+    assert cache.get(*key, 8, 8) is first
+    cache.get(*key, 32, 8)
+    assert destroyed == [created_handles[1]]
+
+    cache.clear()
+    assert set(map(id, destroyed)) == set(map(id, created_handles))
+
+
+def test_converter_finalizer_does_not_raise(monkeypatch):
+    converter = make_converter()
+    monkeypatch.setattr(
+        dx,
+        "dx_image_format_convert_destroy",
+        lambda handle: dx.DxStatus.PARAMETER_INVALID,
+    )
+
+    converter.__del__()
+    assert converter.handle is None
+
+    converter = make_converter()
+    with pytest.raises(UnexpectedError):
+        converter.destroy()
@@ -0,0 +1,98 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import ctypes as ct
+
+import numpy as np
+import pytest
+
+from pygxi.defects import DefectPixelMap, build_defect_map, load_defect_map
+from pygxi.errors import InvalidCallError
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.pixelformat import unpack_pixels
+
+WIDTH, HEIGHT = 32, 24
+
+
+def test_build_finds_hot_dead_and_stuck_pixels():
+    rng = np.random.default_rng(0)
+    dark = rng.normal(1000, 20, (HEIGHT, WIDTH)).astype(np.float32)
+    flat = dark + 30000
+    hot, dead, stuck = 5 * WIDTH + 7, 10 * WIDTH + 12, 20 * WIDTH + 3
+    dark.flat[hot] += 20000
+    flat.flat[hot] += 20000
+    flat.flat[dead] = dark.flat[dead]
+    flat.flat[stuck] += 25000
+
+    defect_map = build_defect_map(
+        WIDTH, HEIGHT, GxPixelFormatEntry.BAYER_RG16, dark=dark, flat=flat
+    )
+    np.testing.assert_array_equal(defect_map.indices, sorted([hot, dead, stuck]))
+
+
+def test_neighbours_have_the_same_color():
+    defect_map = DefectPixelMap(
+        WIDTH, HEIGHT, GxPixelFormatEntry.BAYER_RG8, [0, 5 * WIDTH + 5]
+    )
+    assert defect_map.neighbors.shape == (2, 4)
+    for index, neighbors in zip(defect_map.indices, defect_map.neighbors):
+        y, x = divmod(int(index), WIDTH)
+        neighbor_y, neighbor_x = np.divmod(neighbors.astype(np.int64), WIDTH)
+        assert np.all(neighbor_y % 2 == y % 2)
+        assert np.all(neighbor_x % 2 == x % 2)
+        assert index not in neighbors
+
+
+def test_save_and_load(tmp_path):
+    defect_map = DefectPixelMap(WIDTH, HEIGHT, GxPixelFormatEntry.MONO8, [3, 40, 41])
+    path = str(tmp_path / "defects.npz")
+    defect_map.save(path)
+
+    loaded = load_defect_map(path)
+    assert (loaded.width, loaded.height) == (WIDTH, HEIGHT)
+    assert loaded.pixel_format == GxPixelFormatEntry.MONO8
+    np.testing.assert_array_equal(loaded.indices, defect_map.indices)
+    np.testing.assert_array_equal(loaded.neighbors, defect_map.neighbors)
+
+
+@pytest.mark.parametrize("name", ["BAYER_RG8", "BAYER_RG12_PACKED", "BAYER_RG16"])
+def test_raw_image_correction_keeps_the_source_buffer(make_raw_image, name):
+    pixel_format = getattr(GxPixelFormatEntry, name)
+    values = np.full((HEIGHT, WIDTH), 50, dtype=np.uint16)
+    values[4, 4] = 255
+    image, source = make_raw_image(values, pixel_format)
+    original = source.copy()
+
+    image.defective_pixel_correct(
+        DefectPixelMap(WIDTH, HEIGHT, pixel_format, [4 * WIDTH + 4])
+    )
+    assert image.get_numpy_array()[4, 4] == 50
+    np.testing.assert_array_equal(source, original)
+    # frame_data.image_buf follows the data of the image, for DxImageProc
+    image_buf = ct.string_at(image.frame_data.image_buf, source.size)
+    np.testing.assert_array_equal(
+        unpack_pixels(image_buf, pixel_format, WIDTH, HEIGHT), image.get_numpy_array()
+    )
+
+
+def test_zero_copy_image_is_read_only(make_raw_image):
+    pixel_format = GxPixelFormatEntry.MONO8
+    image, _ = make_raw_image(
+        np.zeros((HEIGHT, WIDTH), dtype=np.uint8), pixel_format, zero_copy=True
+    )
+    with pytest.raises(InvalidCallError):
+        image.defective_pixel_correct(DefectPixelMap(WIDTH, HEIGHT, pixel_format, [0]))
+
+
+def test_copy_mode_frame_is_corrected_after_q_buf(camera):
+    data_stream = camera.data_stream[0]
+    camera.stream_on()
+    image = data_stream.dq_buf()
+    data_stream.q_buf(image)
+    defect_map = DefectPixelMap(64, 48, GxPixelFormatEntry.BAYER_RG8, [0])
+    samples = np.sort(image.get_numpy_array().reshape(-1)[defect_map.neighbors[0]])
+
+    image.defective_pixel_correct(defect_map)
+    expected = (int(samples[1]) + int(samples[2]) + 1) >> 1
+    assert image.get_numpy_array()[0, 0] == expected
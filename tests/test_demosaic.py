@@ -0,0 +1,76 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+from pygxi import demosaic
+from pygxi.gxidef import GxPixelColorFilterEntry, GxPixelFormatEntry
+
+COLOR = (40, 120, 200)
+
+
+def bayer_of_color(color_filter, height=16, width=24, color=COLOR):
+    """
+    Raw frame of a uniform color, red at the _RED_POSITIONS of color_filter
+    """
+    red_y, red_x = demosaic._RED_POSITIONS[color_filter]
+    raw = np.full((height, width), color[1], dtype=np.uint8)
+    raw[red_y::2, red_x::2] = color[0]
+    raw[1 - red_y :: 2, 1 - red_x :: 2] = color[2]
+    return raw
+
+
+@pytest.mark.parametrize("mode", demosaic.MODES)
+@pytest.mark.parametrize(
+    "color_filter",
+    [
+        GxPixelColorFilterEntry.BAYER_RG,
+        GxPixelColorFilterEntry.BAYER_GB,
+        GxPixelColorFilterEntry.BAYER_GR,
+        GxPixelColorFilterEntry.BAYER_BG,
+    ],
+)
+def test_uniform_color_is_recovered(mode, color_filter):
+    rgb = demosaic.demosaic(bayer_of_color(color_filter), color_filter, mode)
+    assert rgb.shape == (16, 24, 3)
+    np.testing.assert_array_equal(rgb, np.broadcast_to(COLOR, rgb.shape))
+
+
+@pytest.mark.parametrize("mode", demosaic.MODES)
+def test_bands_match_single_band(mode):
+    rng = np.random.default_rng(1)
+    raw = rng.integers(0, 4096, (64, 48)).astype(np.uint16)
+    color_filter = GxPixelColorFilterEntry.BAYER_RG
+
+    single = demosaic.demosaic(raw, color_filter, mode, workers=1)
+    banded = demosaic.demosaic(raw, color_filter, mode, workers=4)
+    np.testing.assert_array_equal(banded, single)
+
+
+def test_out_view_receives_bgr():
+    color_filter = GxPixelColorFilterEntry.BAYER_GR
+    out = np.empty((16, 24, 3), dtype=np.uint8)
+
+    result = demosaic.demosaic(bayer_of_color(color_filter), color_filter, out=out)
+    assert result is out
+    demosaic.demosaic(bayer_of_color(color_filter), color_filter, out=out[..., ::-1])
+    np.testing.assert_array_equal(out, np.broadcast_to(COLOR[::-1], out.shape))
+
+
+def test_mono_is_copied_to_every_channel():
+    raw = np.arange(48, dtype=np.uint8).reshape(6, 8)
+    rgb = demosaic.demosaic(raw, GxPixelColorFilterEntry.NONE)
+    for channel in range(3):
+        np.testing.assert_array_equal(rgb[..., channel], raw)
+
+
+def test_raw_image_convert_numpy_engine(make_raw_image):
+    color_filter = GxPixelColorFilterEntry.BAYER_RG
+    image, _ = make_raw_image(
+        bayer_of_color(color_filter), GxPixelFormatEntry.BAYER_RG8
+    )
+
+    rgb = image.convert("RGB", engine="numpy").get_numpy_array()
+    np.testing.assert_array_equal(rgb, np.broadcast_to(COLOR, rgb.shape))
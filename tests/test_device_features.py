@@ -0,0 +1,83 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import ast
+import collections
+import inspect
+
+import pytest
+
+import pygxi.Device
+import pygxi.Feature as feat
+import pygxi.gxwrapper as gx
+from pygxi.Device import Device, GEVDevice, U2Device
+
+
+@pytest.fixture
+def feature_name_calls(monkeypatch):
+    calls = []
+    get_feature_name = gx.gx_get_feature_name
+
+    def count(handle, feature_id):
+        calls.append(feature_id)
+        return get_feature_name(handle, feature_id)
+
+    monkeypatch.setattr(gx, "gx_get_feature_name", count)
+    monkeypatch.setattr(feat, "_feature_name_cache", {})
+    return calls
+
+
+def test_features_are_created_on_first_access(camera, feature_name_calls):
+    assert "Gain" not in vars(camera)
+
+    gain = camera.Gain
+    assert isinstance(gain, feat.FloatFeature)
+    assert vars(camera)["Gain"] is gain
+    assert camera.Gain is gain
+    assert isinstance(camera.TecEnable, feat.BoolFeature)
+    assert camera.TecEnable._Feature__feature == gx.GxFeatureID.BOOL_TEC_ENABLE
+    # the names are only got when they are used
+    assert feature_name_calls == []
+
+
+def test_feature_names_are_shared_by_the_model(camera, feature_name_calls):
+    gain = camera.Gain
+    other_gain = feat.FloatFeature(
+        gain._Feature__handle, gx.GxFeatureID.FLOAT_GAIN, gain._Feature__model_name
+    )
+
+    assert gain.feature_name == "Gain"
+    assert other_gain.feature_name == "Gain"
+    assert feature_name_calls == [gx.GxFeatureID.FLOAT_GAIN]
+
+
+def test_unknown_attribute(camera):
+    with pytest.raises(AttributeError):
+        camera.NotAFeature
+    assert not hasattr(camera, "NotAFeature")
+
+
+def test_dir_lists_the_features(camera):
+    names = dir(camera)
+    assert set(type(camera).FEATURES) <= set(names)
+    assert "close_device" in names
+
+
+@pytest.mark.parametrize("device_class", [Device, GEVDevice, U2Device])
+def test_feature_table(device_class):
+    for name, (feature_class, feature_id) in device_class.FEATURES.items():
+        assert issubclass(feature_class, feat.Feature), name
+        assert isinstance(feature_id, int), name
+
+
+def test_feature_tables_have_no_duplicate_keys():
+    # a repeated key silently replaces the first entry of a dict display
+    tree = ast.parse(inspect.getsource(pygxi.Device))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Dict):
+            keys = [key.value for key in node.keys if isinstance(key, ast.Constant)]
+            duplicates = [
+                key for key, count in collections.Counter(keys).items() if count > 1
+            ]
+            assert duplicates == [], node.lineno
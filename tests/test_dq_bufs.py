@@ -0,0 +1,62 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+import pygxi.gxwrapper as gx
+from pygxi.errors import InvalidParameterError
+
+
+@pytest.fixture
+def data_stream(camera):
+    data_stream = camera.data_stream[0]
+    camera.stream_on()
+    return data_stream
+
+
+def test_dq_bufs_stack(data_stream):
+    frames, metadata = data_stream.dq_bufs(3)
+
+    assert frames.shape == (3, 48, 64)
+    assert frames.dtype == np.uint8
+    assert np.all(np.diff(metadata["frame_id"].astype(np.int64)) > 0)
+
+
+def test_dq_bufs_into_out(data_stream):
+    out = np.zeros((4, 48, 64), dtype=np.uint8)
+    frames, metadata = data_stream.dq_bufs(3, out=out)
+
+    assert np.shares_memory(frames, out)
+    assert frames.shape == (3, 48, 64)
+    assert len(metadata) == 3
+
+
+@pytest.mark.parametrize(
+    "shape, dtype",
+    [((3, 48, 64), np.uint16), ((3, 64, 48), np.uint8), ((3, 48 * 64), np.uint8)],
+)
+def test_dq_bufs_checks_the_frames_of_out(data_stream, shape, dtype):
+    with pytest.raises(InvalidParameterError):
+        data_stream.dq_bufs(3, out=np.zeros(shape, dtype=dtype))
+
+    # the buffers were given back to the driver
+    frames, _ = data_stream.dq_bufs(3)
+    assert len(frames) == 3
+
+
+def test_dq_bufs_stops_when_no_frame_is_got(data_stream, monkeypatch):
+    if not hasattr(gx, "gx_dq_all_bufs"):
+        pytest.skip("GXDQAllBufs not available")
+
+    monkeypatch.setattr(
+        gx,
+        "gx_dq_all_bufs",
+        lambda handle, array, size, timeout: (gx.GxStatusList.SUCCESS, 0),
+    )
+    monkeypatch.setattr(gx, "gx_q_all_bufs", lambda handle: gx.GxStatusList.SUCCESS)
+
+    frames, metadata = data_stream.dq_bufs(3)
+    assert frames is None
+    assert len(metadata) == 0
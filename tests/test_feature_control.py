@@ -0,0 +1,111 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import pytest
+
+import pygxi.gxwrapper as gx
+from pygxi.FeatureControl import FeatureControl
+
+
+@pytest.fixture
+def access_mode_calls(monkeypatch):
+    calls = []
+    get_node_access_mode = gx.gx_get_node_access_mode
+
+    def count(handle, feature_name):
+        calls.append(feature_name)
+        return get_node_access_mode(handle, feature_name)
+
+    monkeypatch.setattr(gx, "gx_get_node_access_mode", count)
+    return calls
+
+
+@pytest.fixture
+def unregistered_callbacks(monkeypatch):
+    calls = []
+    unregister = gx.gx_unregister_feature_call_back_by_string
+
+    def record(handle, feature_name, callback_handle):
+        calls.append(feature_name)
+        return unregister(handle, feature_name, callback_handle)
+
+    monkeypatch.setattr(gx, "gx_unregister_feature_call_back_by_string", record)
+    return calls
+
+
+def test_feature_objects_are_created_once(camera):
+    feature_control = camera.get_remote_device_feature_control()
+
+    gain = feature_control.get_float_feature("Gain")
+    assert feature_control.get_float_feature("Gain") is gain
+    assert feature_control.get_int_feature("Width") is not gain
+
+
+def test_access_mode_is_cached(camera, access_mode_calls):
+    feature_control = camera.get_remote_device_feature_control()
+
+    assert feature_control.is_implemented("Gain")
+    assert feature_control.is_readable("Gain")
+    assert feature_control.is_writable("Gain")
+    assert access_mode_calls == ["Gain"]
+
+    feature_control.invalidate("Gain")
+    feature_control.is_implemented("Gain")
+    assert access_mode_calls == ["Gain", "Gain"]
+
+
+def test_feature_callback_drops_the_cached_entry(camera, access_mode_calls):
+    feature_control = camera.get_remote_device_feature_control()
+    gain = feature_control.get_float_feature("Gain")
+    feature_control.is_implemented("Width")
+    access_mode_calls.clear()
+
+    gain.set(2.0)
+    feature_control.is_implemented("Width")
+    feature_control.is_implemented("Gain")
+    assert access_mode_calls == ["Gain"]
+
+
+def test_close_unregisters_the_callbacks(
+    camera, access_mode_calls, unregistered_callbacks
+):
+    feature_control = camera.get_remote_device_feature_control()
+    feature_control.is_implemented("Gain")
+    feature_control.is_implemented("Width")
+
+    feature_control.close()
+    assert sorted(unregistered_callbacks) == ["Gain", "Width"]
+    feature_control.close()
+    assert len(unregistered_callbacks) == 2
+
+    # the callbacks are registered again on next use
+    feature_control.is_implemented("Gain")
+    assert access_mode_calls == ["Gain", "Width", "Gain"]
+
+
+def test_close_device_closes_the_feature_controls(
+    device_manager, unregistered_callbacks, monkeypatch
+):
+    closed = []
+    close = FeatureControl.close
+
+    def record(feature_control):
+        closed.append(feature_control)
+        close(feature_control)
+
+    monkeypatch.setattr(FeatureControl, "close", record)
+    device_num, _ = device_manager.update_device_list()
+    if device_num == 0:
+        pytest.skip("no device found")
+
+    device = device_manager.open_device_by_index(1)
+    remote_feature_control = device.get_remote_device_feature_control()
+    remote_feature_control.is_implemented("Gain")
+    interface_feature_control = device.get_parent_interface().get_feature_control()
+    device.close_device()
+
+    assert unregistered_callbacks == ["Gain"]
+    assert remote_feature_control in closed
+    assert interface_feature_control in closed
+    assert device.data_stream[0].get_feature_control() in closed
@@ -0,0 +1,102 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import ctypes as ct
+
+import numpy as np
+import pytest
+
+import pygxi.dxwrapper as dx
+from pygxi.flatfield import (
+    FlatFieldCalibration,
+    flat_field_correction,
+    load_coefficients,
+)
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.ImageProc import Buffer
+
+WIDTH, HEIGHT = 16, 8
+
+
+def vignetted(level, pixel_format=GxPixelFormatEntry.MONO12):
+    """
+    Frame of a uniform target, darker towards the right
+    """
+    shading = np.linspace(1.0, 0.5, WIDTH)[np.newaxis, :]
+    return np.broadcast_to(np.round(level * shading), (HEIGHT, WIDTH)).astype(np.uint16)
+
+
+def calibrate(pixel_format=GxPixelFormatEntry.MONO12):
+    calibration = FlatFieldCalibration(WIDTH, HEIGHT, pixel_format)
+    for _ in range(3):
+        assert calibration.add_bright(vignetted(2000))
+        assert calibration.add_dark(np.full((HEIGHT, WIDTH), 100, dtype=np.uint16))
+    return calibration.get_coefficients(target_value=1900)
+
+
+def test_correction_flattens_the_field():
+    coefficients = calibrate()
+    corrected = flat_field_correction(vignetted(2000), coefficients)
+    assert np.abs(corrected.astype(np.int32) - 1900).max() <= 1
+
+
+def test_save_and_load(tmp_path):
+    coefficients = calibrate()
+    coefficients.serial = "SIM0001"
+    coefficients.save(str(tmp_path))
+
+    loaded = load_coefficients(
+        str(tmp_path), "SIM0001", coefficients.roi, GxPixelFormatEntry.MONO12
+    )
+    np.testing.assert_array_equal(loaded.gain, coefficients.gain)
+    np.testing.assert_array_equal(loaded.dark, coefficients.dark)
+    assert (
+        load_coefficients(
+            str(tmp_path), "SIM0002", coefficients.roi, GxPixelFormatEntry.MONO12
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize("name", ["MONO8", "MONO12_PACKED", "MONO12"])
+def test_raw_image_correction_keeps_the_source_buffer(make_raw_image, name):
+    pixel_format = getattr(GxPixelFormatEntry, name)
+    bright = vignetted(200)
+    calibration = FlatFieldCalibration(WIDTH, HEIGHT, pixel_format)
+    calibration.add_bright(bright)
+    coefficients = calibration.get_coefficients(target_value=150)
+
+    image, source = make_raw_image(bright, pixel_format)
+    original = source.copy()
+    out = np.empty((HEIGHT, WIDTH), dtype=image.get_numpy_array().dtype)
+    assert image.flat_field_correction(coefficients, out=out) is out
+    np.testing.assert_array_equal(out, 150)
+    np.testing.assert_array_equal(image.get_numpy_array(), bright)
+
+    assert image.flat_field_correction(coefficients) is None
+    np.testing.assert_array_equal(image.get_numpy_array(), 150)
+    np.testing.assert_array_equal(source, original)
+
+
+def test_buffer_coefficients_use_dx_image_proc(make_raw_image, monkeypatch):
+    calls = []
+
+    def flat_field_correction(
+        input_address, output_address, actual_bits, width, height, coefficients, length
+    ):
+        calls.append(length._obj.value)
+        ct.memset(output_address.value, 7, width.value * height.value)
+        return dx.DxStatus.OK
+
+    monkeypatch.setattr(
+        dx.dll, "DxFlatFieldCorrection", flat_field_correction, raising=False
+    )
+    image, source = make_raw_image(
+        np.full((HEIGHT, WIDTH), 100, dtype=np.uint8), GxPixelFormatEntry.MONO8
+    )
+    image.flat_field_correction(Buffer((ct.c_ubyte * 32)()))
+
+    assert calls == [32]
+    np.testing.assert_array_equal(image.get_numpy_array(), 7)
+    np.testing.assert_array_equal(source, 100)
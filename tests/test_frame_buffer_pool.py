@@ -0,0 +1,74 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+from pygxi.errors import InvalidCallError, InvalidParameterError
+from pygxi.FrameBufferPool import FrameBufferPool
+
+
+@pytest.fixture
+def data_stream(camera):
+    data_stream = camera.data_stream[0]
+    data_stream.set_frame_buffer_pool_size(2)
+    camera.stream_on()
+    return data_stream
+
+
+def test_pool_round_robin_and_exhaustion():
+    pool = FrameBufferPool(2, 16)
+    assert [pool.acquire(), pool.acquire()] == [0, 1]
+    assert pool.acquire() is None
+    assert pool.get_exhausted_count() == 1
+
+    pool.release(0)
+    assert pool.get_free_num() == 1
+    assert pool.acquire() == 0
+    assert pool.get_acquired_count() == 3
+    assert pool.get_buffer_address(0) != pool.get_buffer_address(1)
+
+
+def test_pool_release_twice():
+    pool = FrameBufferPool(1, 16)
+    pool.release(pool.acquire())
+    with pytest.raises(InvalidParameterError):
+        pool.release(0)
+
+
+def test_frame_buffer_pool(data_stream):
+    first = data_stream.get_image()
+    second = data_stream.get_image()
+    assert data_stream.get_frame_buffer_pool().get_free_num() == 0
+
+    # the pool is exhausted, the next image is allocated
+    third = data_stream.get_image()
+    assert not third.is_zero_copy()
+    assert data_stream.get_frame_buffer_pool().get_exhausted_count() == 1
+
+    data_stream.release_image(first)
+    assert not first.is_buffer_valid()
+    with pytest.raises(InvalidParameterError):
+        data_stream.release_image(first)
+    with pytest.raises(InvalidParameterError):
+        data_stream.release_image(third)
+    data_stream.release_image(second)
+    assert data_stream.get_frame_buffer_pool().get_free_num() == 2
+
+
+def test_pool_image_is_a_view_until_release(data_stream):
+    image = data_stream.get_image()
+    frame_buffer_pool = data_stream.get_frame_buffer_pool()
+    address = frame_buffer_pool.get_buffer_address(0)
+
+    view = image.get_numpy_array()
+    assert view.ctypes.data == address
+    assert not view.flags.writeable
+    copy = image.get_numpy_array(view=False)
+    assert not np.shares_memory(copy, view)
+    np.testing.assert_array_equal(copy, view)
+
+    data_stream.release_image(image)
+    with pytest.raises(InvalidCallError):
+        image.get_numpy_array()
@@ -0,0 +1,146 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import time
+
+import numpy as np
+import pytest
+
+from pygxi.errors import InvalidParameterError
+from pygxi.framestats import CFA, GRAY, RGB, FrameStatisticsEngine
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.pixelformat import get_pixel_format_layout
+
+WIDTH, HEIGHT = 32, 16
+
+
+def random_values(data_bits, seed=0):
+    rng = np.random.default_rng(seed)
+    dtype = np.uint8 if data_bits <= 8 else np.uint16
+    return rng.integers(0, 1 << data_bits, (HEIGHT, WIDTH)).astype(dtype)
+
+
+def cfa_histograms(values, step, bins, shift):
+    return [
+        np.bincount(
+            (values[dy :: 2 * step, dx :: 2 * step] >> shift).reshape(-1),
+            minlength=bins,
+        )
+        for dy in (0, 1)
+        for dx in (0, 1)
+    ]
+
+
+@pytest.mark.parametrize(
+    "name, data_bits",
+    [("BAYER_RG8", 8), ("BAYER_RG12_PACKED", 12), ("BAYER_RG16", 16)],
+)
+@pytest.mark.parametrize("step", [1, 2])
+def test_cfa_histograms_match_bincount(make_raw_image, name, data_bits, step):
+    values = random_values(data_bits)
+    image, _ = make_raw_image(values, getattr(GxPixelFormatEntry, name))
+
+    statistics = FrameStatisticsEngine(step=step, bins=64, channels=CFA).process(image)
+    shift = data_bits - 6
+    expected = cfa_histograms(values, step, 64, shift)
+    assert statistics.channels == ("R", "Gr", "Gb", "B")
+    np.testing.assert_array_equal(statistics.histograms, expected)
+    assert statistics.bin_width == 1 << shift
+    assert statistics.sample_count == sum(histogram.sum() for histogram in expected)
+
+
+def test_rgb_and_gray_channels(make_raw_image):
+    values = random_values(8)
+    image, _ = make_raw_image(values, GxPixelFormatEntry.BAYER_RG8)
+    red, green_red, green_blue, blue = cfa_histograms(values, 1, 256, 0)
+
+    rgb = FrameStatisticsEngine(step=1, channels=RGB).process(image)
+    assert rgb.channels == ("R", "G", "B")
+    np.testing.assert_array_equal(rgb.histograms, [red, green_red + green_blue, blue])
+
+    gray = FrameStatisticsEngine(step=1, channels=GRAY).process(image)
+    np.testing.assert_array_equal(gray.histograms[0], np.bincount(values.reshape(-1)))
+    assert gray.mean == pytest.approx(values.mean())
+
+
+def test_weight_roi_counts_samples_several_times(make_raw_image):
+    values = random_values(8)
+    image, _ = make_raw_image(values, GxPixelFormatEntry.MONO8)
+    center = (8, 4, 16, 8)
+
+    statistics = FrameStatisticsEngine(
+        step=1, channels=GRAY, weight_roi=center, weight=3
+    ).process(image)
+    expected = np.bincount(values.reshape(-1), minlength=256)
+    expected += 2 * np.bincount(values[4:12, 8:24].reshape(-1), minlength=256)
+    np.testing.assert_array_equal(statistics.histograms[0], expected)
+
+
+def test_clipped_fractions_and_percentiles(make_raw_image):
+    values = np.zeros((HEIGHT, WIDTH), dtype=np.uint8)
+    values[:, WIDTH // 2 :] = 255
+    image, _ = make_raw_image(values, GxPixelFormatEntry.MONO8)
+
+    engine = FrameStatisticsEngine(step=1, percentiles=(25, 75))
+    statistics = engine.process(image)
+    assert statistics.clipped_low == pytest.approx(0.5)
+    assert statistics.clipped_high == pytest.approx(0.5)
+    np.testing.assert_array_equal(statistics.percentiles, [0, 255])
+    assert engine.get_last() is statistics
+
+
+def test_invalid_parameters():
+    with pytest.raises(InvalidParameterError):
+        FrameStatisticsEngine(bins=100)
+    with pytest.raises(InvalidParameterError):
+        FrameStatisticsEngine(step=0)
+    with pytest.raises(InvalidParameterError):
+        FrameStatisticsEngine(channels="hsv")
+
+
+@pytest.mark.parametrize("name", ["BAYER_RG8", "MONO12_PACKED", "BAYER_RG10_P"])
+def test_get_numpy_rows_matches_get_numpy_array(make_raw_image, name):
+    pixel_format = getattr(GxPixelFormatEntry, name)
+    values = random_values(get_pixel_format_layout(pixel_format).data_bits)
+    image, _ = make_raw_image(values, pixel_format)
+    rows = [0, 3, 4]
+
+    np.testing.assert_array_equal(
+        image.get_numpy_rows(rows), image.get_numpy_array()[rows]
+    )
+
+
+def test_frame_statistics_hook(camera):
+    data_stream = camera.data_stream[0]
+    data_stream.set_frame_statistics(FrameStatisticsEngine(step=1))
+    camera.stream_on()
+
+    image = data_stream.get_image()
+    statistics = data_stream.get_frame_statistics()
+    assert statistics.frame_id == image.get_frame_id()
+    assert statistics.sample_count == 64 * 48
+
+
+def test_frame_statistics_failure_is_kept_for_the_consumer(camera):
+    class FailingEngine(FrameStatisticsEngine):
+        def process(self, image):
+            raise RuntimeError("statistics failure")
+
+    frame_ids = []
+    data_stream = camera.data_stream[0]
+    data_stream.set_frame_statistics(FailingEngine())
+    data_stream.register_capture_callback(
+        lambda image: frame_ids.append(image.get_frame_id())
+    )
+    camera.stream_on()
+    deadline = time.monotonic() + 5
+    while len(frame_ids) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    camera.stream_off()
+    data_stream.unregister_capture_callback()
+
+    assert len(frame_ids) >= 3
+    with pytest.raises(RuntimeError):
+        data_stream.get_frame_statistics()
+    assert data_stream.get_frame_statistics() is None
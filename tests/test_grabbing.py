@@ -0,0 +1,99 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import threading
+import time
+
+import pytest
+
+from pygxi.errors import InvalidCallError, InvalidParameterError
+from pygxi.FrameQueue import FrameQueue
+from pygxi.gxidef import GxQueueOverflowPolicy
+from pygxi.ImageProc import RawImage
+
+
+def test_drop_oldest_keeps_the_newest_frames():
+    queue = FrameQueue(2, GxQueueOverflowPolicy.DROP_OLDEST)
+    for frame in range(4):
+        assert queue.put(frame)
+
+    assert [queue.get(0), queue.get(0)] == [2, 3]
+    assert queue.get(0) is None
+    assert queue.get_dropped_oldest_count() == 2
+
+
+def test_drop_newest_keeps_the_oldest_frames():
+    queue = FrameQueue(2, GxQueueOverflowPolicy.DROP_NEWEST)
+    assert [queue.put(frame) for frame in range(3)] == [True, True, False]
+
+    assert [queue.get(0), queue.get(0)] == [0, 1]
+    assert queue.get_dropped_newest_count() == 1
+
+
+def test_block_waits_for_the_consumer():
+    queue = FrameQueue(1, GxQueueOverflowPolicy.BLOCK)
+    queue.put(0)
+    producer = threading.Thread(target=queue.put, args=(1,))
+    producer.start()
+
+    assert queue.get(1000) == 0
+    producer.join(1)
+    assert not producer.is_alive()
+    assert queue.get(1000) == 1
+    assert queue.get_blocked_count() == 1
+
+
+def test_close_wakes_the_consumer():
+    queue = FrameQueue(1)
+    threading.Timer(0.05, queue.close).start()
+
+    assert queue.get() is None
+    assert not queue.put(0)
+
+
+def test_invalid_queue_depth():
+    with pytest.raises(InvalidParameterError):
+        FrameQueue(0)
+
+
+def test_grabbing_thread(camera):
+    data_stream = camera.data_stream[0]
+    camera.stream_on()
+    data_stream.start_grabbing(queue_depth=4)
+    try:
+        assert data_stream.is_grabbing()
+        with pytest.raises(InvalidCallError):
+            data_stream.dq_buf()
+        frame_ids = [data_stream.retrieve().get_frame_id() for _ in range(5)]
+    finally:
+        data_stream.stop_grabbing()
+
+    assert not data_stream.is_grabbing()
+    assert frame_ids == sorted(frame_ids)
+    assert len(set(frame_ids)) == 5
+
+
+def test_grab_error_gives_the_buffer_back(camera, monkeypatch):
+    def fail(image):
+        raise RuntimeError("copy failure")
+
+    data_stream = camera.data_stream[0]
+    # a buffer kept by the grabbing thread would starve the next dq_buf
+    data_stream.set_acquisition_buffer_number(1)
+    camera.stream_on()
+    monkeypatch.setattr(RawImage, "copy", fail)
+    data_stream.start_grabbing()
+    try:
+        with pytest.raises(RuntimeError):
+            data_stream.retrieve()
+        # the thread ends by itself, the stream can be read directly again
+        deadline = time.monotonic() + 5
+        while data_stream.is_grabbing() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not data_stream.is_grabbing()
+        image = data_stream.dq_buf()
+        assert image is not None
+        data_stream.q_buf(image)
+    finally:
+        data_stream.stop_grabbing()
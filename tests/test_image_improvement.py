@@ -0,0 +1,96 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import ctypes as ct
+
+import numpy as np
+import pytest
+
+import pygxi.dxwrapper as dx
+from pygxi.gxidef import DxValidBit, GxPixelFormatEntry
+from pygxi.ImageProcess import ImageProcess
+from pygxi.ImageProcessConfig import ImageProcessConfig
+
+WIDTH, HEIGHT = 16, 8
+
+
+@pytest.fixture
+def dx_calls(monkeypatch):
+    """
+    Record the DxImageProc calls, the processing calls only copy the first plane
+    """
+    calls = []
+
+    def record(name):
+        def process(input_address, output_address, width, height, param):
+            calls.append((name, input_address, output_address))
+            ct.memmove(output_address, input_address, width * height)
+            return dx.DxStatus.OK
+
+        return process
+
+    monkeypatch.setattr(dx, "dx_raw8_image_process", record("raw8"))
+    monkeypatch.setattr(dx, "dx_mono8_image_process", record("mono8"))
+    set_output_pixel_format = dx.dx_image_format_convert_set_output_pixel_format
+
+    def set_output(handle, pixel_format):
+        calls.append(("set_output_pixel_format", pixel_format, None))
+        return set_output_pixel_format(handle, pixel_format)
+
+    monkeypatch.setattr(
+        dx, "dx_image_format_convert_set_output_pixel_format", set_output
+    )
+    return calls
+
+
+@pytest.fixture
+def image_process_config(monkeypatch):
+    image_process_config = ImageProcessConfig(0)
+    image_process_config.set_valid_bits(DxValidBit.BIT4_11)
+    # the parameters are only passed through to the recorded calls
+    monkeypatch.setattr(
+        image_process_config, "get_color_image_process", lambda color_filter: None
+    )
+    monkeypatch.setattr(image_process_config, "get_mono_image_process", lambda: None)
+    return image_process_config
+
+
+def random_values():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 1 << 12, (HEIGHT, WIDTH)).astype(np.uint16)
+
+
+def test_scratch_buffers_are_reused(make_raw_image, dx_calls, image_process_config):
+    image, _ = make_raw_image(random_values(), GxPixelFormatEntry.BAYER_RG12)
+    image_buf = image.frame_data.image_buf
+    output = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    image_process = ImageProcess()
+
+    image_process.image_improvement(image, output.ctypes.data, image_process_config)
+    first = [call for call in dx_calls if call[0] == "raw8"]
+    image_process.image_improvement(image, output.ctypes.data, image_process_config)
+    second = [call for call in dx_calls if call[0] == "raw8"][1:]
+
+    assert first == second
+    # the 8 bit copy goes to a scratch buffer, not to the image
+    assert first[0][1] != image_buf
+    assert image.frame_data.image_buf == image_buf
+
+
+def test_handle_is_configured_on_change(make_raw_image, dx_calls, image_process_config):
+    values = random_values()
+    image, _ = make_raw_image(values, GxPixelFormatEntry.MONO12)
+    output = np.zeros((HEIGHT, WIDTH), dtype=np.uint8)
+    image_process = ImageProcess()
+
+    image_process.image_improvement(image, output.ctypes.data, image_process_config)
+    image_process.image_improvement(image, output.ctypes.data, image_process_config)
+
+    assert [call[0] for call in dx_calls] == [
+        "set_output_pixel_format",
+        "mono8",
+        "mono8",
+    ]
+    assert dx_calls[1] == dx_calls[2]
+    np.testing.assert_array_equal(output, values >> 4)
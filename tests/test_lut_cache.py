@@ -0,0 +1,61 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import ctypes as ct
+
+import pytest
+
+import pygxi.dxwrapper as dx
+from pygxi.ImageProc import Utility
+from pygxi.ImageProcessConfig import ImageProcessConfig
+
+
+@pytest.fixture
+def gamma_lut_calls(monkeypatch):
+    calls = []
+
+    def get_gamma_lut(gamma):
+        calls.append(gamma)
+        lut = (ct.c_ubyte * 256)(*range(256))
+        return dx.DxStatus.OK, lut, len(lut)
+
+    monkeypatch.setattr(dx, "dx_get_gamma_lut", get_gamma_lut)
+    Utility.clear_result_cache()
+    yield calls
+    Utility.clear_result_cache()
+
+
+def test_lookup_tables_are_computed_once(gamma_lut_calls):
+    first = Utility.get_gamma_lut(2.2)
+    second = Utility.get_gamma_lut(2.2)
+
+    assert gamma_lut_calls == [2.2]
+    assert first.get_data() == second.get_data()
+    info = Utility.get_result_cache_info()
+    assert (info["hits"], info["misses"], info["size"]) == (1, 1, 1)
+
+
+def test_callers_get_their_own_copy(gamma_lut_calls):
+    first = Utility.get_gamma_lut(2.2)
+    first.get_ctype_array()[0] = 99
+    second = Utility.get_gamma_lut(2.2)
+    second.get_ctype_array()[1] = 77
+
+    third = Utility.get_gamma_lut(2.2)
+    assert list(third.get_ctype_array()[:2]) == [0, 1]
+    assert type(third.get_ctype_array()) is type(first.get_ctype_array())
+
+
+def test_configs_share_the_cached_tables(gamma_lut_calls):
+    first = ImageProcessConfig(0)
+    second = ImageProcessConfig(0)
+    first.set_gamma_param(2.2)
+    second.set_gamma_param(2.2)
+    # the setters only store the parameter
+    assert gamma_lut_calls == []
+
+    first.get_gamma_lut().get_ctype_array()[0] = 99
+    assert gamma_lut_calls == [2.2]
+    assert list(second.get_gamma_lut().get_ctype_array()[:2]) == [0, 1]
+    assert gamma_lut_calls == [2.2]
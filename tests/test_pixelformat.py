@@ -0,0 +1,71 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.pixelformat import (
+    PACKING_GVSP,
+    PACKING_NONE,
+    PACKING_PFNC,
+    get_pixel_format_layout,
+    get_pixel_format_size,
+    pack_pixels,
+    unpack_pixels,
+)
+
+PACKED_FORMATS = [
+    "MONO10_PACKED",
+    "MONO12_PACKED",
+    "BAYER_RG12_PACKED",
+    "MONO10_P",
+    "MONO12_P",
+    "MONO14_P",
+    "BAYER_GB10_P",
+    "BAYER_BG12_P",
+]
+UNPACKED_FORMATS = ["MONO8", "BAYER_GR8", "MONO12", "BAYER_RG16"]
+
+
+def random_values(pixel_format, height=6, width=16, seed=0):
+    layout = get_pixel_format_layout(pixel_format)
+    dtype = np.uint8 if layout.data_bits <= 8 else np.uint16
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 1 << layout.data_bits, (height, width)).astype(dtype)
+
+
+def test_layout_of_format_names():
+    layout = get_pixel_format_layout(GxPixelFormatEntry.BAYER_RG12_PACKED)
+    assert layout.data_bits == 12
+    assert layout.packing == PACKING_GVSP
+    assert layout.channels == 1
+
+    assert get_pixel_format_layout(GxPixelFormatEntry.MONO10_P).packing == PACKING_PFNC
+    assert get_pixel_format_layout(GxPixelFormatEntry.RGB8).channels == 3
+    assert get_pixel_format_layout(GxPixelFormatEntry.MONO8).packing == PACKING_NONE
+
+
+@pytest.mark.parametrize("name", PACKED_FORMATS + UNPACKED_FORMATS)
+def test_pack_unpack_round_trip(name):
+    pixel_format = getattr(GxPixelFormatEntry, name)
+    values = random_values(pixel_format)
+    data = pack_pixels(values, pixel_format)
+    assert data.size == get_pixel_format_size(pixel_format, 16, 6)
+
+    unpacked = unpack_pixels(data, pixel_format, 16, 6)
+    np.testing.assert_array_equal(unpacked, values)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_unpack_into_out(workers):
+    pixel_format = GxPixelFormatEntry.MONO12_P
+    values = random_values(pixel_format, height=32, width=64)
+    out = np.empty(values.shape, dtype=np.uint16)
+
+    result = unpack_pixels(
+        pack_pixels(values, pixel_format), pixel_format, 64, 32, out, workers
+    )
+    assert result is out
+    np.testing.assert_array_equal(out, values)
@@ -0,0 +1,75 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+from pygxi.gxidef import DxRGBChannelOrder, DxValidBit, GxPixelFormatEntry
+
+WIDTH, HEIGHT = 32, 24
+
+
+def bin_sum(plane, factor):
+    height, width = plane.shape[0] // factor, plane.shape[1] // factor
+    blocks = plane[: height * factor, : width * factor].astype(np.int64)
+    return blocks.reshape(height, factor, width, factor).sum(axis=(1, 3))
+
+
+def bayer_rg_preview(values, scale):
+    quads = scale // 2
+    red = bin_sum(values[0::2, 0::2], quads) // (quads * quads)
+    green = (
+        bin_sum(values[0::2, 1::2], quads) + bin_sum(values[1::2, 0::2], quads)
+    ) // (2 * quads * quads)
+    blue = bin_sum(values[1::2, 1::2], quads) // (quads * quads)
+    return np.stack([red, green, blue], axis=-1).astype(np.uint8)
+
+
+def random_values(dtype=np.uint8, high=256):
+    return np.random.default_rng(0).integers(0, high, (HEIGHT, WIDTH)).astype(dtype)
+
+
+@pytest.mark.parametrize("scale", [2, 4, 8])
+def test_bayer_preview_averages_the_channels(make_raw_image, scale):
+    values = random_values()
+    image, _ = make_raw_image(values, GxPixelFormatEntry.BAYER_RG8)
+
+    np.testing.assert_array_equal(image.preview(scale), bayer_rg_preview(values, scale))
+
+
+def test_mono_preview(make_raw_image):
+    values = random_values(np.uint16, 1 << 12)
+    image, _ = make_raw_image(values, GxPixelFormatEntry.MONO12)
+
+    preview = image.preview(4, valid_bits=DxValidBit.BIT4_11)
+    expected = (bin_sum(values, 4) // 16) >> 4
+    np.testing.assert_array_equal(preview, expected.astype(np.uint8))
+
+
+def test_flip_channel_order_and_out(make_raw_image):
+    values = random_values()
+    image, _ = make_raw_image(values, GxPixelFormatEntry.BAYER_RG8)
+    out = np.zeros((HEIGHT // 2, WIDTH // 2, 3), dtype=np.uint8)
+
+    preview = image.preview(
+        2, channel_order=DxRGBChannelOrder.ORDER_BGR, flip=True, out=out
+    )
+    assert preview is out
+    np.testing.assert_array_equal(out, bayer_rg_preview(values, 2)[::-1, :, ::-1])
+
+
+def test_lut_and_gamma(make_raw_image):
+    values = random_values()
+    image, _ = make_raw_image(values, GxPixelFormatEntry.BAYER_RG8)
+    lut = (255 - np.arange(256)).astype(np.uint8)
+    expected = bayer_rg_preview(values, 2)
+
+    np.testing.assert_array_equal(image.preview(2, lut=lut), lut[expected])
+    gamma_lut = np.round(255 * (np.arange(256) / 255.0) ** 0.5).astype(np.uint8)
+    np.testing.assert_array_equal(image.preview(2, gamma=2.0), gamma_lut[expected])
+
+
+def test_invalid_scale(make_raw_image):
+    image, _ = make_raw_image(random_values(), GxPixelFormatEntry.BAYER_RG8)
+    assert image.preview(3) is None
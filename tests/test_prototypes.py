@@ -0,0 +1,101 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import ctypes as ct
+import importlib.util
+import os
+import shutil
+import sys
+
+import pytest
+
+import pygxi.dxwrapper as dx
+import pygxi.gxwrapper as gx
+from pygxi.prototypes import bind_prototypes
+
+BENCHMARKS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"
+)
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    # the benchmark imports its helpers from benchmarks/common.py
+    sys.path.insert(0, BENCHMARKS_PATH)
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "ctypes_prototypes", os.path.join(BENCHMARKS_PATH, "ctypes_prototypes.py")
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(BENCHMARKS_PATH)
+    return module
+
+
+@pytest.fixture(scope="module")
+def stub_library(benchmark, tmp_path_factory):
+    """
+    The stub library of the benchmark, exporting every prototyped function and
+    bound with the real prototype tables.
+    """
+    if shutil.which(os.environ.get("CC", "cc")) is None:
+        pytest.skip("no C compiler")
+
+    library_path = benchmark.build_stub(str(tmp_path_factory.mktemp("stub")))
+    library = ct.CDLL(library_path)
+    bind_prototypes(library, benchmark.STUB_PROTOTYPES)
+    return library
+
+
+@pytest.mark.parametrize(
+    "prototypes", [gx.GX_FUNCTION_PROTOTYPES, dx.DX_FUNCTION_PROTOTYPES]
+)
+def test_prototypes_are_ctypes_declarations(prototypes):
+    for name, (restype, argtypes) in prototypes.items():
+        assert restype is None or issubclass(restype, ct._SimpleCData), name
+        assert isinstance(argtypes, list), name
+        for argtype in argtypes:
+            assert hasattr(argtype, "from_param"), (name, argtype)
+
+
+def test_benchmark_calls_accept_the_real_prototypes(benchmark, stub_library):
+    for name, _, after in benchmark.make_cases(stub_library, stub_library):
+        after()
+
+
+def test_wrappers_accept_the_real_prototypes(monkeypatch, stub_library):
+    required = ("gx_get_float", "gx_get_image", "gx_dq_buf", "gx_q_buf")
+    if not all(hasattr(gx, name) for name in required) or not hasattr(
+        dx, "dx_image_format_convert"
+    ):
+        pytest.skip("wrappers not defined without the SDK")
+
+    monkeypatch.setattr(gx, "dll", stub_library)
+    monkeypatch.setattr(dx, "dll", stub_library)
+
+    assert gx.gx_get_float(0x1000, 0x10000) == (gx.GxStatusList.SUCCESS, 0.0)
+    assert gx.gx_get_image(0x1000, gx.GxFrameData(), 100) == gx.GxStatusList.SUCCESS
+
+    ptr_frame_buffer = ct.POINTER(gx.GxFrameBuffer)()
+    assert (
+        gx.gx_dq_buf(0x1000, ct.byref(ptr_frame_buffer), 100) == gx.GxStatusList.SUCCESS
+    )
+    assert (
+        gx.gx_q_buf(0x1000, ct.pointer(gx.GxFrameBuffer())) == gx.GxStatusList.SUCCESS
+    )
+
+    buffer = (ct.c_ubyte * 16)()
+    status = dx.dx_image_format_convert(
+        0x1000,
+        ct.addressof(buffer),
+        16,
+        ct.addressof(buffer),
+        16,
+        0x01080009,
+        4,
+        4,
+        False,
+    )
+    assert status == dx.DxStatus.OK
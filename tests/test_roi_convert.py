@@ -0,0 +1,80 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+from pygxi.errors import InvalidParameterError
+from pygxi.gxidef import DxBayerConvertType, DxValidBit, GxPixelFormatEntry
+
+WIDTH, HEIGHT = 48, 40
+ROIS = [(0, 0, 48, 40), (5, 3, 17, 11), (0, 7, 10, 9), (31, 29, 17, 11), (8, 8, 2, 2)]
+
+
+def crop(values, roi):
+    x, y, width, height = roi
+    return values[y : y + height, x : x + width]
+
+
+@pytest.fixture
+def bayer_image(make_raw_image):
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 256, (HEIGHT, WIDTH), dtype=np.uint8)
+    image, _ = make_raw_image(values, GxPixelFormatEntry.BAYER_RG8)
+    return image
+
+
+@pytest.mark.parametrize("roi", ROIS)
+@pytest.mark.parametrize(
+    "convert_type", [DxBayerConvertType.NEIGHBOUR, DxBayerConvertType.ADAPTIVE]
+)
+def test_roi_is_a_crop_of_the_frame(bayer_image, roi, convert_type):
+    expected = bayer_image.convert("RGB", convert_type=convert_type).get_numpy_array()
+
+    region = bayer_image.convert("RGB", convert_type=convert_type, roi=roi)
+    np.testing.assert_array_equal(region, crop(expected, roi))
+
+
+@pytest.mark.parametrize("name", ["BAYER_RG10_PACKED", "BAYER_GB12"])
+def test_roi_of_deeper_formats(make_raw_image, name):
+    pixel_format = getattr(GxPixelFormatEntry, name)
+    rng = np.random.default_rng(1)
+    values = rng.integers(0, 1 << 10, (HEIGHT, WIDTH)).astype(np.uint16)
+    image, _ = make_raw_image(values, pixel_format)
+    roi = (7, 5, 13, 9)
+
+    expected = image.convert("RAW8", valid_bits=DxValidBit.BIT2_9).get_numpy_array()
+    region = image.convert("RAW8", valid_bits=DxValidBit.BIT2_9, roi=roi)
+    np.testing.assert_array_equal(region, crop(expected, roi))
+
+
+def test_roi_into_out(bayer_image):
+    roi = ROIS[1]
+    out = np.zeros((roi[3], roi[2], 3), dtype=np.uint8)
+
+    assert bayer_image.convert("RGB", out=out, roi=roi) is out
+    expected = bayer_image.convert("RGB").get_numpy_array()
+    np.testing.assert_array_equal(out, crop(expected, roi))
+
+
+def test_roi_out_of_bounds(bayer_image):
+    assert bayer_image.convert("RGB", roi=(40, 0, 9, 4)) is None
+    assert bayer_image.convert_rois("RGB", [ROIS[1], (0, 0, 0, 4)]) is None
+
+
+def test_convert_rois(bayer_image):
+    expected = bayer_image.convert("RGB").get_numpy_array()
+
+    regions = bayer_image.convert_rois("RGB", ROIS, workers=2)
+    for region, roi in zip(regions, ROIS):
+        np.testing.assert_array_equal(region, crop(expected, roi))
+
+    rois = [(1, 1, 8, 6), (20, 13, 8, 6), (40, 34, 8, 6)]
+    stacked = bayer_image.convert_rois("RGB", rois, stack=True)
+    assert stacked.shape == (3, 6, 8, 3)
+    for region, roi in zip(stacked, rois):
+        np.testing.assert_array_equal(region, crop(expected, roi))
+
+    with pytest.raises(InvalidParameterError):
+        bayer_image.convert_rois("RGB", ROIS, stack=True)
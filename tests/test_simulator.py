@@ -0,0 +1,61 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+import pygxi.gxwrapper as gx
+from pygxi.DeviceManager import DeviceManager
+from pygxi.errors import InvalidParameterError
+from pygxi.gxidef import GxFrameStatusList, GxPixelFormatEntry
+from pygxi.gxsimulator import SimulatedCamera
+
+
+def test_cameras_are_listed():
+    gx.dll.set_cameras(
+        [
+            SimulatedCamera(serial_number="SIM1", width=64, height=48),
+            SimulatedCamera(serial_number="SIM2", width=64, height=48),
+        ]
+    )
+    device_num, device_info_list = DeviceManager().update_device_list()
+
+    assert device_num == 2
+    assert [device_info["sn"] for device_info in device_info_list] == ["SIM1", "SIM2"]
+
+
+def test_frames_follow_the_features(camera):
+    camera.Width.set(32)
+    camera.PixelFormat.set(GxPixelFormatEntry.BAYER_RG12)
+    camera.stream_on()
+    first = camera.data_stream[0].get_image()
+    second = camera.data_stream[0].get_image()
+
+    assert first.get_status() == GxFrameStatusList.SUCCESS
+    assert first.get_numpy_array().shape == (48, 32)
+    assert first.get_numpy_array().dtype == np.uint16
+    assert second.get_frame_id() > first.get_frame_id()
+    assert second.get_timestamp() >= first.get_timestamp()
+
+
+def test_lost_packets_make_incomplete_frames():
+    gx.dll.set_cameras(
+        [SimulatedCamera(width=64, height=48, frame_rate=None, packet_loss_rate=1.0)]
+    )
+    device_manager = DeviceManager()
+    device_manager.update_device_list()
+    device = device_manager.open_device_by_index(1)
+    try:
+        device.stream_on()
+        image = device.data_stream[0].get_image()
+        device.stream_off()
+    finally:
+        device.close_device()
+
+    assert image.get_status() == GxFrameStatusList.INCOMPLETE
+
+
+def test_invalid_camera():
+    with pytest.raises(InvalidParameterError):
+        SimulatedCamera(width=60)
@@ -0,0 +1,114 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+from pygxi.errors import InvalidParameterError
+from pygxi.gxidef import GxPixelFormatEntry
+from pygxi.pixelformat import get_pixel_values
+from pygxi.temporal import TemporalStatistics
+
+WIDTH, HEIGHT = 16, 8
+
+
+def random_frames(count, max_value=4095, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, max_value + 1, (count, HEIGHT, WIDTH)).astype(np.uint16)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_cumulative_statistics_match_numpy(workers):
+    frames = random_frames(10)
+    statistics = TemporalStatistics(WIDTH, HEIGHT, GxPixelFormatEntry.MONO12)
+    for frame in frames:
+        assert statistics.add(frame, workers)
+
+    snapshot = statistics.snapshot()
+    assert snapshot.count == 10
+    np.testing.assert_allclose(snapshot.mean, frames.mean(axis=0), rtol=1e-5)
+    np.testing.assert_allclose(snapshot.variance, frames.var(axis=0, ddof=1), rtol=1e-4)
+    np.testing.assert_array_equal(snapshot.minimum, frames.min(axis=0))
+    np.testing.assert_array_equal(snapshot.maximum, frames.max(axis=0))
+
+
+def test_exponential_moving_average():
+    frames = random_frames(5)
+    alpha = 0.25
+    statistics = TemporalStatistics(
+        WIDTH, HEIGHT, GxPixelFormatEntry.MONO12, alpha=alpha
+    )
+    expected = frames[0].astype(np.float64)
+    statistics.add(frames[0])
+    for frame in frames[1:]:
+        statistics.add(frame)
+        expected += alpha * (frame - expected)
+
+    np.testing.assert_allclose(statistics.snapshot().mean, expected, rtol=1e-5)
+
+
+def test_window_keeps_the_last_full_window():
+    frames = random_frames(7)
+    statistics = TemporalStatistics(WIDTH, HEIGHT, GxPixelFormatEntry.MONO12, window=3)
+    for frame in frames:
+        statistics.add(frame)
+
+    assert statistics.get_count() == 1
+    last_window = statistics.snapshot(last_window=True)
+    assert last_window.count == 3
+    np.testing.assert_allclose(last_window.mean, frames[3:6].mean(axis=0), rtol=1e-5)
+
+
+def test_snapshot_into_out_and_reset():
+    statistics = TemporalStatistics(WIDTH, HEIGHT, GxPixelFormatEntry.MONO12)
+    assert statistics.snapshot() is None
+
+    frames = random_frames(2)
+    statistics.add(frames[0])
+    out = statistics.snapshot()
+    statistics.add(frames[1])
+    again = statistics.snapshot(out)
+    assert again.mean is out.mean
+    assert again.count == 2
+
+    statistics.reset()
+    assert statistics.snapshot() is None
+
+
+def test_packed_raw_images(make_raw_image):
+    pixel_format = GxPixelFormatEntry.MONO12_PACKED
+    frames = random_frames(3)
+    statistics = TemporalStatistics(WIDTH, HEIGHT, pixel_format)
+    for frame in frames:
+        image, _ = make_raw_image(frame, pixel_format, zero_copy=True)
+        statistics.add(image)
+
+    np.testing.assert_allclose(
+        statistics.snapshot().mean, frames.mean(axis=0), rtol=1e-5
+    )
+
+
+def test_frames_of_another_geometry_are_refused():
+    statistics = TemporalStatistics(WIDTH, HEIGHT, GxPixelFormatEntry.MONO12)
+    assert not statistics.add(np.zeros((HEIGHT, WIDTH + 2), dtype=np.uint16))
+
+    with pytest.raises(InvalidParameterError):
+        TemporalStatistics(WIDTH, HEIGHT, GxPixelFormatEntry.RGB8)
+    with pytest.raises(InvalidParameterError):
+        TemporalStatistics(WIDTH, HEIGHT, GxPixelFormatEntry.MONO8, alpha=0)
+
+
+def test_get_pixel_values_checks_geometry(make_raw_image):
+    values = random_frames(1)[0]
+    image, _ = make_raw_image(values, GxPixelFormatEntry.MONO12)
+
+    np.testing.assert_array_equal(
+        get_pixel_values(image, WIDTH, HEIGHT, GxPixelFormatEntry.MONO12), values
+    )
+    assert (
+        get_pixel_values(image, WIDTH // 2, HEIGHT, GxPixelFormatEntry.MONO12) is None
+    )
+    assert (
+        get_pixel_values(values, WIDTH, HEIGHT // 2, GxPixelFormatEntry.MONO12) is None
+    )
@@ -0,0 +1,65 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+from pygxi.DeviceManager import DeviceManager
+from pygxi.gxidef import DxBayerConvertType, DxValidBit, GxPixelFormatEntry
+
+WIDTH, HEIGHT = 40, 36
+
+
+@pytest.fixture
+def bayer_image(make_raw_image):
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 256, (HEIGHT, WIDTH), dtype=np.uint8)
+    image, _ = make_raw_image(values, GxPixelFormatEntry.BAYER_RG8)
+    return image
+
+
+@pytest.mark.parametrize(
+    "workers, band_height", [(1, 8), (3, None), (4, 6), (2, HEIGHT), (8, 2)]
+)
+@pytest.mark.parametrize(
+    "convert_type", [DxBayerConvertType.NEIGHBOUR, DxBayerConvertType.ADAPTIVE]
+)
+@pytest.mark.parametrize("flip", [False, True])
+def test_bands_match_the_whole_frame(
+    bayer_image, workers, band_height, convert_type, flip
+):
+    expected = bayer_image.convert("RGB", flip, convert_type=convert_type)
+
+    converted = bayer_image.convert(
+        "RGB",
+        flip,
+        convert_type=convert_type,
+        workers=workers,
+        band_height=band_height,
+    )
+    np.testing.assert_array_equal(
+        converted.get_numpy_array(), expected.get_numpy_array()
+    )
+
+
+def test_raw8_bands(make_raw_image):
+    values = np.arange(HEIGHT * WIDTH, dtype=np.uint16).reshape(HEIGHT, WIDTH) << 4
+    image, _ = make_raw_image(values, GxPixelFormatEntry.MONO12)
+    expected = image.convert("RAW8", valid_bits=DxValidBit.BIT4_11)
+
+    converted = image.convert("RAW8", valid_bits=DxValidBit.BIT4_11, workers=3)
+    np.testing.assert_array_equal(
+        converted.get_numpy_array(), expected.get_numpy_array()
+    )
+
+
+def test_image_format_convert_bands(bayer_image):
+    image_format_convert = DeviceManager().create_image_format_convert()
+    image_format_convert.set_dest_format(GxPixelFormatEntry.RGB8)
+    expected = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    out = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+
+    image_format_convert.convert(bayer_image, out=expected)
+    image_format_convert.convert(bayer_image, out=out, workers=4, band_height=10)
+    np.testing.assert_array_equal(out, expected)
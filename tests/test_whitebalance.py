@@ -0,0 +1,61 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+from pygxi.errors import InvalidParameterError
+from pygxi.gxidef import GxPixelColorFilterEntry, GxPixelFormatEntry
+from pygxi.whitebalance import estimate_white_balance
+
+LIGHT = (0.5, 1.0, 0.8)
+
+
+def bayer_under_light(data_bits=8, height=32, width=48, light=LIGHT):
+    """
+    RG bayer frame of a random gray scene lit with the (red, green, blue) gains
+    """
+    rng = np.random.default_rng(0)
+    gray = rng.uniform(0.1, 0.9, (height // 2, width // 2))
+    raw = np.empty((height, width))
+    raw[0::2, 0::2] = gray * light[0]
+    raw[0::2, 1::2] = gray * light[1]
+    raw[1::2, 0::2] = gray * light[1]
+    raw[1::2, 1::2] = gray * light[2]
+    dtype = np.uint8 if data_bits <= 8 else np.uint16
+    return np.round(raw * ((1 << data_bits) - 1)).astype(dtype)
+
+
+@pytest.mark.parametrize("step", [1, 2, (1, 4)])
+def test_estimate_inverts_the_light(step):
+    ratios = estimate_white_balance(
+        bayer_under_light(12), GxPixelColorFilterEntry.BAYER_RG, 12, step
+    )
+    np.testing.assert_allclose(ratios, (1 / LIGHT[0], 1.0, 1 / LIGHT[2]), rtol=2e-3)
+
+
+def test_saturated_frame_has_no_estimate():
+    values = np.full((8, 8), 255, dtype=np.uint8)
+    assert estimate_white_balance(values, GxPixelColorFilterEntry.BAYER_RG, 8) is None
+
+
+def test_mono_is_refused():
+    with pytest.raises(InvalidParameterError):
+        estimate_white_balance(
+            np.zeros((8, 8), dtype=np.uint8), GxPixelColorFilterEntry.NONE, 8
+        )
+
+
+@pytest.mark.parametrize("name", ["BAYER_RG8", "BAYER_RG12_PACKED"])
+def test_raw_image_ratio(make_raw_image, name):
+    pixel_format = getattr(GxPixelFormatEntry, name)
+    data_bits = 8 if name.endswith("8") else 12
+    image, _ = make_raw_image(bayer_under_light(data_bits), pixel_format)
+
+    np.testing.assert_allclose(
+        image.get_white_balance_ratio(step=2),
+        (1 / LIGHT[0], 1.0, 1 / LIGHT[2]),
+        rtol=2e-2,
+    )
+    assert image.get_white_balance_ratio(roi=(0, 0, 100, 100)) is None
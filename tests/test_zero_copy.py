@@ -0,0 +1,58 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy as np
+import pytest
+
+from pygxi.errors import InvalidCallError
+
+
+@pytest.fixture
+def data_stream(camera):
+    data_stream = camera.data_stream[0]
+    camera.stream_on()
+    return data_stream
+
+
+def test_get_image_owns_its_data(data_stream):
+    image = data_stream.get_image()
+    values = image.get_numpy_array().copy()
+    for _ in range(6):
+        data_stream.get_image()
+
+    assert not image.is_zero_copy()
+    np.testing.assert_array_equal(image.get_numpy_array(), values)
+
+
+def test_zero_copy_frames_are_guarded_after_q_buf(data_stream):
+    image = data_stream.dq_buf(zero_copy=True)
+    values = image.get_numpy_array()
+    view = image.get_numpy_array(view=True)
+    memory_view = image.get_memoryview()
+    expected = values.copy()
+    assert image.is_zero_copy()
+    assert not view.flags.writeable
+
+    data_stream.q_buf(image)
+    assert not image.is_buffer_valid()
+    with pytest.raises(InvalidCallError):
+        image.get_numpy_array()
+    with pytest.raises(ValueError):
+        memory_view[0]
+
+    for _ in range(6):
+        data_stream.q_buf(data_stream.dq_buf())
+    np.testing.assert_array_equal(values, expected)
+
+
+def test_detached_frame_survives_q_buf(data_stream):
+    image = data_stream.dq_buf(zero_copy=True)
+    expected = image.get_numpy_array()
+    image.detach()
+    data_stream.q_buf(image)
+    for _ in range(6):
+        data_stream.q_buf(data_stream.dq_buf())
+
+    assert image.is_buffer_valid()
+    np.testing.assert_array_equal(image.get_numpy_array(), expected)